@@ -0,0 +1,54 @@
+"""Report schedule execution leases
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: str | None = "001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add lease columns used by concurrent scheduler workers."""
+
+    # report_schedules is created by init_database(), so it may not exist yet
+    op.execute(
+        """
+        ALTER TABLE IF EXISTS report_schedules
+            ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(100),
+            ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE
+        """
+    )
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('report_schedules') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS idx_schedule_lease
+                    ON report_schedules (lease_expires_at);
+            END IF;
+        END $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop scheduler lease columns."""
+
+    op.execute("DROP INDEX IF EXISTS idx_schedule_lease")
+    op.execute(
+        """
+        ALTER TABLE IF EXISTS report_schedules
+            DROP COLUMN IF EXISTS lease_expires_at,
+            DROP COLUMN IF EXISTS lease_owner
+        """
+    )
@@ -0,0 +1,72 @@
+"""Generated point geometry and GiST indexes for spatial queries
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, index prefix) for every data-point and risk table queried by location
+SPATIAL_TABLES = [
+    ("era5_data_points", "era5"),
+    ("processed_climate_data", "processed"),
+    ("chirps_data_points", "chirps"),
+    ("modis_data_points", "modis"),
+    ("map_data_points", "map"),
+    ("worldpop_data_points", "worldpop"),
+    ("malaria_risk_indices", "risk"),
+]
+
+# Expression indexes from 001 that no query could use
+LEGACY_GIST_INDEXES = ["era5", "chirps", "modis", "map", "worldpop"]
+
+
+def upgrade() -> None:
+    """Add generated geom columns with GiST indexes."""
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS postgis")
+
+    for table, prefix in SPATIAL_TABLES:
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+                ADD COLUMN IF NOT EXISTS geom geometry(Point, 4326)
+                GENERATED ALWAYS AS (
+                    ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)
+                ) STORED
+            """
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{prefix}_geom ON {table} USING GIST (geom)"
+        )
+        op.execute(f"ANALYZE {table}")
+
+    for prefix in LEGACY_GIST_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS idx_{prefix}_location_gist")
+
+
+def downgrade() -> None:
+    """Drop geom columns and restore the 001 expression indexes."""
+
+    for table, prefix in SPATIAL_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS idx_{prefix}_geom")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS geom")
+
+    for table, prefix in SPATIAL_TABLES:
+        if prefix in LEGACY_GIST_INDEXES:
+            op.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS idx_{prefix}_location_gist
+                ON {table} USING GIST (ST_Point(longitude, latitude))
+                """
+            )
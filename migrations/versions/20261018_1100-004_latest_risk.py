@@ -0,0 +1,83 @@
+"""Latest risk per location
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create latest_risk and backfill it from malaria_risk_indices."""
+
+    op.create_index(
+        "idx_risk_location_latest",
+        "malaria_risk_indices",
+        ["latitude", "longitude", sa.text("assessment_date DESC")],
+        if_not_exists=True,
+    )
+
+    op.create_table(
+        "latest_risk",
+        sa.Column("latitude", sa.Float(), nullable=False),
+        sa.Column("longitude", sa.Float(), nullable=False),
+        sa.Column("risk_index_id", sa.Integer(), nullable=False),
+        sa.Column("assessment_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("location_name", sa.String(length=200), nullable=True),
+        sa.Column("composite_risk_score", sa.Float(), nullable=False),
+        sa.Column("risk_level", sa.String(length=20), nullable=False),
+        sa.Column("confidence_score", sa.Float(), nullable=False),
+        sa.Column("prediction_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("time_horizon_days", sa.Integer(), nullable=False),
+        sa.Column("model_version", sa.String(length=20), nullable=False),
+        sa.Column("model_type", sa.String(length=50), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("latitude", "longitude"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_latest_risk_level", "latest_risk", ["risk_level"], if_not_exists=True
+    )
+
+    op.execute(
+        """
+        INSERT INTO latest_risk (
+            latitude, longitude, risk_index_id, assessment_date, location_name,
+            composite_risk_score, risk_level, confidence_score, prediction_date,
+            time_horizon_days, model_version, model_type
+        )
+        SELECT DISTINCT ON (latitude, longitude)
+            latitude, longitude, id, assessment_date, location_name,
+            composite_risk_score, risk_level, confidence_score, prediction_date,
+            time_horizon_days, model_version, model_type
+        FROM malaria_risk_indices
+        ORDER BY latitude, longitude, assessment_date DESC
+        ON CONFLICT (latitude, longitude) DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop latest_risk."""
+
+    op.drop_index("idx_latest_risk_level", table_name="latest_risk", if_exists=True)
+    op.drop_table("latest_risk", if_exists=True)
+    op.drop_index(
+        "idx_risk_location_latest", table_name="malaria_risk_indices", if_exists=True
+    )
@@ -0,0 +1,163 @@
+"""Grid cell dimension with integer keys on location-keyed facts
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 12:00:00.000000
+
+Runs before compression is enabled (006), so the column, foreign key and
+backfill only touch uncompressed chunks.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Matches GRID_CELL_PRECISION in the repositories
+PRECISION = 4
+SCALE = 10**PRECISION
+
+# (table, time column, cell index, float-coordinate indexes it replaces)
+FACT_TABLES = [
+    (
+        "era5_data_points",
+        "timestamp",
+        "idx_era5_cell_timestamp",
+        [
+            ("idx_era5_location", ["latitude", "longitude"]),
+            ("idx_era5_timestamp_location", ["timestamp", "latitude", "longitude"]),
+        ],
+    ),
+    (
+        "processed_climate_data",
+        "date",
+        "idx_processed_cell_date",
+        [
+            ("idx_processed_location", ["latitude", "longitude"]),
+            ("idx_processed_date_location", ["date", "latitude", "longitude"]),
+        ],
+    ),
+    (
+        "chirps_data_points",
+        "date",
+        "idx_chirps_cell_date",
+        [
+            ("idx_chirps_location", ["latitude", "longitude"]),
+            ("idx_chirps_date_location", ["date", "latitude", "longitude"]),
+        ],
+    ),
+    (
+        "modis_data_points",
+        "date",
+        "idx_modis_cell_date",
+        [
+            ("idx_modis_location", ["latitude", "longitude"]),
+            ("idx_modis_date_location", ["date", "latitude", "longitude"]),
+        ],
+    ),
+    (
+        "malaria_risk_indices",
+        "assessment_date",
+        "idx_risk_cell_date",
+        [
+            ("idx_risk_location", ["latitude", "longitude"]),
+            ("idx_risk_date_location", ["assessment_date", "latitude", "longitude"]),
+        ],
+    ),
+    ("location_time_series", None, "ix_location_time_series_grid_cell_id", []),
+]
+
+
+def _rounded(column: str) -> str:
+    """SQL for ``grid_cell_key``: round half up, all in double precision."""
+    scale = f"CAST({SCALE} AS double precision)"
+    return f"floor({column} * {scale} + CAST(0.5 AS double precision)) / {scale}"
+
+
+def upgrade() -> None:
+    """Create grid_cells, key every fact row to a cell and swap indexes."""
+
+    op.create_table(
+        "grid_cells",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("latitude", sa.Float(), nullable=False),
+        sa.Column("longitude", sa.Float(), nullable=False),
+        sa.Column("country_code", sa.String(length=3), nullable=True),
+        sa.Column("admin1_code", sa.String(length=20), nullable=True),
+        sa.Column("admin2_code", sa.String(length=20), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("latitude", "longitude", name="uq_grid_cell_location"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_grid_cell_country",
+        "grid_cells",
+        ["country_code", "admin1_code"],
+        if_not_exists=True,
+    )
+    op.execute(
+        """
+        ALTER TABLE grid_cells ADD COLUMN IF NOT EXISTS geom geometry(Point, 4326)
+            GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)) STORED
+        """
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS idx_grid_cell_geom ON grid_cells USING GIST (geom)")
+
+    for table, time_column, cell_index, legacy_indexes in FACT_TABLES:
+        op.execute(
+            f"""
+            INSERT INTO grid_cells (latitude, longitude)
+            SELECT DISTINCT {_rounded("latitude")}, {_rounded("longitude")}
+            FROM {table}
+            ON CONFLICT (latitude, longitude) DO NOTHING
+            """
+        )
+        op.add_column(table, sa.Column("grid_cell_id", sa.Integer(), nullable=True))
+        op.create_foreign_key(
+            f"fk_{table}_grid_cell", table, "grid_cells", ["grid_cell_id"], ["id"]
+        )
+        op.execute(
+            f"""
+            UPDATE {table} AS fact
+            SET grid_cell_id = cell.id
+            FROM grid_cells AS cell
+            WHERE cell.latitude = {_rounded("fact.latitude")}
+              AND cell.longitude = {_rounded("fact.longitude")}
+            """
+        )
+
+        columns = ["grid_cell_id", time_column] if time_column else ["grid_cell_id"]
+        op.create_index(cell_index, table, columns, if_not_exists=True)
+        for name, _ in legacy_indexes:
+            op.drop_index(name, table_name=table, if_exists=True)
+        op.execute(f"ANALYZE {table}")
+
+    op.execute("ANALYZE grid_cells")
+
+
+def downgrade() -> None:
+    """Restore float-coordinate indexes and drop grid_cells."""
+
+    for table, _, cell_index, legacy_indexes in FACT_TABLES:
+        for name, columns in legacy_indexes:
+            op.create_index(name, table, columns, if_not_exists=True)
+        op.drop_index(cell_index, table_name=table, if_exists=True)
+        op.drop_constraint(f"fk_{table}_grid_cell", table, type_="foreignkey")
+        op.drop_column(table, "grid_cell_id")
+
+    op.drop_index("idx_grid_cell_geom", table_name="grid_cells", if_exists=True)
+    op.drop_index("idx_grid_cell_country", table_name="grid_cells", if_exists=True)
+    op.drop_table("grid_cells", if_exists=True)
@@ -0,0 +1,160 @@
+"""Climate and alert continuous aggregates, compression and retention
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CLIMATE_SUMMARY = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS {view}
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket('{width}', timestamp) AS {bucket},
+    latitude,
+    longitude,
+    AVG(temperature_2m) as avg_temp,
+    COUNT(temperature_2m) as temp_count,
+    MAX(temperature_2m_max) as max_temp,
+    MIN(temperature_2m_min) as min_temp,
+    SUM(total_precipitation) as total_precip,
+    COUNT(*) as data_points
+FROM era5_data_points
+GROUP BY {bucket}, latitude, longitude
+WITH NO DATA
+"""
+
+ALERT_SUMMARY = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS {view}
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket('{width}', created_at) AS {bucket},
+    configuration_id,
+    COUNT(*) as alert_count,
+    SUM(risk_score) as risk_score_sum,
+    COUNT(risk_score) as risk_score_count,
+    SUM(CASE WHEN push_notification_delivered OR email_notification_delivered
+        OR sms_notification_delivered OR webhook_notification_delivered
+        THEN 1 ELSE 0 END) as delivered_count,
+    COUNT(acknowledged_at) as acknowledged_count,
+    COUNT(escalated_at) as escalation_count
+FROM alerts
+GROUP BY {bucket}, configuration_id
+WITH NO DATA
+"""
+
+# (view, definition, bucket width, bucket column, start offset, end offset, schedule)
+AGGREGATES = [
+    ("daily_climate_summary", CLIMATE_SUMMARY, "1 day", "day", "1 month", "1 hour", "1 hour"),
+    ("weekly_climate_summary", CLIMATE_SUMMARY, "7 days", "week", "2 months", "1 day", "6 hours"),
+    ("daily_alert_summary", ALERT_SUMMARY, "1 day", "day", "90 days", "1 hour", "1 hour"),
+    ("weekly_alert_summary", ALERT_SUMMARY, "7 days", "week", "90 days", "1 day", "6 hours"),
+]
+
+# (hypertable, segmentby, orderby, compress after); location facts are
+# segmented by the grid cell their queries filter on (005)
+COMPRESSION = [
+    ("era5_data_points", "grid_cell_id", "timestamp DESC", "30 days"),
+    ("chirps_data_points", "grid_cell_id", "date DESC", "30 days"),
+    ("modis_data_points", "grid_cell_id", "date DESC", "90 days"),
+    ("processed_climate_data", "grid_cell_id", "date DESC", "30 days"),
+    ("alerts", "configuration_id", "created_at DESC", "90 days"),
+]
+
+RETENTION = [("era5_data_points", "365 days")]
+
+
+def upgrade() -> None:
+    """Create rollups and enable compression and retention policies."""
+
+    # The original daily summary had no counts to weight area averages with
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS daily_climate_summary")
+
+    for view, definition, width, bucket, start, end, schedule in AGGREGATES:
+        op.execute(definition.format(view=view, width=width, bucket=bucket))
+        op.execute(
+            f"""
+            SELECT add_continuous_aggregate_policy('{view}',
+                start_offset => INTERVAL '{start}',
+                end_offset => INTERVAL '{end}',
+                schedule_interval => INTERVAL '{schedule}',
+                if_not_exists => TRUE)
+            """
+        )
+
+    for hypertable, segmentby, orderby, after in COMPRESSION:
+        op.execute(
+            f"""
+            ALTER TABLE {hypertable} SET (
+                timescaledb.compress,
+                timescaledb.compress_segmentby = '{segmentby}',
+                timescaledb.compress_orderby = '{orderby}')
+            """
+        )
+        op.execute(
+            f"SELECT add_compression_policy('{hypertable}', INTERVAL '{after}', "
+            "if_not_exists => TRUE)"
+        )
+
+    for hypertable, keep in RETENTION:
+        op.execute(
+            f"SELECT add_retention_policy('{hypertable}', INTERVAL '{keep}', "
+            "if_not_exists => TRUE)"
+        )
+
+
+def downgrade() -> None:
+    """Remove policies and rollups, restoring the original daily summary."""
+
+    for hypertable, _ in RETENTION:
+        op.execute(f"SELECT remove_retention_policy('{hypertable}', if_exists => TRUE)")
+
+    for hypertable, *_ in COMPRESSION:
+        op.execute(f"SELECT remove_compression_policy('{hypertable}', if_exists => TRUE)")
+        op.execute(
+            f"""
+            SELECT decompress_chunk(c, if_compressed => TRUE)
+            FROM show_chunks('{hypertable}') c
+            """
+        )
+        op.execute(f"ALTER TABLE {hypertable} SET (timescaledb.compress = false)")
+
+    for view, *_ in reversed(AGGREGATES):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view}")
+
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS daily_climate_summary
+        WITH (timescaledb.continuous) AS
+        SELECT
+            time_bucket('1 day', timestamp) AS day,
+            latitude,
+            longitude,
+            AVG(temperature_2m) as avg_temp,
+            MAX(temperature_2m_max) as max_temp,
+            MIN(temperature_2m_min) as min_temp,
+            SUM(total_precipitation) as total_precip
+        FROM era5_data_points
+        GROUP BY day, latitude, longitude
+        WITH NO DATA
+        """
+    )
+    op.execute(
+        """
+        SELECT add_continuous_aggregate_policy('daily_climate_summary',
+            start_offset => INTERVAL '1 month',
+            end_offset => INTERVAL '1 hour',
+            schedule_interval => INTERVAL '1 hour',
+            if_not_exists => TRUE)
+        """
+    )
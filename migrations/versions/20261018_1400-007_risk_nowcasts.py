@@ -0,0 +1,47 @@
+"""Precomputed daily nowcasts per grid cell
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create risk_nowcasts keyed by (target_date, model_type, grid_cell_id)."""
+
+    op.create_table(
+        "risk_nowcasts",
+        sa.Column("target_date", sa.Date(), nullable=False),
+        sa.Column("model_type", sa.String(length=20), nullable=False),
+        sa.Column("grid_cell_id", sa.Integer(), nullable=False),
+        sa.Column("risk_score", sa.Float(), nullable=False),
+        sa.Column("uncertainty", sa.Float(), nullable=True),
+        sa.Column("model_version", sa.String(length=50), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["grid_cell_id"], ["grid_cells.id"]),
+        sa.PrimaryKeyConstraint("target_date", "model_type", "grid_cell_id"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop risk_nowcasts."""
+
+    op.drop_table("risk_nowcasts", if_exists=True)
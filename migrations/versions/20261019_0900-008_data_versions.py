@@ -0,0 +1,42 @@
+"""Data version counters bumped after ingestion
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create data_versions keyed by counter name."""
+
+    op.create_table(
+        "data_versions",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop data_versions."""
+
+    op.drop_table("data_versions", if_exists=True)
@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 from typing import Any, Union, cast
 
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import or_, select
+from sqlalchemy import lambda_stmt, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
@@ -327,43 +327,49 @@ class AlertEngine:
         Returns:
             List of applicable alert rules
         """
-        # Base query for active rules
-        query = db.query(AlertRule).join(AlertConfiguration).filter( # type: ignore[attr-defined]
-            AlertRule.is_active,
-            AlertConfiguration.is_active
+        # Lambda statements cache one compiled form per combination of
+        # filters; the coordinates and country become bound parameters
+        query = lambda_stmt(
+            lambda: select(AlertRule)
+            .join(AlertConfiguration)
+            .where(AlertRule.is_active, AlertConfiguration.is_active)
         )
 
         # Filter by geographic bounds if specified
         if request.latitude and request.longitude:
-            query = query.filter(
+            latitude = request.latitude
+            longitude = request.longitude
+            query += lambda s: s.where(
                 or_(
                     AlertConfiguration.latitude_min.is_(None),
-                    AlertConfiguration.latitude_min <= request.latitude
+                    AlertConfiguration.latitude_min <= latitude
                 ),
                 or_(
                     AlertConfiguration.latitude_max.is_(None),
-                    AlertConfiguration.latitude_max >= request.latitude
+                    AlertConfiguration.latitude_max >= latitude
                 ),
                 or_(
                     AlertConfiguration.longitude_min.is_(None),
-                    AlertConfiguration.longitude_min <= request.longitude
+                    AlertConfiguration.longitude_min <= longitude
                 ),
                 or_(
                     AlertConfiguration.longitude_max.is_(None),
-                    AlertConfiguration.longitude_max >= request.longitude
+                    AlertConfiguration.longitude_max >= longitude
                 )
             )
 
         # Filter by country/region if specified
         if request.country_code:
-            query = query.filter(
+            country_codes = [request.country_code]
+            query += lambda s: s.where(
                 or_(
                     AlertConfiguration.country_codes.is_(None),
-                    AlertConfiguration.country_codes.contains([request.country_code])
+                    AlertConfiguration.country_codes.contains(country_codes)
                 )
             )
 
-        return query.all() # type: ignore[no-any-return]
+        result = await db.execute(query)
+        return list(result.scalars().all())
 
     async def _evaluate_alert_rule(
         self,
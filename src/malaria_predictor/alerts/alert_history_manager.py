@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 from typing import Any, cast
 
 from pydantic import BaseModel, Field
-from sqlalchemy import desc, func, or_, select
+from sqlalchemy import Select, column, desc, func, or_, select, table
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
@@ -23,10 +23,17 @@ from ..database.models import (
     AlertPerformanceMetrics,
     NotificationDelivery,
 )
-from ..database.session import get_session
+from ..database.repositories import bucket_start
+from ..database.session import get_read_session, get_session
 
 logger = logging.getLogger(__name__)
 
+# Alert continuous aggregates by period: (view, bucket column)
+ALERT_AGGREGATES = {
+    "daily": ("daily_alert_summary", "day"),
+    "weekly": ("weekly_alert_summary", "week"),
+}
+
 
 class AlertHistoryQuery(BaseModel):
     """Query parameters for alert history retrieval."""
@@ -137,7 +144,7 @@ class AlertHistoryManager:
         start_time = datetime.now()
 
         try:
-            async with get_session() as db:
+            async with get_read_session() as db:
                 # Build base select statement (SQLAlchemy 2.0 async)
                 stmt = select(Alert).join(AlertConfiguration).where(
                     AlertConfiguration.user_id == query.user_id
@@ -254,7 +261,7 @@ class AlertHistoryManager:
             Alert history summary with statistics
         """
         try:
-            async with get_session() as db:
+            async with get_read_session() as db:
                 start_date = datetime.now() - timedelta(days=days)
 
                 # Total alerts (SQLAlchemy 2.0 async)
@@ -403,6 +410,10 @@ class AlertHistoryManager:
     ) -> list[AlertTrendData]:
         """Get alert trend data over time.
 
+        Daily and weekly trends on PostgreSQL read the alert continuous
+        aggregates and cover whole buckets; hourly trends and other
+        dialects aggregate the alerts table.
+
         Args:
             user_id: User identifier
             period: Aggregation period (hourly, daily, weekly)
@@ -412,47 +423,14 @@ class AlertHistoryManager:
             List of trend data points
         """
         try:
-            async with get_session() as db:
+            async with get_read_session() as db:
                 start_date = datetime.now() - timedelta(days=days)
 
-                # Build time truncation based on period
-                if period == "hourly":
-                    time_trunc = func.date_trunc('hour', Alert.created_at)
-                elif period == "weekly":
-                    time_trunc = func.date_trunc('week', Alert.created_at)
-                else:  # daily
-                    time_trunc = func.date_trunc('day', Alert.created_at)
-
-                # Query trend data (SQLAlchemy 2.0 async)
-                trends_stmt = select(
-                    time_trunc.label("period_date"),
-                    func.count(Alert.id).label("alert_count"),
-                    func.avg(Alert.risk_score).label("avg_risk_score"),
-                    func.sum(
-                        func.case(
-                            (Alert.push_notification_delivered, 1),
-                            (Alert.email_notification_delivered, 1),
-                            (Alert.sms_notification_delivered, 1),
-                            (Alert.webhook_notification_delivered, 1),
-                            else_=0
-                        )
-                    ).label("delivered_count"),
-                    func.sum(
-                        func.case(
-                            (Alert.acknowledged_at.isnot(None), 1),
-                            else_=0
-                        )
-                    ).label("acknowledged_count"),
-                    func.sum(
-                        func.case(
-                            (Alert.escalated_at.isnot(None), 1),
-                            else_=0
-                        )
-                    ).label("escalation_count")
-                ).join(AlertConfiguration).where(
-                    AlertConfiguration.user_id == user_id,
-                    Alert.created_at >= start_date
-                ).group_by(time_trunc).order_by(time_trunc)
+                postgresql = db.bind is not None and db.bind.dialect.name == "postgresql"
+                if period in ALERT_AGGREGATES and postgresql:
+                    trends_stmt = self._aggregate_trends_statement(user_id, period, start_date)
+                else:
+                    trends_stmt = self._raw_trends_statement(user_id, period, start_date)
 
                 trends_result = await db.execute(trends_stmt)
                 trends = trends_result.all()
@@ -479,6 +457,84 @@ class AlertHistoryManager:
             logger.error(f"Failed to get alert trends: {e}")
             raise
 
+    def _raw_trends_statement(
+        self, user_id: str, period: str, start_date: datetime
+    ) -> Select[Any]:
+        """Build the trend query over the alerts table."""
+        # Build time truncation based on period
+        if period == "hourly":
+            time_trunc = func.date_trunc('hour', Alert.created_at)
+        elif period == "weekly":
+            time_trunc = func.date_trunc('week', Alert.created_at)
+        else:  # daily
+            time_trunc = func.date_trunc('day', Alert.created_at)
+
+        # Query trend data (SQLAlchemy 2.0 async)
+        return select(
+            time_trunc.label("period_date"),
+            func.count(Alert.id).label("alert_count"),
+            func.avg(Alert.risk_score).label("avg_risk_score"),
+            func.sum(
+                func.case(
+                    (Alert.push_notification_delivered, 1),
+                    (Alert.email_notification_delivered, 1),
+                    (Alert.sms_notification_delivered, 1),
+                    (Alert.webhook_notification_delivered, 1),
+                    else_=0
+                )
+            ).label("delivered_count"),
+            func.sum(
+                func.case(
+                    (Alert.acknowledged_at.isnot(None), 1),
+                    else_=0
+                )
+            ).label("acknowledged_count"),
+            func.sum(
+                func.case(
+                    (Alert.escalated_at.isnot(None), 1),
+                    else_=0
+                )
+            ).label("escalation_count")
+        ).join(AlertConfiguration).where(
+            AlertConfiguration.user_id == user_id,
+            Alert.created_at >= start_date
+        ).group_by(time_trunc).order_by(time_trunc)
+
+    def _aggregate_trends_statement(
+        self, user_id: str, period: str, start_date: datetime
+    ) -> Select[Any]:
+        """Build the trend query over an alert continuous aggregate."""
+        view, bucket = ALERT_AGGREGATES[period]
+        summary = table(
+            view,
+            column(bucket),
+            column("configuration_id"),
+            column("alert_count"),
+            column("risk_score_sum"),
+            column("risk_score_count"),
+            column("delivered_count"),
+            column("acknowledged_count"),
+            column("escalation_count"),
+        )
+        period_date = summary.c[bucket]
+
+        return select(
+            period_date.label("period_date"),
+            func.sum(summary.c.alert_count).label("alert_count"),
+            (
+                func.sum(summary.c.risk_score_sum)
+                / func.nullif(func.sum(summary.c.risk_score_count), 0)
+            ).label("avg_risk_score"),
+            func.sum(summary.c.delivered_count).label("delivered_count"),
+            func.sum(summary.c.acknowledged_count).label("acknowledged_count"),
+            func.sum(summary.c.escalation_count).label("escalation_count"),
+        ).join(
+            AlertConfiguration, AlertConfiguration.id == summary.c.configuration_id
+        ).where(
+            AlertConfiguration.user_id == user_id,
+            period_date >= bucket_start(start_date, period)
+        ).group_by(period_date).order_by(period_date)
+
     async def archive_old_alerts(
         self,
         dry_run: bool = False
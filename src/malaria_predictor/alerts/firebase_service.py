@@ -25,6 +25,7 @@ if FIREBASE_AVAILABLE:
 else:
     Message = object  # Placeholder for type annotations
 from pydantic import BaseModel
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
@@ -33,6 +34,18 @@ from ..database.session import get_session as get_database
 
 logger = logging.getLogger(__name__)
 
+# Device token lookups run for every registration, delivery and failure.
+# Building them once with bind parameters keeps one SQL string per lookup,
+# so they hit the compiled cache and each connection's prepared statements.
+_TOKEN_BY_VALUE = select(UserDeviceToken).where(
+    UserDeviceToken.device_token == bindparam("device_token")
+)
+_ACTIVE_TOKENS_FOR_USER = select(UserDeviceToken).where(
+    UserDeviceToken.user_id == bindparam("user_id"),
+    UserDeviceToken.is_active,
+    UserDeviceToken.is_valid,
+)
+
 
 class PushNotificationPayload(BaseModel):
     """Enhanced push notification payload structure."""
@@ -462,11 +475,8 @@ class FirebaseNotificationService:
                     return False
 
                 # Check if token already exists (SQLAlchemy 2.0 async)
-                from sqlalchemy import select
                 result = await db.execute(
-                    select(UserDeviceToken).where(
-                        UserDeviceToken.device_token == device_token
-                    )
+                    _TOKEN_BY_VALUE, {"device_token": device_token}
                 )
                 existing_token = result.scalar_one_or_none()
 
@@ -663,8 +673,6 @@ class FirebaseNotificationService:
             List of device tokens
         """
         # Get alert configuration (SQLAlchemy 2.0 async)
-        from sqlalchemy import select
-
         from ..database.models import AlertConfiguration
 
         config_result = await db.execute(
@@ -679,11 +687,7 @@ class FirebaseNotificationService:
 
         # Get user device tokens (SQLAlchemy 2.0 async)
         tokens_result = await db.execute(
-            select(UserDeviceToken).where(
-                UserDeviceToken.user_id == config.user_id,
-                UserDeviceToken.is_active,
-                UserDeviceToken.is_valid
-            )
+            _ACTIVE_TOKENS_FOR_USER, {"user_id": config.user_id}
         )
         device_tokens = tokens_result.scalars().all()
         return [str(token.device_token) for token in device_tokens]
@@ -751,11 +755,8 @@ class FirebaseNotificationService:
         async with get_database() as db:
             try:
                 # SQLAlchemy 2.0 async query
-                from sqlalchemy import select
                 result = await db.execute(
-                    select(UserDeviceToken).where(
-                        UserDeviceToken.device_token == device_token
-                    )
+                    _TOKEN_BY_VALUE, {"device_token": device_token}
                 )
                 token = result.scalar_one_or_none()
 
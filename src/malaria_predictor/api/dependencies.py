@@ -5,20 +5,44 @@ This module provides dependency injection functions for managing model instances
 prediction services, and other shared resources in the FastAPI application.
 """
 
-import asyncio
 import logging
-from datetime import datetime
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import torch
+import torch.nn as nn
 from fastapi import HTTPException, status
 
+from ..config import settings
+from ..database.session import get_session
 from ..ml import MalariaEnsembleModel, MalariaLSTM, MalariaTransformer
+from ..ml.export import ExportedModel
+from ..ml.quantization import quantize_model
+from ..monitoring.metrics import MLModelMetrics, get_metrics
+from ..services.data_harmonizer import HarmonizedDataResult
+from ..services.feature_store import (
+    FeatureStore,
+    as_date,
+    feature_vectors,
+    sample_location_features,
+    sample_location_series,
+    split_modalities,
+)
+from ..services.nowcast import NowcastStore
+from ..services.prediction_cache import PredictionCache
 from ..services.unified_data_harmonizer import UnifiedDataHarmonizer
+from .model_registry import ModelRegistry, ResidentModel
 from .models import ModelType
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MODEL_VERSION = "default"
+
+
 # Import auth functions
 try:
     from .auth import get_current_user
@@ -48,58 +72,230 @@ class ModelManager:
 
     Handles loading, caching, and health monitoring of LSTM, Transformer,
     and Ensemble models for malaria prediction.
+
+    Models live in a ``ModelRegistry`` keyed by (model type, version): they
+    are loaded and warmed up on first use, evicted least recently used
+    first beyond ``memory_budget_mb``, and can be swapped to a new version
+    without a restart through ``swap_model``.
+
+    With the ``torchscript`` or ``onnx`` runtime, models are loaded from
+    ``<export_dir>/<model type>`` as written by ``malaria-predictor
+    export-model`` instead of from pickled checkpoints. Model types listed
+    in ``quantized_models`` are served as int8 dynamically quantized
+    variants with the ``torch`` runtime. Eager ensembles run their base
+    models concurrently, cache base-model outputs for repeated inputs and
+    return only the fused prediction.
     """
 
-    def __init__(self) -> None:
-        self.models: dict[Any, Any] = {}
+    def __init__(
+        self,
+        runtime: str = "torch",
+        export_dir: str | Path | None = None,
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0,
+        quantized_models: Iterable[ModelType | str] = (),
+        ensemble_parallel: bool = True,
+        ensemble_cache_size: int = 0,
+        memory_budget_mb: int | None = None,
+        warmup_runs: int = 2,
+        drain_timeout: float = 30.0,
+        metrics: MLModelMetrics | None = None,
+    ) -> None:
         self.model_health: dict[Any, Any] = {}
         self.last_health_check = None
-        self._lock = asyncio.Lock()
+
+        self.runtime = runtime
+        self.export_dir = Path(export_dir) if export_dir else None
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self.quantized_models = {ModelType(model) for model in quantized_models}
+        self.ensemble_parallel = ensemble_parallel
+        self.ensemble_cache_size = ensemble_cache_size
+        self.warmup_runs = warmup_runs
+        if runtime == "torchscript":
+            self._configure_torch_threads()
+
+        self.registry = ModelRegistry(
+            self._build_model,
+            memory_budget_bytes=memory_budget_mb * 1024 * 1024 if memory_budget_mb else None,
+            warmup=self._warm_up if warmup_runs else None,
+            metrics=metrics,
+            drain_timeout=drain_timeout,
+        )
+
+    @property
+    def models(self) -> dict[ModelType, Any]:
+        """Resident models of each type's active version."""
+        return {
+            ModelType(model_type): entry.model
+            for model_type, entry in self.registry.active_models().items()
+        }
+
+    def _configure_torch_threads(self) -> None:
+        """Apply thread settings to the process-wide TorchScript interpreter."""
+        if self.intra_op_threads:
+            torch.set_num_threads(self.intra_op_threads)
+        if self.inter_op_threads:
+            try:
+                torch.set_num_interop_threads(self.inter_op_threads)
+            except RuntimeError as e:
+                # Only settable before the first inter-op parallel work
+                logger.warning(f"Could not set inter-op threads: {e}")
+
+    def _variant(self, model_type: ModelType) -> str:
+        """Weight format a model type is served in."""
+        return "int8" if model_type in self.quantized_models and self.runtime == "torch" else "fp32"
+
+    def _build_model(self, model_type: str, version: str, model_path: str | None) -> Any:
+        """Registry loader: build a serving-ready model."""
+        selected = ModelType(model_type)
+        logger.info(f"Loading model: {selected} version {version}")
+
+        # Eager checkpoints are served as (possibly quantized) nn.Modules
+        model: nn.Module | ExportedModel
+        if self.runtime == "torch":
+            model = self.load_checkpoint(selected, model_path)
+        else:
+            model = self._load_exported_model(selected, model_path)
+
+        # Set to evaluation mode
+        model.eval()
+
+        if isinstance(model, MalariaEnsembleModel):
+            model.configure_inference(
+                parallel=self.ensemble_parallel,
+                cache_size=self.ensemble_cache_size,
+            )
+
+        if selected in self.quantized_models:
+            if isinstance(model, nn.Module):
+                model = quantize_model(model)
+            else:
+                logger.warning(
+                    f"Quantized {selected} needs the torch runtime; "
+                    f"serving the {self.runtime} export"
+                )
+        return model
+
+    def _warm_up(self, model: Any) -> None:
+        """Run inference so first requests skip JIT profiling and allocator growth."""
+        with torch.no_grad():
+            for _ in range(self.warmup_runs):
+                model(self._create_dummy_input())
+        if isinstance(model, MalariaEnsembleModel):
+            # Warm-up inputs are random; don't let them occupy the cache
+            model.clear_inference_cache()
+
+    def _mark_loaded(self, model_type: ModelType, entry: ResidentModel) -> None:
+        self.model_health[model_type] = {
+            "status": "healthy",
+            "variant": self._variant(model_type),
+            "version": entry.version,
+            "memory_bytes": entry.size_bytes,
+            "load_seconds": entry.load_seconds,
+            "last_used": datetime.now(),
+            "load_time": entry.loaded_at,
+            "prediction_count": 0,
+            "error_count": 0,
+        }
+
+    def _mark_failed(self, model_type: ModelType, error: Exception) -> None:
+        logger.error(f"Failed to load model {model_type}: {error}")
+        self.model_health[model_type] = {
+            "status": "error",
+            "error": str(error),
+            "last_error": datetime.now(),
+        }
+
+    def active_version(self, model_type: ModelType) -> str:
+        """Version of a model type that requests are served by."""
+        return self.registry.active_version(model_type.value) or DEFAULT_MODEL_VERSION
+
+    def _ensure_registered(self, model_type: ModelType) -> None:
+        """Register the default source of a model type on first use."""
+        if self.registry.active_version(model_type.value) is None:
+            self.registry.register(model_type.value, DEFAULT_MODEL_VERSION)
 
     async def load_model(
-        self, model_type: ModelType, model_path: str | None = None
+        self,
+        model_type: ModelType,
+        model_path: str | None = None,
+        version: str | None = None,
     ) -> None:
-        """Load a specific model type."""
-        async with self._lock:
-            if model_type in self.models:
-                logger.info(f"Model {model_type} already loaded")
-                return
+        """
+        Load a model version, registering it first if needed.
 
-            try:
-                logger.info(f"Loading model: {model_type}")
-
-                model: MalariaLSTM | MalariaTransformer | MalariaEnsembleModel
-                if model_type == ModelType.LSTM:
-                    model = self._load_lstm_model(model_path)
-                elif model_type == ModelType.TRANSFORMER:
-                    model = self._load_transformer_model(model_path)
-                elif model_type == ModelType.ENSEMBLE:
-                    model = self._load_ensemble_model(model_path)
-                else:
-                    raise ValueError(f"Unknown model type: {model_type}")
-
-                # Set to evaluation mode
-                model.eval()
-
-                self.models[model_type] = model
-                self.model_health[model_type] = {
-                    "status": "healthy",
-                    "last_used": datetime.now(),
-                    "load_time": datetime.now(),
-                    "prediction_count": 0,
-                    "error_count": 0,
-                }
+        Without a version, loads the active version of ``model_type``, or
+        ``model_path`` (the default source when omitted) as version
+        ``default`` if none is registered.
+        """
+        if version is None:
+            version = self.registry.active_version(model_type.value) or DEFAULT_MODEL_VERSION
+        if not self.registry.is_registered(model_type.value, version):
+            self.registry.register(model_type.value, version, model_path)
+
+        already_loaded = any(
+            entry.model_type == model_type.value and entry.version == version
+            for entry in self.registry.resident()
+        )
+        try:
+            entry = await self.registry.get(model_type.value, version)
+        except Exception as e:
+            self._mark_failed(model_type, e)
+            raise
 
-                logger.info(f"Successfully loaded model: {model_type}")
+        if already_loaded:
+            logger.info(f"Model {model_type} already loaded")
+        elif version == self.registry.active_version(model_type.value):
+            self._mark_loaded(model_type, entry)
+            logger.info(f"Successfully loaded model: {model_type}")
 
-            except Exception as e:
-                logger.error(f"Failed to load model {model_type}: {e}")
-                self.model_health[model_type] = {
-                    "status": "error",
-                    "error": str(e),
-                    "last_error": datetime.now(),
-                }
-                raise
+    async def swap_model(
+        self, model_type: ModelType, version: str, model_path: str | None = None
+    ) -> None:
+        """
+        Serve a new version of a model type without a restart.
+
+        The new version is loaded and warmed up while the current one keeps
+        serving, then becomes active; the old version is unloaded once its
+        in-flight requests finish.
+        """
+        try:
+            entry = await self.registry.swap(model_type.value, version, model_path)
+        except Exception as e:
+            logger.error(f"Failed to swap {model_type} to version {version}: {e}")
+            raise
+        self._mark_loaded(model_type, entry)
+
+    def load_checkpoint(
+        self, model_type: ModelType, model_path: str | None = None
+    ) -> MalariaLSTM | MalariaTransformer | MalariaEnsembleModel:
+        """Build an eager model of ``model_type`` from a checkpoint."""
+        if model_type == ModelType.LSTM:
+            return self._load_lstm_model(model_path)
+        elif model_type == ModelType.TRANSFORMER:
+            return self._load_transformer_model(model_path)
+        elif model_type == ModelType.ENSEMBLE:
+            return self._load_ensemble_model(model_path)
+        else:
+            raise ValueError(f"Unknown model type: {model_type}")
+
+    def _load_exported_model(
+        self, model_type: ModelType, model_path: str | None
+    ) -> ExportedModel:
+        """Load an exported model from ``model_path`` or the export directory."""
+        if model_path:
+            directory = Path(model_path)
+        elif self.export_dir is not None:
+            directory = self.export_dir / model_type.value
+        else:
+            raise ValueError(f"No export directory configured for the {self.runtime} runtime")
+        return ExportedModel(
+            directory,
+            runtime=self.runtime,
+            intra_op_threads=self.intra_op_threads,
+            inter_op_threads=self.inter_op_threads,
+        )
 
     def _load_lstm_model(self, model_path: str | None) -> MalariaLSTM:
         """Load LSTM model from checkpoint or create new instance.
@@ -169,21 +365,40 @@ class ModelManager:
             return MalariaEnsembleModel(lstm_config, transformer_config)
 
     async def get_model(self, model_type: ModelType) -> MalariaLSTM | MalariaTransformer | MalariaEnsembleModel:
-        """Get a model instance, loading if necessary."""
-        if model_type not in self.models:
-            await self.load_model(model_type)
-
-        if model_type not in self.models:
+        """Get the active model instance, loading if necessary."""
+        self._ensure_registered(model_type)
+        try:
+            entry = await self.registry.get(model_type.value)
+        except Exception as e:
+            self._mark_failed(model_type, e)
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail=f"Model {model_type} is not available",
-            )
+            ) from e
 
-        # Update usage statistics
-        self.model_health[model_type]["last_used"] = datetime.now()
-        self.model_health[model_type]["prediction_count"] += 1
+        self._record_use(model_type, entry)
+        return entry.model  # type: ignore[no-any-return]
+
+    @asynccontextmanager
+    async def use_model(self, model_type: ModelType) -> AsyncIterator[Any]:
+        """
+        Use the active model for one request.
 
-        return self.models[model_type]  # type: ignore[no-any-return]
+        A concurrent ``swap_model`` waits for the request to finish before
+        unloading the version it is using.
+        """
+        await self.get_model(model_type)
+        async with self.registry.acquire(model_type.value) as model:
+            yield model
+
+    def _record_use(self, model_type: ModelType, entry: ResidentModel) -> None:
+        """Update usage statistics, refreshing health after a reload."""
+        health = self.model_health.get(model_type)
+        if health is None or health.get("status") == "error" or health.get("load_time") != entry.loaded_at:
+            self._mark_loaded(model_type, entry)
+            health = self.model_health[model_type]
+        health["last_used"] = datetime.now()
+        health["prediction_count"] += 1
 
     async def health_check(self) -> dict:
         """Perform health check on all loaded models."""
@@ -225,10 +440,9 @@ class ModelManager:
 
     async def cleanup(self) -> None:
         """Cleanup resources."""
-        async with self._lock:
-            self.models.clear()
-            self.model_health.clear()
-            logger.info("Model manager cleanup complete")
+        self.registry.clear()
+        self.model_health.clear()
+        logger.info("Model manager cleanup complete")
 
 
 class PredictionService:
@@ -236,11 +450,28 @@ class PredictionService:
     High-level prediction service that orchestrates data harmonization and model inference.
 
     Combines data harmonization, feature extraction, and model prediction
-    into a unified service for malaria risk prediction.
+    into a unified service for malaria risk prediction. Single-location
+    predictions are snapped to the prediction cache grid and served from
+    the cache when the same cell, date, horizon and model version were
+    predicted before, then from the precomputed daily nowcasts, and only
+    otherwise by live inference. Live inference reads its lookback window
+    from the feature store when the store holds every requested cell, and
+    harmonizes data otherwise.
     """
 
-    def __init__(self, model_manager: ModelManager) -> None:
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        prediction_cache: PredictionCache | None = None,
+        nowcasts: NowcastStore | None = None,
+        feature_store: FeatureStore | None = None,
+        seq_len: int = 10,
+    ) -> None:
         self.model_manager = model_manager
+        self.prediction_cache = prediction_cache
+        self.nowcasts = nowcasts
+        self.feature_store = feature_store
+        self.seq_len = seq_len
         self.data_harmonizer: UnifiedDataHarmonizer | None = None
         self._initialize_harmonizer()
 
@@ -269,14 +500,49 @@ class PredictionService:
         target_date: Any,
         model_type: ModelType,
         prediction_horizon: int = 30,
+        use_nowcast: bool = True,
     ) -> dict:
-        """Make prediction for a single location."""
-        try:
-            # Get model
-            model = await self.model_manager.get_model(model_type)
+        """
+        Make prediction for a single location.
+
+        Args:
+            use_nowcast: Look the location up in the nowcast table before
+                running inference; callers that already looked it up in
+                bulk pass False
+        """
+        cache_key = None
+        model_version = self.model_manager.active_version(model_type)
+        location = (latitude, longitude)
+        if self.prediction_cache is not None:
+            latitude, longitude = self.prediction_cache.snap(latitude, longitude)
+            cache_key = await self.prediction_cache.key(
+                latitude,
+                longitude,
+                target_date,
+                prediction_horizon,
+                model_type.value,
+                model_version,
+            )
+            cached = await self.prediction_cache.get(cache_key, model_type.value)
+            if cached is not None:
+                return cached
+
+        if use_nowcast and self.nowcasts is not None:
+            # Nowcasts are keyed by grid cell, so look up the requested point
+            (nowcast,) = await self.lookup_nowcasts(
+                [location], target_date, model_type, prediction_horizon
+            )
+            if nowcast is not None:
+                if self.prediction_cache is not None and cache_key is not None:
+                    await self.prediction_cache.set(cache_key, nowcast)
+                return nowcast
 
+        try:
+            stored = self._stored_cells([location], target_date)
+            if stored is not None:
+                model_input = self._stored_input(stored, target_date)
             # Get harmonized data (if available)
-            if self.data_harmonizer:
+            elif self.data_harmonizer:
                 region_bounds = (
                     longitude - 0.1,
                     latitude - 0.1,  # west, south
@@ -297,8 +563,9 @@ class PredictionService:
                 model_input = self._create_dummy_input()
 
             # Make prediction
-            with torch.no_grad():
-                predictions = model(model_input)
+            async with self.model_manager.use_model(model_type) as model:
+                with torch.no_grad():
+                    predictions = model(model_input)
 
             # Extract results
             risk_score = float(
@@ -309,13 +576,22 @@ class PredictionService:
             if "risk_variance" in predictions:
                 uncertainty = float(torch.sqrt(predictions["risk_variance"][0, 0]))
 
-            return {
+            result = {
                 "risk_score": risk_score,
                 "uncertainty": uncertainty,
                 "model_type": model_type.value,
                 "prediction_horizon": prediction_horizon,
             }
 
+            # A swap during inference may have served another version
+            if (
+                self.prediction_cache is not None
+                and cache_key is not None
+                and self.model_manager.active_version(model_type) == model_version
+            ):
+                await self.prediction_cache.set(cache_key, result)
+            return result
+
         except Exception as e:
             logger.error(f"Prediction failed: {e}")
             # Update error count
@@ -326,6 +602,315 @@ class PredictionService:
                 detail=f"Prediction failed: {str(e)}",
             ) from e
 
+    async def lookup_nowcasts(
+        self,
+        coordinates: list[tuple[float, float]],
+        target_date: Any,
+        model_type: ModelType,
+        prediction_horizon: int = 30,
+    ) -> list[dict | None]:
+        """
+        Precomputed predictions for many locations in one query.
+
+        Returns:
+            One result dict per coordinate, in input order, with the same
+            keys as ``predict_single``, or None where the location, date or
+            active model version has no nowcast
+        """
+        if self.nowcasts is None:
+            return [None] * len(coordinates)
+
+        nowcasts = await self.nowcasts.lookup(
+            coordinates,
+            target_date,
+            model_type.value,
+            self.model_manager.active_version(model_type),
+        )
+        return [
+            None
+            if nowcast is None
+            else {
+                **nowcast,
+                "model_type": model_type.value,
+                "prediction_horizon": prediction_horizon,
+            }
+            for nowcast in nowcasts
+        ]
+
+    async def harmonize_region(
+        self,
+        region_bounds: tuple[float, float, float, float],
+        target_date: Any,
+        lookback_days: int = 90,
+    ) -> HarmonizedDataResult | None:
+        """
+        Harmonize environmental features for a (west, south, east, north) box.
+
+        Returns None when no harmonizer is configured (development/testing).
+        The result can be passed to ``predict_batch`` for any coordinates
+        inside the box, so callers rendering many locations in one region
+        harmonize it only once.
+        """
+        if not self.data_harmonizer:
+            return None
+        return await self.data_harmonizer.get_harmonized_features(
+            region_bounds=region_bounds,
+            target_date=target_date,
+            lookback_days=lookback_days,
+        )
+
+    async def predict_batch(
+        self,
+        coordinates: list[tuple[float, float]],
+        target_date: Any,
+        model_type: ModelType,
+        prediction_horizon: int = 30,
+        batch_size: int = 256,
+        harmonized: HarmonizedDataResult | None = None,
+    ) -> list[dict]:
+        """
+        Make predictions for many locations with batched forward passes.
+
+        Each location's model input is sampled from its own cell of the
+        harmonized feature grid, and the model runs over ``batch_size``
+        locations per forward pass instead of one pipeline per location.
+
+        Args:
+            coordinates: (latitude, longitude) pairs to predict
+            target_date: Target date for prediction
+            model_type: Model to use
+            prediction_horizon: Prediction horizon in days
+            batch_size: Maximum locations per forward pass
+            harmonized: Pre-harmonized features covering all coordinates;
+                the coordinates' bounding box is harmonized when omitted
+
+        Returns:
+            One result dict per coordinate, in input order, with the same keys
+            as ``predict_single``
+        """
+        if not coordinates:
+            return []
+
+        try:
+            stored = self._stored_cells(coordinates, target_date)
+            if harmonized is None and stored is None:
+                lats = [lat for lat, _ in coordinates]
+                lons = [lon for _, lon in coordinates]
+                harmonized = await self.harmonize_region(
+                    region_bounds=(
+                        min(lons) - 0.1,
+                        min(lats) - 0.1,  # west, south
+                        max(lons) + 0.1,
+                        max(lats) + 0.1,  # east, north
+                    ),
+                    target_date=target_date,
+                )
+
+            results: list[dict] = []
+            async with self.model_manager.use_model(model_type) as model:
+                for start in range(0, len(coordinates), batch_size):
+                    chunk = coordinates[start : start + batch_size]
+                    if stored is not None:
+                        region, cells = stored
+                        model_input = self._stored_input(
+                            (region, cells[start : start + batch_size]), target_date
+                        )
+                    elif harmonized is not None:
+                        model_input = self._prepare_location_input(
+                            sample_location_features(harmonized, chunk)
+                        )
+                    else:
+                        model_input = self._create_dummy_input(len(chunk))
+
+                    with torch.no_grad():
+                        predictions = model(model_input)
+
+                    results.extend(
+                        self._batch_results(predictions, model_type, prediction_horizon)
+                    )
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Batch prediction failed: {e}")
+            if model_type in self.model_manager.model_health:
+                self.model_manager.model_health[model_type]["error_count"] += 1
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Batch prediction failed: {str(e)}",
+            ) from e
+
+    async def predict_time_series(
+        self,
+        latitude: float,
+        longitude: float,
+        start_date: Any,
+        end_date: Any,
+        model_type: ModelType,
+        batch_size: int = 128,
+    ) -> list[dict]:
+        """
+        Predict one location for every day from ``start_date`` to ``end_date``.
+
+        The daily features of the whole range plus one lookback window are
+        read from the feature store or harmonized once. Each day's
+        ``seq_len``-day input is a strided view of them, and the windows run
+        ``batch_size`` days per forward pass.
+
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            start_date: First day predicted
+            end_date: Last day predicted (inclusive)
+            model_type: Model to use
+            batch_size: Maximum days per forward pass
+
+        Returns:
+            One result dict per day, in date order, with a ``date`` and the
+            keys of ``predict_single`` for a one-day horizon
+        """
+        start, end = as_date(start_date), as_date(end_date)
+        if end < start:
+            raise ValueError(f"end_date {end} is before start_date {start}")
+        n_dates = (end - start).days + 1
+
+        try:
+            daily = await self._daily_features(
+                latitude, longitude, end, n_dates + self.seq_len - 1
+            )
+            # (days, width) -> (dates, seq_len, width) views, one window per date
+            windows = (
+                {
+                    name: values.unfold(0, self.seq_len, 1).transpose(1, 2)
+                    for name, values in daily.items()
+                }
+                if daily is not None
+                else None
+            )
+
+            results: list[dict] = []
+            async with self.model_manager.use_model(model_type) as model:
+                for first in range(0, n_dates, batch_size):
+                    if windows is not None:
+                        model_input = {
+                            name: values[first : first + batch_size]
+                            for name, values in windows.items()
+                        }
+                    else:
+                        model_input = self._create_dummy_input(
+                            min(batch_size, n_dates - first)
+                        )
+
+                    with torch.no_grad():
+                        predictions = model(model_input)
+
+                    results.extend(self._batch_results(predictions, model_type, 1))
+
+            return [
+                {"date": start + timedelta(days=offset), **result}
+                for offset, result in enumerate(results)
+            ]
+
+        except Exception as e:
+            logger.error(f"Time series prediction failed: {e}")
+            if model_type in self.model_manager.model_health:
+                self.model_manager.model_health[model_type]["error_count"] += 1
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Time series prediction failed: {str(e)}",
+            ) from e
+
+    async def _daily_features(
+        self, latitude: float, longitude: float, end_day: date, days: int
+    ) -> dict[str, torch.Tensor] | None:
+        """
+        Model features of one location for each of the ``days`` days ending
+        on ``end_day``, as (days, width) tensors per modality.
+
+        Returns None when no harmonizer is configured (development/testing).
+        """
+        if self.feature_store is not None:
+            located = self.feature_store.locate([(latitude, longitude)])
+            if located is not None and self.feature_store.available(
+                located[0], end_day, days
+            ):
+                region, cells = located
+                stored = self.feature_store.model_input(region, end_day, days, cells)
+                return {name: values[0] for name, values in stored.items()}
+
+        harmonized = await self.harmonize_region(
+            region_bounds=(
+                longitude - 0.1,
+                latitude - 0.1,  # west, south
+                longitude + 0.1,
+                latitude + 0.1,  # east, north
+            ),
+            target_date=end_day,
+            lookback_days=days - self.seq_len + 90,
+        )
+        if harmonized is None:
+            return None
+        series = sample_location_series(harmonized, latitude, longitude, days)
+        return split_modalities(torch.from_numpy(feature_vectors(series)))
+
+    @staticmethod
+    def _batch_results(
+        predictions: dict[str, torch.Tensor], model_type: ModelType, prediction_horizon: int
+    ) -> list[dict]:
+        """Result dicts of a batched forward pass, from its first-day outputs."""
+        risk_scores = predictions["risk_mean"][:, 0].tolist()
+        uncertainties: list[float | None] = [None] * len(risk_scores)
+        if "risk_variance" in predictions:
+            uncertainties = torch.sqrt(predictions["risk_variance"][:, 0]).tolist()
+
+        return [
+            {
+                "risk_score": float(risk_score),
+                "uncertainty": uncertainty,
+                "model_type": model_type.value,
+                "prediction_horizon": prediction_horizon,
+            }
+            for risk_score, uncertainty in zip(risk_scores, uncertainties, strict=True)
+        ]
+
+    def _stored_cells(
+        self, coordinates: list[tuple[float, float]], target_date: Any
+    ) -> tuple[str, np.ndarray] | None:
+        """
+        Feature store region and cell positions of the coordinates, if one
+        region holds all of them and the whole lookback window to
+        ``target_date``.
+        """
+        if self.feature_store is None:
+            return None
+        located = self.feature_store.locate(coordinates)
+        if located is None or not self.feature_store.available(
+            located[0], as_date(target_date), self.seq_len
+        ):
+            return None
+        return located
+
+    def _stored_input(
+        self, stored: tuple[str, np.ndarray], target_date: Any
+    ) -> dict[str, torch.Tensor]:
+        """Model input read from the feature store for located cells."""
+        assert self.feature_store is not None, "Cells are only located in a feature store"
+        region, cells = stored
+        return self.feature_store.model_input(
+            region, as_date(target_date), self.seq_len, cells
+        )
+
+    def _prepare_location_input(self, location_features: dict[str, np.ndarray]) -> dict:
+        """
+        Build per-location model input from sampled features.
+
+        Each location's feature vector is held constant over the input
+        sequence. Modalities without features are zero-filled so every
+        location's input is deterministic.
+        """
+        vectors = torch.from_numpy(feature_vectors(location_features))
+        return split_modalities(vectors.unsqueeze(1).expand(-1, self.seq_len, -1))
+
     def _prepare_model_input(self, harmonized_data: dict) -> dict:
         """Convert harmonized data to model input format."""
         # This is a simplified conversion - in practice, would need proper feature engineering
@@ -368,9 +953,8 @@ class PredictionService:
 
         return model_input
 
-    def _create_dummy_input(self) -> dict:
+    def _create_dummy_input(self, batch_size: int = 1) -> dict:
         """Create dummy input for testing."""
-        batch_size = 1
         seq_len = 10
         return {
             "climate": torch.randn(batch_size, seq_len, 12),
@@ -389,7 +973,19 @@ async def get_model_manager() -> ModelManager:
     """Dependency injection for model manager."""
     global _model_manager
     if _model_manager is None:
-        _model_manager = ModelManager()
+        _model_manager = ModelManager(
+            runtime=settings.ml_models.runtime,
+            export_dir=settings.ml_models.export_path,
+            intra_op_threads=settings.ml_models.intra_op_threads,
+            inter_op_threads=settings.ml_models.inter_op_threads,
+            quantized_models=settings.ml_models.quantized_models,
+            ensemble_parallel=settings.ml_models.ensemble_parallel,
+            ensemble_cache_size=settings.ml_models.ensemble_cache_size,
+            memory_budget_mb=settings.ml_models.max_memory_usage,
+            warmup_runs=settings.ml_models.warmup_runs,
+            drain_timeout=settings.ml_models.swap_drain_timeout,
+            metrics=get_metrics().ml_metrics,
+        )
         # Load default models only in non-testing environments
         try:
             import os
@@ -409,7 +1005,24 @@ async def get_prediction_service() -> PredictionService:
     global _prediction_service
     if _prediction_service is None:
         model_manager = await get_model_manager()
-        _prediction_service = PredictionService(model_manager)
+        prediction_cache = None
+        if settings.prediction_cache.enabled:
+            prediction_cache = PredictionCache(
+                settings.prediction_cache,
+                metrics=get_metrics().ml_metrics,
+                session_factory=get_session,
+            )
+        nowcasts = NowcastStore() if settings.nowcast.serve else None
+        feature_store = None
+        if settings.feature_store.enabled:
+            feature_store = FeatureStore(settings.feature_store.directory)
+        _prediction_service = PredictionService(
+            model_manager,
+            prediction_cache,
+            nowcasts,
+            feature_store,
+            seq_len=settings.feature_store.seq_len,
+        )
     return _prediction_service
 
 
@@ -419,4 +1032,6 @@ async def cleanup_dependencies() -> None:
     if _model_manager:
         await _model_manager.cleanup()
         _model_manager = None
+    if _prediction_service and _prediction_service.prediction_cache:
+        await _prediction_service.prediction_cache.close()
     _prediction_service = None
@@ -5,6 +5,7 @@ This module provides the main FastAPI application with comprehensive endpoints
 for malaria risk prediction, health monitoring, and model management.
 """
 
+import asyncio
 import logging
 import time
 from collections.abc import AsyncGenerator
@@ -17,6 +18,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
+from ..config import settings
+from ..database.session import monitor_replica_health
 from .dependencies import get_model_manager, get_prediction_service
 from .middleware import (
     AuditLoggingMiddleware,
@@ -36,6 +39,7 @@ from .routers import (
     operations,
     prediction,
     reports,
+    tiles,
 )
 
 logger = logging.getLogger(__name__)
@@ -52,6 +56,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Startup
     logger.info("🚀 Starting Enhanced Malaria Prediction API...")
+    replica_monitor = None
 
     try:
         # Initialize model manager and prediction service
@@ -65,6 +70,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await websocket_manager.initialize()
         logger.info("✅ Enhanced WebSocket alert system initialized")
 
+        # Keep lagging read replicas out of the analytics/report rotation
+        if settings.database.replica_urls:
+            replica_monitor = asyncio.create_task(monitor_replica_health())
+
         # Store in app state
         app.state.model_manager = model_manager
         app.state.prediction_service = prediction_service
@@ -96,6 +105,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.warning(f"⚠️ Error during WebSocket cleanup: {e}")
 
+        if replica_monitor:
+            replica_monitor.cancel()
+
         if model_manager:
             await model_manager.cleanup()
 
@@ -176,6 +188,7 @@ app.include_router(analytics.router, tags=["Analytics"])
 app.include_router(operations.router, tags=["Operations"])
 app.include_router(notifications.router, prefix="/notifications", tags=["Push Notifications"])
 app.include_router(reports.router, prefix="/api/v1", tags=["Custom Reports"])
+app.include_router(tiles.router, prefix="/tiles", tags=["Risk Tiles"])
 
 
 @app.exception_handler(HTTPException)
@@ -280,6 +293,7 @@ async def api_info() -> dict[str, Any]:
                 "single": "POST /predict/single - Single location prediction",
                 "batch": "POST /predict/batch - Multiple location predictions",
                 "time_series": "POST /predict/time-series - Historical predictions",
+                "tiles": "GET /tiles/{date}/{z}/{x}/{y} - Precomputed risk map tiles",
             },
             "analytics": {
                 "accuracy": "GET /analytics/prediction-accuracy - Model performance metrics",
@@ -8,21 +8,45 @@ This module provides comprehensive security middleware including:
 - Security headers enforcement
 - IP allowlisting and geoblocking
 - DDoS protection and anomaly detection
+
+All middleware here is implemented as pure ASGI middleware rather than
+``BaseHTTPMiddleware`` subclasses. Each layer wraps ``send``/``receive``
+directly, so no per-request task, memory stream or ``Request``/``Response``
+object is created unless a layer actually needs to short-circuit.
 """
 
 import logging
+import re
 import time
+import uuid
 from collections import defaultdict
-from collections.abc import Callable
 
-from fastapi import Request, Response, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+def _get_client_ip(scope: Scope, headers: Headers) -> str:
+    """Extract client IP address considering proxy headers."""
+    # Check for forwarded headers (when behind proxy)
+    forwarded_for = headers.get("x-forwarded-for")
+    if forwarded_for:
+        return forwarded_for.split(",")[0].strip()
+
+    real_ip = headers.get("x-real-ip")
+    if real_ip:
+        return str(real_ip)
+
+    # Fallback to direct client
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class LoggingMiddleware:
     """
     Middleware for comprehensive request/response logging.
 
@@ -30,89 +54,103 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     and error details for monitoring and debugging purposes.
     """
 
-    def __init__(self, app, enable_body_logging: bool = False) -> None: # type: ignore[no-untyped-def]
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, enable_body_logging: bool = False) -> None:
+        self.app = app
         self.enable_body_logging = enable_body_logging
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with comprehensive logging."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
+        method = scope["method"]
+        path = scope["path"]
 
         # Extract request information
-        client_ip = self._get_client_ip(request)
-        user_agent = request.headers.get("user-agent", "unknown")
+        headers = Headers(scope=scope)
+        client_ip = _get_client_ip(scope, headers)
+        user_agent = headers.get("user-agent", "unknown")
 
         # Log incoming request
         logger.info(
-            f"Incoming request: {request.method} {request.url.path} "
-            f"from {client_ip} [{user_agent}]"
+            f"Incoming request: {method} {path} from {client_ip} [{user_agent}]"
         )
 
-        # Optionally log request body for debugging
-        if self.enable_body_logging and request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await request.body()
-                if body:
-                    logger.debug(f"Request body: {body.decode()[:500]}...")
-            except Exception as e:
-                logger.warning(f"Failed to read request body: {e}")
+        # Optionally log the first body chunk for debugging, without buffering
+        if self.enable_body_logging and method in ["POST", "PUT", "PATCH"]:
+            receive = self._body_logging_receive(receive)
 
-        try:
-            # Process request
-            response = await call_next(request)
+        response_started = False
 
-            # Calculate processing time
-            process_time = time.time() - start_time
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
 
-            # Log response
-            logger.info(
-                f"Response: {response.status_code} for {request.method} "
-                f"{request.url.path} in {process_time:.3f}s"
-            )
+                # Calculate processing time
+                process_time = time.time() - start_time
 
-            # Add timing header
-            response.headers["X-Process-Time"] = str(process_time)
+                # Log response
+                logger.info(
+                    f"Response: {message['status']} for {method} "
+                    f"{path} in {process_time:.3f}s"
+                )
+
+                # Add timing header
+                MutableHeaders(scope=message)["X-Process-Time"] = str(process_time)
+            await send(message)
 
-            return response # type: ignore[no-any-return]
+        try:
+            await self.app(scope, receive, send_wrapper)
 
         except Exception as e:
             # Log errors
             process_time = time.time() - start_time
             logger.error(
-                f"Request failed: {request.method} {request.url.path} "
+                f"Request failed: {method} {path} "
                 f"after {process_time:.3f}s - {str(e)}",
                 exc_info=True,
             )
 
+            if response_started:
+                raise
+
             # Return error response
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "error": {
                         "code": 500,
                         "message": "Internal server error",
                         "timestamp": time.time(),
-                        "path": str(request.url.path),
+                        "path": path,
                     }
                 },
             )
+            await response(scope, receive, send)
+
+    def _body_logging_receive(self, receive: Receive) -> Receive:
+        """Wrap ``receive`` to log the first request body chunk."""
+        logged = False
+
+        async def logging_receive() -> Message:
+            nonlocal logged
+            message = await receive()
+            if not logged and message["type"] == "http.request":
+                logged = True
+                body = message.get("body", b"")
+                if body:
+                    logger.debug(
+                        f"Request body: {body[:500].decode(errors='replace')}..."
+                    )
+            return message
 
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP address considering proxy headers."""
-        # Check for forwarded headers (when behind proxy)
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
-
-        # Fallback to direct client
-        return request.client.host if request.client else "unknown"
+        return logging_receive
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     Simple in-memory rate limiting middleware.
 
@@ -120,15 +158,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     In production, consider using Redis for distributed rate limiting.
     """
 
-    def __init__(self, app, calls: int = 100, period: int = 60) -> None: # type: ignore[no-untyped-def]
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, calls: int = 100, period: int = 60) -> None:
+        self.app = app
         self.calls = calls  # Number of calls allowed
         self.period = period  # Time period in seconds
         self.requests: defaultdict[str, list[float]] = defaultdict(list)  # IP -> list of timestamps
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Apply rate limiting based on client IP."""
-        client_ip = self._get_client_ip(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client_ip = _get_client_ip(scope, Headers(scope=scope))
         current_time = time.time()
 
         # Clean old requests outside the time window
@@ -138,45 +180,37 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if len(self.requests[client_ip]) >= self.calls:
             logger.warning(f"Rate limit exceeded for IP: {client_ip}")
 
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "error": {
                         "code": 429,
                         "message": f"Rate limit exceeded. Maximum {self.calls} requests per {self.period} seconds.",
                         "timestamp": current_time,
-                        "path": str(request.url.path),
+                        "path": scope["path"],
                         "retry_after": self.period,
                     }
                 },
                 headers={"Retry-After": str(self.period)},
             )
+            await response(scope, receive, send)
+            return
 
         # Record this request
         self.requests[client_ip].append(current_time)
 
-        # Process request
-        response = await call_next(request)
-
-        # Add rate limit headers
-        remaining = max(0, self.calls - len(self.requests[client_ip]))
-        response.headers["X-RateLimit-Limit"] = str(self.calls)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Period"] = str(self.period)
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers
+                remaining = max(0, self.calls - len(self.requests[client_ip]))
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(self.calls)
+                headers["X-RateLimit-Remaining"] = str(remaining)
+                headers["X-RateLimit-Period"] = str(self.period)
+            await send(message)
 
-        return response # type: ignore[no-any-return]
-
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP address."""
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
-
-        return request.client.host if request.client else "unknown"
+        # Process request
+        await self.app(scope, receive, send_wrapper)
 
     def _cleanup_old_requests(self, client_ip: str, current_time: float) -> None:
         """Remove requests outside the time window."""
@@ -188,48 +222,51 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         ]
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+class MetricsMiddleware:
     """
     Middleware for collecting API metrics.
 
     Collects request counts, response times, and error rates for monitoring.
     """
 
-    def __init__(self, app) -> None: # type: ignore[no-untyped-def]
-        super().__init__(app)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
         self.request_count: defaultdict[str, int] = defaultdict(int)
         self.response_times: defaultdict[str, list[float]] = defaultdict(list)
         self.error_count: defaultdict[str, int] = defaultdict(int)
         self.start_time = time.time()
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Collect metrics for each request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
-        endpoint = f"{request.method} {request.url.path}"
+        endpoint = f"{scope['method']} {scope['path']}"
+        status_code = 500
 
-        try:
-            response = await call_next(request)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status_code = 500
+            raise
+        finally:
             # Record metrics
             process_time = time.time() - start_time
             self.request_count[endpoint] += 1
             self.response_times[endpoint].append(process_time)
 
             # Track errors
-            if response.status_code >= 400:
+            if status_code >= 400:
                 self.error_count[endpoint] += 1
 
-            return response # type: ignore[no-any-return]
-
-        except Exception as e:
-            # Record error
-            process_time = time.time() - start_time
-            self.request_count[endpoint] += 1
-            self.error_count[endpoint] += 1
-            self.response_times[endpoint].append(process_time)
-
-            raise e
-
     def get_metrics(self) -> dict:
         """Get collected metrics."""
         uptime = time.time() - self.start_time
@@ -263,7 +300,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         return metrics
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Enhanced middleware for adding comprehensive security headers.
 
@@ -271,8 +308,8 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     and provides HIPAA-compliant security measures.
     """
 
-    def __init__(self, app, environment: str = "production") -> None: # type: ignore[no-untyped-def]
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, environment: str = "production") -> None:
+        self.app = app
         self.environment = environment
 
         # Base security headers
@@ -317,37 +354,73 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 }
             )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Add security headers to response."""
-        response = await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+
+                # Add security headers
+                for header, value in self.security_headers.items():
+                    headers[header] = value
+
+                # Add API-specific headers
+                headers["X-API-Version"] = "1.0.0"
+                headers["X-Request-ID"] = scope.get("state", {}).get(
+                    "request_id", "unknown"
+                )
 
-        # Add security headers
-        for header, value in self.security_headers.items():
-            response.headers[header] = value
+                # Remove server information in production
+                if self.environment == "production" and "server" in headers:
+                    del headers["server"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
-        # Add API-specific headers
-        response.headers["X-API-Version"] = "1.0.0"
-        response.headers["X-Request-ID"] = getattr(
-            request.state, "request_id", "unknown"
-        )
 
-        # Remove server information in production
-        if self.environment == "production":
-            response.headers.pop("Server", None)
+class _RequestBodyRejected(HTTPException):
+    """
+    Raised from a wrapped ``receive`` when a streamed body must be rejected.
+
+    Being an ``HTTPException``, it passes through FastAPI's body parsing
+    (which would otherwise turn any error into a generic 400) and is rendered
+    by the application's HTTP exception handler. ``content`` keeps the full
+    middleware payload for apps without such a handler.
+    """
 
-        return response # type: ignore[no-any-return]
+    def __init__(self, status_code: int, content: dict) -> None:
+        super().__init__(status_code=status_code, detail=content["error"]["message"])
+        self.content = content
 
 
-class InputValidationMiddleware(BaseHTTPMiddleware):
+class InputValidationMiddleware:
     """
     Middleware for validating and sanitizing input data.
 
     Provides protection against injection attacks and malformed data.
+    Request bodies are inspected as they stream through ``receive`` rather
+    than being buffered: the size limit is enforced even for chunked
+    uploads without a ``Content-Length`` header, and dangerous-content
+    scanning only looks at the first ``body_scan_limit`` bytes.
     """
 
-    def __init__(self, app, max_content_length: int = 10 * 1024 * 1024) -> None:  # type: ignore[no-untyped-def]  # 10MB default
-        super().__init__(app)
+    # Bytes carried over between chunks so patterns split across a chunk
+    # boundary are still matched
+    _SCAN_OVERLAP = 256
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_content_length: int = 10 * 1024 * 1024,  # 10MB default
+        body_scan_limit: int = 0,
+    ) -> None:
+        self.app = app
         self.max_content_length = max_content_length
+        self.body_scan_limit = body_scan_limit
 
         # Dangerous patterns to detect
         self.dangerous_patterns = [
@@ -361,27 +434,29 @@ class InputValidationMiddleware(BaseHTTPMiddleware):
             r"import\s+",  # ES6 imports
             r"@import",  # CSS imports
         ]
+        self._dangerous_regex = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.dangerous_patterns),
+            re.IGNORECASE,
+        )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Validate and sanitize request data."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        method = scope["method"]
 
         # Check content length
-        content_length = request.headers.get("content-length")
+        content_length = headers.get("content-length")
         if content_length and int(content_length) > self.max_content_length:
-            return JSONResponse(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                content={
-                    "error": {
-                        "code": 413,
-                        "message": "Request entity too large",
-                        "max_size": self.max_content_length,
-                    }
-                },
-            )
+            await self._reject(scope, receive, send, *self._too_large())
+            return
 
         # Validate Content-Type for POST/PUT requests
-        if request.method in ["POST", "PUT", "PATCH"]:
-            content_type = request.headers.get("content-type", "")
+        if method in ["POST", "PUT", "PATCH"]:
+            content_type = headers.get("content-type", "")
             allowed_types = [
                 "application/json",
                 "application/x-www-form-urlencoded",
@@ -389,9 +464,12 @@ class InputValidationMiddleware(BaseHTTPMiddleware):
             ]
 
             if not any(allowed_type in content_type for allowed_type in allowed_types):
-                return JSONResponse(
-                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-                    content={
+                await self._reject(
+                    scope,
+                    receive,
+                    send,
+                    status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    {
                         "error": {
                             "code": 415,
                             "message": "Unsupported media type",
@@ -399,13 +477,17 @@ class InputValidationMiddleware(BaseHTTPMiddleware):
                         }
                     },
                 )
+                return
 
         # Validate query parameters
-        for param_name, param_value in request.query_params.items():
+        for param_name, param_value in QueryParams(scope["query_string"]).items():
             if self._contains_dangerous_content(param_value):
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content={
+                await self._reject(
+                    scope,
+                    receive,
+                    send,
+                    status.HTTP_400_BAD_REQUEST,
+                    {
                         "error": {
                             "code": 400,
                             "message": f"Invalid query parameter: {param_name}",
@@ -413,53 +495,130 @@ class InputValidationMiddleware(BaseHTTPMiddleware):
                         }
                     },
                 )
+                return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, self._inspect_body(receive), send_wrapper)
+        except _RequestBodyRejected as rejection:
+            if response_started:
+                raise
+            await self._reject(
+                scope, receive, send, rejection.status_code, rejection.content
+            )
+
+    def _inspect_body(self, receive: Receive) -> Receive:
+        """Wrap ``receive`` to enforce size and content limits while streaming."""
+        received = 0
+        tail = ""
+
+        async def inspecting_receive() -> Message:
+            nonlocal received, tail
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+
+            chunk = message.get("body", b"")
+            scan_start = received
+            received += len(chunk)
+
+            if received > self.max_content_length:
+                raise _RequestBodyRejected(*self._too_large())
+
+            if scan_start < self.body_scan_limit and chunk:
+                window = chunk[: self.body_scan_limit - scan_start]
+                text = tail + window.decode("utf-8", errors="ignore")
+                if self._contains_dangerous_content(text):
+                    raise _RequestBodyRejected(
+                        status.HTTP_400_BAD_REQUEST,
+                        {
+                            "error": {
+                                "code": 400,
+                                "message": "Invalid request body",
+                                "details": "Contains potentially dangerous content",
+                            }
+                        },
+                    )
+                tail = text[-self._SCAN_OVERLAP :]
 
-        return await call_next(request) # type: ignore[no-any-return]
+            return message
+
+        return inspecting_receive
+
+    def _too_large(self) -> tuple[int, dict]:
+        """Build the 413 rejection payload."""
+        return (
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            {
+                "error": {
+                    "code": 413,
+                    "message": "Request entity too large",
+                    "max_size": self.max_content_length,
+                }
+            },
+        )
+
+    async def _reject(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        status_code: int,
+        content: dict,
+    ) -> None:
+        """Send a JSON error response without calling the downstream app."""
+        response = JSONResponse(status_code=status_code, content=content)
+        await response(scope, receive, send)
 
     def _contains_dangerous_content(self, content: str) -> bool:
         """Check if content contains dangerous patterns."""
-        import re
-
-        for pattern in self.dangerous_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        return False
+        return self._dangerous_regex.search(content) is not None
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
+class RequestIdMiddleware:
     """
     Middleware for adding unique request IDs for tracing.
     """
 
-    def __init__(self, app) -> None: # type: ignore[no-untyped-def]
-        super().__init__(app)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Add unique request ID to request state."""
-        import uuid
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Generate unique request ID
         request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-
-        # Process request
-        response = await call_next(request)
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add request ID to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-        return response # type: ignore[no-any-return]
+        # Process request
+        await self.app(scope, receive, send_wrapper)
 
 
-class AuditLoggingMiddleware(BaseHTTPMiddleware):
+class AuditLoggingMiddleware:
     """
     Middleware for comprehensive audit logging.
 
     Logs all requests for security and compliance monitoring.
     """
 
-    def __init__(self, app, log_sensitive_data: bool = False) -> None: # type: ignore[no-untyped-def]
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, log_sensitive_data: bool = False) -> None:
+        self.app = app
         self.log_sensitive_data = log_sensitive_data
 
         # Sensitive endpoints that require special logging
@@ -471,46 +630,39 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
             "/predict/batch",
         }
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Log request and response for audit purposes."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         from .security import SecurityAuditor
 
         start_time = time.time()
 
         # Extract request information
-        client_ip = self._get_client_ip(request)
-        user_agent = request.headers.get("user-agent", "unknown")
-        endpoint = str(request.url.path)
-        method = request.method
+        headers = Headers(scope=scope)
+        client_ip = _get_client_ip(scope, headers)
+        user_agent = headers.get("user-agent", "unknown")
+        endpoint = scope["path"]
+        method = scope["method"]
 
         # Determine if this is a sensitive operation
         is_sensitive = any(
             sensitive in endpoint for sensitive in self.sensitive_endpoints
         )
 
-        try:
-            # Process request
-            response = await call_next(request)
+        status_code = 500
 
-            # Calculate processing time
-            duration_ms = int((time.time() - start_time) * 1000)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-            # Log successful request
-            SecurityAuditor.log_security_event(
-                "api_request",
-                ip_address=client_ip,
-                details={
-                    "endpoint": endpoint,
-                    "method": method,
-                    "status_code": response.status_code,
-                    "duration_ms": duration_ms,
-                    "user_agent": user_agent,
-                    "is_sensitive": is_sensitive,
-                    "success": response.status_code < 400,
-                },
-            )
-
-            return response # type: ignore[no-any-return]
+        try:
+            # Process request
+            await self.app(scope, receive, send_wrapper)
 
         except Exception as e:
             # Calculate processing time for failed requests
@@ -533,14 +685,20 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
 
             raise
 
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP address."""
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
-
-        return request.client.host if request.client else "unknown"
+        # Calculate processing time
+        duration_ms = int((time.time() - start_time) * 1000)
+
+        # Log successful request
+        SecurityAuditor.log_security_event(
+            "api_request",
+            ip_address=client_ip,
+            details={
+                "endpoint": endpoint,
+                "method": method,
+                "status_code": status_code,
+                "duration_ms": duration_ms,
+                "user_agent": user_agent,
+                "is_sensitive": is_sensitive,
+                "success": status_code < 400,
+            },
+        )
@@ -0,0 +1,264 @@
+"""
+Versioned Model Registry for Serving.
+
+Holds loaded models keyed by (model type, version) within a memory budget.
+Models are loaded lazily on first use, outside the event loop, and run
+warm-up inference before serving. Each model type has one active version.
+A hot swap loads the new version in the background, switches the active
+pointer, and unloads the old version once its in-flight requests finish.
+When resident models exceed the budget, the least recently used idle
+models are evicted and reloaded on their next use.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import torch.nn as nn
+
+from ..ml.export import ExportedModel
+from ..ml.quantization import model_size_bytes
+from ..monitoring.metrics import MLModelMetrics
+
+logger = logging.getLogger(__name__)
+
+ModelKey = tuple[str, str]
+# (model type, version, source path) -> model
+ModelLoader = Callable[[str, str, str | None], Any]
+
+
+@dataclass
+class ResidentModel:
+    """A loaded model version and its usage."""
+
+    model_type: str
+    version: str
+    model: Any
+    size_bytes: int
+    load_seconds: float
+    loaded_at: datetime = field(default_factory=datetime.now)
+    last_used: datetime = field(default_factory=datetime.now)
+    in_flight: int = 0
+    idle: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def __post_init__(self) -> None:
+        self.idle.set()
+
+
+def resident_size_bytes(model: Any) -> int:
+    """Approximate memory held by a model's weights."""
+    if isinstance(model, nn.Module):
+        return model_size_bytes(model)
+    if isinstance(model, ExportedModel):
+        return sum(path.stat().st_size for path in model.directory.iterdir() if path.is_file())
+    return 0
+
+
+class ModelRegistry:
+    """
+    Lazily loaded, memory-bounded models with atomic version swaps.
+
+    Not thread-safe: all methods are meant to be called from one event loop.
+    """
+
+    def __init__(
+        self,
+        loader: ModelLoader,
+        memory_budget_bytes: int | None = None,
+        warmup: Callable[[Any], None] | None = None,
+        metrics: MLModelMetrics | None = None,
+        drain_timeout: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            loader: Builds a model from its type, version and source path
+            memory_budget_bytes: Evict idle models beyond this (None = unbounded)
+            warmup: Runs inference on a freshly loaded model
+            metrics: Receives load durations and resident memory
+            drain_timeout: Seconds a swap waits for requests on the old version
+        """
+        self._loader = loader
+        self._warmup = warmup
+        self.memory_budget_bytes = memory_budget_bytes
+        self.metrics = metrics
+        self.drain_timeout = drain_timeout
+
+        self._sources: dict[ModelKey, str | None] = {}
+        self._active: dict[str, str] = {}
+        self._resident: OrderedDict[ModelKey, ResidentModel] = OrderedDict()
+        self._load_locks: dict[ModelKey, asyncio.Lock] = {}
+
+    def register(
+        self, model_type: str, version: str, path: str | None = None, activate: bool = False
+    ) -> None:
+        """Make a version loadable; the first version of a type becomes active."""
+        self._sources[(model_type, version)] = path
+        if activate or model_type not in self._active:
+            self._active[model_type] = version
+
+    def add(self, model_type: str, version: str, model: Any, activate: bool = True) -> ResidentModel:
+        """Make an already built model resident."""
+        self.register(model_type, version, activate=activate)
+        entry = ResidentModel(model_type, version, model, resident_size_bytes(model), 0.0)
+        self._resident[(model_type, version)] = entry
+        self._evict(keep=(model_type, version))
+        return entry
+
+    def active_version(self, model_type: str) -> str | None:
+        """Version served for a model type."""
+        return self._active.get(model_type)
+
+    def is_registered(self, model_type: str, version: str) -> bool:
+        return (model_type, version) in self._sources
+
+    @property
+    def resident_bytes(self) -> int:
+        return sum(entry.size_bytes for entry in self._resident.values())
+
+    def active_models(self) -> dict[str, ResidentModel]:
+        """Resident entries of each type's active version."""
+        return {
+            model_type: self._resident[(model_type, version)]
+            for model_type, version in self._active.items()
+            if (model_type, version) in self._resident
+        }
+
+    def resident(self) -> list[ResidentModel]:
+        """Resident entries, least recently used first."""
+        return list(self._resident.values())
+
+    async def get(self, model_type: str, version: str | None = None) -> ResidentModel:
+        """
+        Return a model version, loading it on first use.
+
+        Args:
+            model_type: Registered model type
+            version: Registered version, the active one when omitted
+
+        Raises:
+            ValueError: If the version is not registered
+        """
+        version = version or self._active.get(model_type)
+        key = (model_type, str(version))
+        if version is None or key not in self._sources:
+            raise ValueError(f"No registered version {version!r} of model {model_type}")
+
+        entry = self._resident.get(key)
+        if entry is None:
+            lock = self._load_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                # Another request may have loaded it while this one waited
+                entry = self._resident.get(key) or await self._load(key)
+
+        self._resident.move_to_end(key)
+        entry.last_used = datetime.now()
+        return entry
+
+    @asynccontextmanager
+    async def acquire(
+        self, model_type: str, version: str | None = None
+    ) -> AsyncIterator[Any]:
+        """Use a model, holding off its unloading by a swap until released."""
+        entry = await self.get(model_type, version)
+        entry.in_flight += 1
+        entry.idle.clear()
+        try:
+            yield entry.model
+        finally:
+            entry.in_flight -= 1
+            if entry.in_flight == 0:
+                entry.idle.set()
+
+    async def swap(
+        self, model_type: str, version: str, path: str | None = None
+    ) -> ResidentModel:
+        """
+        Atomically switch a model type to a new version.
+
+        The new version is loaded and warmed up while the old one keeps
+        serving. Requests started after the switch use the new version;
+        the old version is unloaded once its in-flight requests finish or
+        ``drain_timeout`` passes.
+        """
+        self.register(model_type, version, path)
+        entry = await self.get(model_type, version)
+
+        previous = self._active.get(model_type)
+        self._active[model_type] = version
+        logger.info(f"Serving {model_type} version {version} (was {previous})")
+
+        old = self._resident.get((model_type, str(previous)))
+        if previous != version and old is not None:
+            try:
+                await asyncio.wait_for(old.idle.wait(), self.drain_timeout)
+            except TimeoutError:
+                logger.warning(
+                    f"{old.in_flight} requests still using {model_type} version {previous} "
+                    f"after {self.drain_timeout}s; unloading it anyway"
+                )
+            self.unload(model_type, str(previous))
+        return entry
+
+    def unload(self, model_type: str, version: str) -> None:
+        """Drop a resident model; in-flight requests keep their reference."""
+        entry = self._resident.pop((model_type, version), None)
+        if entry is None:
+            return
+        if self.metrics is not None:
+            self.metrics.set_model_memory_usage(model_type, version, 0)
+        logger.info(f"Unloaded {model_type} version {version} ({entry.size_bytes} bytes)")
+
+    def clear(self) -> None:
+        """Unload all models."""
+        for model_type, version in list(self._resident):
+            self.unload(model_type, version)
+
+    async def _load(self, key: ModelKey) -> ResidentModel:
+        model_type, version = key
+        start = time.perf_counter()
+        model = await asyncio.to_thread(self._loader, model_type, version, self._sources[key])
+        if self._warmup is not None:
+            await asyncio.to_thread(self._warmup, model)
+        load_seconds = time.perf_counter() - start
+
+        entry = ResidentModel(
+            model_type, version, model, resident_size_bytes(model), load_seconds
+        )
+        self._resident[key] = entry
+        if self.metrics is not None:
+            self.metrics.record_model_loading(
+                model_type, version, load_seconds, memory_bytes=entry.size_bytes
+            )
+        logger.info(
+            f"Loaded {model_type} version {version} in {load_seconds:.2f}s "
+            f"({entry.size_bytes} bytes)"
+        )
+        self._evict(keep=key)
+        return entry
+
+    def _evict(self, keep: ModelKey) -> None:
+        """Evict least recently used idle models until within the budget."""
+        if self.memory_budget_bytes is None:
+            return
+        while self.resident_bytes > self.memory_budget_bytes:
+            candidate = next(
+                (
+                    key
+                    for key, entry in self._resident.items()
+                    if key != keep and entry.in_flight == 0
+                ),
+                None,
+            )
+            if candidate is None:
+                logger.warning(
+                    f"Resident models use {self.resident_bytes} bytes, over the "
+                    f"{self.memory_budget_bytes} byte budget, and none can be evicted"
+                )
+                return
+            self.unload(*candidate)
@@ -16,13 +16,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...database.models import (
     CHIRPSDataPoint,
-    ERA5DataPoint,
     MalariaRiskIndex,
     MODISDataPoint,
     ProcessedClimateData,
     WorldPopDataPoint,
 )
-from ...database.session import get_session as get_db
+from ...database.repositories import CLIMATE_AGGREGATES, ERA5Repository
+from ...database.session import get_read_db as get_db
 from ...services.data_export import get_data_export_service
 from ..dependencies import get_current_user_optional
 
@@ -201,43 +201,31 @@ async def get_environmental_trend_analysis(
 
         # ERA5 Climate Data Trends
         if 'era5' in sources:
-            era5_stmt = select(ERA5DataPoint).where(
-                and_(
-                    ERA5DataPoint.latitude.between(lat_min, lat_max),
-                    ERA5DataPoint.longitude.between(lon_min, lon_max),
-                    ERA5DataPoint.timestamp >= start_date,
-                    ERA5DataPoint.timestamp <= end_date,
+            # Daily and weekly rollups come from the climate continuous
+            # aggregates on PostgreSQL
+            climate_summary = []
+            if aggregation in CLIMATE_AGGREGATES:
+                climate_summary = await ERA5Repository(db).get_climate_summary(
+                    start_date,
+                    end_date,
+                    location_lat,
+                    location_lon,
+                    radius_km=radius_km,
+                    granularity=aggregation,
                 )
-            )
-
-            era5_result = await db.execute(era5_stmt)
-            era5_data = era5_result.scalars().all()
 
-            # Process ERA5 trends
             temperature_trends = []
             precipitation_trends = []
-
-            if aggregation == "daily":
-                # Group by day
-                daily_groups: dict[str, list[Any]] = {}
-                for point in era5_data:
-                    day_key = point.timestamp.date().isoformat()
-                    if day_key not in daily_groups:
-                        daily_groups[day_key] = []
-                    daily_groups[day_key].append(point)
-
-                for day, points in daily_groups.items():
-                    if points:
-                        avg_temp = sum(p.temperature_2m for p in points if p.temperature_2m) / len([p for p in points if p.temperature_2m])
-                        total_precip = sum(p.total_precipitation for p in points if p.total_precipitation)
-
-                        temperature_trends.append({"date": day, "value": avg_temp, "type": "temperature"})
-                        precipitation_trends.append({"date": day, "value": total_precip, "type": "precipitation"})
+            for period in climate_summary:
+                day = period["period"].date().isoformat()
+                if period["avg_temp"] is not None:
+                    temperature_trends.append({"date": day, "value": period["avg_temp"], "type": "temperature"})
+                precipitation_trends.append({"date": day, "value": period["total_precip"] or 0, "type": "precipitation"})
 
             trends_data["climate"] = {
                 "temperature_trends": temperature_trends,
                 "precipitation_trends": precipitation_trends,
-                "data_points": len(era5_data),
+                "data_points": sum(period["data_points"] for period in climate_summary),
                 "source": "ERA5",
             }
 
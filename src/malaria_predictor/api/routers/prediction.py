@@ -6,11 +6,15 @@ single location predictions, batch processing, and time series analysis.
 """
 
 import asyncio
+import json
 import logging
 import time
+from collections.abc import AsyncIterator
 from typing import Annotated, Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+import numpy as np
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from ...models import RiskLevel
 from ..auth import require_scopes
@@ -19,6 +23,7 @@ from ..models import (
     BatchPredictionRequest,
     BatchPredictionResult,
     LocationPoint,
+    ModelType,
     PredictionResult,
     SinglePredictionRequest,
     SpatialPredictionRequest,
@@ -26,6 +31,13 @@ from ..models import (
     TimeSeriesPredictionRequest,
     TimeSeriesPredictionResult,
 )
+from ..streaming import (
+    STREAM_CHUNK_SIZE,
+    negotiate_encoding,
+    negotiate_format,
+    prediction_columns,
+    stream_predictions,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +56,81 @@ def _calculate_risk_level(risk_score: float) -> RiskLevel:
         return RiskLevel.VERY_HIGH
 
 
+async def _precomputed(prediction: dict) -> dict:
+    """Awaitable standing in for a prediction task already answered."""
+    return prediction
+
+
+async def _prediction_chunks(
+    prediction_service: PredictionService,
+    points: list[tuple[float, float]],
+    target_date: Any,
+    model_type: ModelType,
+    prediction_horizon: int,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[dict[str, np.ndarray]]:
+    """
+    Predict locations chunk by chunk for streamed responses.
+
+    Each chunk serves its precomputed nowcasts, predicts the rest
+    concurrently and is yielded as columns once complete, so the first rows
+    reach the client while later chunks are still running.
+    """
+    start_time = time.time()
+    semaphore = asyncio.Semaphore(10)  # Max 10 concurrent predictions
+    successful_predictions = 0
+
+    async def predict_with_semaphore(lat: float, lon: float) -> dict | None:
+        async with semaphore:
+            try:
+                return await prediction_service.predict_single(
+                    latitude=lat,
+                    longitude=lon,
+                    target_date=target_date,
+                    model_type=model_type,
+                    prediction_horizon=prediction_horizon,
+                    use_nowcast=False,
+                )
+            except Exception as e:
+                logger.warning(f"Prediction failed for {lat}, {lon}: {e}")
+                return None
+
+    for offset in range(0, len(points), chunk_size):
+        chunk = points[offset : offset + chunk_size]
+        predictions = await prediction_service.lookup_nowcasts(
+            chunk,
+            target_date=target_date,
+            model_type=model_type,
+            prediction_horizon=prediction_horizon,
+        )
+        misses = [i for i, prediction in enumerate(predictions) if prediction is None]
+        predicted = await asyncio.gather(
+            *[predict_with_semaphore(*chunk[i]) for i in misses]
+        )
+        for i, prediction in zip(misses, predicted, strict=True):
+            predictions[i] = prediction
+
+        columns = prediction_columns(chunk, predictions)
+        successful_predictions += len(columns["risk_score"])
+        yield columns
+
+    processing_time = (time.time() - start_time) * 1000
+    logger.info(
+        f"Streamed prediction completed: {successful_predictions} successful, "
+        f"{len(points) - successful_predictions} failed in {processing_time:.2f}ms"
+    )
+
+
+def _stream_metadata(request: Any, **extra: Any) -> dict[str, str]:
+    """Request-wide values sent once with a streamed response."""
+    return {
+        "target_date": request.target_date.isoformat(),
+        "model_type": request.model_type.value,
+        "prediction_horizon": str(request.prediction_horizon.value),
+        **{key: str(value) for key, value in extra.items()},
+    }
+
+
 @router.post("/single", response_model=PredictionResult)
 async def predict_single_location(
     request: SinglePredictionRequest,
@@ -126,10 +213,12 @@ async def predict_batch_locations(
     request: BatchPredictionRequest,
     background_tasks: BackgroundTasks,
     prediction_service: PredictionService = Depends(get_prediction_service),
+    accept: Annotated[str | None, Header()] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
     current_user: Annotated[
         object, Depends(require_scopes("read:predictions", "write:predictions"))
     ] = None,
-) -> BatchPredictionResult:
+) -> BatchPredictionResult | StreamingResponse:
     """
     Make malaria risk predictions for multiple locations.
 
@@ -137,16 +226,43 @@ async def predict_batch_locations(
     batch prediction. Useful for analyzing risk across regions or for
     bulk analysis workflows.
 
+    Clients accepting ``application/x-ndjson`` or
+    ``application/vnd.apache.arrow.stream`` get the predictions streamed
+    column-wise in chunks instead, without the summary counts.
+
     Args:
         request: Batch prediction request with multiple locations
         background_tasks: FastAPI background tasks for async processing
+        accept: Response format, JSON unless a streaming type is preferred
+        accept_encoding: Compression of streamed responses (zstd or gzip)
 
     Returns:
-        Batch prediction results with statistics and individual predictions
+        Batch prediction results with statistics and individual predictions,
+        or a stream of prediction rows
 
     Raises:
-        HTTPException: If batch processing fails
+        HTTPException: If batch processing fails or no format is acceptable
     """
+    stream_format = negotiate_format(accept)
+    if stream_format != "json":
+        logger.info(
+            f"Streaming batch prediction: {len(request.locations)} locations "
+            f"as {stream_format}"
+        )
+        points = [(loc.latitude, loc.longitude) for loc in request.locations]
+        return stream_predictions(
+            _prediction_chunks(
+                prediction_service,
+                points,
+                request.target_date,
+                request.model_type,
+                request.prediction_horizon.value,
+            ),
+            stream_format,
+            encoding=negotiate_encoding(accept_encoding),
+            metadata=_stream_metadata(request),
+        )
+
     try:
         start_time = time.time()
         total_locations = len(request.locations)
@@ -156,16 +272,26 @@ async def predict_batch_locations(
             f"on {request.target_date} using {request.model_type.value}"
         )
 
-        # Process predictions concurrently
+        # Serve precomputed nowcasts, then predict the rest concurrently
+        nowcasts = await prediction_service.lookup_nowcasts(
+            [(location.latitude, location.longitude) for location in request.locations],
+            target_date=request.target_date,
+            model_type=request.model_type,
+            prediction_horizon=request.prediction_horizon.value,
+        )
         tasks = []
-        for location in request.locations:
-            task = prediction_service.predict_single(
-                latitude=location.latitude,
-                longitude=location.longitude,
-                target_date=request.target_date,
-                model_type=request.model_type,
-                prediction_horizon=request.prediction_horizon.value,
-            )
+        for location, nowcast in zip(request.locations, nowcasts, strict=True):
+            if nowcast is not None:
+                task = _precomputed(nowcast)
+            else:
+                task = prediction_service.predict_single(
+                    latitude=location.latitude,
+                    longitude=location.longitude,
+                    target_date=request.target_date,
+                    model_type=request.model_type,
+                    prediction_horizon=request.prediction_horizon.value,
+                    use_nowcast=False,
+                )
             tasks.append((location, task))
 
         # Execute all predictions concurrently
@@ -246,14 +372,16 @@ async def predict_batch_locations(
         ) from e
 
 
-@router.post("/spatial")
+@router.post("/spatial", response_model=None)
 async def predict_spatial_grid(
     request: SpatialPredictionRequest,
     prediction_service: PredictionService = Depends(get_prediction_service),
+    accept: Annotated[str | None, Header()] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
     current_user: Annotated[
         object, Depends(require_scopes("read:predictions", "write:predictions"))
     ] = None,
-) -> dict[str, Any]:
+) -> dict[str, Any] | StreamingResponse:
     """
     Make predictions across a spatial grid.
 
@@ -261,15 +389,25 @@ async def predict_spatial_grid(
     the specified geographic bounds, useful for creating risk maps and
     spatial visualizations.
 
+    Clients accepting ``application/x-ndjson`` or
+    ``application/vnd.apache.arrow.stream`` get the grid points streamed
+    column-wise in chunks instead, with the grid info as Arrow metadata.
+
     Args:
         request: Spatial prediction request with geographic bounds and resolution
+        accept: Response format, JSON unless a streaming type is preferred
+        accept_encoding: Compression of streamed responses (zstd or gzip)
 
     Returns:
-        Grid predictions with spatial coordinates and risk values
+        Grid predictions with spatial coordinates and risk values, or a
+        stream of prediction rows
 
     Raises:
-        HTTPException: If spatial prediction fails or grid is too large
+        HTTPException: If spatial prediction fails, the grid is too large or
+            no format is acceptable
     """
+    stream_format = negotiate_format(accept)
+
     try:
         start_time = time.time()
 
@@ -302,18 +440,48 @@ async def predict_spatial_grid(
         ]
         lons = [request.bounds["west"] + j * request.resolution for j in range(lon_points)]
 
-        # Create prediction tasks
+        points = [(lat, lon) for lat in lats for lon in lons]
+        if stream_format != "json":
+            return stream_predictions(
+                _prediction_chunks(
+                    prediction_service,
+                    points,
+                    request.target_date,
+                    request.model_type,
+                    request.prediction_horizon.value,
+                ),
+                stream_format,
+                encoding=negotiate_encoding(accept_encoding),
+                metadata=_stream_metadata(
+                    request,
+                    bounds=json.dumps(request.bounds),
+                    resolution=request.resolution,
+                    lat_points=lat_points,
+                    lon_points=lon_points,
+                ),
+            )
+
+        # Serve precomputed nowcasts, then create prediction tasks for the rest
+        nowcasts = await prediction_service.lookup_nowcasts(
+            points,
+            target_date=request.target_date,
+            model_type=request.model_type,
+            prediction_horizon=request.prediction_horizon.value,
+        )
         tasks = []
-        for lat in lats:
-            for lon in lons:
+        for (lat, lon), nowcast in zip(points, nowcasts, strict=True):
+            if nowcast is not None:
+                task = _precomputed(nowcast)
+            else:
                 task = prediction_service.predict_single(
                     latitude=lat,
                     longitude=lon,
                     target_date=request.target_date,
                     model_type=request.model_type,
                     prediction_horizon=request.prediction_horizon.value,
+                    use_nowcast=False,
                 )
-                tasks.append((lat, lon, task))
+            tasks.append((lat, lon, task))
 
         # Process in batches to avoid overwhelming the system
         batch_size = 100
@@ -423,34 +591,23 @@ async def predict_time_series(
             f"to {request.end_date} ({date_range} days)"
         )
 
-        # Generate predictions for each date
-        time_series = []
-        current_date = request.start_date
-
-        while current_date <= request.end_date:
-            try:
-                prediction = await prediction_service.predict_single(
-                    latitude=request.location.latitude,
-                    longitude=request.location.longitude,
-                    target_date=current_date,
-                    model_type=request.model_type,
-                    prediction_horizon=1,  # Single day prediction
-                )
-
-                time_series.append(
-                    TimeSeriesPoint(  # type: ignore[call-arg]  # Pydantic Field alias - mypy limitation
-                        prediction_date=current_date,
-                        risk_score=prediction["risk_score"],
-                        risk_level=_calculate_risk_level(prediction["risk_score"]),
-                        uncertainty=prediction["uncertainty"],
-                    )
-                )
-
-            except Exception as e:
-                logger.warning(f"Prediction failed for {current_date}: {e}")
-                # Continue with next date
-
-            current_date = current_date.replace(day=current_date.day + 1)
+        # One harmonization and batched forward passes for the whole range
+        predictions = await prediction_service.predict_time_series(
+            latitude=request.location.latitude,
+            longitude=request.location.longitude,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            model_type=request.model_type,
+        )
+        time_series = [
+            TimeSeriesPoint(  # type: ignore[call-arg]  # Pydantic Field alias - mypy limitation
+                prediction_date=prediction["date"],
+                risk_score=prediction["risk_score"],
+                risk_level=_calculate_risk_level(prediction["risk_score"]),
+                uncertainty=prediction["uncertainty"],
+            )
+            for prediction in predictions
+        ]
 
         # Calculate summary statistics
         risk_scores = [point.risk_score for point in time_series]
@@ -23,7 +23,7 @@ from sqlalchemy import desc, or_
 from sqlalchemy.orm import Session
 
 from ...database.models import Report, ReportSchedule, ReportTemplate
-from ...database.session import get_session as get_db
+from ...database.session import get_db, get_read_db
 from ...services.report_generator import get_report_generator
 from ...services.report_scheduler import get_report_scheduler
 from ..dependencies import get_current_user
@@ -198,7 +198,7 @@ async def list_reports(
     report_type: str | None = Query(None, description="Filter by report type"),
     status: str | None = Query(None, description="Filter by status"),
     search: str | None = Query(None, description="Search in title and description"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: dict[str, Any] = Depends(get_current_user)
 ) -> list[ReportResponse]:
     """
@@ -240,7 +240,7 @@ async def list_reports(
 @router.get("/{report_id}", response_model=ReportResponse)
 async def get_report(
     report_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: dict[str, Any] = Depends(get_current_user)
 ) -> ReportResponse:
     """
@@ -271,7 +271,7 @@ async def get_report(
 async def download_report(
     report_id: int,
     format_name: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: dict[str, Any] = Depends(get_current_user)
 ) -> FileResponse:
     """
@@ -375,7 +375,7 @@ async def list_templates(
     category: str | None = Query(None, description="Filter by category"),
     search: str | None = Query(None, description="Search in name and description"),
     include_public: bool = Query(True, description="Include public templates"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: dict[str, Any] = Depends(get_current_user)
 ) -> list[ReportTemplateResponse]:
     """
@@ -469,7 +469,7 @@ async def create_template(
 @router.get("/templates/{template_id}", response_model=dict[str, Any])
 async def get_template(
     template_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: dict[str, Any] = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
@@ -526,7 +526,7 @@ async def list_schedules(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=500, description="Number of records to return"),
     status: str | None = Query(None, description="Filter by status"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: dict[str, Any] = Depends(get_current_user)
 ) -> list[ReportScheduleResponse]:
     """
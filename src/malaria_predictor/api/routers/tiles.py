@@ -0,0 +1,94 @@
+"""
+Risk Tile Router for Map Clients.
+
+This module serves precomputed malaria risk tiles on the XYZ web-mercator
+grid. Tiles are rendered once per day by ``malaria-predictor render-tiles``,
+so requests here are plain file reads rather than model calls.
+"""
+
+import logging
+from datetime import date
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import FileResponse
+
+from ...config import settings
+from ...services.risk_tiles import RiskTileStore
+from ..auth import require_scopes
+from ..models import ModelType
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Tiles can be re-rendered with ``render-tiles --overwrite``, so clients cache
+# them briefly and then revalidate with If-None-Match
+TILE_CACHE_CONTROL = "private, max-age=3600, must-revalidate"
+
+
+def get_tile_store() -> RiskTileStore:
+    """Dependency providing the configured tile store."""
+    return RiskTileStore(settings.tiles.directory)
+
+
+@router.get("/dates")
+async def list_tile_dates(
+    store: RiskTileStore = Depends(get_tile_store),
+    current_user: Annotated[object, Depends(require_scopes("read:predictions"))] = None,
+) -> dict[str, list[str]]:
+    """List dates for which precomputed risk tiles exist, newest first."""
+    return {"dates": store.available_dates()}
+
+
+@router.get("/{tile_date}/{z}/{x}/{y}", response_model=None)
+async def get_risk_tile(
+    tile_date: date,
+    z: int,
+    x: int,
+    y: int,
+    model_type: ModelType = ModelType.ENSEMBLE,
+    if_none_match: Annotated[str | None, Header()] = None,
+    store: RiskTileStore = Depends(get_tile_store),
+    current_user: Annotated[object, Depends(require_scopes("read:predictions"))] = None,
+) -> Response:
+    """
+    Serve a precomputed risk tile.
+
+    Pixel palette indices encode the risk score quantized to 0-254 (255 is
+    missing data). Returns 404 when the tile has not been rendered, in which
+    case clients should fall back to ``/predict/spatial``.
+
+    Args:
+        tile_date: Date the tile represents
+        z: Zoom level
+        x: Tile column
+        y: Tile row
+        model_type: Model whose predictions were rendered
+
+    Returns:
+        PNG tile with ETag and caching headers, or 304 if unchanged
+
+    Raises:
+        HTTPException: If coordinates are invalid or the tile does not exist
+    """
+    if z < 0 or not (0 <= x < 2**z and 0 <= y < 2**z):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid tile coordinates {z}/{x}/{y}",
+        )
+
+    path = store.tile_path(tile_date, model_type.value, z, x, y)
+    if not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tile {tile_date}/{z}/{x}/{y} has not been rendered",
+        )
+
+    etag = store.etag(path)
+    headers = {"ETag": etag, "Cache-Control": TILE_CACHE_CONTROL}
+
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return FileResponse(path, media_type="image/png", headers=headers)
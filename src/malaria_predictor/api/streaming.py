@@ -0,0 +1,356 @@
+"""
+Streaming Prediction Responses for Large Requests.
+
+Batch and spatial predictions can be streamed as NDJSON or Apache Arrow IPC
+instead of one JSON document, selected with the ``Accept`` header. Results
+are encoded column-wise per chunk as soon as the chunk completes, skipping
+per-item pydantic models, and compressed in the stream with zstd or gzip
+according to ``Accept-Encoding``.
+"""
+
+import io
+import json
+import logging
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+import numpy as np
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from ..models import RiskLevel
+
+try:
+    import pyarrow as pa
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    ARROW_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Media types each response format answers to, the first being the one sent
+STREAM_MEDIA_TYPES = {
+    "json": (JSON_MEDIA_TYPE,),
+    "ndjson": (NDJSON_MEDIA_TYPE, "application/ndjson"),
+    "arrow": (ARROW_MEDIA_TYPE,),
+}
+
+# Locations predicted and encoded per streamed chunk
+STREAM_CHUNK_SIZE = 1000
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Upper bounds of the risk levels, matching the JSON responses
+RISK_THRESHOLDS = np.array([0.25, 0.5, 0.75])
+RISK_LEVELS = np.array(
+    [
+        RiskLevel.LOW.value,
+        RiskLevel.MEDIUM.value,
+        RiskLevel.HIGH.value,
+        RiskLevel.VERY_HIGH.value,
+    ],
+    dtype=object,
+)
+
+PREDICTION_COLUMNS = (
+    "latitude",
+    "longitude",
+    "risk_score",
+    "risk_level",
+    "uncertainty",
+    "confidence_lower",
+    "confidence_upper",
+)
+
+
+def _weighted(header: str | None) -> list[tuple[str, float]]:
+    """Values of a comma-separated header with their q weights, in order."""
+    weighted = []
+    for item in (header or "").split(","):
+        value, *params = (part.strip() for part in item.split(";"))
+        if not value:
+            continue
+        weight = 1.0
+        for param in params:
+            name, _, number = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(number)
+                except ValueError:
+                    weight = 0.0
+        weighted.append((value.lower(), weight))
+    return weighted
+
+
+def negotiate_format(accept: str | None) -> str:
+    """
+    Response format requested by an ``Accept`` header.
+
+    Picks the highest-weighted of JSON, NDJSON and Arrow, earlier entries
+    winning ties. Wildcards and missing headers get JSON, and Arrow is only
+    offered when pyarrow is installed.
+
+    Returns:
+        "json", "ndjson" or "arrow"
+
+    Raises:
+        HTTPException: 406 if the header only accepts unavailable formats
+    """
+    weighted = _weighted(accept)
+    if not weighted:
+        return "json"
+
+    best: str | None = None
+    best_weight = 0.0
+    for media_type, weight in weighted:
+        fmt: str | None
+        if media_type in ("*/*", "application/*"):
+            fmt = "json"
+        else:
+            fmt = next(
+                (
+                    name
+                    for name, types in STREAM_MEDIA_TYPES.items()
+                    if media_type in types
+                ),
+                None,
+            )
+        if fmt == "arrow" and not ARROW_AVAILABLE:
+            continue
+        if fmt is not None and weight > best_weight:
+            best, best_weight = fmt, weight
+
+    if best is None:
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail=f"Supported response types: {JSON_MEDIA_TYPE}, {NDJSON_MEDIA_TYPE}"
+            + (f", {ARROW_MEDIA_TYPE}" if ARROW_AVAILABLE else ""),
+        )
+    return best
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Stream compression accepted by an ``Accept-Encoding`` header.
+
+    Returns:
+        "zstd" when accepted and zstandard is installed, else "gzip" when
+        accepted, else None for an uncompressed stream
+    """
+    accepted = {value for value, weight in _weighted(accept_encoding) if weight > 0}
+    if "zstd" in accepted and ZSTD_AVAILABLE:
+        return "zstd"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def prediction_columns(
+    coordinates: Sequence[tuple[float, float]], predictions: Sequence[dict | None]
+) -> dict[str, np.ndarray]:
+    """
+    Encode a chunk of predictions column-wise.
+
+    Locations whose prediction failed (None) are dropped, as in the JSON
+    responses. Missing uncertainties and their confidence bounds are NaN.
+
+    Args:
+        coordinates: (latitude, longitude) of each prediction
+        predictions: Result dicts from ``PredictionService``, or None
+
+    Returns:
+        Dict of ``PREDICTION_COLUMNS`` to arrays of equal length
+    """
+    kept = [
+        (coordinate, prediction)
+        for coordinate, prediction in zip(coordinates, predictions, strict=True)
+        if prediction is not None
+    ]
+    points = np.array([coordinate for coordinate, _ in kept], dtype=np.float64).reshape(
+        -1, 2
+    )
+    risk = np.array(
+        [prediction["risk_score"] for _, prediction in kept], dtype=np.float64
+    )
+    uncertainty = np.array(
+        [prediction["uncertainty"] for _, prediction in kept], dtype=np.float64
+    )
+
+    return {
+        "latitude": points[:, 0],
+        "longitude": points[:, 1],
+        "risk_score": risk,
+        "risk_level": RISK_LEVELS[np.searchsorted(RISK_THRESHOLDS, risk, side="right")],
+        "uncertainty": uncertainty,
+        "confidence_lower": np.clip(risk - 1.96 * uncertainty, 0.0, 1.0),
+        "confidence_upper": np.clip(risk + 1.96 * uncertainty, 0.0, 1.0),
+    }
+
+
+def _json_values(values: np.ndarray) -> list[Any]:
+    """Column values as Python objects, with NaN as None (JSON null)."""
+    objects = values.astype(object)
+    if values.dtype.kind == "f":
+        objects[np.isnan(values)] = None
+    return list(objects)
+
+
+def encode_ndjson(columns: dict[str, np.ndarray]) -> bytes:
+    """Encode columns as one JSON object per line."""
+    names = list(columns)
+    encoder = json.JSONEncoder(separators=(",", ":"))
+    rows = zip(*(_json_values(columns[name]) for name in names), strict=True)
+    return "".join(
+        encoder.encode(dict(zip(names, row, strict=True))) + "\n" for row in rows
+    ).encode()
+
+
+class ArrowStreamEncoder:
+    """Incremental Arrow IPC stream of prediction columns."""
+
+    def __init__(self, metadata: dict[str, str] | None = None) -> None:
+        """
+        Start a stream with the prediction schema.
+
+        Args:
+            metadata: Request-wide values (target date, model, ...) stored as
+                schema metadata instead of repeating them on every row
+        """
+        if not ARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Arrow responses")
+        self.schema = pa.schema(
+            [
+                (name, pa.string() if name == "risk_level" else pa.float64())
+                for name in PREDICTION_COLUMNS
+            ],
+            metadata=metadata,
+        )
+        self._sink = io.BytesIO()
+        self._writer = pa.ipc.new_stream(self._sink, self.schema)
+
+    def _drain(self) -> bytes:
+        data = self._sink.getvalue()
+        self._sink.seek(0)
+        self._sink.truncate()
+        return data
+
+    def encode(self, columns: dict[str, np.ndarray]) -> bytes:
+        """Encode one chunk as a record batch, NaN becoming null."""
+        batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array(columns[field.name], type=field.type, from_pandas=True)
+                for field in self.schema
+            ],
+            schema=self.schema,
+        )
+        self._writer.write_batch(batch)
+        return self._drain()
+
+    def close(self) -> bytes:
+        """End-of-stream marker, plus the schema if no chunk was written."""
+        self._writer.close()
+        return self._drain()
+
+
+class StreamCompressor:
+    """Compress a response body chunk by chunk, flushing after each."""
+
+    def __init__(self, encoding: str) -> None:
+        """
+        Args:
+            encoding: "zstd" or "gzip"
+        """
+        if encoding == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise ImportError("zstandard is required for zstd responses")
+            self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+            self._sync = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        elif encoding == "gzip":
+            self._compressor = zlib.compressobj(
+                GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+            self._sync = zlib.Z_SYNC_FLUSH
+        else:
+            raise ValueError(f"Unsupported stream encoding: {encoding}")
+
+    def compress(self, data: bytes) -> bytes:
+        """Compressed chunk, flushed so clients can decode it right away."""
+        chunk: bytes = self._compressor.compress(data) + self._compressor.flush(self._sync)
+        return chunk
+
+    def finish(self) -> bytes:
+        """Trailing bytes closing the compressed stream."""
+        tail: bytes = self._compressor.flush()
+        return tail
+
+
+async def _encoded(
+    chunks: AsyncIterator[dict[str, np.ndarray]],
+    fmt: str,
+    encoding: str | None,
+    metadata: dict[str, str] | None,
+) -> AsyncIterator[bytes]:
+    """Encode and compress column chunks as they arrive."""
+    arrow = ArrowStreamEncoder(metadata) if fmt == "arrow" else None
+    compressor = StreamCompressor(encoding) if encoding else None
+
+    def emit(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+
+    async for columns in chunks:
+        data = arrow.encode(columns) if arrow else encode_ndjson(columns)
+        if data:
+            yield emit(data)
+
+    tail = arrow.close() if arrow else b""
+    if compressor:
+        yield compressor.compress(tail) + compressor.finish()
+    elif tail:
+        yield tail
+
+
+def stream_predictions(
+    chunks: AsyncIterator[dict[str, np.ndarray]],
+    fmt: str,
+    encoding: str | None = None,
+    metadata: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """
+    Stream prediction column chunks as NDJSON or Arrow IPC.
+
+    Args:
+        chunks: Column chunks, see ``prediction_columns``
+        fmt: "ndjson" or "arrow", see ``negotiate_format``
+        encoding: Compression, see ``negotiate_encoding``
+        metadata: Request-wide values for the Arrow schema metadata
+
+    Returns:
+        Streaming response with the negotiated content type and encoding
+    """
+    if fmt not in ("ndjson", "arrow"):
+        raise ValueError(f"Unsupported stream format: {fmt}")
+
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return StreamingResponse(
+        _encoded(chunks, fmt, encoding, metadata),
+        media_type=STREAM_MEDIA_TYPES[fmt][0],
+        headers=headers,
+    )
@@ -1,5 +1,7 @@
 """Command-line interface for the malaria prediction system."""
 
+from datetime import date, datetime
+from pathlib import Path
 from typing import Any
 
 import typer
@@ -129,6 +131,15 @@ def ingest_data(
     dry_run: bool = typer.Option(
         False, help="Preview what would be ingested without downloading"
     ),
+    render_tiles: bool = typer.Option(
+        False, help="Render today's risk map tiles after ingestion completes"
+    ),
+    features: bool = typer.Option(
+        False, help="Materialize today's model features after ingestion completes"
+    ),
+    nowcast: bool = typer.Option(
+        False, help="Precompute today's nowcasts after ingestion completes"
+    ),
 ) -> None:
     """Download and process all environmental data."""
     available_sources = ["era5", "chirps", "map", "modis", "worldpop", "all"]
@@ -167,6 +178,287 @@ def ingest_data(
 
     typer.echo("✅ Data ingestion complete")
 
+    if not dry_run:
+        _invalidate_prediction_cache()
+
+    if features and not dry_run:
+        _materialize_features(date.today(), date.today(), regions=None)
+
+    if nowcast and not dry_run:
+        _run_nowcasts(date.today(), model_types=None)
+
+    if render_tiles and not dry_run:
+        _render_risk_tiles(date.today(), model_types=None, zoom_levels=None)
+
+
+@app.command(name="render-tiles")
+def render_tiles_command(
+    target_date: str = typer.Option(
+        None, help="Date to render tiles for (YYYY-MM-DD, defaults to today)"
+    ),
+    model_type: list[str] = typer.Option(
+        None, help="Model type(s) to render (defaults to configured models)"
+    ),
+    zoom: list[int] = typer.Option(
+        None, help="Zoom level(s) to render (defaults to configured levels)"
+    ),
+    overwrite: bool = typer.Option(False, help="Re-render existing tiles"),
+) -> None:
+    """Precompute XYZ risk map tiles for configured regions."""
+    if target_date:
+        try:
+            tile_date = datetime.strptime(target_date, "%Y-%m-%d").date()
+        except ValueError as e:
+            typer.echo(f"❌ Invalid date format: {e}", err=True)
+            raise typer.Exit(1) from e
+    else:
+        tile_date = date.today()
+
+    _render_risk_tiles(tile_date, model_type or None, zoom or None, overwrite)
+
+
+def _render_risk_tiles(
+    tile_date: date,
+    model_types: list[str] | None,
+    zoom_levels: list[int] | None,
+    overwrite: bool = False,
+) -> None:
+    """Render risk tiles with the prediction service."""
+    import asyncio
+
+    from .api.dependencies import get_prediction_service
+    from .api.models import ModelType
+    from .config import settings
+    from .services.risk_tiles import RiskTileGenerator
+
+    names = model_types or settings.tiles.model_types
+    try:
+        selected_models = [ModelType(name) for name in names]
+    except ValueError as e:
+        typer.echo(f"❌ Unknown model type: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    typer.echo(f"🗺️  Rendering risk tiles for {tile_date}")
+    typer.echo(f"   Models: {', '.join(model.value for model in selected_models)}")
+    typer.echo(f"   Output: {settings.tiles.directory}")
+
+    async def run_render() -> dict:
+        prediction_service = await get_prediction_service()
+        generator = RiskTileGenerator(prediction_service, settings.tiles)
+        return await generator.generate(
+            tile_date,
+            selected_models,
+            zoom_levels=zoom_levels,
+            overwrite=overwrite,
+        )
+
+    summary = asyncio.run(run_render())
+    typer.echo(
+        f"✅ Tiles rendered: {summary['rendered']}, skipped: {summary['skipped']}, "
+        f"failed: {summary['failed']}"
+    )
+    if summary["failed"]:
+        raise typer.Exit(1)
+
+
+@app.command(name="nowcast")
+def nowcast_command(
+    target_date: str = typer.Option(
+        None, help="Date to nowcast (YYYY-MM-DD, defaults to today)"
+    ),
+    model_type: list[str] = typer.Option(
+        None, help="Model type(s) to run (defaults to configured models)"
+    ),
+) -> None:
+    """Precompute predictions for every populated grid cell of configured regions."""
+    if target_date:
+        try:
+            nowcast_date = datetime.strptime(target_date, "%Y-%m-%d").date()
+        except ValueError as e:
+            typer.echo(f"❌ Invalid date format: {e}", err=True)
+            raise typer.Exit(1) from e
+    else:
+        nowcast_date = date.today()
+
+    _run_nowcasts(nowcast_date, model_type or None)
+
+
+def _run_nowcasts(nowcast_date: date, model_types: list[str] | None) -> None:
+    """Write nowcasts with the prediction service."""
+    import asyncio
+
+    from .api.dependencies import get_prediction_service
+    from .api.models import ModelType
+    from .config import settings
+    from .services.nowcast import NowcastGenerator
+
+    names = model_types or settings.nowcast.model_types
+    try:
+        selected_models = [ModelType(name) for name in names]
+    except ValueError as e:
+        typer.echo(f"❌ Unknown model type: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    typer.echo(f"📍 Precomputing nowcasts for {nowcast_date}")
+    typer.echo(f"   Models: {', '.join(model.value for model in selected_models)}")
+    typer.echo(f"   Regions: {', '.join(settings.nowcast.regions)}")
+
+    async def run_nowcast() -> dict:
+        prediction_service = await get_prediction_service()
+        generator = NowcastGenerator(prediction_service, settings.nowcast)
+        return await generator.generate(nowcast_date, selected_models)
+
+    summary = asyncio.run(run_nowcast())
+    typer.echo(
+        f"✅ Nowcasts written: {summary['written']} for {summary['cells']} grid cells, "
+        f"failed: {summary['failed']}, expired: {summary['deleted']}"
+    )
+    if summary["failed"]:
+        raise typer.Exit(1)
+
+
+@app.command(name="materialize-features")
+def materialize_features_command(
+    start_date: str = typer.Option(
+        None, help="First day to materialize (YYYY-MM-DD, defaults to today)"
+    ),
+    end_date: str = typer.Option(
+        None, help="Last day to materialize (YYYY-MM-DD, defaults to start date)"
+    ),
+    region: list[str] = typer.Option(
+        None, help="Region(s) to materialize (defaults to configured regions)"
+    ),
+) -> None:
+    """Write daily model feature vectors of every grid cell to the feature store."""
+    try:
+        start = (
+            datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else date.today()
+        )
+        end = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else start
+    except ValueError as e:
+        typer.echo(f"❌ Invalid date format: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    _materialize_features(start, end, region or None)
+
+
+def _materialize_features(start: date, end: date, regions: list[str] | None) -> None:
+    """Fill the feature store with the prediction service's harmonizer."""
+    import asyncio
+
+    from .api.dependencies import get_prediction_service
+    from .config import settings
+    from .services.feature_store import FeatureStore, FeatureStoreBuilder
+
+    configured = settings.feature_store.regions
+    names = regions or list(configured)
+    unknown = [name for name in names if name not in configured]
+    if unknown:
+        typer.echo(f"❌ Unknown region(s): {', '.join(unknown)}", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(f"🧮 Materializing model features from {start} to {end}")
+    typer.echo(f"   Regions: {', '.join(names)}")
+    typer.echo(f"   Output: {settings.feature_store.directory}")
+
+    async def run_materialize() -> list[dict]:
+        prediction_service = await get_prediction_service()
+        builder = FeatureStoreBuilder(
+            prediction_service, FeatureStore(settings.feature_store.directory)
+        )
+        return [
+            await builder.build(name, configured[name], start, end) for name in names
+        ]
+
+    summaries = asyncio.run(run_materialize())
+    failed = sum(summary["failed"] for summary in summaries)
+    typer.echo(
+        f"✅ Feature days written: {sum(summary['written'] for summary in summaries)}, "
+        f"skipped: {sum(summary['skipped'] for summary in summaries)}, failed: {failed}"
+    )
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command(name="invalidate-prediction-cache")
+def invalidate_prediction_cache_command() -> None:
+    """Invalidate cached predictions, e.g. after loading data by other means."""
+    _invalidate_prediction_cache()
+
+
+def _invalidate_prediction_cache() -> None:
+    """Bump the data version so caches in every process use the new data."""
+    import asyncio
+
+    from .config import settings
+    from .database.session import get_session
+    from .services.prediction_cache import PredictionCache
+
+    async def run_invalidate() -> int:
+        cache = PredictionCache(settings.prediction_cache, session_factory=get_session)
+        try:
+            return await cache.invalidate_data()
+        finally:
+            await cache.close()
+
+    generation = asyncio.run(run_invalidate())
+    typer.echo(f"🧹 Prediction cache invalidated (data generation {generation})")
+
+
+@app.command(name="export-model")
+def export_model_command(
+    model_type: list[str] = typer.Option(
+        None, help="Model type(s) to export (defaults to lstm, transformer and ensemble)"
+    ),
+    checkpoint: str = typer.Option(
+        None, help="Checkpoint to export (requires a single --model-type)"
+    ),
+    output_dir: str = typer.Option(
+        None, help="Export directory (defaults to the configured export path)"
+    ),
+    export_format: list[str] = typer.Option(
+        None, "--format", help="Format(s) to write: torchscript, onnx (defaults to both)"
+    ),
+    seq_len: int = typer.Option(10, help="Input sequence length served"),
+    atol: float = typer.Option(1e-4, help="Allowed absolute difference from eager outputs"),
+) -> None:
+    """Export models to TorchScript/ONNX for CPU serving."""
+    from .api.dependencies import ModelManager
+    from .api.models import ModelType
+    from .config import settings
+    from .ml import MalariaEnsembleModel
+    from .ml.export import EXPORT_FORMATS, export_model
+
+    try:
+        selected_models = [ModelType(name) for name in model_type or [m.value for m in ModelType]]
+    except ValueError as e:
+        typer.echo(f"❌ Unknown model type: {e}", err=True)
+        raise typer.Exit(1) from e
+    if checkpoint and len(selected_models) != 1:
+        typer.echo("❌ --checkpoint needs exactly one --model-type", err=True)
+        raise typer.Exit(1)
+
+    formats = tuple(export_format or EXPORT_FORMATS)
+    root = Path(output_dir) if output_dir else settings.ml_models.export_path
+    manager = ModelManager()
+
+    for selected in selected_models:
+        directory = root / selected.value
+        typer.echo(f"📦 Exporting {selected.value} model to {directory}")
+        try:
+            model = manager.load_checkpoint(selected, checkpoint)
+            if isinstance(model, MalariaEnsembleModel):
+                # Trace the base models as a fork the runtime can run in parallel
+                model.configure_inference(parallel=True, cache_size=0)
+            manifest = export_model(model, directory, formats, seq_len=seq_len, atol=atol)
+        except (ImportError, ValueError) as e:
+            typer.echo(f"❌ Export failed: {e}", err=True)
+            raise typer.Exit(1) from e
+        for name, diff in manifest["parity"].items():
+            typer.echo(f"   {name}: max abs diff vs eager {diff:.2e}")
+
+    typer.echo("✅ Export complete")
+
 
 @app.command(name="ingest-era5")
 def ingest_era5_command(
@@ -181,6 +473,7 @@ def ingest_era5_command(
         typer.echo("DRY RUN MODE - would download ERA5 climate data")
         return
     _ingest_era5_data(dry_run)
+    _invalidate_prediction_cache()
 
 
 @app.command(name="ingest-chirps")
@@ -196,6 +489,7 @@ def ingest_chirps_command(
         typer.echo("DRY RUN MODE - would download CHIRPS rainfall data")
         return
     _ingest_chirps_data(dry_run)
+    _invalidate_prediction_cache()
 
 
 @app.command(name="ingest-map")
@@ -211,6 +505,7 @@ def ingest_map_command(
         typer.echo("DRY RUN MODE - would download MAP data")
         return
     _ingest_map_data(dry_run)
+    _invalidate_prediction_cache()
 
 
 @app.command(name="ingest-modis")
@@ -227,6 +522,7 @@ def ingest_modis_command(
         typer.echo("DRY RUN MODE - would download MODIS vegetation data")
         return
     _ingest_modis_data(dry_run)
+    _invalidate_prediction_cache()
 
 
 @app.command()
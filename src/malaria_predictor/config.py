@@ -80,6 +80,40 @@ class DatabaseSettings(BaseModel):
         le=86400,
         description="Pool connection recycle time in seconds",
     )
+    statement_cache_size: int = Field(
+        default=500,
+        ge=0,
+        le=10000,
+        description="Prepared statements cached per asyncpg connection (0 disables)",
+    )
+    query_cache_size: int = Field(
+        default=1200,
+        ge=0,
+        le=100000,
+        description="Compiled SQL statements cached by the SQLAlchemy engine",
+    )
+    replica_urls: list[str] = Field(
+        default_factory=list,
+        description="Read replica URLs for analytics and reporting sessions",
+    )
+    replica_retry_seconds: int = Field(
+        default=30,
+        ge=1,
+        le=3600,
+        description="Seconds before a failed or lagging replica is tried again",
+    )
+    replica_max_lag_seconds: int = Field(
+        default=300,
+        ge=1,
+        le=86400,
+        description="Replication lag above which a replica is taken out of rotation",
+    )
+    replica_check_seconds: int = Field(
+        default=15,
+        ge=1,
+        le=3600,
+        description="How often the API probes replica lag and refreshes the rotation",
+    )
 
     @field_validator("url")
     @classmethod
@@ -191,7 +225,8 @@ class MLModelSettings(BaseModel):
         default=4096,
         ge=512,
         le=32768,
-        description="Maximum memory usage for models in MB",
+        description="Memory budget for resident models in MB; least recently used "
+        "idle models are unloaded beyond it",
     )
     device: str = Field(
         default="auto", description="Device for model inference (auto, cpu, cuda)"
@@ -199,14 +234,71 @@ class MLModelSettings(BaseModel):
     batch_size: int = Field(
         default=32, ge=1, le=1024, description="Default batch size for model inference"
     )
+    runtime: str = Field(
+        default="torch",
+        description="Serving runtime (torch, torchscript, onnx); exported runtimes "
+        "load models written by `malaria-predictor export-model`",
+    )
+    export_path: Path = Field(
+        default=Path("./models/exported"),
+        description="Directory of exported TorchScript/ONNX models",
+    )
+    intra_op_threads: int = Field(
+        default=0, ge=0, le=256, description="Threads within an operator (0 = runtime default)"
+    )
+    inter_op_threads: int = Field(
+        default=0, ge=0, le=256, description="Operators run in parallel (0 = runtime default)"
+    )
+    ensemble_parallel: bool = Field(
+        default=True, description="Run the ensemble's LSTM and Transformer concurrently"
+    )
+    ensemble_cache_size: int = Field(
+        default=256,
+        ge=0,
+        le=65536,
+        description="Input batches whose ensemble base-model outputs are cached (0 = off)",
+    )
+    warmup_runs: int = Field(
+        default=2, ge=0, le=100, description="Warm-up inferences after loading a model"
+    )
+    swap_drain_timeout: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=600.0,
+        description="Seconds a hot swap waits for requests on the old model version",
+    )
+    quantized_models: list[str] = Field(
+        default=[],
+        description="Model types served as int8 dynamically quantized variants "
+        "(torch runtime)",
+    )
 
-    @field_validator("storage_path")
+    @field_validator("storage_path", "export_path")
     @classmethod
     def validate_storage_path(cls, v: str | Path) -> Path:
         """Validate and normalize storage path."""
         path = Path(v) if isinstance(v, str) else v
         return path.absolute()
 
+    @field_validator("runtime")
+    @classmethod
+    def validate_runtime(cls, v: str) -> str:
+        """Validate serving runtime."""
+        valid_runtimes = ["torch", "torchscript", "onnx"]
+        if v not in valid_runtimes:
+            raise ValueError(f"Runtime must be one of: {valid_runtimes}")
+        return v
+
+    @field_validator("quantized_models")
+    @classmethod
+    def validate_quantized_models(cls, v: list[str]) -> list[str]:
+        """Validate quantized model types."""
+        valid_models = ["lstm", "transformer", "ensemble"]
+        invalid = [model for model in v if model not in valid_models]
+        if invalid:
+            raise ValueError(f"Quantized models must be among: {valid_models}")
+        return v
+
     @field_validator("device")
     @classmethod
     def validate_device(cls, v: str) -> str:
@@ -251,6 +343,182 @@ class DataSettings(BaseModel):
         return path.absolute()
 
 
+class PredictionCacheSettings(BaseModel):
+    """Prediction result cache configuration settings."""
+
+    enabled: bool = Field(default=True, description="Cache single-location predictions")
+    cell_size_degrees: float = Field(
+        default=0.01,
+        gt=0.0,
+        le=1.0,
+        description="Grid cell edge that coordinates are snapped to (0.01 is about 1 km)",
+    )
+    max_entries: int = Field(
+        default=10000, ge=0, le=1_000_000, description="In-process LRU entries (0 = off)"
+    )
+    ttl: int = Field(
+        default=21600, ge=60, le=604800, description="Cached prediction TTL in seconds"
+    )
+    use_redis: bool = Field(
+        default=False, description="Share cached predictions between replicas through Redis"
+    )
+    redis_db: int | None = Field(
+        default=None, ge=0, le=15, description="Redis database, the default one when unset"
+    )
+    generation_refresh_seconds: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=300.0,
+        description="How often replicas re-read the data generation from Redis",
+    )
+
+
+def _validate_region_boxes(
+    regions: dict[str, tuple[float, float, float, float]],
+) -> dict[str, tuple[float, float, float, float]]:
+    """Check (west, south, east, north) boxes of named regions."""
+    for name, (west, south, east, north) in regions.items():
+        if not (-180 <= west < east <= 180):
+            raise ValueError(
+                f"Region '{name}' must have -180 <= west < east <= 180; "
+                "split regions crossing the antimeridian in two"
+            )
+        if not (-90 <= south < north <= 90):
+            raise ValueError(f"Region '{name}' must have -90 <= south < north <= 90")
+    return regions
+
+
+class TileSettings(BaseModel):
+    """Precomputed risk tile configuration settings."""
+
+    directory: Path = Field(
+        default=Path("./data/tiles"), description="Path to store rendered risk tiles"
+    )
+    tile_size: int = Field(
+        default=256, ge=64, le=1024, description="Tile edge length in pixels"
+    )
+    samples_per_tile: int = Field(
+        default=32,
+        ge=1,
+        le=256,
+        description="Prediction samples per tile edge (upsampled to tile_size)",
+    )
+    zoom_levels: list[int] = Field(
+        default=[3, 4, 5, 6, 7, 8], description="XYZ zoom levels to precompute"
+    )
+    regions: dict[str, tuple[float, float, float, float]] = Field(
+        default={"africa": (-20.0, -35.0, 55.0, 40.0)},
+        description="Named regions to render as (west, south, east, north)",
+    )
+    model_types: list[str] = Field(
+        default=["ensemble"], description="Model types to render tiles for"
+    )
+    tiles_per_batch: int = Field(
+        default=16,
+        ge=1,
+        le=1024,
+        description="Tiles whose samples are predicted in one batched call",
+    )
+
+    @field_validator("directory")
+    @classmethod
+    def validate_directory(cls, v: str | Path) -> Path:
+        """Validate and normalize tile directory path."""
+        path = Path(v) if isinstance(v, str) else v
+        return path.absolute()
+
+    @field_validator("regions")
+    @classmethod
+    def validate_regions(
+        cls, v: dict[str, tuple[float, float, float, float]]
+    ) -> dict[str, tuple[float, float, float, float]]:
+        """Validate region boxes; each is harmonized as one contiguous box."""
+        return _validate_region_boxes(v)
+
+    @model_validator(mode="after")
+    def validate_sampling(self) -> "TileSettings":
+        """Ensure samples divide evenly into tile pixels."""
+        if self.tile_size % self.samples_per_tile != 0:
+            raise ValueError("tile_size must be a multiple of samples_per_tile")
+        if any(z < 0 or z > 18 for z in self.zoom_levels):
+            raise ValueError("Zoom levels must be between 0 and 18")
+        return self
+
+
+class NowcastSettings(BaseModel):
+    """Precomputed daily nowcast configuration settings."""
+
+    serve: bool = Field(
+        default=False,
+        description="Serve prediction endpoints from precomputed nowcasts when available",
+    )
+    regions: dict[str, tuple[float, float, float, float]] = Field(
+        default={"africa": (-20.0, -35.0, 55.0, 40.0)},
+        description="Named regions whose grid cells are nowcast, as (west, south, east, north)",
+    )
+    model_types: list[str] = Field(
+        default=["ensemble"], description="Model types to precompute nowcasts for"
+    )
+    cell_size_degrees: float = Field(
+        default=0.1,
+        ge=0.001,
+        le=1.0,
+        description="Spacing of the nowcast grid; lookups snap to the cell containing them",
+    )
+    batch_size: int = Field(
+        default=1024,
+        ge=1,
+        le=65536,
+        description="Grid cells per forward pass, predicted as one square block",
+    )
+    retention_days: int = Field(
+        default=30, ge=1, le=3650, description="Days of past nowcasts to keep"
+    )
+
+    @field_validator("regions")
+    @classmethod
+    def validate_regions(
+        cls, v: dict[str, tuple[float, float, float, float]]
+    ) -> dict[str, tuple[float, float, float, float]]:
+        """Validate region boxes; each is harmonized as one contiguous box."""
+        return _validate_region_boxes(v)
+
+
+class FeatureStoreSettings(BaseModel):
+    """Materialized model feature store configuration settings."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Read model inputs from the feature store when it covers a request",
+    )
+    directory: Path = Field(
+        default=Path("./data/features"),
+        description="Path of the memory-mapped feature arrays",
+    )
+    seq_len: int = Field(
+        default=10, ge=1, le=365, description="Days of features in each model input"
+    )
+    regions: dict[str, tuple[float, float, float, float]] = Field(
+        default={"africa": (-20.0, -35.0, 55.0, 40.0)},
+        description="Named regions to materialize, as (west, south, east, north)",
+    )
+
+    @field_validator("directory")
+    @classmethod
+    def validate_directory(cls, v: str | Path) -> Path:
+        """Validate and normalize feature store directory path."""
+        path = Path(v) if isinstance(v, str) else v
+        return path.absolute()
+
+    @field_validator("regions")
+    @classmethod
+    def validate_regions(
+        cls, v: dict[str, tuple[float, float, float, float]]
+    ) -> dict[str, tuple[float, float, float, float]]:
+        """Validate region boxes; each is harmonized as one contiguous box."""
+        return _validate_region_boxes(v)
+
+
 class MonitoringSettings(BaseModel):
     """Monitoring and observability configuration settings."""
 
@@ -434,6 +702,19 @@ class Settings(BaseSettings):
     monitoring: MonitoringSettings = Field(
         default_factory=MonitoringSettings, description="Monitoring configuration"
     )
+    prediction_cache: PredictionCacheSettings = Field(
+        default_factory=PredictionCacheSettings,
+        description="Prediction result cache configuration",
+    )
+    tiles: TileSettings = Field(
+        default_factory=TileSettings, description="Risk tile configuration"
+    )
+    nowcast: NowcastSettings = Field(
+        default_factory=NowcastSettings, description="Daily nowcast configuration"
+    )
+    feature_store: FeatureStoreSettings = Field(
+        default_factory=FeatureStoreSettings, description="Model feature store configuration"
+    )
     fcm: FCMSettings = Field(
         default_factory=FCMSettings, description="Firebase Cloud Messaging configuration"
     )
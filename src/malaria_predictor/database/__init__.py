@@ -7,10 +7,14 @@ and prediction data.
 
 from .models import (
     Base,
+    DataVersion,
     ERA5DataPoint,
+    GridCell,
+    LatestRisk,
     LocationTimeSeries,
     MalariaRiskIndex,
     ProcessedClimateData,
+    RiskNowcast,
 )
 from .security_models import (
     APIKey,
@@ -21,14 +25,18 @@ from .security_models import (
     SecuritySettings,
     User,
 )
-from .session import get_session, init_database
+from .session import get_read_session, get_session, init_database
 
 __all__ = [
     "Base",
     "ERA5DataPoint",
+    "GridCell",
     "ProcessedClimateData",
     "LocationTimeSeries",
     "MalariaRiskIndex",
+    "LatestRisk",
+    "RiskNowcast",
+    "DataVersion",
     "User",
     "APIKey",
     "RefreshToken",
@@ -37,5 +45,6 @@ __all__ = [
     "IPAllowlist",
     "RateLimitLog",
     "get_session",
+    "get_read_session",
     "init_database",
 ]
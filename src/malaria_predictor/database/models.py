@@ -11,6 +11,7 @@ from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    Date,
     DateTime,
     Float,
     ForeignKey,
@@ -62,6 +63,33 @@ class Base(DeclarativeBase):
     pass
 
 
+class GridCell(Base):
+    """Location dimension shared by the time-series fact tables.
+
+    Each distinct coordinate pair (rounded to a fixed number of decimals)
+    gets a compact integer key, so facts from different sources index and
+    join on ``grid_cell_id`` instead of float latitude/longitude pairs.
+    """
+
+    __tablename__ = "grid_cells"
+
+    id = Column(Integer, primary_key=True)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+
+    # Administrative codes, filled in by boundary lookups when available
+    country_code = Column(String(3), nullable=True)
+    admin1_code = Column(String(20), nullable=True)
+    admin2_code = Column(String(20), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("latitude", "longitude", name="uq_grid_cell_location"),
+        Index("idx_grid_cell_country", "country_code", "admin1_code"),
+    )
+
+
 class ERA5DataPoint(Base):
     """Raw ERA5 climate data points.
 
@@ -75,6 +103,7 @@ class ERA5DataPoint(Base):
     timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
+    grid_cell_id = Column(Integer, ForeignKey("grid_cells.id"), nullable=True)
 
     # Temperature data (Celsius)
     temperature_2m = Column(Float, nullable=True)
@@ -98,8 +127,7 @@ class ERA5DataPoint(Base):
     file_reference = Column(String(500), nullable=True)
 
     __table_args__ = (
-        Index("idx_era5_location", "latitude", "longitude"),
-        Index("idx_era5_timestamp_location", "timestamp", "latitude", "longitude"),
+        Index("idx_era5_cell_timestamp", "grid_cell_id", "timestamp"),
         UniqueConstraint(
             "timestamp", "latitude", "longitude", name="uq_era5_timestamp_location"
         ),
@@ -119,6 +147,7 @@ class ProcessedClimateData(Base):
     date = Column(DateTime(timezone=True), nullable=False, index=True)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
+    grid_cell_id = Column(Integer, ForeignKey("grid_cells.id"), nullable=True)
 
     # Aggregated temperature metrics (Celsius)
     mean_temperature = Column(Float, nullable=False)
@@ -145,8 +174,7 @@ class ProcessedClimateData(Base):
     source_file_reference = Column(String(500), nullable=True)
 
     __table_args__ = (
-        Index("idx_processed_location", "latitude", "longitude"),
-        Index("idx_processed_date_location", "date", "latitude", "longitude"),
+        Index("idx_processed_cell_date", "grid_cell_id", "date"),
         UniqueConstraint(
             "date", "latitude", "longitude", name="uq_processed_date_location"
         ),
@@ -167,6 +195,7 @@ class LocationTimeSeries(Base):
     location_name = Column(String(200), nullable=False)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
+    grid_cell_id = Column(Integer, ForeignKey("grid_cells.id"), nullable=True, index=True)
     country_code = Column(String(3), nullable=False)
     admin_level = Column(String(100), nullable=True)
 
@@ -207,6 +236,7 @@ class CHIRPSDataPoint(Base):
     date = Column(DateTime(timezone=True), nullable=False, index=True)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
+    grid_cell_id = Column(Integer, ForeignKey("grid_cells.id"), nullable=True)
 
     # Precipitation data (mm)
     precipitation = Column(Float, nullable=False)
@@ -228,8 +258,7 @@ class CHIRPSDataPoint(Base):
     file_reference = Column(String(500), nullable=True)
 
     __table_args__ = (
-        Index("idx_chirps_location", "latitude", "longitude"),
-        Index("idx_chirps_date_location", "date", "latitude", "longitude"),
+        Index("idx_chirps_cell_date", "grid_cell_id", "date"),
         UniqueConstraint(
             "date", "latitude", "longitude", name="uq_chirps_date_location"
         ),
@@ -249,6 +278,7 @@ class MODISDataPoint(Base):
     date = Column(DateTime(timezone=True), nullable=False, index=True)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
+    grid_cell_id = Column(Integer, ForeignKey("grid_cells.id"), nullable=True)
 
     # Vegetation indices
     ndvi = Column(Float, nullable=True)  # Normalized Difference Vegetation Index
@@ -278,8 +308,7 @@ class MODISDataPoint(Base):
     file_reference = Column(String(500), nullable=True)
 
     __table_args__ = (
-        Index("idx_modis_location", "latitude", "longitude"),
-        Index("idx_modis_date_location", "date", "latitude", "longitude"),
+        Index("idx_modis_cell_date", "grid_cell_id", "date"),
         Index("idx_modis_ndvi", "ndvi"),
         UniqueConstraint(
             "date",
@@ -421,6 +450,7 @@ class MalariaRiskIndex(Base):
     assessment_date = Column(DateTime(timezone=True), nullable=False, index=True)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
+    grid_cell_id = Column(Integer, ForeignKey("grid_cells.id"), nullable=True)
     location_name = Column(String(200), nullable=True)
 
     # Risk scores (0-1 scale)
@@ -450,12 +480,85 @@ class MalariaRiskIndex(Base):
     data_sources = Column(JSON, nullable=True)  # ["ERA5", "CHIRPS", etc.]
 
     __table_args__ = (
-        Index("idx_risk_location", "latitude", "longitude"),
-        Index("idx_risk_date_location", "assessment_date", "latitude", "longitude"),
+        Index("idx_risk_cell_date", "grid_cell_id", "assessment_date"),
+        Index(
+            "idx_risk_location_latest",
+            "latitude",
+            "longitude",
+            assessment_date.desc(),
+        ),
         Index("idx_risk_level", "risk_level"),
     )
 
 
+class LatestRisk(Base):
+    """Most recent risk assessment per location.
+
+    One row per (latitude, longitude), upserted whenever a newer
+    MalariaRiskIndex row is written, so dashboard maps read a single row
+    per location instead of scanning assessment history.
+    """
+
+    __tablename__ = "latest_risk"
+
+    latitude = Column(Float, primary_key=True)
+    longitude = Column(Float, primary_key=True)
+    risk_index_id = Column(Integer, nullable=False)
+    assessment_date = Column(DateTime(timezone=True), nullable=False)
+    location_name = Column(String(200), nullable=True)
+
+    composite_risk_score = Column(Float, nullable=False)
+    risk_level = Column(String(20), nullable=False)
+    confidence_score = Column(Float, nullable=False)
+    prediction_date = Column(DateTime(timezone=True), nullable=False)
+    time_horizon_days = Column(Integer, nullable=False)
+    model_version = Column(String(20), nullable=False)
+    model_type = Column(String(50), nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (Index("idx_latest_risk_level", "risk_level"),)
+
+
+class RiskNowcast(Base):
+    """Precomputed model prediction per grid cell and day.
+
+    Written in bulk by the daily nowcast job for every populated grid cell
+    of the configured regions, and read by the prediction endpoints
+    instead of running harmonization and inference per request. Rows are
+    only served while ``model_version`` is the active version of
+    ``model_type``.
+    """
+
+    __tablename__ = "risk_nowcasts"
+
+    target_date = Column(Date, primary_key=True)
+    model_type = Column(String(20), primary_key=True)
+    grid_cell_id = Column(Integer, ForeignKey("grid_cells.id"), primary_key=True)
+
+    # First-day model output, the same for every prediction horizon
+    risk_score = Column(Float, nullable=False)
+    uncertainty = Column(Float, nullable=True)
+    model_version = Column(String(50), nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class DataVersion(Base):
+    """Named counter bumped after each data ingestion or risk assessment edit.
+
+    Caches of derived results (predictions, report sections) key entries
+    by the version, so every process sees new data by re-reading one row
+    instead of scanning the data tables.
+    """
+
+    __tablename__ = "data_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class AlertConfiguration(Base):
     """Alert configuration and threshold settings.
 
@@ -1057,6 +1160,10 @@ class ReportSchedule(Base):
     next_execution = Column(DateTime(timezone=True), nullable=True, index=True)
     last_execution = Column(DateTime(timezone=True), nullable=True)
 
+    # Execution lease held by the scheduler worker running this schedule
+    lease_owner = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+
     # Delivery configuration
     delivery_methods = Column(JSON, nullable=False)  # ["email", "webhook", "storage"]
     email_recipients = Column(JSON, nullable=True)  # List of email addresses
@@ -1089,6 +1196,7 @@ class ReportSchedule(Base):
         Index("idx_schedule_user_active", "created_by", "is_active"),
         Index("idx_schedule_next_execution", "next_execution", "is_active"),
         Index("idx_schedule_template", "template_id", "is_active"),
+        Index("idx_schedule_lease", "lease_expires_at"),
     )
 
 
@@ -1212,37 +1320,128 @@ SELECT create_hypertable('report_metrics', 'metric_date',
     chunk_time_interval => INTERVAL '1 month',
     if_not_exists => TRUE);
 
--- Create spatial indexes for geospatial queries
-CREATE INDEX IF NOT EXISTS idx_era5_location_gist
-ON era5_data_points USING GIST (ST_Point(longitude, latitude));
+-- Grid cell dimension geometry for cell lookups by area
+ALTER TABLE grid_cells ADD COLUMN IF NOT EXISTS geom geometry(Point, 4326)
+    GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_grid_cell_geom
+ON grid_cells USING GIST (geom);
+
+-- Generated point geometry with GiST index for spatial range queries.
+-- The column is not mapped on the models (SQLite test databases have no
+-- PostGIS); repositories reference it by name.
+ALTER TABLE era5_data_points ADD COLUMN IF NOT EXISTS geom geometry(Point, 4326)
+    GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_era5_geom
+ON era5_data_points USING GIST (geom);
 
-CREATE INDEX IF NOT EXISTS idx_chirps_location_gist
-ON chirps_data_points USING GIST (ST_Point(longitude, latitude));
+ALTER TABLE processed_climate_data ADD COLUMN IF NOT EXISTS geom geometry(Point, 4326)
+    GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)) STORED;
 
-CREATE INDEX IF NOT EXISTS idx_modis_location_gist
-ON modis_data_points USING GIST (ST_Point(longitude, latitude));
+CREATE INDEX IF NOT EXISTS idx_processed_geom
+ON processed_climate_data USING GIST (geom);
 
-CREATE INDEX IF NOT EXISTS idx_map_location_gist
-ON map_data_points USING GIST (ST_Point(longitude, latitude));
+ALTER TABLE chirps_data_points ADD COLUMN IF NOT EXISTS geom geometry(Point, 4326)
+    GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)) STORED;
 
-CREATE INDEX IF NOT EXISTS idx_worldpop_location_gist
-ON worldpop_data_points USING GIST (ST_Point(longitude, latitude));
+CREATE INDEX IF NOT EXISTS idx_chirps_geom
+ON chirps_data_points USING GIST (geom);
 
--- Create continuous aggregates for common queries
+ALTER TABLE modis_data_points ADD COLUMN IF NOT EXISTS geom geometry(Point, 4326)
+    GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_modis_geom
+ON modis_data_points USING GIST (geom);
+
+ALTER TABLE map_data_points ADD COLUMN IF NOT EXISTS geom geometry(Point, 4326)
+    GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_map_geom
+ON map_data_points USING GIST (geom);
+
+ALTER TABLE worldpop_data_points ADD COLUMN IF NOT EXISTS geom geometry(Point, 4326)
+    GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_worldpop_geom
+ON worldpop_data_points USING GIST (geom);
+
+ALTER TABLE malaria_risk_indices ADD COLUMN IF NOT EXISTS geom geometry(Point, 4326)
+    GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_risk_geom
+ON malaria_risk_indices USING GIST (geom);
+
+-- Create continuous aggregates for common queries. Climate and alert
+-- rollups keep counts next to averages so repositories can combine
+-- locations and configurations exactly; materialized_only = false adds
+-- raw rows newer than the last refresh.
 CREATE MATERIALIZED VIEW IF NOT EXISTS daily_climate_summary
-WITH (timescaledb.continuous) AS
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
 SELECT
     time_bucket('1 day', timestamp) AS day,
     latitude,
     longitude,
     AVG(temperature_2m) as avg_temp,
+    COUNT(temperature_2m) as temp_count,
     MAX(temperature_2m_max) as max_temp,
     MIN(temperature_2m_min) as min_temp,
-    SUM(total_precipitation) as total_precip
+    SUM(total_precipitation) as total_precip,
+    COUNT(*) as data_points
 FROM era5_data_points
 GROUP BY day, latitude, longitude
 WITH NO DATA;
 
+CREATE MATERIALIZED VIEW IF NOT EXISTS weekly_climate_summary
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket('7 days', timestamp) AS week,
+    latitude,
+    longitude,
+    AVG(temperature_2m) as avg_temp,
+    COUNT(temperature_2m) as temp_count,
+    MAX(temperature_2m_max) as max_temp,
+    MIN(temperature_2m_min) as min_temp,
+    SUM(total_precipitation) as total_precip,
+    COUNT(*) as data_points
+FROM era5_data_points
+GROUP BY week, latitude, longitude
+WITH NO DATA;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS daily_alert_summary
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket('1 day', created_at) AS day,
+    configuration_id,
+    COUNT(*) as alert_count,
+    SUM(risk_score) as risk_score_sum,
+    COUNT(risk_score) as risk_score_count,
+    SUM(CASE WHEN push_notification_delivered OR email_notification_delivered
+        OR sms_notification_delivered OR webhook_notification_delivered
+        THEN 1 ELSE 0 END) as delivered_count,
+    COUNT(acknowledged_at) as acknowledged_count,
+    COUNT(escalated_at) as escalation_count
+FROM alerts
+GROUP BY day, configuration_id
+WITH NO DATA;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS weekly_alert_summary
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket('7 days', created_at) AS week,
+    configuration_id,
+    COUNT(*) as alert_count,
+    SUM(risk_score) as risk_score_sum,
+    COUNT(risk_score) as risk_score_count,
+    SUM(CASE WHEN push_notification_delivered OR email_notification_delivered
+        OR sms_notification_delivered OR webhook_notification_delivered
+        THEN 1 ELSE 0 END) as delivered_count,
+    COUNT(acknowledged_at) as acknowledged_count,
+    COUNT(escalated_at) as escalation_count
+FROM alerts
+GROUP BY week, configuration_id
+WITH NO DATA;
+
 CREATE MATERIALIZED VIEW IF NOT EXISTS weekly_precipitation_summary
 WITH (timescaledb.continuous) AS
 SELECT
@@ -1276,6 +1475,26 @@ SELECT add_continuous_aggregate_policy('daily_climate_summary',
     schedule_interval => INTERVAL '1 hour',
     if_not_exists => TRUE);
 
+SELECT add_continuous_aggregate_policy('weekly_climate_summary',
+    start_offset => INTERVAL '2 months',
+    end_offset => INTERVAL '1 day',
+    schedule_interval => INTERVAL '6 hours',
+    if_not_exists => TRUE);
+
+-- Alerts are acknowledged and escalated after creation, so refresh a
+-- longer window than for append-only climate data
+SELECT add_continuous_aggregate_policy('daily_alert_summary',
+    start_offset => INTERVAL '90 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '1 hour',
+    if_not_exists => TRUE);
+
+SELECT add_continuous_aggregate_policy('weekly_alert_summary',
+    start_offset => INTERVAL '90 days',
+    end_offset => INTERVAL '1 day',
+    schedule_interval => INTERVAL '6 hours',
+    if_not_exists => TRUE);
+
 SELECT add_continuous_aggregate_policy('weekly_precipitation_summary',
     start_offset => INTERVAL '2 months',
     end_offset => INTERVAL '1 day',
@@ -1287,4 +1506,51 @@ SELECT add_continuous_aggregate_policy('monthly_vegetation_summary',
     end_offset => INTERVAL '1 week',
     schedule_interval => INTERVAL '1 day',
     if_not_exists => TRUE);
+
+-- Native compression of older chunks, segmented by grid cell so
+-- per-location range queries decompress only their own segments
+ALTER TABLE era5_data_points SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'grid_cell_id',
+    timescaledb.compress_orderby = 'timestamp DESC');
+
+ALTER TABLE chirps_data_points SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'grid_cell_id',
+    timescaledb.compress_orderby = 'date DESC');
+
+ALTER TABLE modis_data_points SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'grid_cell_id',
+    timescaledb.compress_orderby = 'date DESC');
+
+ALTER TABLE processed_climate_data SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'grid_cell_id',
+    timescaledb.compress_orderby = 'date DESC');
+
+ALTER TABLE alerts SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'configuration_id',
+    timescaledb.compress_orderby = 'created_at DESC');
+
+SELECT add_compression_policy('era5_data_points', INTERVAL '30 days',
+    if_not_exists => TRUE);
+
+SELECT add_compression_policy('chirps_data_points', INTERVAL '30 days',
+    if_not_exists => TRUE);
+
+SELECT add_compression_policy('modis_data_points', INTERVAL '90 days',
+    if_not_exists => TRUE);
+
+SELECT add_compression_policy('processed_climate_data', INTERVAL '30 days',
+    if_not_exists => TRUE);
+
+SELECT add_compression_policy('alerts', INTERVAL '90 days',
+    if_not_exists => TRUE);
+
+-- Retention: raw ERA5 rows older than a year are dropped chunk by chunk;
+-- the continuous aggregates keep their rollups
+SELECT add_retention_policy('era5_data_points', INTERVAL '365 days',
+    if_not_exists => TRUE);
 """
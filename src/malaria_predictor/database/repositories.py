@@ -6,27 +6,533 @@ clean separation of concerns and testability.
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import cast
+import math
+from collections.abc import AsyncIterator, Iterable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, cast
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import and_, func, select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    and_,
+    bindparam,
+    column,
+    func,
+    literal_column,
+    select,
+    table,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..services.data_processor import ProcessingResult
 from .models import (
     CHIRPSDataPoint,
+    DataVersion,
     ERA5DataPoint,
+    GridCell,
+    LatestRisk,
     MalariaRiskIndex,
     MODISDataPoint,
     ProcessedClimateData,
+    RiskNowcast,
     WorldPopDataPoint,
 )
 from .security_models import User
 
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    ARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_KM = 6371.0088
+
+# Shortest length of one degree of latitude on the WGS84 spheroid, so degree
+# boxes derived from a km radius always enclose the circle
+MIN_KM_PER_DEGREE = 110.5
+
+# Decimal places kept when resolving coordinates to grid cells (~11 m)
+GRID_CELL_PRECISION = 4
+
+# ERA5 continuous aggregates by granularity: (view, bucket column)
+CLIMATE_AGGREGATES = {
+    "daily": ("daily_climate_summary", "day"),
+    "weekly": ("weekly_climate_summary", "week"),
+}
+
+CLIMATE_GRANULARITIES = ("hourly", "daily", "weekly")
+
+# Rows per keyset page in the streaming reads
+STREAM_BATCH_SIZE = 10_000
+
+# Rows per statement in the nowcast bulk upsert
+NOWCAST_WRITE_CHUNK = 5_000
+
+# DataVersion rows bumped after every data ingestion and risk assessment edit
+INGESTION_VERSION = "ingestion"
+RISK_EDIT_VERSION = "risk_assessment_edits"
+
+# ProcessedClimateData columns returned by get_location_data
+PROCESSED_FRAME_COLUMNS = (
+    "date",
+    "mean_temperature",
+    "max_temperature",
+    "min_temperature",
+    "temperature_suitability",
+    "daily_precipitation_mm",
+    "mean_relative_humidity",
+)
+
+# MalariaRiskIndex columns copied into LatestRisk
+LATEST_RISK_FIELDS = (
+    "assessment_date",
+    "location_name",
+    "composite_risk_score",
+    "risk_level",
+    "confidence_score",
+    "prediction_date",
+    "time_horizon_days",
+    "model_version",
+    "model_type",
+)
+
+# Latest-risk map lookups are built once with bind parameters so every call
+# shares one compiled statement and one prepared statement per connection
+_LATEST_RISK_IN_BOX = (
+    select(LatestRisk)
+    .where(
+        LatestRisk.latitude >= bindparam("south"),
+        LatestRisk.latitude <= bindparam("north"),
+        LatestRisk.longitude >= bindparam("west"),
+        LatestRisk.longitude <= bindparam("east"),
+    )
+    .order_by(LatestRisk.latitude, LatestRisk.longitude)
+)
+_LATEST_RISK_IN_BOX_BY_LEVEL = _LATEST_RISK_IN_BOX.where(
+    LatestRisk.risk_level.in_(bindparam("risk_levels", expanding=True))
+)
+
+
+def _is_postgresql(session: AsyncSession) -> bool:
+    """Whether the session is bound to PostgreSQL (PostGIS ``geom`` columns,
+    arrays); anything else is treated like the SQLite test database."""
+    bind = session.bind
+    return bind is not None and bind.dialect.name == "postgresql"
+
+
+def _coordinate_array(locations: Iterable[tuple[float, float]]) -> Any:
+    """Coordinates as a derived table ``requested(latitude, longitude)``.
+
+    The pairs are bound as two PostgreSQL arrays expanded with ``unnest``,
+    so the statement size does not grow with the number of locations.
+    """
+    latitudes, longitudes = zip(*locations, strict=True)
+    return (
+        func.unnest(
+            bindparam("latitudes", list(latitudes), ARRAY(Float)),
+            bindparam("longitudes", list(longitudes), ARRAY(Float)),
+        )
+        .table_valued("latitude", "longitude")
+        .render_derived()
+        .alias("requested")
+    )
+
+
+def grid_cell_key(latitude: float, longitude: float) -> tuple[float, float]:
+    """Coordinates of the grid cell a point resolves to.
+
+    Rounds half up in double precision, ``floor(x * scale + 0.5) / scale``,
+    the same expression the grid_cells migration backfills with in SQL.
+    ``round()`` would differ from it at half-way values.
+    """
+    scale = 10**GRID_CELL_PRECISION
+    return (
+        math.floor(latitude * scale + 0.5) / scale,
+        math.floor(longitude * scale + 0.5) / scale,
+    )
+
+
+def _radius_box(latitude: float, radius_km: float) -> tuple[float, float]:
+    """Latitude and longitude half-widths (degrees) enclosing a km radius."""
+    lat_delta = radius_km / MIN_KM_PER_DEGREE
+    widest = min(abs(latitude) + lat_delta, 90.0)
+    cos_lat = math.cos(math.radians(widest))
+    lon_delta = 180.0 if cos_lat < 1e-9 else min(lat_delta / cos_lat, 180.0)
+    return lat_delta, lon_delta
+
+
+def _location_filter(
+    session: AsyncSession,
+    model: Any,
+    latitude: float,
+    longitude: float,
+    buffer_degrees: float = 0.25,
+    radius_km: float | None = None,
+) -> ColumnElement[bool]:
+    """Build a location filter for a table with latitude/longitude columns.
+
+    On PostgreSQL the box is matched with the ``&&`` operator against the
+    generated ``geom`` column so its GiST index is used; a ``radius_km`` adds
+    ``ST_DWithin`` on geography for true great-circle distance. Other
+    dialects get plain latitude/longitude ranges, and callers apply
+    ``_within_radius`` to the rows.
+
+    Args:
+        session: Session the query will run on
+        model: Mapped class with ``latitude`` and ``longitude``
+        latitude: Center latitude
+        longitude: Center longitude
+        buffer_degrees: Half-width of the box when no radius is given
+        radius_km: Optional great-circle radius in kilometres
+
+    Returns:
+        Boolean SQL expression
+    """
+    if radius_km is None:
+        lat_delta = lon_delta = buffer_degrees
+    else:
+        lat_delta, lon_delta = _radius_box(latitude, radius_km)
+
+    if _is_postgresql(session):
+        geom = literal_column(f"{model.__tablename__}.geom")
+        envelope = func.ST_MakeEnvelope(
+            longitude - lon_delta,
+            latitude - lat_delta,
+            longitude + lon_delta,
+            latitude + lat_delta,
+            4326,
+        )
+        clauses = [geom.op("&&")(envelope)]
+        if radius_km is not None:
+            center = func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326)
+            clauses.append(
+                func.ST_DWithin(
+                    func.geography(geom), func.geography(center), radius_km * 1000.0
+                )
+            )
+        return and_(*clauses)
+
+    return and_(
+        model.latitude >= latitude - lat_delta,
+        model.latitude <= latitude + lat_delta,
+        model.longitude >= longitude - lon_delta,
+        model.longitude <= longitude + lon_delta,
+    )
+
+
+def _within_radius(
+    session: AsyncSession,
+    rows: list,
+    latitude: float,
+    longitude: float,
+    radius_km: float | None,
+) -> list:
+    """Drop rows outside ``radius_km`` where the database could not check it."""
+    if radius_km is None or _is_postgresql(session):
+        return rows
+    return [
+        row
+        for row in rows
+        if haversine_km(latitude, longitude, row.latitude, row.longitude) <= radius_km
+    ]
+
+
+async def _upsert_latest_risk(session: AsyncSession, risk_index: MalariaRiskIndex) -> None:
+    """Point ``latest_risk`` at a flushed assessment unless a newer one is there."""
+    values = {
+        "latitude": risk_index.latitude,
+        "longitude": risk_index.longitude,
+        "risk_index_id": risk_index.id,
+        **{field: getattr(risk_index, field) for field in LATEST_RISK_FIELDS},
+    }
+    dialect_insert = insert if _is_postgresql(session) else sqlite.insert
+    stmt = dialect_insert(LatestRisk).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["latitude", "longitude"],
+        set_={
+            "risk_index_id": stmt.excluded.risk_index_id,
+            **{field: stmt.excluded[field] for field in LATEST_RISK_FIELDS},
+            "updated_at": func.now(),
+        },
+        where=LatestRisk.assessment_date <= stmt.excluded.assessment_date,
+    )
+    await session.execute(stmt)
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    """Start of the hourly, daily or weekly bucket containing ``timestamp``.
+
+    Weeks start on Monday, like ``time_bucket('7 days', ...)``.
+    """
+    if granularity == "hourly":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    day = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "weekly":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in kilometres on a spherical Earth."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _summarize_climate(data_points: list[ERA5DataPoint], granularity: str) -> list[dict]:
+    """Aggregate raw ERA5 rows like the climate continuous aggregates."""
+    buckets: dict[datetime, list[ERA5DataPoint]] = {}
+    for point in data_points:
+        buckets.setdefault(bucket_start(point.timestamp, granularity), []).append(point)
+
+    summary = []
+    for period in sorted(buckets):
+        points = buckets[period]
+        temps = [p.temperature_2m for p in points if p.temperature_2m is not None]
+        maxima = [p.temperature_2m_max for p in points if p.temperature_2m_max is not None]
+        minima = [p.temperature_2m_min for p in points if p.temperature_2m_min is not None]
+        precip = [p.total_precipitation for p in points if p.total_precipitation is not None]
+        summary.append(
+            {
+                "period": period,
+                "avg_temp": sum(temps) / len(temps) if temps else None,
+                "max_temp": max(maxima) if maxima else None,
+                "min_temp": min(minima) if minima else None,
+                "total_precip": sum(precip) if precip else None,
+                "data_points": len(points),
+            }
+        )
+    return summary
+
+
+def _stream_columns(model: Any, names: Iterable[str] | None) -> list[Any]:
+    """Table columns to stream; all of them when no names are given."""
+    table_columns = model.__table__.c
+    if names is None:
+        return list(table_columns)
+    return [table_columns[name] for name in names]
+
+
+async def _stream_keyset(
+    session: AsyncSession,
+    model: Any,
+    order_column: Any,
+    columns: list[Any],
+    filters: list[ColumnElement[bool]],
+    location: tuple[float, float, float] | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> AsyncIterator[list[Row]]:
+    """Yield pages of column-only rows ordered by ``(order_column, id)``.
+
+    Each page is its own query that resumes after the last key of the
+    previous page (keyset pagination, no OFFSET), read through a
+    server-side cursor with ``session.stream``. Only one page is held at a
+    time and no cursor stays open between pages.
+
+    Args:
+        session: Session to read with
+        model: Mapped class being read
+        order_column: Time column that leads the ordering
+        columns: Columns to select; the ordering columns are added if missing
+        filters: WHERE clauses
+        location: ``(latitude, longitude, radius_km)`` to check in Python
+            on dialects without PostGIS; adds latitude/longitude to the rows
+        batch_size: Rows per page
+
+    Yields:
+        Non-empty lists of rows
+    """
+    key = (order_column, model.__table__.c.id)
+    columns = list(columns)
+    required = [*key]
+    if location is not None and not _is_postgresql(session):
+        required += [model.__table__.c.latitude, model.__table__.c.longitude]
+    for col in required:
+        if not any(col is c for c in columns):
+            columns.append(col)
+
+    after: tuple | None = None
+    while True:
+        query = select(*columns).where(*filters).order_by(*key).limit(batch_size)
+        if after is not None:
+            query = query.where(tuple_(*key) > tuple_(*after))
+
+        result = await session.stream(query)
+        page = list(await result.all())
+        if not page:
+            return
+        after = tuple(page[-1]._mapping[col] for col in key)
+        last_page = len(page) < batch_size
+
+        if location is not None:
+            page = _within_radius(session, page, *location)
+        if page:
+            yield page
+        if last_page:
+            return
+
+
+def _column_array(values: list) -> np.ndarray:
+    """NumPy array for one column, typed from its first non-null value."""
+    sample = next((v for v in values if v is not None), None)
+    if isinstance(sample, bool):
+        return np.array(values, dtype=object)
+    if isinstance(sample, float) or (isinstance(sample, int) and None in values):
+        return np.array(values, dtype=np.float64)
+    if isinstance(sample, int):
+        return np.array(values, dtype=np.int64)
+    if isinstance(sample, datetime):
+        return np.array(
+            [
+                v.astimezone(UTC).replace(tzinfo=None) if v is not None and v.tzinfo else v
+                for v in values
+            ],
+            dtype="datetime64[us]",
+        )
+    return np.array(values, dtype=object)
+
+
+def to_record_batch(rows: list[Row], arrow: bool = False) -> Any:
+    """Convert a page of rows to columnar arrays.
+
+    Floats (and integers with nulls) become float64 with NaN, integers
+    int64, datetimes naive-UTC datetime64[us], anything else object arrays.
+
+    Args:
+        rows: Rows from a streaming read
+        arrow: Return a ``pyarrow.RecordBatch`` instead of a dict of arrays
+
+    Returns:
+        Dict of column name to NumPy array, or a pyarrow RecordBatch
+    """
+    names = list(rows[0]._fields) if rows else []
+    arrays = {name: _column_array([row[i] for row in rows]) for i, name in enumerate(names)}
+    if not arrow:
+        return arrays
+    if not ARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Arrow record batches")
+    return pa.RecordBatch.from_pydict(arrays)
+
+
+class GridCellRepository:
+    """Repository for the grid cell location dimension."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with database session.
+
+        Args:
+            session: Async SQLAlchemy session
+        """
+        self.session = session
+
+    async def resolve_cell_ids(
+        self, coordinates: Iterable[tuple[float, float]]
+    ) -> dict[tuple[float, float], int]:
+        """Get grid cell ids for coordinates, creating missing cells.
+
+        Two statements regardless of batch size: an insert of the distinct
+        cells that ignores existing ones, then a lookup of all their ids.
+
+        Args:
+            coordinates: (latitude, longitude) pairs, duplicates allowed
+
+        Returns:
+            Cell id keyed by ``grid_cell_key(latitude, longitude)``
+        """
+        keys = sorted({grid_cell_key(lat, lon) for lat, lon in coordinates})
+        if not keys:
+            return {}
+
+        if _is_postgresql(self.session):
+            requested = _coordinate_array(keys)
+            stmt = insert(GridCell).from_select(
+                ["latitude", "longitude"],
+                select(requested.c.latitude, requested.c.longitude),
+            )
+            query = select(GridCell.id, GridCell.latitude, GridCell.longitude).join(
+                requested,
+                and_(
+                    GridCell.latitude == requested.c.latitude,
+                    GridCell.longitude == requested.c.longitude,
+                ),
+            )
+        else:
+            stmt = sqlite.insert(GridCell).values(
+                [{"latitude": lat, "longitude": lon} for lat, lon in keys]
+            )
+            query = select(GridCell.id, GridCell.latitude, GridCell.longitude).where(
+                tuple_(GridCell.latitude, GridCell.longitude).in_(keys)
+            )
+
+        await self.session.execute(
+            stmt.on_conflict_do_nothing(index_elements=["latitude", "longitude"])
+        )
+        result = await self.session.execute(query)
+        return {(row.latitude, row.longitude): row.id for row in result}
+
+    async def get_cells_in_bbox(
+        self, south: float, west: float, north: float, east: float
+    ) -> list[GridCell]:
+        """Get grid cells inside a bounding box.
+
+        Args:
+            south: Minimum latitude
+            west: Minimum longitude
+            north: Maximum latitude
+            east: Maximum longitude
+
+        Returns:
+            Grid cells ordered by latitude and longitude
+        """
+        query = (
+            select(GridCell)
+            .where(
+                and_(
+                    GridCell.latitude.between(south, north),
+                    GridCell.longitude.between(west, east),
+                )
+            )
+            .order_by(GridCell.latitude, GridCell.longitude)
+        )
+        result = await self.session.execute(query)
+        return cast(list[GridCell], result.scalars().all())
+
+
+async def _assign_grid_cells(session: AsyncSession, records: list[dict]) -> None:
+    """Set ``grid_cell_id`` on fact records from their coordinates."""
+    cell_ids = await GridCellRepository(session).resolve_cell_ids(
+        (record["latitude"], record["longitude"]) for record in records
+    )
+    for record in records:
+        record["grid_cell_id"] = cell_ids[
+            grid_cell_key(record["latitude"], record["longitude"])
+        ]
+
+
+async def _assign_grid_cell(session: AsyncSession, fact: Any) -> None:
+    """Set ``grid_cell_id`` on a fact instance that has coordinates."""
+    if fact.latitude is None or fact.longitude is None:
+        return
+    cell_ids = await GridCellRepository(session).resolve_cell_ids(
+        [(fact.latitude, fact.longitude)]
+    )
+    fact.grid_cell_id = cell_ids[grid_cell_key(fact.latitude, fact.longitude)]
+
 
 class ERA5Repository:
     """Repository for ERA5 climate data operations."""
@@ -44,6 +550,8 @@ class ERA5Repository:
     ) -> int:
         """Bulk insert ERA5 data points.
 
+        Coordinates are resolved to grid cell ids in bulk before the insert.
+
         Args:
             data_points: List of data point dictionaries
             upsert: Whether to update on conflict
@@ -54,6 +562,9 @@ class ERA5Repository:
         if not data_points:
             return 0
 
+        data_points = [dict(point) for point in data_points]
+        await _assign_grid_cells(self.session, data_points)
+
         if upsert:
             # Check if we're using SQLite (for testing) or PostgreSQL
             dialect_name = self.session.bind.dialect.name
@@ -92,6 +603,7 @@ class ERA5Repository:
         latitude: float | None = None,
         longitude: float | None = None,
         buffer_degrees: float = 0.25,
+        radius_km: float | None = None,
     ) -> list[ERA5DataPoint]:
         """Get ERA5 data for a date range and optional location.
 
@@ -101,6 +613,8 @@ class ERA5Repository:
             latitude: Optional center latitude
             longitude: Optional center longitude
             buffer_degrees: Buffer around location point
+            radius_km: Great-circle radius around the location; replaces
+                ``buffer_degrees`` when given
 
         Returns:
             List of ERA5 data points
@@ -114,18 +628,28 @@ class ERA5Repository:
 
         if latitude is not None and longitude is not None:
             query = query.where(
-                and_(
-                    ERA5DataPoint.latitude >= latitude - buffer_degrees,
-                    ERA5DataPoint.latitude <= latitude + buffer_degrees,
-                    ERA5DataPoint.longitude >= longitude - buffer_degrees,
-                    ERA5DataPoint.longitude <= longitude + buffer_degrees,
+                _location_filter(
+                    self.session,
+                    ERA5DataPoint,
+                    latitude,
+                    longitude,
+                    buffer_degrees,
+                    radius_km,
                 )
             )
+        else:
+            radius_km = None
 
         query = query.order_by(ERA5DataPoint.timestamp)
 
         result = await self.session.execute(query)
-        return cast(list[ERA5DataPoint], result.scalars().all())
+        return _within_radius(
+            self.session,
+            cast(list[ERA5DataPoint], result.scalars().all()),
+            latitude or 0.0,
+            longitude or 0.0,
+            radius_km,
+        )
 
     async def get_data_by_location_and_timerange(
         self,
@@ -134,6 +658,7 @@ class ERA5Repository:
         start_date: datetime,
         end_date: datetime,
         buffer_degrees: float = 0.25,
+        radius_km: float | None = None,
     ) -> list[ERA5DataPoint]:
         """Get ERA5 data for a specific location and time range.
 
@@ -143,6 +668,7 @@ class ERA5Repository:
             start_date: Start of date range
             end_date: End of date range
             buffer_degrees: Buffer around location point
+            radius_km: Optional great-circle radius instead of the buffer
 
         Returns:
             List of ERA5 data points
@@ -153,6 +679,7 @@ class ERA5Repository:
             latitude=latitude,
             longitude=longitude,
             buffer_degrees=buffer_degrees,
+            radius_km=radius_km,
         )
 
     async def get_latest_timestamp(
@@ -180,9 +707,237 @@ class ERA5Repository:
         result = await self.session.execute(query)
         return cast(datetime | None, result.scalar()) # type: ignore[redundant-cast]
 
+    def stream_data_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        buffer_degrees: float = 0.25,
+        radius_km: float | None = None,
+        columns: list[str] | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[list[Row]]:
+        """Stream ERA5 data for a date range in keyset-paginated pages.
+
+        Same filters as ``get_data_range`` but selects plain columns instead
+        of ORM objects and holds one page at a time.
+
+        Args:
+            start_date: Start of date range
+            end_date: End of date range
+            latitude: Optional center latitude
+            longitude: Optional center longitude
+            buffer_degrees: Buffer around location point
+            radius_km: Optional great-circle radius instead of the buffer
+            columns: Column names to select (default all); timestamp and id
+                are always included
+            batch_size: Rows per page
+
+        Returns:
+            Async iterator of row pages ordered by timestamp and id
+        """
+        filters = [
+            ERA5DataPoint.timestamp >= start_date,
+            ERA5DataPoint.timestamp <= end_date,
+        ]
+        location = None
+        if latitude is not None and longitude is not None:
+            filters.append(
+                _location_filter(
+                    self.session,
+                    ERA5DataPoint,
+                    latitude,
+                    longitude,
+                    buffer_degrees,
+                    radius_km,
+                )
+            )
+            if radius_km is not None:
+                location = (latitude, longitude, radius_km)
+
+        return _stream_keyset(
+            self.session,
+            ERA5DataPoint,
+            ERA5DataPoint.__table__.c.timestamp,
+            _stream_columns(ERA5DataPoint, columns),
+            filters,
+            location,
+            batch_size,
+        )
+
+    async def stream_record_batches(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        buffer_degrees: float = 0.25,
+        radius_km: float | None = None,
+        columns: list[str] | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+        arrow: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Stream ERA5 data as columnar record batches.
+
+        Args:
+            start_date: Start of date range
+            end_date: End of date range
+            latitude: Optional center latitude
+            longitude: Optional center longitude
+            buffer_degrees: Buffer around location point
+            radius_km: Optional great-circle radius instead of the buffer
+            columns: Column names to select (default all)
+            batch_size: Rows per batch
+            arrow: Yield pyarrow RecordBatches instead of dicts of arrays
+
+        Yields:
+            One record batch per page, see ``to_record_batch``
+        """
+        pages = self.stream_data_range(
+            start_date,
+            end_date,
+            latitude,
+            longitude,
+            buffer_degrees,
+            radius_km,
+            columns,
+            batch_size,
+        )
+        async for page in pages:
+            yield to_record_batch(page, arrow)
+
+    async def get_cell_data(
+        self, cell_ids: list[int], start_date: datetime, end_date: datetime
+    ) -> list[ERA5DataPoint]:
+        """Get ERA5 data for grid cells over a date range.
+
+        Args:
+            cell_ids: Grid cell ids
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            ERA5 data points ordered by cell and timestamp
+        """
+        query = (
+            select(ERA5DataPoint)
+            .where(
+                and_(
+                    ERA5DataPoint.grid_cell_id.in_(cell_ids),
+                    ERA5DataPoint.timestamp >= start_date,
+                    ERA5DataPoint.timestamp <= end_date,
+                )
+            )
+            .order_by(ERA5DataPoint.grid_cell_id, ERA5DataPoint.timestamp)
+        )
+
+        result = await self.session.execute(query)
+        return cast(list[ERA5DataPoint], result.scalars().all())
+
+    async def get_climate_summary(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        latitude: float,
+        longitude: float,
+        buffer_degrees: float = 0.25,
+        radius_km: float | None = None,
+        granularity: str = "daily",
+    ) -> list[dict]:
+        """Get area-wide climate rollups around a location.
+
+        Daily and weekly rollups on PostgreSQL read the continuous
+        aggregates; hourly rollups and other dialects aggregate raw rows.
+        Periods are whole buckets, so the first and last may include data
+        just outside the requested range.
+
+        Args:
+            start_date: Start of date range
+            end_date: End of date range
+            latitude: Center latitude
+            longitude: Center longitude
+            buffer_degrees: Buffer around location point
+            radius_km: Optional great-circle radius instead of the buffer
+            granularity: hourly, daily or weekly
+
+        Returns:
+            Dicts with period, avg_temp, max_temp, min_temp, total_precip
+            and data_points, ordered by period
+        """
+        if granularity not in CLIMATE_GRANULARITIES:
+            raise ValueError(f"Unsupported granularity: {granularity}")
+
+        if not (_is_postgresql(self.session) and granularity in CLIMATE_AGGREGATES):
+            data_points = await self.get_data_range(
+                start_date, end_date, latitude, longitude, buffer_degrees, radius_km
+            )
+            return _summarize_climate(data_points, granularity)
+
+        view, bucket = CLIMATE_AGGREGATES[granularity]
+        summary = table(
+            view,
+            column(bucket),
+            column("latitude"),
+            column("longitude"),
+            column("avg_temp"),
+            column("temp_count"),
+            column("max_temp"),
+            column("min_temp"),
+            column("total_precip"),
+            column("data_points"),
+        )
+        period = summary.c[bucket]
+
+        if radius_km is None:
+            lat_delta = lon_delta = buffer_degrees
+        else:
+            lat_delta, lon_delta = _radius_box(latitude, radius_km)
+        query = (
+            select(
+                period.label("period"),
+                (
+                    func.sum(summary.c.avg_temp * summary.c.temp_count)
+                    / func.nullif(func.sum(summary.c.temp_count), 0)
+                ).label("avg_temp"),
+                func.max(summary.c.max_temp).label("max_temp"),
+                func.min(summary.c.min_temp).label("min_temp"),
+                func.sum(summary.c.total_precip).label("total_precip"),
+                func.sum(summary.c.data_points).label("data_points"),
+            )
+            .where(
+                and_(
+                    period >= bucket_start(start_date, granularity),
+                    period <= end_date,
+                    summary.c.latitude.between(latitude - lat_delta, latitude + lat_delta),
+                    summary.c.longitude.between(longitude - lon_delta, longitude + lon_delta),
+                )
+            )
+            .group_by(period)
+            .order_by(period)
+        )
+        if radius_km is not None:
+            center = func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326)
+            location = func.ST_SetSRID(
+                func.ST_MakePoint(summary.c.longitude, summary.c.latitude), 4326
+            )
+            query = query.where(
+                func.ST_DWithin(
+                    func.geography(location), func.geography(center), radius_km * 1000.0
+                )
+            )
+
+        result = await self.session.execute(query)
+        return [dict(row._mapping) for row in result]
+
     async def delete_old_data(self, days_to_keep: int = 365) -> int:
         """Delete data older than specified days.
 
+        On PostgreSQL the rows are counted, whole chunks older than the
+        cutoff are dropped with ``drop_chunks`` (as the retention policy in
+        TIMESCALEDB_SETUP does on schedule) and only the rows left in the
+        boundary chunk are deleted one by one; other dialects delete rows.
+
         Args:
             days_to_keep: Number of days of data to retain
 
@@ -190,12 +945,25 @@ class ERA5Repository:
             Number of rows deleted
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
+        old_rows = ERA5DataPoint.__table__.delete().where(
+            ERA5DataPoint.timestamp < cutoff_date
+        )
 
-        result = await self.session.execute(
-            ERA5DataPoint.__table__.delete().where( # type: ignore[attr-defined]
-                ERA5DataPoint.timestamp < cutoff_date
+        if _is_postgresql(self.session):
+            counted = await self.session.execute(
+                select(func.count()).where(ERA5DataPoint.timestamp < cutoff_date)
             )
-        )
+            deleted = cast(int, counted.scalar())
+            await self.session.execute(
+                text("SELECT drop_chunks('era5_data_points', older_than => :cutoff)"),
+                {"cutoff": cutoff_date},
+            )
+            await self.session.execute(old_rows)
+            await self.session.commit()
+            logger.info(f"Deleted {deleted} old ERA5 data points")
+            return deleted
+
+        result = await self.session.execute(old_rows)
         await self.session.commit()
 
         logger.info(f"Deleted {result.rowcount} old ERA5 data points") # type: ignore[attr-defined]
@@ -218,6 +986,8 @@ class ProcessedClimateRepository:
     ) -> int:
         """Save processed climate data from a processing result.
 
+        Coordinates are resolved to grid cell ids in bulk before the insert.
+
         Args:
             result: Processing result metadata
             data: DataFrame with processed climate data
@@ -254,6 +1024,8 @@ class ProcessedClimateRepository:
             }
             records.append(record)
 
+        await _assign_grid_cells(self.session, records)
+
         # Bulk upsert
         dialect_name = self.session.bind.dialect.name
 
@@ -286,6 +1058,7 @@ class ProcessedClimateRepository:
         start_date: datetime,
         end_date: datetime,
         buffer_degrees: float = 0.25,
+        radius_km: float | None = None,
     ) -> pd.DataFrame:
         """Get processed climate data for a location.
 
@@ -295,6 +1068,7 @@ class ProcessedClimateRepository:
             start_date: Start date
             end_date: End date
             buffer_degrees: Buffer around location
+            radius_km: Optional great-circle radius instead of the buffer
 
         Returns:
             DataFrame with climate data
@@ -305,17 +1079,23 @@ class ProcessedClimateRepository:
                 and_(
                     ProcessedClimateData.date >= start_date,
                     ProcessedClimateData.date <= end_date,
-                    ProcessedClimateData.latitude >= latitude - buffer_degrees,
-                    ProcessedClimateData.latitude <= latitude + buffer_degrees,
-                    ProcessedClimateData.longitude >= longitude - buffer_degrees,
-                    ProcessedClimateData.longitude <= longitude + buffer_degrees,
+                    _location_filter(
+                        self.session,
+                        ProcessedClimateData,
+                        latitude,
+                        longitude,
+                        buffer_degrees,
+                        radius_km,
+                    ),
                 )
             )
             .order_by(ProcessedClimateData.date)
         )
 
         result = await self.session.execute(query)
-        data = result.scalars().all()
+        data = _within_radius(
+            self.session, list(result.scalars().all()), latitude, longitude, radius_km
+        )
 
         # Convert to DataFrame
         if data:
@@ -364,6 +1144,93 @@ class ProcessedClimateRepository:
         return cast(list[ProcessedClimateData], result.scalars().all())
 
 
+    async def stream_location_batches(
+        self,
+        latitude: float,
+        longitude: float,
+        start_date: datetime,
+        end_date: datetime,
+        buffer_degrees: float = 0.25,
+        radius_km: float | None = None,
+        columns: list[str] | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+        arrow: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Stream processed climate data for a location as record batches.
+
+        The streaming counterpart of ``get_location_data``: columns go
+        straight from the cursor into arrays, one page at a time.
+
+        Args:
+            latitude: Center latitude
+            longitude: Center longitude
+            start_date: Start date
+            end_date: End date
+            buffer_degrees: Buffer around location
+            radius_km: Optional great-circle radius instead of the buffer
+            columns: Column names (default those of ``get_location_data``);
+                date and id are always included
+            batch_size: Rows per batch
+            arrow: Yield pyarrow RecordBatches instead of dicts of arrays
+
+        Yields:
+            One record batch per page, ordered by date
+        """
+        filters = [
+            ProcessedClimateData.date >= start_date,
+            ProcessedClimateData.date <= end_date,
+            _location_filter(
+                self.session,
+                ProcessedClimateData,
+                latitude,
+                longitude,
+                buffer_degrees,
+                radius_km,
+            ),
+        ]
+        location = (latitude, longitude, radius_km) if radius_km is not None else None
+
+        pages = _stream_keyset(
+            self.session,
+            ProcessedClimateData,
+            ProcessedClimateData.__table__.c.date,
+            _stream_columns(ProcessedClimateData, columns or PROCESSED_FRAME_COLUMNS),
+            filters,
+            location,
+            batch_size,
+        )
+        async for page in pages:
+            yield to_record_batch(page, arrow)
+
+    async def get_cell_data(
+        self, cell_ids: list[int], start_date: datetime, end_date: datetime
+    ) -> list[ProcessedClimateData]:
+        """Get processed climate data for grid cells over a date range.
+
+        Args:
+            cell_ids: Grid cell ids
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            Processed climate records ordered by cell and date
+        """
+        query = (
+            select(ProcessedClimateData)
+            .where(
+                and_(
+                    ProcessedClimateData.grid_cell_id.in_(cell_ids),
+                    ProcessedClimateData.date >= start_date,
+                    ProcessedClimateData.date <= end_date,
+                )
+            )
+            .order_by(ProcessedClimateData.grid_cell_id, ProcessedClimateData.date)
+        )
+
+        result = await self.session.execute(query)
+        return cast(list[ProcessedClimateData], result.scalars().all())
+
+
 class MalariaRiskRepository:
     """Repository for malaria risk index operations."""
 
@@ -411,14 +1278,21 @@ class MalariaRiskRepository:
             data_sources=risk_data.get("data_sources", ["ERA5"]),
         )
 
+        await _assign_grid_cell(self.session, risk_index)
         self.session.add(risk_index)
+        await self.session.flush()
+        await _upsert_latest_risk(self.session, risk_index)
         await self.session.commit()
         await self.session.refresh(risk_index)
 
         return risk_index
 
     async def get_latest_assessment(
-        self, latitude: float, longitude: float, buffer_degrees: float = 0.25
+        self,
+        latitude: float,
+        longitude: float,
+        buffer_degrees: float = 0.25,
+        radius_km: float | None = None,
     ) -> MalariaRiskIndex | None:
         """Get the latest risk assessment for a location.
 
@@ -426,6 +1300,7 @@ class MalariaRiskRepository:
             latitude: Location latitude
             longitude: Location longitude
             buffer_degrees: Buffer around location
+            radius_km: Optional great-circle radius instead of the buffer
 
         Returns:
             Latest MalariaRiskIndex or None
@@ -433,18 +1308,28 @@ class MalariaRiskRepository:
         query = (
             select(MalariaRiskIndex)
             .where(
-                and_(
-                    MalariaRiskIndex.latitude >= latitude - buffer_degrees,
-                    MalariaRiskIndex.latitude <= latitude + buffer_degrees,
-                    MalariaRiskIndex.longitude >= longitude - buffer_degrees,
-                    MalariaRiskIndex.longitude <= longitude + buffer_degrees,
+                _location_filter(
+                    self.session,
+                    MalariaRiskIndex,
+                    latitude,
+                    longitude,
+                    buffer_degrees,
+                    radius_km,
                 )
             )
             .order_by(MalariaRiskIndex.assessment_date.desc())
-            .limit(1)
         )
 
-        result = await self.session.execute(query)
+        if radius_km is not None and not _is_postgresql(self.session):
+            # The radius is checked in Python, so the newest in-box row may
+            # fall outside it
+            result = await self.session.execute(query)
+            rows = _within_radius(
+                self.session, list(result.scalars().all()), latitude, longitude, radius_km
+            )
+            return rows[0] if rows else None
+
+        result = await self.session.execute(query.limit(1))
         return cast(MalariaRiskIndex | None, result.scalar_one_or_none()) # type: ignore[redundant-cast]
 
     async def get_risk_history(
@@ -453,6 +1338,7 @@ class MalariaRiskRepository:
         longitude: float,
         days_back: int = 90,
         buffer_degrees: float = 0.25,
+        radius_km: float | None = None,
     ) -> list[MalariaRiskIndex]:
         """Get risk assessment history for a location.
 
@@ -461,6 +1347,7 @@ class MalariaRiskRepository:
             longitude: Location longitude
             days_back: Number of days of history
             buffer_degrees: Buffer around location
+            radius_km: Optional great-circle radius instead of the buffer
 
         Returns:
             List of risk assessments
@@ -472,15 +1359,53 @@ class MalariaRiskRepository:
             .where(
                 and_(
                     MalariaRiskIndex.assessment_date >= start_date,
-                    MalariaRiskIndex.latitude >= latitude - buffer_degrees,
-                    MalariaRiskIndex.latitude <= latitude + buffer_degrees,
-                    MalariaRiskIndex.longitude >= longitude - buffer_degrees,
-                    MalariaRiskIndex.longitude <= longitude + buffer_degrees,
+                    _location_filter(
+                        self.session,
+                        MalariaRiskIndex,
+                        latitude,
+                        longitude,
+                        buffer_degrees,
+                        radius_km,
+                    ),
                 )
             )
             .order_by(MalariaRiskIndex.assessment_date)
         )
 
+        result = await self.session.execute(query)
+        return _within_radius(
+            self.session,
+            cast(list[MalariaRiskIndex], result.scalars().all()),
+            latitude,
+            longitude,
+            radius_km,
+        )
+
+    async def get_cell_history(
+        self, cell_ids: list[int], start_date: datetime, end_date: datetime
+    ) -> list[MalariaRiskIndex]:
+        """Get risk assessments for grid cells over a date range.
+
+        Args:
+            cell_ids: Grid cell ids
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            Risk assessments ordered by cell and assessment date
+        """
+        query = (
+            select(MalariaRiskIndex)
+            .where(
+                and_(
+                    MalariaRiskIndex.grid_cell_id.in_(cell_ids),
+                    MalariaRiskIndex.assessment_date >= start_date,
+                    MalariaRiskIndex.assessment_date <= end_date,
+                )
+            )
+            .order_by(MalariaRiskIndex.grid_cell_id, MalariaRiskIndex.assessment_date)
+        )
+
         result = await self.session.execute(query)
         return cast(list[MalariaRiskIndex], result.scalars().all())
 
@@ -531,7 +1456,10 @@ class MalariaRiskRepository:
             data_sources=risk_data.get("data_sources", ["ERA5"]),
         )
 
+        await _assign_grid_cell(self.session, risk_index)
         self.session.add(risk_index)
+        await self.session.flush()
+        await _upsert_latest_risk(self.session, risk_index)
         await self.session.commit()
         await self.session.refresh(risk_index)
 
@@ -540,37 +1468,100 @@ class MalariaRiskRepository:
     async def get_current_risk_levels(
         self, locations: list[tuple[float, float]]
     ) -> list[MalariaRiskIndex]:
-        """Get current risk levels for multiple locations.
+        """Get the latest risk assessment for each of many locations.
+
+        Locations are matched exactly. On PostgreSQL the coordinates are
+        passed as two arrays joined via ``unnest`` and reduced with
+        ``DISTINCT ON``, so the statement size does not grow with the
+        number of locations; other dialects rank rows with ``row_number``.
 
         Args:
             locations: List of (latitude, longitude) tuples
 
         Returns:
-            List of current risk assessments
+            Latest assessment per location that has one, ordered by
+            latitude and longitude
         """
         if not locations:
             return []
 
-        # Create OR conditions for all locations
-        from sqlalchemy import or_
-
-        location_conditions = []
-        for lat, lon in locations:
-            location_conditions.append(
-                and_(
-                    MalariaRiskIndex.latitude == lat, MalariaRiskIndex.longitude == lon
+        if _is_postgresql(self.session):
+            requested = _coordinate_array(locations)
+            query = (
+                select(MalariaRiskIndex)
+                .join(
+                    requested,
+                    and_(
+                        MalariaRiskIndex.latitude == requested.c.latitude,
+                        MalariaRiskIndex.longitude == requested.c.longitude,
+                    ),
+                )
+                .distinct(MalariaRiskIndex.latitude, MalariaRiskIndex.longitude)
+                .order_by(
+                    MalariaRiskIndex.latitude,
+                    MalariaRiskIndex.longitude,
+                    MalariaRiskIndex.assessment_date.desc(),
                 )
             )
-
-        query = (
-            select(MalariaRiskIndex)
-            .where(or_(*location_conditions))
-            .order_by(MalariaRiskIndex.assessment_date.desc())
-        )
+        else:
+            ranked = (
+                select(
+                    MalariaRiskIndex.id,
+                    func.row_number()
+                    .over(
+                        partition_by=(MalariaRiskIndex.latitude, MalariaRiskIndex.longitude),
+                        order_by=MalariaRiskIndex.assessment_date.desc(),
+                    )
+                    .label("position"),
+                )
+                .where(
+                    tuple_(MalariaRiskIndex.latitude, MalariaRiskIndex.longitude).in_(
+                        list(set(locations))
+                    )
+                )
+                .subquery()
+            )
+            query = (
+                select(MalariaRiskIndex)
+                .join(ranked, MalariaRiskIndex.id == ranked.c.id)
+                .where(ranked.c.position == 1)
+                .order_by(MalariaRiskIndex.latitude, MalariaRiskIndex.longitude)
+            )
 
         result = await self.session.execute(query)
         return cast(list[MalariaRiskIndex], result.scalars().all())
 
+    async def get_latest_risk_map(
+        self,
+        south: float,
+        west: float,
+        north: float,
+        east: float,
+        risk_levels: list[str] | None = None,
+    ) -> list[LatestRisk]:
+        """Get the latest assessment of every location inside a bounding box.
+
+        Reads the ``latest_risk`` table, which holds one row per location.
+
+        Args:
+            south: Minimum latitude
+            west: Minimum longitude
+            north: Maximum latitude
+            east: Maximum longitude
+            risk_levels: Optional risk levels to include
+
+        Returns:
+            LatestRisk rows ordered by latitude and longitude
+        """
+        params: dict[str, Any] = {"south": south, "west": west, "north": north, "east": east}
+        query = _LATEST_RISK_IN_BOX
+        if risk_levels:
+            query = _LATEST_RISK_IN_BOX_BY_LEVEL
+            params["risk_levels"] = risk_levels
+
+        result = await self.session.execute(query, params)
+        return cast(list[LatestRisk], result.scalars().all())
+
     async def update_risk_assessment(
         self, assessment_id: str, updated_data: dict
     ) -> int:
@@ -592,11 +1583,166 @@ class MalariaRiskRepository:
         )
 
         result = await self.session.execute(stmt)
+        # Edits keep the assessment id, so cached report sections need a new version
+        await DataVersionRepository(self.session).bump(RISK_EDIT_VERSION)
+
+        # Keep latest_risk in step when the current assessment is edited
+        latest_values = {
+            field: value
+            for field, value in updated_data.items()
+            if field in LATEST_RISK_FIELDS
+        }
+        if latest_values:
+            await self.session.execute(
+                update(LatestRisk)
+                .where(LatestRisk.risk_index_id == assessment_id)
+                .values(**latest_values, updated_at=func.now())
+            )
+
         await self.session.commit()
 
         return cast(int, result.rowcount) # type: ignore[redundant-cast]
 
 
+class RiskNowcastRepository:
+    """Repository for the precomputed daily nowcasts."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with database session.
+
+        Args:
+            session: Async SQLAlchemy session
+        """
+        self.session = session
+
+    async def bulk_upsert(
+        self, rows: list[dict], chunk_size: int = NOWCAST_WRITE_CHUNK
+    ) -> int:
+        """Write nowcast rows, replacing those of the same cell, day and model.
+
+        Args:
+            rows: Dicts with the RiskNowcast columns
+            chunk_size: Rows per insert statement
+
+        Returns:
+            Number of rows written
+        """
+        dialect_insert = insert if _is_postgresql(self.session) else sqlite.insert
+        for start in range(0, len(rows), chunk_size):
+            stmt = dialect_insert(RiskNowcast).values(rows[start : start + chunk_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["target_date", "model_type", "grid_cell_id"],
+                set_={
+                    "risk_score": stmt.excluded.risk_score,
+                    "uncertainty": stmt.excluded.uncertainty,
+                    "model_version": stmt.excluded.model_version,
+                    "created_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+        return len(rows)
+
+    async def get_for_coordinates(
+        self,
+        coordinates: Iterable[tuple[float, float]],
+        target_date: date,
+        model_type: str,
+        model_version: str,
+    ) -> dict[tuple[float, float], Row]:
+        """Get nowcasts of the grid cells at the given coordinates.
+
+        Coordinates match a cell when they round to its location, so
+        locations without a grid cell or without a nowcast are left out.
+
+        Args:
+            coordinates: (latitude, longitude) pairs
+            target_date: Day of the nowcasts
+            model_type: Model that produced them
+            model_version: Only rows of this model version are returned
+
+        Returns:
+            Rows with ``risk_score`` and ``uncertainty`` keyed by
+            ``grid_cell_key(latitude, longitude)``
+        """
+        keys = sorted({grid_cell_key(lat, lon) for lat, lon in coordinates})
+        if not keys:
+            return {}
+
+        query = (
+            select(
+                GridCell.latitude,
+                GridCell.longitude,
+                RiskNowcast.risk_score,
+                RiskNowcast.uncertainty,
+            )
+            .join(GridCell, GridCell.id == RiskNowcast.grid_cell_id)
+            .where(
+                RiskNowcast.target_date == target_date,
+                RiskNowcast.model_type == model_type,
+                RiskNowcast.model_version == model_version,
+            )
+        )
+        if _is_postgresql(self.session):
+            requested = _coordinate_array(keys)
+            query = query.join(
+                requested,
+                and_(
+                    GridCell.latitude == requested.c.latitude,
+                    GridCell.longitude == requested.c.longitude,
+                ),
+            )
+        else:
+            query = query.where(tuple_(GridCell.latitude, GridCell.longitude).in_(keys))
+
+        result = await self.session.execute(query)
+        return {(row.latitude, row.longitude): row for row in result}
+
+    async def delete_before(self, target_date: date) -> int:
+        """Delete nowcasts for days before ``target_date``.
+
+        Returns:
+            Number of rows deleted
+        """
+        result = await self.session.execute(
+            RiskNowcast.__table__.delete().where(RiskNowcast.target_date < target_date)
+        )
+        return cast(int, result.rowcount)
+
+
+class DataVersionRepository:
+    """Repository for the data version counters."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with database session.
+
+        Args:
+            session: Async SQLAlchemy session
+        """
+        self.session = session
+
+    async def get(self, name: str = INGESTION_VERSION) -> int:
+        """Current version of a counter, 0 before its first bump."""
+        result = await self.session.execute(
+            select(DataVersion.version).where(DataVersion.name == name)
+        )
+        return int(result.scalar() or 0)
+
+    async def bump(self, name: str = INGESTION_VERSION) -> int:
+        """Increment a counter, creating it at 1.
+
+        Returns:
+            The new version
+        """
+        dialect_insert = insert if _is_postgresql(self.session) else sqlite.insert
+        stmt = dialect_insert(DataVersion).values(name=name, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={"version": DataVersion.version + 1, "updated_at": func.now()},
+        ).returning(DataVersion.version)
+        result = await self.session.execute(stmt)
+        return int(result.scalar_one())
+
+
 class EnvironmentalDataRepository:
     """Repository for environmental data operations."""
 
@@ -633,6 +1779,7 @@ class EnvironmentalDataRepository:
                 ingestion_timestamp=datetime.utcnow(),
             )
 
+            await _assign_grid_cell(self.session, modis_record)
             self.session.add(modis_record)
             await self.session.commit()
             await self.session.refresh(modis_record)
@@ -671,6 +1818,7 @@ class EnvironmentalDataRepository:
         longitude: float,
         buffer_degrees: float = 0.25,
         data_type: str = "modis",
+        radius_km: float | None = None,
     ) -> list:
         """Get environmental data by location.
 
@@ -679,6 +1827,7 @@ class EnvironmentalDataRepository:
             longitude: Location longitude
             buffer_degrees: Buffer around location in degrees
             data_type: Type of environmental data (modis, worldpop)
+            radius_km: Optional great-circle radius instead of the buffer
 
         Returns:
             List of environmental data records
@@ -687,11 +1836,13 @@ class EnvironmentalDataRepository:
             query = (
                 select(MODISDataPoint)
                 .where(
-                    and_(
-                        MODISDataPoint.latitude >= latitude - buffer_degrees,
-                        MODISDataPoint.latitude <= latitude + buffer_degrees,
-                        MODISDataPoint.longitude >= longitude - buffer_degrees,
-                        MODISDataPoint.longitude <= longitude + buffer_degrees,
+                    _location_filter(
+                        self.session,
+                        MODISDataPoint,
+                        latitude,
+                        longitude,
+                        buffer_degrees,
+                        radius_km,
                     )
                 )
                 .order_by(MODISDataPoint.date.desc())
@@ -702,11 +1853,13 @@ class EnvironmentalDataRepository:
             query = (
                 select(WorldPopDataPoint) # type: ignore[assignment]
                 .where(
-                    and_(
-                        WorldPopDataPoint.latitude >= latitude - buffer_degrees,
-                        WorldPopDataPoint.latitude <= latitude + buffer_degrees,
-                        WorldPopDataPoint.longitude >= longitude - buffer_degrees,
-                        WorldPopDataPoint.longitude <= longitude + buffer_degrees,
+                    _location_filter(
+                        self.session,
+                        WorldPopDataPoint,
+                        latitude,
+                        longitude,
+                        buffer_degrees,
+                        radius_km,
                     )
                 )
                 .order_by(WorldPopDataPoint.year.desc())
@@ -717,7 +1870,62 @@ class EnvironmentalDataRepository:
             raise ValueError(f"Unsupported environmental data type: {data_type}")
 
         result = await self.session.execute(query)
-        return cast(list, result.scalars().all())
+        return _within_radius(
+            self.session, cast(list, result.scalars().all()), latitude, longitude, radius_km
+        )
+
+    def stream_by_location(
+        self,
+        latitude: float,
+        longitude: float,
+        buffer_degrees: float = 0.25,
+        data_type: str = "modis",
+        radius_km: float | None = None,
+        columns: list[str] | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[list[Row]]:
+        """Stream all environmental data for a location in keyset pages.
+
+        Unlike ``get_by_location`` this is not capped at the newest 100
+        records; rows come oldest first as plain columns.
+
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            buffer_degrees: Buffer around location in degrees
+            data_type: Type of environmental data (modis, worldpop)
+            radius_km: Optional great-circle radius instead of the buffer
+            columns: Column names to select (default all)
+            batch_size: Rows per page
+
+        Returns:
+            Async iterator of row pages
+        """
+        if data_type == "modis":
+            model: Any = MODISDataPoint
+            order_column = MODISDataPoint.__table__.c.date
+        elif data_type == "worldpop":
+            model = WorldPopDataPoint
+            order_column = WorldPopDataPoint.__table__.c.year
+        else:
+            raise ValueError(f"Unsupported environmental data type: {data_type}")
+
+        filters = [
+            _location_filter(
+                self.session, model, latitude, longitude, buffer_degrees, radius_km
+            )
+        ]
+        location = (latitude, longitude, radius_km) if radius_km is not None else None
+
+        return _stream_keyset(
+            self.session,
+            model,
+            order_column,
+            _stream_columns(model, columns),
+            filters,
+            location,
+            batch_size,
+        )
 
 
 class MalariaIncidenceRepository:
@@ -761,7 +1969,11 @@ class MalariaIncidenceRepository:
         return str(incidence_record.id)
 
     async def get_by_location(
-        self, latitude: float, longitude: float, buffer_degrees: float = 0.25
+        self,
+        latitude: float,
+        longitude: float,
+        buffer_degrees: float = 0.25,
+        radius_km: float | None = None,
     ) -> list:
         """Get incidence data by location.
 
@@ -769,6 +1981,7 @@ class MalariaIncidenceRepository:
             latitude: Location latitude
             longitude: Location longitude
             buffer_degrees: Buffer around location in degrees
+            radius_km: Optional great-circle radius instead of the buffer
 
         Returns:
             List of incidence data records
@@ -778,10 +1991,14 @@ class MalariaIncidenceRepository:
             select(CHIRPSDataPoint)
             .where(
                 and_(
-                    CHIRPSDataPoint.latitude >= latitude - buffer_degrees,
-                    CHIRPSDataPoint.latitude <= latitude + buffer_degrees,
-                    CHIRPSDataPoint.longitude >= longitude - buffer_degrees,
-                    CHIRPSDataPoint.longitude <= longitude + buffer_degrees,
+                    _location_filter(
+                        self.session,
+                        CHIRPSDataPoint,
+                        latitude,
+                        longitude,
+                        buffer_degrees,
+                        radius_km,
+                    ),
                 )
             )
             .order_by(CHIRPSDataPoint.date.desc())
@@ -789,7 +2006,9 @@ class MalariaIncidenceRepository:
         )
 
         result = await self.session.execute(query)
-        return cast(list, result.scalars().all())
+        return _within_radius(
+            self.session, cast(list, result.scalars().all()), latitude, longitude, radius_km
+        )
 
 
 class PredictionRepository:
@@ -831,7 +2050,10 @@ class PredictionRepository:
             data_sources=data.get("data_sources", ["prediction_model"]),
         )
 
+        await _assign_grid_cell(self.session, prediction_record)
         self.session.add(prediction_record)
+        await self.session.flush()
+        await _upsert_latest_risk(self.session, prediction_record)
         await self.session.commit()
         await self.session.refresh(prediction_record)
 
@@ -839,7 +2061,11 @@ class PredictionRepository:
         return str(prediction_record.id)
 
     async def get_by_location(
-        self, latitude: float, longitude: float, buffer_degrees: float = 0.25
+        self,
+        latitude: float,
+        longitude: float,
+        buffer_degrees: float = 0.25,
+        radius_km: float | None = None,
     ) -> list:
         """Get predictions by location.
 
@@ -847,6 +2073,7 @@ class PredictionRepository:
             latitude: Location latitude
             longitude: Location longitude
             buffer_degrees: Buffer around location in degrees
+            radius_km: Optional great-circle radius instead of the buffer
 
         Returns:
             List of prediction records
@@ -856,10 +2083,14 @@ class PredictionRepository:
             select(MalariaRiskIndex)
             .where(
                 and_(
-                    MalariaRiskIndex.latitude >= latitude - buffer_degrees,
-                    MalariaRiskIndex.latitude <= latitude + buffer_degrees,
-                    MalariaRiskIndex.longitude >= longitude - buffer_degrees,
-                    MalariaRiskIndex.longitude <= longitude + buffer_degrees,
+                    _location_filter(
+                        self.session,
+                        MalariaRiskIndex,
+                        latitude,
+                        longitude,
+                        buffer_degrees,
+                        radius_km,
+                    ),
                     MalariaRiskIndex.model_type == "prediction",
                 )
             )
@@ -868,7 +2099,9 @@ class PredictionRepository:
         )
 
         result = await self.session.execute(query)
-        return cast(list, result.scalars().all())
+        return _within_radius(
+            self.session, cast(list, result.scalars().all()), latitude, longitude, radius_km
+        )
 
 
 class UserRepository:
@@ -6,17 +6,21 @@ and initialization routines for the malaria prediction system.
 
 import asyncio
 import logging
+import time
+from collections import deque
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import event, exc, make_url, text
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, NullPool
 
 from ..config import settings
 from .models import TIMESCALEDB_SETUP, Base
@@ -26,9 +30,71 @@ logger = logging.getLogger(__name__)
 # Global engine and session maker
 _engine: AsyncEngine | None = None
 _async_session_maker: async_sessionmaker[AsyncSession] | None = None
+_replica_router: "ReplicaRouter | None" = None
+
+# Number of recent samples kept for pool wait and checkout percentiles
+POOL_METRICS_WINDOW = 1000
+
+
+class PoolMetrics:
+    """Rolling connection wait and checkout timings for the engine pool."""
+
+    def __init__(self, window: int = POOL_METRICS_WINDOW) -> None:
+        self.wait_ms: deque[float] = deque(maxlen=window)
+        self.checkout_ms: deque[float] = deque(maxlen=window)
+        self.checkouts = 0
+        self.timeouts = 0
+
+    def record_wait(self, milliseconds: float) -> None:
+        """Record the time spent acquiring a connection from the pool."""
+        self.wait_ms.append(milliseconds)
+        self.checkouts += 1
+
+    def record_checkout(self, milliseconds: float) -> None:
+        """Record how long a connection was held before being returned."""
+        self.checkout_ms.append(milliseconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return counters and p50/p95/p99/max of the recent samples."""
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_ms": _percentiles(self.wait_ms),
+            "checkout_ms": _percentiles(self.checkout_ms),
+        }
+
+
+def _percentiles(samples: deque[float]) -> dict[str, float | None]:
+    ordered = sorted(samples)
+    if not ordered:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+
+    def at(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+    return {"p50": at(0.50), "p95": at(0.95), "p99": at(0.99), "max": round(ordered[-1], 3)}
+
+
+_pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long callers wait for a connection."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            _pool_metrics.timeouts += 1
+            raise
+        finally:
+            _pool_metrics.record_wait((time.perf_counter() - start) * 1000)
+
 
 # Connection pool configuration for production
 PRODUCTION_POOL_CONFIG = {
+    "poolclass": InstrumentedAsyncQueuePool,
     "pool_size": 20,  # Base number of connections to maintain
     "max_overflow": 30,  # Additional connections beyond pool_size
     "pool_timeout": 30,  # Timeout when getting connection from pool
@@ -36,10 +102,69 @@ PRODUCTION_POOL_CONFIG = {
     "pool_pre_ping": True,  # Validate connections before use
 }
 
+STAGING_POOL_CONFIG = {
+    "poolclass": InstrumentedAsyncQueuePool,
+    "pool_size": 10,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_recycle": 1800,  # Shared staging databases restart more often
+    "pool_pre_ping": True,
+}
+
+DEVELOPMENT_POOL_CONFIG = {
+    "poolclass": InstrumentedAsyncQueuePool,
+    "pool_size": 5,
+    "max_overflow": 5,
+    "pool_timeout": 10,
+    "pool_recycle": 3600,
+    "pool_pre_ping": False,  # Local database; skip the extra round trip per checkout
+}
+
 TESTING_POOL_CONFIG = {
     "poolclass": NullPool,  # No connection pooling for tests
 }
 
+POOL_CONFIGS = {
+    "production": PRODUCTION_POOL_CONFIG,
+    "staging": STAGING_POOL_CONFIG,
+    "development": DEVELOPMENT_POOL_CONFIG,
+}
+
+
+def _connect_args(database_url: str) -> dict[str, Any]:
+    """Driver arguments for the database URL.
+
+    asyncpg connections keep an LRU of prepared statements; sizing it to
+    cover the hot repository queries means they are parsed and planned
+    once per connection rather than on every call.
+    """
+    if not str(database_url).startswith("postgresql+asyncpg"):
+        return {}
+    return {"prepared_statement_cache_size": settings.database.statement_cache_size}
+
+
+def _instrument_pool(engine: AsyncEngine) -> None:
+    """Record how long each connection is checked out of the pool."""
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):  # type: ignore[no-untyped-def]
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):  # type: ignore[no-untyped-def]
+        started = connection_record.info.pop("checked_out_at", None)
+        if started is not None:
+            _pool_metrics.record_checkout((time.perf_counter() - started) * 1000)
+
+
+def _pool_config() -> tuple[str, dict[str, Any]]:
+    """Return the pool policy name and engine options for this environment."""
+    if settings.testing:
+        return "testing", TESTING_POOL_CONFIG.copy()
+    # Unknown environments get the production policy
+    environment = settings.environment if settings.environment in POOL_CONFIGS else "production"
+    return environment, POOL_CONFIGS[environment].copy()
+
 
 def get_engine() -> AsyncEngine:
     """Get or create the database engine with optimized connection pooling.
@@ -50,23 +175,24 @@ def get_engine() -> AsyncEngine:
     global _engine
 
     if _engine is None:
-        # Choose pool configuration based on environment
-        if settings.testing:
-            pool_config = TESTING_POOL_CONFIG.copy()
-            logger.info("Creating database engine with testing pool configuration")
-        else:
-            pool_config = PRODUCTION_POOL_CONFIG.copy()  # type: ignore[assignment]
-            logger.info("Creating database engine with production pool configuration")
+        environment, pool_config = _pool_config()
+        logger.info(f"Creating database engine with {environment} pool configuration")
+
+        database_url = settings.get_database_url()
 
         # Create engine with enhanced async support and connection pooling
         _engine = create_async_engine(
-            settings.get_database_url(),
+            database_url,
             echo=settings.database.echo,
             **pool_config,
+            connect_args=_connect_args(database_url),
+            query_cache_size=settings.database.query_cache_size,
             # Additional async-specific settings
             future=True,  # Use SQLAlchemy 2.0 style
             echo_pool=settings.database.echo,  # Log pool events if echo is enabled
         )
+        if isinstance(_engine, AsyncEngine):
+            _instrument_pool(_engine)
 
         logger.info(
             f"Database engine created with pool_size={pool_config.get('pool_size', 'default')}, "
@@ -158,6 +284,207 @@ async def get_session_with_retry(
                 raise last_exception from e
 
 
+class ReplicaRouter:
+    """Round-robin over read replica engines, skipping unhealthy ones.
+
+    A replica that fails to connect, or lags too far behind the primary,
+    is left out of rotation for ``retry_seconds`` and then tried again.
+    """
+
+    def __init__(self, engines: dict[str, AsyncEngine], retry_seconds: float) -> None:
+        self.engines = engines
+        self.retry_seconds = retry_seconds
+        self._unhealthy_until: dict[str, float] = {}
+        self._next = 0
+
+    def candidates(self) -> list[tuple[str, AsyncEngine]]:
+        """Healthy replicas, starting with the next one in rotation."""
+        now = time.monotonic()
+        healthy = [
+            (name, engine)
+            for name, engine in self.engines.items()
+            if self._unhealthy_until.get(name, 0.0) <= now
+        ]
+        if not healthy:
+            return []
+        start = self._next % len(healthy)
+        self._next += 1
+        return healthy[start:] + healthy[:start]
+
+    def mark_unhealthy(self, name: str) -> None:
+        """Take a replica out of rotation for ``retry_seconds``."""
+        self._unhealthy_until[name] = time.monotonic() + self.retry_seconds
+
+    def mark_healthy(self, name: str) -> None:
+        """Put a replica back into rotation."""
+        self._unhealthy_until.pop(name, None)
+
+    def status(self) -> list[dict[str, Any]]:
+        """Rotation state of every replica."""
+        now = time.monotonic()
+        return [
+            {
+                "replica": name,
+                "healthy": self._unhealthy_until.get(name, 0.0) <= now,
+                "checked_out": getattr(engine.sync_engine.pool, "checkedout", lambda: None)(),
+            }
+            for name, engine in self.engines.items()
+        ]
+
+
+def _replica_name(url: str) -> str:
+    """Replica label without credentials."""
+    return make_url(url).render_as_string(hide_password=True)
+
+
+def get_replica_router() -> ReplicaRouter | None:
+    """Get or create the router over ``settings.database.replica_urls``.
+
+    Returns:
+        ReplicaRouter, or None when no replicas are configured
+    """
+    global _replica_router
+
+    if _replica_router is None and settings.database.replica_urls:
+        environment, pool_config = _pool_config()
+        if pool_config.get("poolclass") is InstrumentedAsyncQueuePool:
+            # Pool wait metrics describe the primary
+            pool_config["poolclass"] = AsyncAdaptedQueuePool
+        engines = {
+            _replica_name(url): create_async_engine(
+                url,
+                echo=settings.database.echo,
+                **pool_config,
+                connect_args=_connect_args(url),
+                query_cache_size=settings.database.query_cache_size,
+            )
+            for url in settings.database.replica_urls
+        }
+        _replica_router = ReplicaRouter(engines, settings.database.replica_retry_seconds)
+        logger.info(
+            f"Read replica engines created for {list(engines)} with {environment} pool configuration"
+        )
+
+    return _replica_router
+
+
+async def _read_connection() -> AsyncConnection:
+    """Connect to the next healthy replica, falling back to the primary."""
+    router = get_replica_router()
+    for name, engine in router.candidates() if router else []:
+        try:
+            connection = await engine.connect()
+        except Exception as e:
+            router.mark_unhealthy(name)  # type: ignore[union-attr]
+            logger.warning(f"Read replica {name} unavailable, trying next: {e}")
+            continue
+        return connection
+
+    return await get_engine().connect()
+
+
+@asynccontextmanager
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get a session for read-only work such as analytics and reporting.
+
+    The session is bound to a connection on a healthy read replica when
+    ``settings.database.replica_urls`` is set, otherwise (or when every
+    replica is down) to the primary. Nothing is committed; the
+    transaction is rolled back on exit.
+
+    Yields:
+        AsyncSession instance for read-only queries
+
+    Example:
+        async with get_read_session() as session:
+            rows = await ERA5Repository(session).get_data_range(start, end)
+    """
+    connection = await _read_connection()
+    try:
+        async with AsyncSession(
+            bind=connection, expire_on_commit=False, autoflush=False
+        ) as session:
+            yield session
+    finally:
+        await connection.close()
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency yielding a ``get_session`` session.
+
+    ``Depends`` needs a generator function, not the context managers above.
+    """
+    async with get_session() as session:
+        yield session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency yielding a ``get_read_session`` session."""
+    async with get_read_session() as session:
+        yield session
+
+
+async def check_replica_health() -> list[dict[str, Any]]:
+    """Probe replication lag and update the rotation.
+
+    Replicas that cannot be reached or whose last replayed transaction is
+    older than ``settings.database.replica_max_lag_seconds`` are taken out
+    of rotation; the rest are put back.
+
+    Returns:
+        Lag in seconds (None if unknown) and health per replica
+    """
+    router = get_replica_router()
+    if router is None:
+        return []
+
+    results = []
+    for name, engine in router.engines.items():
+        lag = None
+        try:
+            async with engine.connect() as conn:
+                lag = (
+                    await conn.execute(
+                        text(
+                            "SELECT EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+                        )
+                    )
+                ).scalar()
+            healthy = lag is None or lag <= settings.database.replica_max_lag_seconds
+        except Exception as e:
+            logger.warning(f"Read replica {name} health check failed: {e}")
+            healthy = False
+
+        if healthy:
+            router.mark_healthy(name)
+        else:
+            router.mark_unhealthy(name)
+        results.append(
+            {"replica": name, "lag_seconds": None if lag is None else float(lag), "healthy": healthy}
+        )
+
+    return results
+
+
+async def monitor_replica_health(interval_seconds: float | None = None) -> None:
+    """Run ``check_replica_health`` periodically until cancelled.
+
+    Started from the API lifespan so lagging replicas leave the read
+    rotation without waiting for a CLI health check.
+
+    Args:
+        interval_seconds: Seconds between probes, defaults to
+            ``settings.database.replica_check_seconds``
+    """
+    interval = interval_seconds or settings.database.replica_check_seconds
+    while True:
+        try:
+            await check_replica_health()
+        except Exception as e:
+            logger.warning(f"Read replica health check failed: {e}")
+        await asyncio.sleep(interval)
+
+
 async def init_database(drop_existing: bool = False) -> None:
     """Initialize the database schema.
 
@@ -196,13 +523,17 @@ async def init_database(drop_existing: bool = False) -> None:
 async def get_connection_pool_status() -> dict:
     """Get detailed connection pool status for monitoring.
 
+    Besides the pool counters, reports p50/p95/p99/max of the time spent
+    waiting for a connection (``wait_ms``) and of how long connections
+    are held (``checkout_ms``) over the most recent checkouts.
+
     Returns:
         Dictionary with connection pool metrics
     """
     engine = get_engine()
     pool = engine.sync_engine.pool if hasattr(engine, "sync_engine") else None
 
-    pool_status = {
+    pool_status: dict[str, Any] = {
         "pool_size": None,
         "checked_in": None,
         "checked_out": None,
@@ -211,15 +542,21 @@ async def get_connection_pool_status() -> dict:
     }
 
     if pool:
-        pool_status.update(
-            {
-                "pool_size": pool.size(),  # type: ignore[attr-defined]
-                "checked_in": pool.checkedin(),  # type: ignore[attr-defined]
-                "checked_out": pool.checkedout(),  # type: ignore[attr-defined]
-                "overflow": pool.overflow(),  # type: ignore[attr-defined]
-                "invalid": pool.invalid(),  # type: ignore[attr-defined]
-            }
-        )
+        # Queue pools have no ``invalid()`` counter and NullPool has none at
+        # all, so report whichever counters this pool class provides
+        for key, counter in (
+            ("pool_size", "size"),
+            ("checked_in", "checkedin"),
+            ("checked_out", "checkedout"),
+            ("overflow", "overflow"),
+            ("invalid", "invalid"),
+        ):
+            method = getattr(pool, counter, None)
+            pool_status[key] = method() if callable(method) else None
+
+    pool_status.update(_pool_metrics.snapshot())
+    if _replica_router is not None:
+        pool_status["replicas"] = _replica_router.status()
 
     return pool_status
 
@@ -314,6 +651,9 @@ async def check_database_health() -> dict:
         # Get connection pool status
         health_status["connection_pool"] = await get_connection_pool_status()
 
+        # Probe read replicas and refresh their rotation
+        health_status["replicas"] = await check_replica_health()
+
     except Exception as e:
         health_status["error"] = str(e)
         health_status["response_time_ms"] = int(
@@ -329,13 +669,19 @@ async def close_database() -> None:
 
     Should be called during application shutdown.
     """
-    global _engine, _async_session_maker
+    global _engine, _async_session_maker, _replica_router
 
     if _engine:
         await _engine.dispose()
         logger.info("Database engine disposed")
         _engine = None
 
+    if _replica_router:
+        for engine in _replica_router.engines.values():
+            await engine.dispose()
+        logger.info("Read replica engines disposed")
+        _replica_router = None
+
     _async_session_maker = None
 
 
@@ -0,0 +1,306 @@
+"""
+Allocation Solver
+
+Linear and mixed-integer programming model for allocating resources across
+facilities, resource types and planning periods, solved with the HiGHS
+backends of ``scipy.optimize.linprog`` and ``scipy.optimize.milp``.
+
+Model (f = facility, r = resource type, t = planning period):
+- x[f, r, t] >= 0: quantity shipped to f in period t
+- u[f, r, t] >= 0: stock-out (unmet cumulative demand) at the end of t
+- u >= cumulative demand - initial inventory - cumulative shipments
+- initial inventory + cumulative shipments - demand of earlier periods
+  <= storage capacity
+- sum(unit cost * x) <= budget
+- minimize sum(priority[f] * period length[t] * u), i.e. priority-weighted
+  stock-out days, with a small shipment-cost tie-break
+
+Constraint matrices are assembled as sparse blocks, so a national problem
+(thousands of facilities) is built in milliseconds and solved in seconds.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import Bounds, LinearConstraint, linprog, milp
+
+logger = logging.getLogger(__name__)
+
+# Weight added to every facility priority so low-priority facilities are
+# still served when budget allows
+PRIORITY_FLOOR = 0.05
+
+# Shipment cost weight relative to the smallest shortage weight; only breaks
+# ties between plans with equal stock-outs
+COST_TIE_BREAK = 1e-3
+
+_STATUS_NAMES = {0: "optimal", 1: "time_limit", 2: "infeasible", 3: "unbounded"}
+
+
+@dataclass
+class AllocationProblem:
+    """Vectorized multi-facility allocation problem"""
+    facility_ids: list[str]
+    resource_types: list[str]
+    period_demand: np.ndarray  # (facilities, resource types, periods)
+    initial_inventory: np.ndarray  # (facilities, resource types)
+    storage_capacity: np.ndarray  # (facilities, resource types), inf if unlimited
+    unit_costs: np.ndarray  # (facilities, resource types)
+    priorities: np.ndarray  # (facilities,)
+    budget: float
+    period_lengths: np.ndarray | None = None  # (periods,), days; equal if None
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self.period_demand.shape  # type: ignore[return-value]
+
+
+@dataclass
+class AllocationSolution:
+    """Solved shipment plan"""
+    shipments: np.ndarray  # (facilities, resource types, periods)
+    shortages: np.ndarray  # (facilities, resource types, periods)
+    objective_value: float
+    solver_status: str
+    computation_time: float
+    warm_started: bool = False
+
+
+class AllocationSolver:
+    """
+    Solves allocation problems and keeps the previous solution per problem
+    family (resource types and period count) for warm starts.
+
+    SciPy's HiGHS interface does not accept an initial point, so a warm start
+    reuses the cached sparse structure and keeps the previous plan, projected
+    onto today's demand, inventory and budget, as an incumbent. The solver
+    result replaces it only when it is at least as good, which matters when
+    a time limit stops the solver early.
+    """
+
+    def __init__(self, time_limit: float | None = None, mip_rel_gap: float = 1e-4):
+        """
+        Initialize the solver.
+
+        Args:
+            time_limit: Solver time limit in seconds
+            mip_rel_gap: Relative optimality gap for integer problems
+        """
+        self.time_limit = time_limit
+        self.mip_rel_gap = mip_rel_gap
+        self._cumulative: dict[tuple[int, int], sparse.csr_matrix] = {}
+        self._previous: dict[tuple[tuple[str, ...], int], dict[str, np.ndarray]] = {}
+
+    def solve(
+        self,
+        problem: AllocationProblem,
+        integer: bool = False,
+        warm_start: bool = True
+    ) -> AllocationSolution:
+        """
+        Solve an allocation problem.
+
+        Args:
+            problem: Problem arrays
+            integer: Restrict shipments to whole units (MILP)
+            warm_start: Use and update the previous solution for this family
+
+        Returns:
+            Shipment and stock-out plan
+        """
+        start = time.perf_counter()
+        n_facilities, n_resources, n_periods = problem.shape
+        family = (tuple(problem.resource_types), n_periods)
+
+        if n_facilities == 0 or n_resources == 0 or n_periods == 0:
+            empty = np.zeros(problem.shape)
+            return AllocationSolution(empty, empty.copy(), 0.0, "optimal", 0.0)
+
+        cost, a_ub, b_ub = self._build_lp(problem)
+        n = n_facilities * n_resources * n_periods
+
+        incumbent = None
+        if warm_start and family in self._previous:
+            incumbent = self._project_previous(problem, self._previous[family], integer)
+
+        options: dict[str, float] = {}
+        if self.time_limit is not None:
+            options["time_limit"] = self.time_limit
+
+        if integer:
+            integrality = np.concatenate([np.ones(n), np.zeros(n)])
+            result = milp(
+                cost,
+                constraints=LinearConstraint(a_ub, -np.inf, b_ub),
+                integrality=integrality,
+                bounds=Bounds(0, np.inf),
+                options={**options, "mip_rel_gap": self.mip_rel_gap},
+            )
+        else:
+            result = linprog(
+                cost, A_ub=a_ub, b_ub=b_ub, bounds=(0, None), method="highs", options=options
+            )
+
+        status = _STATUS_NAMES.get(result.status, "failed")
+        warm_started = False
+
+        if result.x is not None:
+            x = np.maximum(result.x[:n], 0.0)
+            if integer:
+                x = np.round(x)
+            shipments = x.reshape(problem.shape)
+            shortages = self._shortages(problem, shipments)
+            objective = self._objective(problem, shipments, shortages)
+        else:
+            logger.warning(f"Allocation solver returned no solution: {result.message}")
+            shipments = np.zeros(problem.shape)
+            shortages = self._shortages(problem, shipments)
+            objective = self._objective(problem, shipments, shortages)
+
+        if incumbent is not None and incumbent[2] < objective - 1e-9 * max(abs(objective), 1.0):
+            shipments, shortages, objective = incumbent
+            status = "warm_start"
+            warm_started = True
+
+        if warm_start:
+            self._previous[family] = {
+                "facility_ids": np.asarray(problem.facility_ids, dtype=object),
+                "shipments": shipments,
+            }
+
+        return AllocationSolution(
+            shipments=shipments,
+            shortages=shortages,
+            objective_value=float(objective),
+            solver_status=status,
+            computation_time=time.perf_counter() - start,
+            warm_started=warm_started,
+        )
+
+    def _cumulative_matrix(self, n_cells: int, n_periods: int) -> sparse.csr_matrix:
+        """Block-diagonal matrix summing shipments up to each period."""
+        key = (n_cells, n_periods)
+        if key not in self._cumulative:
+            lower = sparse.csr_matrix(np.tril(np.ones((n_periods, n_periods))))
+            self._cumulative[key] = sparse.kron(
+                sparse.identity(n_cells, format="csr"), lower, format="csr"
+            )
+        return self._cumulative[key]
+
+    def _build_lp(
+        self, problem: AllocationProblem
+    ) -> tuple[np.ndarray, sparse.csr_matrix, np.ndarray]:
+        """Assemble objective, inequality matrix and right-hand side."""
+        n_facilities, n_resources, n_periods = problem.shape
+        n = n_facilities * n_resources * n_periods
+        cumulative = self._cumulative_matrix(n_facilities * n_resources, n_periods)
+        demand_cum, demand_before = _cumulative_demand(problem.period_demand)
+        inventory = problem.initial_inventory[:, :, None]
+
+        # Shortage rows: -X_cum - u <= I0 - D_cum
+        shortage_block = sparse.hstack(
+            [-cumulative, -sparse.identity(n, format="csr")], format="csr"
+        )
+        shortage_rhs = (inventory - demand_cum).ravel()
+
+        # Storage rows: X_cum <= S - I0 + D_before, only where capacity is finite
+        storage_rhs = np.maximum(
+            problem.storage_capacity[:, :, None] - inventory + demand_before, 0.0
+        ).ravel()
+        finite = np.isfinite(storage_rhs)
+        storage_block = sparse.hstack(
+            [cumulative[finite], sparse.csr_matrix((int(finite.sum()), n))], format="csr"
+        )
+
+        unit_costs = np.repeat(problem.unit_costs.ravel(), n_periods)
+        budget_row = sparse.csr_matrix(np.concatenate([unit_costs, np.zeros(n)])[None, :])
+
+        a_ub = sparse.vstack([shortage_block, storage_block, budget_row], format="csr")
+        b_ub = np.concatenate([shortage_rhs, storage_rhs[finite], [problem.budget]])
+
+        weights = _shortage_weights(problem)
+        shortage_costs = (
+            weights[:, None, None] * _period_lengths(problem)[None, None, :]
+        ) * np.ones((1, n_resources, 1))
+        cost = np.concatenate(
+            [_tie_break_costs(weights, unit_costs), shortage_costs.ravel()]
+        )
+        return cost, a_ub, b_ub
+
+    def _project_previous(
+        self,
+        problem: AllocationProblem,
+        previous: dict[str, np.ndarray],
+        integer: bool
+    ) -> tuple[np.ndarray, np.ndarray, float]:
+        """Map the previous plan onto the current problem and make it feasible."""
+        n_facilities, n_resources, n_periods = problem.shape
+        shipments = np.zeros(problem.shape)
+
+        index = {facility_id: i for i, facility_id in enumerate(previous["facility_ids"])}
+        rows = np.array([index.get(fid, -1) for fid in problem.facility_ids])
+        known = rows >= 0
+        shipments[known] = previous["shipments"][rows[known]]
+
+        # Respect storage caps period by period
+        _, demand_before = _cumulative_demand(problem.period_demand)
+        caps = problem.storage_capacity[:, :, None] - problem.initial_inventory[:, :, None] + demand_before
+        shipped = np.zeros((n_facilities, n_resources))
+        for t in range(n_periods):
+            shipments[:, :, t] = np.clip(shipments[:, :, t], 0.0, np.maximum(caps[:, :, t] - shipped, 0.0))
+            shipped += shipments[:, :, t]
+
+        spend = float((problem.unit_costs[:, :, None] * shipments).sum())
+        if spend > problem.budget > 0:
+            shipments *= problem.budget / spend
+        elif problem.budget <= 0:
+            shipments[:] = 0.0
+        if integer:
+            shipments = np.floor(shipments)
+
+        shortages = self._shortages(problem, shipments)
+        return shipments, shortages, self._objective(problem, shipments, shortages)
+
+    @staticmethod
+    def _shortages(problem: AllocationProblem, shipments: np.ndarray) -> np.ndarray:
+        demand_cum, _ = _cumulative_demand(problem.period_demand)
+        supply = problem.initial_inventory[:, :, None] + np.cumsum(shipments, axis=2)
+        return np.maximum(demand_cum - supply, 0.0)
+
+    @staticmethod
+    def _objective(
+        problem: AllocationProblem, shipments: np.ndarray, shortages: np.ndarray
+    ) -> float:
+        weights = _shortage_weights(problem)
+        unit_costs = np.repeat(problem.unit_costs.ravel(), problem.shape[2])
+        shortage_days = shortages * _period_lengths(problem)[None, None, :]
+        return float(
+            (weights[:, None, None] * shortage_days).sum()
+            + _tie_break_costs(weights, unit_costs) @ shipments.ravel()
+        )
+
+
+def _cumulative_demand(period_demand: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Cumulative demand through each period and before each period."""
+    demand_cum = np.cumsum(period_demand, axis=2)
+    return demand_cum, demand_cum - period_demand
+
+
+def _shortage_weights(problem: AllocationProblem) -> np.ndarray:
+    return np.asarray(problem.priorities, dtype=float) + PRIORITY_FLOOR
+
+
+def _period_lengths(problem: AllocationProblem) -> np.ndarray:
+    if problem.period_lengths is None:
+        return np.ones(problem.shape[2])
+    return np.asarray(problem.period_lengths, dtype=float)
+
+
+def _tie_break_costs(weights: np.ndarray, unit_costs: np.ndarray) -> np.ndarray:
+    max_cost = float(unit_costs.max()) if unit_costs.size else 0.0
+    if max_cost <= 0:
+        return np.zeros_like(unit_costs)
+    return COST_TIE_BREAK * float(weights.min()) * unit_costs / max_cost
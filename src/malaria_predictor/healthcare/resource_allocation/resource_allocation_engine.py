@@ -18,12 +18,19 @@ Date: 2025-09-19
 """
 
 import logging
+import math
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, cast
 
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linprog
+
+from .allocation_solver import AllocationProblem, AllocationSolver
+
 logger = logging.getLogger(__name__)
 
 
@@ -158,9 +165,22 @@ class ResourceAllocationEngine:
         self._optimization_config = self._load_optimization_config()
         self._constraint_handlers = self._initialize_constraint_handlers()
         self._objective_functions = self._initialize_objective_functions()
+        self._allocation_solver = AllocationSolver(
+            time_limit=self._optimization_config["time_limit_seconds"]
+        )
 
         logger.info("Resource Allocation Engine initialized successfully")
 
+    def register_facilities(self, facilities: list[HealthcareFacility]) -> None:
+        """
+        Register or update facilities available for allocation.
+
+        Args:
+            facilities: Facilities to add, replacing entries with the same ID
+        """
+        for facility in facilities:
+            self._facilities[facility.facility_id] = facility
+
     def allocate_resources(
         self,
         requests: list[ResourceRequest],
@@ -219,33 +239,50 @@ class ResourceAllocationEngine:
     def optimize_multi_facility_allocation(
         self,
         target_facilities: list[str],
-        resource_type: ResourceType,
+        resource_type: ResourceType | list[ResourceType],
         total_budget: float,
-        time_horizon_days: int = 30
+        time_horizon_days: int = 30,
+        period_days: int | None = None,
+        integer_quantities: bool = False,
+        warm_start: bool = True
     ) -> dict[str, Any]:
         """
         Optimize resource allocation across multiple facilities.
 
+        All resource types share one budget and are solved in a single
+        program over facilities x resource types x planning periods. The
+        previous solution for the same resource types seeds the next run.
+
         Args:
             target_facilities: List of facility IDs to optimize
-            resource_type: Type of resource to allocate
+            resource_type: Type, or list of types, of resource to allocate
             total_budget: Total budget available
             time_horizon_days: Planning time horizon
+            period_days: Length of each planning period within the horizon
+            integer_quantities: Allocate whole units (mixed-integer program)
+            warm_start: Seed the solver with the previous solution
 
         Returns:
             Optimization results with facility-specific allocations
         """
-        logger.info(f"Optimizing {resource_type.value} allocation across {len(target_facilities)} facilities")
+        resource_types = [resource_type] if isinstance(resource_type, ResourceType) else list(resource_type)
+        logger.info(
+            f"Optimizing {', '.join(r.value for r in resource_types)} allocation "
+            f"across {len(target_facilities)} facilities"
+        )
 
         # Get facility data
         facilities = [self._facilities[fid] for fid in target_facilities if fid in self._facilities]
 
         # Calculate demand forecasts for each facility
-        demand_forecasts = self._calculate_facility_demands(
-            facilities=facilities,
-            resource_type=resource_type,
-            time_horizon_days=time_horizon_days
-        )
+        demand_forecasts = {
+            rtype: self._calculate_facility_demands(
+                facilities=facilities,
+                resource_type=rtype,
+                time_horizon_days=time_horizon_days
+            )
+            for rtype in resource_types
+        }
 
         # Calculate malaria risk-adjusted priorities
         risk_priorities = self._calculate_risk_based_priorities(facilities)
@@ -256,7 +293,11 @@ class ResourceAllocationEngine:
             demand_forecasts=demand_forecasts,
             risk_priorities=risk_priorities,
             total_budget=total_budget,
-            resource_type=resource_type
+            resource_types=resource_types,
+            time_horizon_days=time_horizon_days,
+            period_days=period_days or self._optimization_config["period_days"],
+            integer_quantities=integer_quantities,
+            warm_start=warm_start
         )
 
         logger.info("Multi-facility optimization completed")
@@ -437,21 +478,39 @@ class ResourceAllocationEngine:
         return problem
 
     def _solve_optimization_problem(self, problem: dict[str, Any]) -> dict[str, Any]:
-        """Solve the optimization problem using appropriate algorithm"""
-
-        # For this implementation, we'll use a simplified heuristic approach
-        # In practice, this would use OR-Tools, CPLEX, Gurobi, or similar
+        """Solve the request-level allocation linear program"""
+        start = datetime.now()
+        values = self._request_unit_values(problem)
 
-        solution = {
+        solution: dict[str, Any] = {
             "allocations": {},
             "objective_value": 0.0,
             "solver_status": "optimal",
-            "computation_time": 0.1
+            "computation_time": 0.0
         }
 
-        # Implement greedy allocation algorithm as baseline
-        solution["allocations"] = self._greedy_allocation_algorithm(problem)
+        if len(values):
+            constraints = problem["constraints"]
+            result = linprog(
+                -values,
+                A_ub=constraints["membership"],
+                b_ub=constraints["availability"],
+                bounds=list(zip(np.zeros(len(values)), constraints["quantity_caps"], strict=True)),
+                method="highs",
+                options={"time_limit": self._optimization_config["time_limit_seconds"]}
+            )
+
+            if result.x is not None:
+                solution["allocations"] = self._format_request_allocations(problem, result.x)
+                solution["solver_status"] = "optimal" if result.status == 0 else "time_limit"
+            else:
+                # Fall back to the greedy heuristic if the solver fails
+                logger.warning(f"Allocation LP failed ({result.message}); using greedy allocation")
+                solution["allocations"] = self._greedy_allocation_algorithm(problem)
+                solution["solver_status"] = "greedy_fallback"
+
         solution["objective_value"] = self._evaluate_objective(cast(dict[Any, Any], solution["allocations"]), problem)
+        solution["computation_time"] = (datetime.now() - start).total_seconds()
 
         return solution
 
@@ -558,60 +617,95 @@ class ResourceAllocationEngine:
     def _solve_multi_facility_optimization(
         self,
         facilities: list[HealthcareFacility],
-        demand_forecasts: dict[str, float],
+        demand_forecasts: dict[ResourceType, dict[str, float]],
         risk_priorities: dict[str, float],
         total_budget: float,
-        resource_type: ResourceType
+        resource_types: list[ResourceType],
+        time_horizon_days: int,
+        period_days: int,
+        integer_quantities: bool = False,
+        warm_start: bool = True
     ) -> dict[str, Any]:
-        """Solve multi-facility optimization problem"""
-
-        # Simplified optimization using priority-based allocation
-        allocations = {}
-        remaining_budget = total_budget
-
-        # Sort facilities by priority
-        sorted_facilities = sorted(
-            facilities,
-            key=lambda f: risk_priorities.get(f.facility_id, 0),
-            reverse=True
+        """Solve multi-facility optimization problem as a linear program"""
+
+        # Split the horizon into planning periods; demand is spread evenly
+        n_periods = max(1, math.ceil(time_horizon_days / period_days))
+        period_lengths = np.full(n_periods, float(period_days))
+        period_lengths[-1] = time_horizon_days - period_days * (n_periods - 1)
+        period_share = period_lengths / max(time_horizon_days, 1)
+
+        facility_ids = [facility.facility_id for facility in facilities]
+        resource_names = [rtype.value for rtype in resource_types]
+
+        horizon_demand = np.array(
+            [[demand_forecasts[rtype].get(fid, 0.0) for rtype in resource_types] for fid in facility_ids],
+            dtype=float
+        ).reshape(len(facilities), len(resource_types))
+        problem = AllocationProblem(
+            facility_ids=facility_ids,
+            resource_types=resource_names,
+            period_demand=horizon_demand[:, :, None] * period_share[None, None, :],
+            initial_inventory=np.array(
+                [[f.current_inventory.get(name, 0) for name in resource_names] for f in facilities],
+                dtype=float
+            ).reshape(horizon_demand.shape),
+            storage_capacity=np.array(
+                [[f.storage_capacity.get(name, np.inf) for name in resource_names] for f in facilities],
+                dtype=float
+            ).reshape(horizon_demand.shape),
+            unit_costs=np.array(
+                [[self._get_resource_cost(rtype, f.location) for rtype in resource_types] for f in facilities],
+                dtype=float
+            ).reshape(horizon_demand.shape),
+            priorities=np.array([risk_priorities.get(fid, 0.0) for fid in facility_ids], dtype=float),
+            budget=total_budget,
+            period_lengths=period_lengths
         )
 
-        for facility in sorted_facilities:
-            demand = demand_forecasts.get(facility.facility_id, 0)
-            estimated_cost_per_unit = self._get_resource_cost(resource_type, facility.location)
-            total_cost = demand * estimated_cost_per_unit
+        solution = self._allocation_solver.solve(
+            problem, integer=integer_quantities, warm_start=warm_start
+        )
 
-            if total_cost <= remaining_budget:
-                allocations[facility.facility_id] = {
-                    "quantity": demand,
-                    "cost": total_cost,
-                    "priority_score": risk_priorities.get(facility.facility_id, 0)
-                }
-                remaining_budget -= total_cost
-            else:
-                # Partial allocation based on remaining budget
-                affordable_quantity = remaining_budget / estimated_cost_per_unit
-                if affordable_quantity > 0:
-                    allocations[facility.facility_id] = {
-                        "quantity": affordable_quantity,
-                        "cost": remaining_budget,
-                        "priority_score": risk_priorities.get(facility.facility_id, 0)
+        quantities = solution.shipments.sum(axis=2)
+        costs = quantities * problem.unit_costs
+        allocations = {}
+        for i in np.flatnonzero(quantities.sum(axis=1) > 1e-9):
+            fid = facility_ids[i]
+            allocations[fid] = {
+                "quantity": float(quantities[i].sum()),
+                "cost": float(costs[i].sum()),
+                "priority_score": risk_priorities.get(fid, 0),
+                "resources": {
+                    name: {
+                        "quantity": float(quantities[i, r]),
+                        "cost": float(costs[i, r]),
+                        "schedule": solution.shipments[i, r].tolist()
                     }
-                    remaining_budget = 0
-                break
+                    for r, name in enumerate(resource_names)
+                    if quantities[i, r] > 1e-9
+                }
+            }
+
+        total_cost = float(costs.sum())
+        unmet = solution.shortages[:, :, -1].sum(axis=1) if facilities else np.zeros(0)
 
         return {
             "allocations": allocations,
-            "total_cost": total_budget - remaining_budget,
-            "budget_utilization": (total_budget - remaining_budget) / total_budget,
+            "total_cost": total_cost,
+            "budget_utilization": total_cost / total_budget if total_budget > 0 else 0.0,
             "facilities_served": len(allocations),
-            "unmet_demand": self._calculate_unmet_demand(demand_forecasts, allocations)
+            "unmet_demand": {fid: float(unmet[i]) for i, fid in enumerate(facility_ids)},
+            "period_days": period_lengths.tolist(),
+            "objective_value": solution.objective_value,
+            "solver_status": solution.solver_status,
+            "computation_time": solution.computation_time,
+            "warm_started": solution.warm_started
         }
 
     # Additional helper methods would be implemented here
     def _load_optimization_config(self) -> dict:
         """Load optimization configuration"""
-        return {"max_iterations": 1000, "tolerance": 1e-6}
+        return {"max_iterations": 1000, "tolerance": 1e-6, "time_limit_seconds": 30.0, "period_days": 7}
 
     def _initialize_constraint_handlers(self) -> dict:
         """Initialize constraint handling functions"""
@@ -630,28 +724,193 @@ class ResourceAllocationEngine:
         return {}
 
     def _define_decision_variables(self, requests: list[ResourceRequest]) -> dict:
-        """Define optimization decision variables"""
-        return {}
+        """Define optimization decision variables (one quantity per request)"""
+        return {
+            "request_ids": [request.request_id for request in requests],
+            "upper_bounds": np.array([request.quantity_requested for request in requests], dtype=float)
+        }
 
     def _build_objective_function(self, strategy: AllocationStrategy, objectives: OptimizationObjective) -> dict:
-        """Build objective function for optimization"""
-        return {}
+        """Build objective function weights for optimization"""
+        weights = {
+            "coverage": objectives.coverage_weight,
+            "equity": objectives.equity_weight,
+            "cost": objectives.cost_weight,
+            "efficiency": objectives.efficiency_weight
+        }
+        urgency_weights = {
+            ResourceUrgency.EMERGENCY: 5.0,
+            ResourceUrgency.HIGH: 3.0,
+            ResourceUrgency.MEDIUM: 2.0,
+            ResourceUrgency.LOW: 1.0,
+            ResourceUrgency.ROUTINE: 0.5
+        }
+
+        # Strategies shift emphasis between the weighted objectives
+        if strategy == AllocationStrategy.COST_MINIMIZATION:
+            weights["cost"] *= 2.0
+        elif strategy == AllocationStrategy.COVERAGE_MAXIMIZATION:
+            weights["cost"] = 0.0
+        elif strategy == AllocationStrategy.EQUITY_OPTIMIZATION:
+            weights["equity"] *= 2.0
+        elif strategy == AllocationStrategy.RISK_BASED:
+            urgency_weights = {urgency: weight * 2.0 for urgency, weight in urgency_weights.items()}
+
+        return {"weights": weights, "urgency_weights": urgency_weights}
 
     def _build_constraints(self, requests: list[ResourceRequest], available_resources: dict) -> dict:
         """Build optimization constraints"""
-        return {}
+        resource_names = sorted({request.resource_name for request in requests})
+        resource_index = {name: i for i, name in enumerate(resource_names)}
+        supplier = available_resources.get("supplier_availability", {})
+        totals = available_resources.get("total_availability", {})
+
+        # One availability row per resource shared by all requests for it
+        membership = sparse.csr_matrix(
+            (
+                np.ones(len(requests)),
+                ([resource_index[r.resource_name] for r in requests], np.arange(len(requests)))
+            ),
+            shape=(len(resource_names), len(requests))
+        )
+        availability = np.array(
+            [totals.get(name, 0) + supplier.get(name, 0) for name in resource_names], dtype=float
+        )
+
+        # Per-request cost limits become quantity caps
+        quantity_caps = np.array([
+            min(
+                request.quantity_requested,
+                request.cost_limit / self._get_request_unit_cost(request)
+                if request.cost_limit is not None else np.inf
+            )
+            for request in requests
+        ], dtype=float)
+
+        return {
+            "resource_names": resource_names,
+            "membership": membership,
+            "availability": availability,
+            "quantity_caps": quantity_caps
+        }
 
     def _extract_optimization_parameters(self, requests: list[ResourceRequest], available_resources: dict) -> dict:
         """Extract parameters for optimization"""
-        return {}
+        facility_priorities = self._calculate_risk_based_priorities(list(self._facilities.values()))
+
+        # Stocked facilities per resource, largest stock first
+        stock_holders: dict[str, list[str]] = defaultdict(list)
+        for facility_id, stock in sorted(
+            available_resources.get("facility_stocks", {}).items(),
+            key=lambda item: -sum(item[1].values())
+        ):
+            for resource, quantity in stock.items():
+                if quantity > 0:
+                    stock_holders[resource].append(facility_id)
+
+        sources = []
+        for request in requests:
+            holders = [fid for fid in stock_holders.get(request.resource_name, []) if fid != request.facility_id]
+            sources.append(holders[0] if holders else "supplier")
+
+        return {
+            "requests": requests,
+            "unit_costs": np.array([self._get_request_unit_cost(r) for r in requests], dtype=float),
+            "facility_priorities": np.array(
+                [facility_priorities.get(r.facility_id, 0.0) for r in requests], dtype=float
+            ),
+            "sources": sources
+        }
+
+    def _get_request_unit_cost(self, request: ResourceRequest) -> float:
+        facility = self._facilities.get(request.facility_id)
+        location = facility.location if facility else (0.0, 0.0)
+        return self._get_resource_cost(request.resource_type, location)
+
+    def _request_unit_values(self, problem: dict) -> np.ndarray:
+        """Net objective value of allocating one unit to each request"""
+        parameters = problem["parameters"]
+        objective = problem["objective_function"]
+        weights = objective["weights"]
+        if not parameters.get("requests"):
+            return np.zeros(0)
+
+        urgency = np.array(
+            [objective["urgency_weights"][r.urgency] for r in parameters["requests"]], dtype=float
+        )
+        unit_costs = parameters["unit_costs"]
+        relative_cost = unit_costs / unit_costs.max() if unit_costs.max() > 0 else unit_costs
+
+        values: np.ndarray = (
+            weights["coverage"] * urgency
+            + weights["equity"] * parameters["facility_priorities"]
+            + weights["efficiency"]
+            - weights["cost"] * relative_cost
+        )
+        return values
+
+    def _format_request_allocations(self, problem: dict, quantities: np.ndarray) -> dict:
+        """Convert allocated quantities into allocation entries"""
+        parameters = problem["parameters"]
+        caps = problem["constraints"]["quantity_caps"]
+        timelines = {
+            ResourceUrgency.EMERGENCY: "immediate",
+            ResourceUrgency.HIGH: "within 24 hours",
+            ResourceUrgency.MEDIUM: "within 72 hours",
+            ResourceUrgency.LOW: "within 1 week",
+            ResourceUrgency.ROUTINE: "standard procurement cycle"
+        }
+        constraints_applied = ["resource_availability"]
+
+        allocations = {}
+        for j, request in enumerate(parameters["requests"]):
+            quantity = int(np.floor(quantities[j] + 1e-6))
+            if quantity <= 0:
+                continue
+
+            applied = list(constraints_applied)
+            if caps[j] < request.quantity_requested:
+                applied.append("cost_limit")
+
+            allocations[request.request_id] = {
+                "resource": request.resource_name,
+                "quantity": quantity,
+                "source": parameters["sources"][j],
+                "cost": quantity * float(parameters["unit_costs"][j]),
+                "timeline": timelines[request.urgency],
+                "confidence": quantity / request.quantity_requested,
+                "metrics": {"fill_rate": quantity / request.quantity_requested},
+                "constraints": applied
+            }
+
+        return allocations
 
     def _greedy_allocation_algorithm(self, problem: dict) -> dict:
-        """Implement greedy allocation algorithm"""
-        return {}
+        """Allocate requests in order of unit value until resources run out"""
+        values = self._request_unit_values(problem)
+        constraints = problem["constraints"]
+        membership = constraints["membership"].tocsc()
+        remaining = constraints["availability"].copy()
+        quantities = np.zeros(len(values))
+
+        for j in np.argsort(-values, kind="stable"):
+            if values[j] <= 0:
+                break
+            resource = membership.indices[membership.indptr[j]]
+            quantities[j] = min(constraints["quantity_caps"][j], remaining[resource])
+            remaining[resource] -= quantities[j]
+
+        return self._format_request_allocations(problem, quantities)
 
     def _evaluate_objective(self, allocations: dict, problem: dict) -> float:
         """Evaluate objective function value"""
-        return 0.0
+        values = self._request_unit_values(problem)
+        request_ids = problem["decision_variables"].get("request_ids", [])
+        return float(sum(
+            values[j] * allocations[request_id]["quantity"]
+            for j, request_id in enumerate(request_ids)
+            if request_id in allocations
+        ))
 
     def _calculate_emergency_requirements(self, emergency_type: str, affected_population: int, response_time_hours: int) -> dict:
         """Calculate emergency resource requirements"""
@@ -724,11 +983,3 @@ class ResourceAllocationEngine:
     def _get_resource_cost(self, resource_type: ResourceType, location: tuple[float, float]) -> float:
         """Get estimated resource cost per unit"""
         return 10.0  # Simplified
-
-    def _calculate_unmet_demand(self, demand_forecasts: dict, allocations: dict) -> dict:
-        """Calculate unmet demand after allocation"""
-        unmet = {}
-        for facility_id, demand in demand_forecasts.items():
-            allocated = allocations.get(facility_id, {}).get("quantity", 0)
-            unmet[facility_id] = max(0, demand - allocated)
-        return unmet
@@ -6,10 +6,12 @@ including LSTM and Transformer models, feature engineering, and training pipelin
 """
 
 from .evaluation.metrics import ModelEvaluationMetrics
+from .export import ExportedModel, export_model
 from .feature_extractor import EnvironmentalFeatureExtractor
 from .models.ensemble_model import MalariaEnsembleModel
 from .models.lstm_model import MalariaLSTM
 from .models.transformer_model import MalariaTransformer
+from .quantization import check_quantized_accuracy, quantize_model
 from .training.pipeline import MalariaTrainingPipeline
 
 __all__ = [
@@ -19,4 +21,8 @@ __all__ = [
     "EnvironmentalFeatureExtractor",
     "MalariaTrainingPipeline",
     "ModelEvaluationMetrics",
+    "ExportedModel",
+    "export_model",
+    "quantize_model",
+    "check_quantized_accuracy",
 ]
@@ -154,7 +154,9 @@ class ModelEvaluationMetrics:
                 )
 
             # Confusion matrix elements
-            tn, fp, fn, tp = confusion_matrix(y_true_binary, y_pred_binary).ravel()
+            tn, fp, fn, tp = confusion_matrix(
+                y_true_binary, y_pred_binary, labels=[0, 1]
+            ).ravel()
             classification_metrics[f"{prefix}sensitivity"] = (
                 tp / (tp + fn) if (tp + fn) > 0 else 0
             )
@@ -281,9 +283,10 @@ class ModelEvaluationMetrics:
         # Trend consistency
         true_trend = self._calculate_trend(y_true_sorted)
         pred_trend = self._calculate_trend(y_pred_sorted)
-        temporal_metrics["trend_consistency"] = np.corrcoef([true_trend, pred_trend])[
-            0, 1
-        ]
+        # Slopes are single values, so compare their direction
+        temporal_metrics["trend_consistency"] = float(
+            np.sign(true_trend) == np.sign(pred_trend)
+        )
 
         # Seasonal pattern preservation
         if len(timestamps_sorted) > 365:  # If we have more than a year of data
@@ -0,0 +1,327 @@
+"""
+Model Export for CPU Serving.
+
+Traces the LSTM, Transformer and Ensemble models to TorchScript and ONNX
+with a dynamic batch axis, checks the exported graphs against the eager
+model, and loads them back for serving through the TorchScript or ONNX
+Runtime interpreters. Exported artifacts hold no pickled Python objects,
+so serving them does not need ``torch.load(weights_only=False)``.
+
+Layout of an export directory:
+    model.pt      TorchScript module
+    model.onnx    ONNX graph
+    export.json   Input shapes, output names and parity results
+"""
+
+import importlib.util
+import json
+import logging
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytorch_lightning as pl
+import torch
+import torch.nn as nn
+
+try:
+    import onnxruntime as ort
+
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ort = None
+    ONNXRUNTIME_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+INPUT_NAMES = ("climate", "vegetation", "population", "historical")
+OUTPUT_NAMES = ("risk_mean", "risk_variance")
+EXPORT_FORMATS = ("torchscript", "onnx")
+MANIFEST_NAME = "export.json"
+TORCHSCRIPT_NAME = "model.pt"
+ONNX_NAME = "model.onnx"
+
+
+class _ExportWrapper(nn.Module):
+    """Positional-tensor front end for models that take and return dicts."""
+
+    def __init__(self, model: nn.Module, output_names: list[str]) -> None:
+        super().__init__()
+        self.model = model
+        self.output_names = output_names
+
+    def forward(
+        self,
+        climate: torch.Tensor,
+        vegetation: torch.Tensor,
+        population: torch.Tensor,
+        historical: torch.Tensor,
+    ) -> tuple[torch.Tensor, ...]:
+        outputs = self.model(
+            {
+                "climate": climate,
+                "vegetation": vegetation,
+                "population": population,
+                "historical": historical,
+            }
+        )
+        return tuple(outputs[name] for name in self.output_names)
+
+
+@contextmanager
+def _export_mode(model: nn.Module) -> Iterator[None]:
+    """
+    Put a model in eval mode and let it be traced.
+
+    Lightning modules raise when tracing touches ``trainer`` while they are
+    not attached to one; ``_jit_is_scripting`` is the flag Lightning's own
+    ``to_torchscript`` sets to avoid that.
+    """
+    lightning_modules = [m for m in model.modules() if isinstance(m, pl.LightningModule)]
+    was_training = model.training
+    model.eval()
+    for module in lightning_modules:
+        module._jit_is_scripting = True
+    try:
+        yield
+    finally:
+        for module in lightning_modules:
+            module._jit_is_scripting = False
+        model.train(was_training)
+
+
+def _input_widths(model: nn.Module) -> dict[str, int]:
+    """Feature width of each input modality."""
+    source = getattr(model, "lstm_model", model)  # Ensembles share inputs with their LSTM
+    return {name: int(getattr(source, f"{name}_features")) for name in INPUT_NAMES}
+
+
+def example_inputs(
+    model: nn.Module, batch_size: int = 2, seq_len: int = 10, seed: int = 0
+) -> dict[str, torch.Tensor]:
+    """Random model inputs shaped for ``model``."""
+    generator = torch.Generator().manual_seed(seed)
+    return {
+        name: torch.randn(batch_size, seq_len, width, generator=generator)
+        for name, width in _input_widths(model).items()
+    }
+
+
+def export_torchscript(
+    model: nn.Module, path: str | Path, seq_len: int = 10
+) -> torch.jit.ScriptModule:
+    """
+    Trace a model to TorchScript and save it.
+
+    The traced graph accepts any batch size; the sequence length is fixed
+    at ``seq_len``.
+    """
+    inputs = example_inputs(model, seq_len=seq_len)
+    with _export_mode(model), torch.no_grad():
+        wrapper = _ExportWrapper(model, _output_names(model, inputs))
+        traced: torch.jit.ScriptModule = torch.jit.trace(
+            wrapper, tuple(inputs.values()), check_trace=False
+        )
+    traced = torch.jit.freeze(traced.eval())
+    torch.jit.save(traced, str(path))
+    return traced
+
+
+def export_onnx(
+    model: nn.Module, path: str | Path, seq_len: int = 10, opset_version: int = 17
+) -> None:
+    """Export a model to ONNX with a dynamic batch axis."""
+    if importlib.util.find_spec("onnx") is None:
+        raise ImportError("onnx is required for ONNX export")
+
+    inputs = example_inputs(model, seq_len=seq_len)
+    with _export_mode(model), torch.no_grad():
+        output_names = _output_names(model, inputs)
+        torch.onnx.export(
+            _ExportWrapper(model, output_names),
+            tuple(inputs.values()),
+            str(path),
+            input_names=list(INPUT_NAMES),
+            output_names=output_names,
+            dynamic_axes={name: {0: "batch"} for name in [*INPUT_NAMES, *output_names]},
+            opset_version=opset_version,
+            dynamo=False,
+        )
+
+
+def _output_names(model: nn.Module, inputs: dict[str, torch.Tensor]) -> list[str]:
+    """Serving outputs the model produces, in a fixed order."""
+    outputs = model(inputs)
+    return [name for name in OUTPUT_NAMES if name in outputs]
+
+
+def check_parity(
+    model: nn.Module,
+    exported: "ExportedModel",
+    batch_size: int = 3,
+    seq_len: int = 10,
+    atol: float = 1e-4,
+) -> float:
+    """
+    Compare exported outputs with the eager model.
+
+    Uses a batch size different from the traced one, so a batch axis that
+    was baked in fails here rather than in serving.
+
+    Returns:
+        Largest absolute difference over all outputs
+
+    Raises:
+        ValueError: If any output differs by more than ``atol``
+    """
+    inputs = example_inputs(model, batch_size=batch_size, seq_len=seq_len, seed=1)
+    with _export_mode(model), torch.no_grad():
+        expected = model(inputs)
+    actual = exported(inputs)
+
+    max_diff = max(
+        float(torch.max(torch.abs(expected[name] - actual[name]))) for name in actual
+    )
+    if max_diff > atol:
+        raise ValueError(
+            f"Exported {exported.runtime} model differs from eager by {max_diff:.2e} "
+            f"(tolerance {atol:.0e})"
+        )
+    return max_diff
+
+
+def export_model(
+    model: nn.Module,
+    output_dir: str | Path,
+    formats: tuple[str, ...] = EXPORT_FORMATS,
+    seq_len: int = 10,
+    atol: float = 1e-4,
+) -> dict[str, Any]:
+    """
+    Export a model in each format, check parity and write the manifest.
+
+    Args:
+        model: LSTM, Transformer or Ensemble model
+        output_dir: Directory for the exported files
+        formats: Any of ``torchscript`` and ``onnx``
+        seq_len: Input sequence length served
+        atol: Largest allowed absolute difference from eager outputs
+
+    Returns:
+        The export manifest
+    """
+    unknown = set(formats) - set(EXPORT_FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown export formats: {sorted(unknown)}")
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    inputs = example_inputs(model, seq_len=seq_len)
+    with _export_mode(model), torch.no_grad():
+        output_names = _output_names(model, inputs)
+
+    manifest: dict[str, Any] = {
+        "model_class": type(model).__name__,
+        "seq_len": seq_len,
+        "inputs": {name: [None, seq_len, width] for name, width in _input_widths(model).items()},
+        "outputs": output_names,
+        "formats": list(formats),
+        "parity": {},
+        "exported_at": datetime.now().isoformat(),
+    }
+    (output_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+
+    if "torchscript" in formats:
+        export_torchscript(model, output_dir / TORCHSCRIPT_NAME, seq_len)
+        manifest["parity"]["torchscript"] = check_parity(
+            model, ExportedModel(output_dir, "torchscript"), seq_len=seq_len, atol=atol
+        )
+    if "onnx" in formats:
+        export_onnx(model, output_dir / ONNX_NAME, seq_len)
+        if ONNXRUNTIME_AVAILABLE:
+            manifest["parity"]["onnx"] = check_parity(
+                model, ExportedModel(output_dir, "onnx"), seq_len=seq_len, atol=atol
+            )
+        else:
+            logger.warning("onnxruntime is not installed; skipping ONNX parity check")
+
+    (output_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+    logger.info(f"Exported {manifest['model_class']} ({', '.join(formats)}) to {output_dir}")
+    return manifest
+
+
+class ExportedModel:
+    """
+    Exported model served through TorchScript or ONNX Runtime.
+
+    Called with the same input dict as the eager models and returns a dict
+    of tensors, so it can stand in for them in prediction code.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        runtime: str = "torchscript",
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0,
+    ) -> None:
+        """
+        Load an exported model.
+
+        Args:
+            directory: Export directory written by ``export_model``
+            runtime: ``torchscript`` or ``onnx``
+            intra_op_threads: ONNX Runtime threads within an operator
+                (0 = runtime default); TorchScript uses the process-wide
+                ``torch`` thread settings
+            inter_op_threads: ONNX Runtime operators run in parallel
+                (0 = runtime default)
+        """
+        self.directory = Path(directory)
+        self.runtime = runtime
+        self.manifest = json.loads((self.directory / MANIFEST_NAME).read_text())
+        self.output_names: list[str] = self.manifest["outputs"]
+
+        if runtime == "torchscript":
+            self._module: torch.jit.ScriptModule = torch.jit.load(
+                str(self.directory / TORCHSCRIPT_NAME), map_location="cpu"
+            )
+            self._module.eval()
+        elif runtime == "onnx":
+            if not ONNXRUNTIME_AVAILABLE:
+                raise ImportError("onnxruntime is required to serve ONNX models")
+            options = ort.SessionOptions()
+            options.intra_op_num_threads = intra_op_threads
+            options.inter_op_num_threads = inter_op_threads
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            self._session = ort.InferenceSession(
+                str(self.directory / ONNX_NAME),
+                sess_options=options,
+                providers=["CPUExecutionProvider"],
+            )
+        else:
+            raise ValueError(f"Unknown runtime: {runtime}")
+
+    def __call__(self, batch: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        outputs: Sequence[torch.Tensor]
+        if self.runtime == "torchscript":
+            with torch.no_grad():
+                outputs = self._module(*(batch[name].contiguous() for name in INPUT_NAMES))
+        else:
+            feeds = {
+                name: np.ascontiguousarray(batch[name].numpy(), dtype=np.float32)
+                for name in INPUT_NAMES
+            }
+            outputs = [
+                torch.from_numpy(values)
+                for values in self._session.run(self.output_names, feeds)
+            ]
+        return dict(zip(self.output_names, outputs, strict=True))
+
+    def eval(self) -> "ExportedModel":
+        """No-op, for interchangeability with ``nn.Module``."""
+        return self
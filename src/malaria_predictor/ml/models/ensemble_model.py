@@ -6,7 +6,11 @@ models to leverage the strengths of both temporal sequence modeling and spatial
 attention mechanisms for improved malaria risk prediction.
 """
 
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
@@ -22,6 +26,40 @@ from .transformer_model import MalariaTransformer
 
 logger = logging.getLogger(__name__)
 
+# Base-model outputs the fusion layers read
+_FUSED_OUTPUTS = ("risk_mean", "risk_variance")
+
+# Runs the Transformer branch while the calling thread runs the LSTM; torch
+# releases the GIL inside operators, so the two overlap on separate cores.
+_base_model_executor: ThreadPoolExecutor | None = None
+
+
+def _get_base_model_executor() -> ThreadPoolExecutor:
+    global _base_model_executor
+    if _base_model_executor is None:
+        _base_model_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="ensemble-base"
+        )
+    return _base_model_executor
+
+
+# Guards the inference caches, which concurrent serving threads share. Kept
+# at module level so models stay deep-copyable (e.g. for quantization).
+_base_output_cache_lock = threading.Lock()
+
+
+def _fused_outputs(outputs: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+    """Keep only what fusion needs, not embeddings or attention maps."""
+    return {name: outputs[name] for name in _FUSED_OUTPUTS if name in outputs}
+
+
+def _run_base_model(
+    model: nn.Module, batch: dict[str, torch.Tensor], grad_enabled: bool
+) -> dict[str, torch.Tensor]:
+    # Grad mode is thread-local, so carry the caller's into the worker
+    with torch.set_grad_enabled(grad_enabled):
+        return model(batch)  # type: ignore[no-any-return]
+
 
 class MalariaEnsembleModel(pl.LightningModule):
     """
@@ -103,6 +141,48 @@ class MalariaEnsembleModel(pl.LightningModule):
         self.uncertainty_loss_weight = 0.1
         self.consistency_loss_weight = 0.05
 
+        # Inference settings, see configure_inference
+        self.parallel_inference = False
+        self.return_base_predictions = True
+        self.inference_cache_size = 0
+        self._base_output_cache: OrderedDict[str, tuple[dict, dict]] = OrderedDict()
+
+    def configure_inference(
+        self,
+        parallel: bool = True,
+        cache_size: int = 256,
+        return_base_predictions: bool = False,
+    ) -> "MalariaEnsembleModel":
+        """
+        Configure how the ensemble runs outside training.
+
+        Args:
+            parallel: Run the LSTM and Transformer concurrently
+            cache_size: Batches whose base-model outputs are kept, keyed by
+                a hash of the inputs (0 disables the cache)
+            return_base_predictions: Include each base model's predictions
+                in the outputs, not just the fused result
+
+        Returns:
+            The model, for chaining
+        """
+        self.parallel_inference = parallel
+        self.return_base_predictions = return_base_predictions
+        self.inference_cache_size = cache_size
+        self.clear_inference_cache()
+        return self
+
+    def clear_inference_cache(self) -> None:
+        """Drop cached base-model outputs, e.g. after changing weights."""
+        with _base_output_cache_lock:
+            self._base_output_cache.clear()
+
+    def train(self, mode: bool = True) -> "MalariaEnsembleModel":
+        # Cached outputs would go stale once training updates the weights
+        if mode:
+            self.clear_inference_cache()
+        return super().train(mode)
+
     def forward(self, batch: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
         """
         Forward pass through ensemble model.
@@ -113,9 +193,16 @@ class MalariaEnsembleModel(pl.LightningModule):
         Returns:
             Dictionary with ensemble predictions
         """
+        return self._ensemble_forward(
+            batch, base_predictions=self.training or self.return_base_predictions
+        )
+
+    def _ensemble_forward(
+        self, batch: dict[str, torch.Tensor], base_predictions: bool = True
+    ) -> dict[str, torch.Tensor]:
+        """Fuse the base models' outputs, optionally returning their predictions."""
         # Get predictions from base models
-        lstm_outputs = self.lstm_model(batch)
-        transformer_outputs = self.transformer_model(batch)
+        lstm_outputs, transformer_outputs = self._base_model_outputs(batch)
 
         # Extract predictions
         lstm_predictions = lstm_outputs["risk_mean"]
@@ -126,11 +213,10 @@ class MalariaEnsembleModel(pl.LightningModule):
             lstm_predictions, transformer_predictions
         )
 
-        outputs = {
-            "risk_mean": ensemble_predictions,
-            "lstm_predictions": lstm_predictions,
-            "transformer_predictions": transformer_predictions,
-        }
+        outputs = {"risk_mean": ensemble_predictions}
+        if base_predictions:
+            outputs["lstm_predictions"] = lstm_predictions
+            outputs["transformer_predictions"] = transformer_predictions
 
         # Fuse uncertainties if available
         if (
@@ -151,6 +237,58 @@ class MalariaEnsembleModel(pl.LightningModule):
 
         return outputs
 
+    def _base_model_outputs(
+        self, batch: dict[str, torch.Tensor]
+    ) -> tuple[dict[str, torch.Tensor], dict[str, torch.Tensor]]:
+        """Run both base models, concurrently and cached when configured."""
+        if self.training:
+            return self.lstm_model(batch), self.transformer_model(batch)
+
+        tracing = torch.jit.is_tracing()
+        key = None
+        if self.inference_cache_size and not tracing and not torch.is_grad_enabled():
+            key = self._cache_key(batch)
+            with _base_output_cache_lock:
+                cached = self._base_output_cache.get(key)
+                if cached is not None:
+                    self._base_output_cache.move_to_end(key)
+                    return cached
+
+        outputs: tuple[dict[str, torch.Tensor], dict[str, torch.Tensor]]
+        if not self.parallel_inference:
+            outputs = self.lstm_model(batch), self.transformer_model(batch)
+        elif tracing:
+            # Recorded as a fork in the traced graph, which TorchScript and
+            # its exports run on the inter-op thread pool
+            future = torch.jit.fork(self.transformer_model, batch)
+            outputs = self.lstm_model(batch), torch.jit.wait(future)
+        else:
+            pending = _get_base_model_executor().submit(
+                _run_base_model, self.transformer_model, batch, torch.is_grad_enabled()
+            )
+            outputs = self.lstm_model(batch), pending.result()
+
+        if key is not None:
+            outputs = _fused_outputs(outputs[0]), _fused_outputs(outputs[1])
+            with _base_output_cache_lock:
+                self._base_output_cache[key] = outputs
+                if len(self._base_output_cache) > self.inference_cache_size:
+                    self._base_output_cache.popitem(last=False)
+        return outputs
+
+    @staticmethod
+    def _cache_key(batch: dict[str, Any]) -> str:
+        """Hash of the input tensors' names, shapes, dtypes and values."""
+        digest = hashlib.blake2b(digest_size=16)
+        for name in sorted(batch):
+            value = batch[name]
+            if isinstance(value, torch.Tensor):
+                digest.update(f"{name}:{tuple(value.shape)}:{value.dtype}".encode())
+                digest.update(value.detach().cpu().contiguous().numpy().tobytes())
+            else:
+                digest.update(f"{name}:{value!r}".encode())
+        return digest.hexdigest()
+
     def training_step(
         self, batch: dict[str, torch.Tensor], batch_idx: int
     ) -> torch.Tensor:
@@ -256,7 +394,7 @@ class MalariaEnsembleModel(pl.LightningModule):
         """
         self.eval()
         with torch.no_grad():
-            outputs = self(batch)
+            outputs = self._ensemble_forward(batch, base_predictions=True)
 
             # Calculate prediction variance across models
             lstm_pred = outputs["lstm_predictions"]
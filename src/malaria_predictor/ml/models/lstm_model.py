@@ -392,7 +392,7 @@ class MalariaLSTM(pl.LightningModule):
         )
 
         scheduler = ReduceLROnPlateau(
-            optimizer, mode="min", factor=0.5, patience=10, verbose=True  # type: ignore[call-arg]
+            optimizer, mode="min", factor=0.5, patience=10
         )
 
         return {
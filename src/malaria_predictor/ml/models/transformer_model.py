@@ -7,8 +7,11 @@ The model uses multi-head attention to capture both local and global patterns
 across space and time.
 """
 
+import hashlib
 import logging
 import math
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import numpy as np
@@ -85,14 +88,110 @@ class PositionalEncoding(nn.Module):
         return x + positional_encoding
 
 
+class SpatialDistanceCache:
+    """
+    LRU cache of pairwise spatial distance decay, ``exp(-distance)``.
+
+    Prediction grids reuse the same coordinates batch after batch and every
+    encoder layer needs the same decay, so it is computed once per distinct
+    coordinate tensor. In k-nearest-neighbour mode only the decay to each
+    location's neighbours and their indices are kept.
+    """
+
+    def __init__(self, max_entries: int = 4) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[torch.Tensor, torch.Tensor | None]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def lookup(
+        self, spatial_coords: torch.Tensor, knn: int | None = None
+    ) -> tuple[torch.Tensor, torch.Tensor | None]:
+        """
+        Distance decay between locations.
+
+        Args:
+            spatial_coords: Spatial coordinates [batch_size, seq_len, 2]
+            knn: Keep only each location's ``knn`` nearest locations
+
+        Returns:
+            Decay [batch_size, seq_len, seq_len] and None, or with ``knn``
+            decay [batch_size, seq_len, knn] and neighbour indices of the
+            same shape
+        """
+        cacheable = not spatial_coords.requires_grad and not torch.jit.is_tracing()
+        if not cacheable:
+            return self._compute(spatial_coords, knn)
+
+        coords = spatial_coords.detach()
+        key = (
+            tuple(coords.shape),
+            coords.dtype,
+            coords.device,
+            knn,
+            hashlib.blake2b(coords.cpu().contiguous().numpy().tobytes(), digest_size=16).digest(),
+        )
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        result = self._compute(coords, knn)
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _compute(
+        spatial_coords: torch.Tensor, knn: int | None
+    ) -> tuple[torch.Tensor, torch.Tensor | None]:
+        # Pairwise differences rather than the matmul expansion, so each
+        # location's distance to itself is exactly 0
+        distances = torch.cdist(
+            spatial_coords, spatial_coords, compute_mode="donot_use_mm_for_euclid_dist"
+        )
+        if knn is None:
+            return torch.exp(-distances), None
+        nearest, indices = torch.topk(distances, knn, dim=-1, largest=False)
+        return torch.exp(-nearest), indices
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+_distance_cache = SpatialDistanceCache()
+
+
 class SpatialTemporalAttention(nn.Module):
-    """Multi-head attention with spatial-temporal awareness."""
+    """
+    Multi-head attention with spatial-temporal awareness.
+
+    Dense attention runs through ``F.scaled_dot_product_attention`` with the
+    spatial distance bias as an additive mask. With ``knn_neighbors`` set,
+    sequences longer than that attend only to each location's nearest
+    neighbours, so memory grows with ``seq_len * knn_neighbors`` rather
+    than ``seq_len ** 2``.
+    """
 
-    def __init__(self, d_model: int, num_heads: int = 8, dropout: float = 0.1) -> None:
+    def __init__(
+        self,
+        d_model: int,
+        num_heads: int = 8,
+        dropout: float = 0.1,
+        knn_neighbors: int | None = None,
+        knn_chunk_size: int = 256,
+    ) -> None:
         super().__init__()
         self.d_model = d_model
         self.num_heads = num_heads
         self.head_dim = d_model // num_heads
+        self.knn_neighbors = knn_neighbors
+        self.knn_chunk_size = knn_chunk_size
 
         assert self.head_dim * num_heads == d_model
 
@@ -109,7 +208,7 @@ class SpatialTemporalAttention(nn.Module):
     def forward(
         self,
         x: torch.Tensor,
-        spatial_coords: torch.Tensor,
+        spatial_coords: torch.Tensor | None,
         mask: torch.Tensor | None = None,
     ) -> torch.Tensor:
         """
@@ -117,7 +216,8 @@ class SpatialTemporalAttention(nn.Module):
 
         Args:
             x: Input tensor [batch_size, seq_len, d_model]
-            spatial_coords: Spatial coordinates [batch_size, seq_len, 2]
+            spatial_coords: Spatial coordinates [batch_size, seq_len, 2], or None
+                for no spatial bias
             mask: Attention mask [batch_size, seq_len, seq_len]
 
         Returns:
@@ -142,24 +242,32 @@ class SpatialTemporalAttention(nn.Module):
             .transpose(1, 2)
         )
 
-        # Compute attention scores
-        scores = torch.matmul(Q, K.transpose(-2, -1)) / math.sqrt(self.head_dim)
-
-        # Add spatial bias based on distance
-        spatial_distances = self._compute_spatial_distances(spatial_coords)
-        spatial_bias = self.spatial_bias * torch.exp(-spatial_distances.unsqueeze(1))
-        scores = scores + spatial_bias
-
-        # Apply mask if provided
-        if mask is not None:
-            scores = scores.masked_fill(mask.unsqueeze(1) == 0, float("-inf"))
-
-        # Apply softmax
-        attention_weights = F.softmax(scores, dim=-1)
-        attention_weights = self.dropout(attention_weights)
-
-        # Apply attention to values
-        attended = torch.matmul(attention_weights, V)
+        if (
+            spatial_coords is not None
+            and self.knn_neighbors is not None
+            and seq_len > self.knn_neighbors
+        ):
+            attended = self._knn_attention(Q, K, V, spatial_coords, mask)
+        else:
+            # Additive bias from spatial distance and the mask
+            bias = None
+            if spatial_coords is not None:
+                decay, _ = _distance_cache.lookup(spatial_coords)
+                bias = self.spatial_bias * decay.unsqueeze(1)
+            if mask is not None:
+                if bias is None:
+                    bias = torch.zeros(
+                        batch_size, 1, seq_len, seq_len, dtype=Q.dtype, device=Q.device
+                    )
+                bias = bias.masked_fill(mask.unsqueeze(1) == 0, float("-inf"))
+
+            attended = F.scaled_dot_product_attention(
+                Q,
+                K,
+                V,
+                attn_mask=bias,
+                dropout_p=self.dropout.p if self.training else 0.0,
+            )
 
         # Reshape and project
         attended = (
@@ -170,27 +278,69 @@ class SpatialTemporalAttention(nn.Module):
 
         return self.output_proj(attended)  # type: ignore[no-any-return]
 
+    def _knn_attention(
+        self,
+        Q: torch.Tensor,
+        K: torch.Tensor,
+        V: torch.Tensor,
+        spatial_coords: torch.Tensor,
+        mask: torch.Tensor | None,
+    ) -> torch.Tensor:
+        """Attention over each location's nearest neighbours, in query chunks."""
+        decay, neighbors = _distance_cache.lookup(spatial_coords, self.knn_neighbors)
+        assert neighbors is not None
+
+        batch_size, seq_len = neighbors.shape[:2]
+        batch_index = torch.arange(batch_size, device=Q.device)[:, None, None]
+        # [batch, seq_len, heads, head_dim] so neighbours index dimension 1
+        keys = K.transpose(1, 2)
+        values = V.transpose(1, 2)
+
+        chunks = []
+        for start in range(0, seq_len, self.knn_chunk_size):
+            stop = min(start + self.knn_chunk_size, seq_len)
+            chunk_neighbors = neighbors[:, start:stop]
+
+            # [batch, heads, chunk, knn, head_dim]
+            neighbor_keys = keys[batch_index, chunk_neighbors].permute(0, 3, 1, 2, 4)
+            neighbor_values = values[batch_index, chunk_neighbors].permute(0, 3, 1, 2, 4)
+
+            scores = torch.einsum(
+                "bhqd,bhqkd->bhqk", Q[:, :, start:stop], neighbor_keys
+            ) / math.sqrt(self.head_dim)
+            scores = scores + self.spatial_bias * decay[:, start:stop].unsqueeze(1)
+            if mask is not None:
+                chunk_mask = torch.gather(mask[:, start:stop], 2, chunk_neighbors)
+                scores = scores.masked_fill(chunk_mask.unsqueeze(1) == 0, float("-inf"))
+
+            weights = self.dropout(F.softmax(scores, dim=-1))
+            chunks.append(torch.einsum("bhqk,bhqkd->bhqd", weights, neighbor_values))
+
+        return torch.cat(chunks, dim=2)
+
     def _compute_spatial_distances(self, spatial_coords: torch.Tensor) -> torch.Tensor:
         """Compute pairwise spatial distances."""
         # spatial_coords: [batch_size, seq_len, 2]
-        coord1 = spatial_coords.unsqueeze(2)  # [batch_size, seq_len, 1, 2]
-        coord2 = spatial_coords.unsqueeze(1)  # [batch_size, 1, seq_len, 2]
-
-        distances = torch.norm(
-            coord1 - coord2, dim=-1
+        return torch.cdist(
+            spatial_coords, spatial_coords, compute_mode="donot_use_mm_for_euclid_dist"
         )  # [batch_size, seq_len, seq_len]
 
-        return distances  # type: ignore[no-any-return]
-
 
 class TransformerEncoderLayer(nn.Module):
     """Custom transformer encoder layer with spatial-temporal attention."""
 
     def __init__(
-        self, d_model: int, num_heads: int = 8, d_ff: int = 2048, dropout: float = 0.1
+        self,
+        d_model: int,
+        num_heads: int = 8,
+        d_ff: int = 2048,
+        dropout: float = 0.1,
+        knn_neighbors: int | None = None,
     ):
         super().__init__()
-        self.attention = SpatialTemporalAttention(d_model, num_heads, dropout)
+        self.attention = SpatialTemporalAttention(
+            d_model, num_heads, dropout, knn_neighbors=knn_neighbors
+        )
         self.feed_forward = nn.Sequential(
             nn.Linear(d_model, d_ff),
             nn.ReLU(),
@@ -205,7 +355,7 @@ class TransformerEncoderLayer(nn.Module):
     def forward(
         self,
         x: torch.Tensor,
-        spatial_coords: torch.Tensor,
+        spatial_coords: torch.Tensor | None,
         mask: torch.Tensor | None = None,
     ) -> torch.Tensor:
         """Forward pass with residual connections."""
@@ -248,6 +398,7 @@ class MalariaTransformer(pl.LightningModule):
         weight_decay: float = 1e-5,
         uncertainty_quantification: bool = True,
         spatial_attention: bool = True,
+        knn_neighbors: int | None = None,
     ):
         super().__init__()
 
@@ -285,7 +436,7 @@ class MalariaTransformer(pl.LightningModule):
         # Transformer encoder layers
         self.encoder_layers = nn.ModuleList(
             [
-                TransformerEncoderLayer(d_model, num_heads, d_ff, dropout)
+                TransformerEncoderLayer(d_model, num_heads, d_ff, dropout, knn_neighbors)
                 for _ in range(num_layers)
             ]
         )
@@ -638,6 +789,7 @@ class TransformerConfig:
         weight_decay: float = 1e-5,
         uncertainty_quantification: bool = True,
         spatial_attention: bool = True,
+        knn_neighbors: int | None = None,
     ):
         self.climate_features = climate_features
         self.vegetation_features = vegetation_features
@@ -654,6 +806,7 @@ class TransformerConfig:
         self.weight_decay = weight_decay
         self.uncertainty_quantification = uncertainty_quantification
         self.spatial_attention = spatial_attention
+        self.knn_neighbors = knn_neighbors
 
     def to_dict(self) -> dict[str, Any]:
         """Convert configuration to dictionary."""
@@ -673,4 +826,5 @@ class TransformerConfig:
             "weight_decay": self.weight_decay,
             "uncertainty_quantification": self.uncertainty_quantification,
             "spatial_attention": self.spatial_attention,
+            "knn_neighbors": self.knn_neighbors,
         }
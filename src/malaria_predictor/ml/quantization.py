@@ -0,0 +1,120 @@
+"""
+Quantized Model Variants for CPU Serving.
+
+Dynamic int8 quantization of the Linear and LSTM layers that dominate the
+LSTM, Transformer and Ensemble models, optionally after L1 magnitude
+pruning of the Linear weights, plus an accuracy-regression check of a
+quantized variant against its fp32 source on a held-out set.
+"""
+
+import copy
+import io
+import logging
+from typing import Any
+
+import numpy as np
+import torch
+import torch.nn as nn
+from torch.nn.utils import prune
+
+from .evaluation.metrics import ModelEvaluationMetrics
+
+logger = logging.getLogger(__name__)
+
+QUANTIZED_MODULES: set[type[nn.Module]] = {nn.Linear, nn.LSTM}
+MODEL_VARIANTS = ("fp32", "int8")
+
+
+def quantize_model(model: nn.Module, prune_amount: float = 0.0) -> nn.Module:
+    """
+    Return an int8 dynamically quantized copy of a model.
+
+    Weights of Linear and LSTM layers are stored as int8 and activations are
+    quantized on the fly, so no calibration data is needed. The source model
+    is left unchanged.
+
+    Args:
+        model: LSTM, Transformer or Ensemble model
+        prune_amount: Fraction of each Linear layer's smallest-magnitude
+            weights to zero before quantizing
+
+    Returns:
+        Quantized model in eval mode
+    """
+    if not 0.0 <= prune_amount < 1.0:
+        raise ValueError(f"prune_amount must be in [0, 1), got {prune_amount}")
+
+    quantized = copy.deepcopy(model).eval()
+
+    if prune_amount:
+        for module in quantized.modules():
+            if isinstance(module, nn.Linear):
+                prune.l1_unstructured(module, "weight", amount=prune_amount)
+                prune.remove(module, "weight")
+
+    return torch.ao.quantization.quantize_dynamic(  # type: ignore[no-any-return]
+        quantized, QUANTIZED_MODULES, dtype=torch.qint8, inplace=True
+    )
+
+
+def model_size_bytes(model: nn.Module) -> int:
+    """Serialized size of a model's state dict."""
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.getbuffer().nbytes
+
+
+def _predict(model: nn.Module, inputs: dict[str, torch.Tensor]) -> np.ndarray:
+    with torch.no_grad():
+        return model(inputs)["risk_mean"].cpu().numpy()  # type: ignore[no-any-return]
+
+
+def check_quantized_accuracy(
+    reference: nn.Module,
+    quantized: nn.Module,
+    inputs: dict[str, torch.Tensor],
+    targets: np.ndarray,
+    max_rmse_increase: float = 0.01,
+    evaluator: ModelEvaluationMetrics | None = None,
+) -> dict[str, Any]:
+    """
+    Compare a quantized model with its fp32 source on a held-out set.
+
+    Args:
+        reference: fp32 model
+        quantized: Quantized variant of ``reference``
+        inputs: Held-out model inputs
+        targets: True risk, shape (n,) for the first horizon day or
+            (n, prediction_horizon)
+        max_rmse_increase: Largest allowed RMSE increase over fp32
+        evaluator: Metrics calculator, a default one when omitted
+
+    Returns:
+        Metrics of both variants, the RMSE increase, the largest prediction
+        difference and whether the check passed
+    """
+    evaluator = evaluator or ModelEvaluationMetrics()
+    reference.eval()
+
+    predictions = {"fp32": _predict(reference, inputs), "int8": _predict(quantized, inputs)}
+    if targets.ndim == 1:
+        predictions = {name: values[:, 0] for name, values in predictions.items()}
+
+    metrics = {
+        name: evaluator.calculate_comprehensive_metrics(targets.ravel(), values.ravel())
+        for name, values in predictions.items()
+    }
+    rmse_increase = float(metrics["int8"]["rmse"] - metrics["fp32"]["rmse"])
+    report = {
+        **metrics,
+        "rmse_increase": rmse_increase,
+        "max_prediction_diff": float(np.max(np.abs(predictions["int8"] - predictions["fp32"]))),
+        "passed": rmse_increase <= max_rmse_increase,
+    }
+
+    if not report["passed"]:
+        logger.warning(
+            f"Quantized {type(reference).__name__} RMSE increased by {rmse_increase:.4f} "
+            f"(limit {max_rmse_increase})"
+        )
+    return report
@@ -5,6 +5,12 @@ This module provides training pipelines, cross-validation, hyperparameter optimi
 and model selection capabilities for malaria prediction models.
 """
 
+from .dataset import ShardedDataset, ShardedDatasetWriter, ShardIterableDataset
 from .pipeline import MalariaTrainingPipeline
 
-__all__ = ["MalariaTrainingPipeline"]
+__all__ = [
+    "MalariaTrainingPipeline",
+    "ShardedDataset",
+    "ShardedDatasetWriter",
+    "ShardIterableDataset",
+]
@@ -0,0 +1,296 @@
+"""
+Sharded On-Disk Training Datasets.
+
+Training samples are written in fixed-size shards of NumPy ``.npy`` files
+(features, targets, dates and locations) plus a JSON manifest, so multi-year
+histories never need to fit in memory. Shards are memory-mapped on read and
+can be streamed into PyTorch through ``ShardIterableDataset``.
+"""
+
+import json
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import torch
+from sklearn.preprocessing import StandardScaler
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+SHARD_ARRAYS = ("X", "y", "dates", "locations")
+
+
+class ShardedDataset:
+    """
+    Read-only view over a directory of training shards.
+
+    Rows keep the order they were written in, so a dataset built day by
+    day is sorted by date and temporal splits are plain row ranges.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """
+        Open a sharded dataset.
+
+        Args:
+            directory: Directory containing the manifest and shard files
+        """
+        self.directory = Path(directory)
+        manifest = json.loads((self.directory / MANIFEST_NAME).read_text())
+
+        self.feature_names: list[str] = manifest["feature_names"]
+        self.n_features: int = manifest["n_features"]
+        self.shards: list[dict[str, Any]] = manifest["shards"]
+        self.offsets: np.ndarray = np.cumsum([0] + [shard["rows"] for shard in self.shards])
+
+        scaler = manifest.get("scaler")
+        self.mean: np.ndarray | None = (
+            np.asarray(scaler["mean"], dtype=np.float32) if scaler else None
+        )
+        self.scale: np.ndarray | None = (
+            np.asarray(scaler["scale"], dtype=np.float32) if scaler else None
+        )
+
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+
+    def _load(self, shard: dict[str, Any], name: str) -> np.ndarray:
+        array: np.ndarray = np.load(
+            self.directory / f"{shard['name']}.{name}.npy", mmap_mode="r"
+        )
+        return array
+
+    def pieces(self, start: int = 0, stop: int | None = None) -> list[tuple[int, int, int]]:
+        """
+        Split a row range at shard boundaries.
+
+        Returns:
+            (shard index, first row, end row) with rows local to the shard
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        pieces: list[tuple[int, int, int]] = []
+        for index, shard_start in enumerate(self.offsets[:-1]):
+            shard_stop = self.offsets[index + 1]
+            if shard_stop <= start or shard_start >= stop:
+                continue
+            pieces.append(
+                (index, int(max(start, shard_start) - shard_start), int(min(stop, shard_stop) - shard_start))
+            )
+        return pieces
+
+    def read(
+        self,
+        name: str,
+        start: int = 0,
+        stop: int | None = None,
+        rows: np.ndarray | None = None,
+        piece: tuple[int, int, int] | None = None,
+    ) -> np.ndarray:
+        """
+        Read one array over a row range into memory.
+
+        Features are standardized with the stored scaler statistics.
+
+        Args:
+            name: One of ``X``, ``y``, ``dates`` or ``locations``
+            start: First row
+            stop: End row (exclusive), defaults to the last row
+            rows: Optional row order within a single ``piece``
+            piece: Read just this (shard, first, end) piece
+
+        Returns:
+            Array of the requested rows
+        """
+        if name not in SHARD_ARRAYS:
+            raise ValueError(f"Unknown shard array: {name}")
+
+        parts: list[np.ndarray] = []
+        for index, first, end in [piece] if piece else self.pieces(start, stop):
+            array = self._load(self.shards[index], name)
+            parts.append(array[first + rows] if rows is not None else np.asarray(array[first:end]))
+
+        if not parts:
+            array = self._load(self.shards[0], name) if self.shards else np.empty((0,))
+            return np.empty((0,) + array.shape[1:], dtype=array.dtype)
+
+        values = np.concatenate(parts) if len(parts) > 1 else parts[0]
+        if name == "X" and self.mean is not None and self.scale is not None:
+            values = (values - self.mean) / self.scale
+        return values.astype(np.float32) if name in ("X", "y") else values
+
+    def batches(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+        batch_size: int = 1024,
+        names: tuple[str, ...] = ("X", "y"),
+    ) -> Iterator[tuple[np.ndarray, ...]]:
+        """Yield consecutive batches of the requested arrays over a row range."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        for batch_start in range(start, stop, batch_size):
+            batch_stop = min(batch_start + batch_size, stop)
+            yield tuple(self.read(name, batch_start, batch_stop) for name in names)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        directory: str | Path,
+        X: np.ndarray,
+        y: np.ndarray,
+        dates: np.ndarray,
+        locations: np.ndarray,
+        feature_names: list[str] | None = None,
+        shard_size: int = 100_000,
+    ) -> "ShardedDataset":
+        """Write in-memory arrays (already scaled) as a sharded dataset."""
+        writer = ShardedDatasetWriter(directory, feature_names or [], shard_size)
+        writer.append(X, y, dates, locations)
+        return writer.close()
+
+
+class ShardedDatasetWriter:
+    """
+    Append samples to a sharded dataset, flushing every ``shard_size`` rows.
+
+    When a scaler is given it is fitted incrementally on the raw features
+    and its statistics are stored in the manifest; shards keep raw values
+    and are standardized on read.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        feature_names: list[str],
+        shard_size: int = 100_000,
+        scaler: StandardScaler | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.feature_names = feature_names
+        self.shard_size = shard_size
+        self.scaler = scaler
+        self.shards: list[dict[str, Any]] = []
+        self.n_features: int | None = None
+        self._buffer: dict[str, list[np.ndarray]] = {name: [] for name in SHARD_ARRAYS}
+        self._buffered = 0
+
+    def append(
+        self, X: np.ndarray, y: np.ndarray, dates: np.ndarray, locations: np.ndarray
+    ) -> None:
+        """Buffer rows and write full shards."""
+        if self.n_features is None:
+            self.n_features = X.shape[1]
+        elif X.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features, got {X.shape[1]}")
+
+        if self.scaler is not None and len(X):
+            self.scaler.partial_fit(X)
+
+        arrays = {
+            "X": np.asarray(X, dtype=np.float32),
+            "y": np.asarray(y, dtype=np.float32),
+            "dates": np.asarray(dates, dtype="datetime64[D]"),
+            "locations": np.asarray(locations, dtype=np.float64).reshape(len(X), 2),
+        }
+        for name, array in arrays.items():
+            self._buffer[name].append(array)
+        self._buffered += len(X)
+
+        while self._buffered >= self.shard_size:
+            self._flush(self.shard_size)
+
+    def _flush(self, rows: int) -> None:
+        merged = {name: np.concatenate(parts) for name, parts in self._buffer.items()}
+        name = f"shard-{len(self.shards):05d}"
+        for array_name, array in merged.items():
+            np.save(self.directory / f"{name}.{array_name}.npy", array[:rows])
+            self._buffer[array_name] = [array[rows:]] if len(array) > rows else []
+        self.shards.append({"name": name, "rows": rows})
+        self._buffered -= rows
+
+    def close(self) -> ShardedDataset:
+        """Write the last partial shard and the manifest."""
+        if self._buffered:
+            self._flush(self._buffered)
+
+        scaler = None
+        if self.scaler is not None and hasattr(self.scaler, "mean_"):
+            scaler = {"mean": self.scaler.mean_.tolist(), "scale": self.scaler.scale_.tolist()}
+
+        manifest = {
+            "feature_names": self.feature_names,
+            "n_features": self.n_features or 0,
+            "shards": self.shards,
+            "scaler": scaler,
+        }
+        (self.directory / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+        logger.info(
+            f"Wrote {sum(s['rows'] for s in self.shards)} rows in {len(self.shards)} shards "
+            f"to {self.directory}"
+        )
+        return ShardedDataset(self.directory)
+
+
+class ShardIterableDataset(torch.utils.data.IterableDataset):
+    """
+    Stream (features, targets) batches from a sharded dataset.
+
+    Yields whole batches, so use it with ``DataLoader(batch_size=None)``.
+    Shard pieces are divided between DataLoader workers, and only the
+    piece being read is paged in.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        start: int = 0,
+        stop: int | None = None,
+        batch_size: int = 32,
+        shuffle: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Args:
+            directory: Sharded dataset directory
+            start: First row of the range to stream
+            stop: End row (exclusive), defaults to the last row
+            batch_size: Rows per yielded batch
+            shuffle: Shuffle piece order and rows within each piece
+            seed: Seed for shuffling
+        """
+        super().__init__()
+        self.directory = Path(directory)
+        self.start = start
+        self.stop = stop
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self._epoch = 0
+
+    def __iter__(self) -> Iterator[tuple[torch.Tensor, torch.Tensor]]:
+        dataset = ShardedDataset(self.directory)
+        pieces = dataset.pieces(self.start, self.stop)
+
+        worker = torch.utils.data.get_worker_info()
+        if worker is not None:
+            pieces = pieces[worker.id :: worker.num_workers]
+
+        rng = np.random.default_rng(None if self.seed is None else self.seed + self._epoch)
+        self._epoch += 1
+        if self.shuffle:
+            rng.shuffle(pieces)
+
+        for piece in pieces:
+            _, first, end = piece
+            order = rng.permutation(end - first) if self.shuffle else np.arange(end - first)
+            for batch_start in range(0, len(order), self.batch_size):
+                rows = order[batch_start : batch_start + self.batch_size]
+                if self.shuffle:
+                    # Sorted indices keep memory-mapped reads sequential
+                    rows = np.sort(rows)
+                X = dataset.read("X", rows=rows, piece=piece)
+                y = dataset.read("y", rows=rows, piece=piece)
+                yield torch.from_numpy(X), torch.from_numpy(y)
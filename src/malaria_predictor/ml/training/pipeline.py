@@ -5,8 +5,18 @@ This module provides a comprehensive training pipeline with cross-validation,
 hyperparameter optimization, and model evaluation for malaria prediction models.
 """
 
+import asyncio
 import logging
+import multiprocessing
+import os
+import tempfile
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
+from functools import partial
+from itertools import islice, repeat
 from pathlib import Path
 from typing import Any
 
@@ -17,16 +27,148 @@ import optuna
 import pandas as pd
 import pytorch_lightning as pl
 import torch
-from sklearn.model_selection import TimeSeriesSplit
 from sklearn.preprocessing import StandardScaler
 
 from ...services.unified_data_harmonizer import UnifiedDataHarmonizer
 from ..evaluation.metrics import ModelEvaluationMetrics
 from ..feature_extractor import EnvironmentalFeatureExtractor
 from ..models.lstm_model import MalariaLSTM, ModelConfig
+from .dataset import ShardedDataset, ShardedDatasetWriter, ShardIterableDataset
+
+try:
+    from optuna.storages.journal import JournalFileBackend
+except ImportError:  # optuna < 4
+    from optuna.storages import JournalFileStorage as JournalFileBackend
 
 logger = logging.getLogger(__name__)
 
+# (fold index, (train start, train stop), (validation start, validation stop))
+Fold = tuple[int, tuple[int, int], tuple[int, int]]
+
+
+def _feature_groups(X: torch.Tensor) -> dict[str, torch.Tensor]:
+    """Split a flat feature matrix into the LSTM's four single-step inputs."""
+    quarter = X.shape[1] // 4
+    return {
+        "climate": X[:, :quarter].unsqueeze(1),
+        "vegetation": X[:, quarter : 2 * quarter].unsqueeze(1),
+        "population": X[:, 2 * quarter : 3 * quarter].unsqueeze(1),
+        "historical": X[:, 3 * quarter :].unsqueeze(1),
+    }
+
+
+def _lstm_batch(
+    batch: tuple[torch.Tensor, torch.Tensor], prediction_horizon: int
+) -> dict[str, torch.Tensor]:
+    """Turn a streamed (features, targets) batch into the LSTM batch layout."""
+    X, y = batch
+    return {**_feature_groups(X), "target": y.unsqueeze(1).repeat(1, prediction_horizon)}
+
+
+def temporal_folds(n_rows: int, n_splits: int) -> Iterator[Fold]:
+    """
+    Expanding-window folds over date-ordered rows.
+
+    Boundaries match ``sklearn.model_selection.TimeSeriesSplit(n_splits)``
+    but are returned as row ranges, so no index arrays are materialized.
+    """
+    test_size = n_rows // (n_splits + 1)
+    if test_size == 0:
+        raise ValueError(f"Cannot split {n_rows} rows into {n_splits} temporal folds")
+
+    for fold in range(n_splits):
+        val_start = n_rows - (n_splits - fold) * test_size
+        yield fold, (0, val_start), (val_start, val_start + test_size)
+
+
+def _init_fold_worker(torch_threads: int) -> None:
+    # Folds share the machine's cores instead of each claiming all of them
+    torch.set_num_threads(torch_threads)
+
+
+def _run_fold_in_worker(config: dict[str, Any], directory: str, fold: Fold) -> dict[str, Any]:
+    """Train and evaluate one fold in a process pool worker."""
+    pipeline = MalariaTrainingPipeline._worker_instance(config)
+    return pipeline._run_fold(ShardedDataset(directory), fold)
+
+
+def _hpo_storage(spec: str) -> optuna.storages.BaseStorage | str:
+    """
+    Optuna storage shared by search workers.
+
+    ``spec`` is either a database URL (``sqlite:///hpo.db``,
+    ``postgresql://...``) or the path of a journal file.
+    """
+    if "://" in spec:
+        return spec
+    return optuna.storages.JournalStorage(JournalFileBackend(spec))
+
+
+def _hpo_pruner(name: str | None, max_resource: int) -> optuna.pruners.BasePruner:
+    """Pruner for the configured name; steps are epochs summed over folds."""
+    if name == "median":
+        return optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=2)
+    if name == "hyperband":
+        return optuna.pruners.HyperbandPruner(min_resource=1, max_resource=max_resource)
+    if name is None or name == "none":
+        return optuna.pruners.NopPruner()
+    raise ValueError(f"Unknown pruner: {name}")
+
+
+def _cpu_groups(workers: int) -> list[list[int]]:
+    """Split the CPUs this process may use into one group per worker."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+    # With more workers than CPUs, workers share CPUs round-robin
+    return [
+        group.tolist() or [cpus[i % len(cpus)]]
+        for i, group in enumerate(np.array_split(cpus, workers))
+    ]
+
+
+def _run_hpo_worker(
+    config: dict[str, Any],
+    storage: str,
+    study_name: str,
+    directory: str,
+    n_trials: int,
+    cpus: list[int],
+) -> None:
+    """Run trials of a shared study in a process pinned to ``cpus``."""
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    torch.set_num_threads(len(cpus))
+
+    pipeline = MalariaTrainingPipeline._worker_instance(config)
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=_hpo_storage(storage),
+        pruner=_hpo_pruner(config.get("hpo_pruner"), pipeline._hpo_max_resource()),
+    )
+    dataset = ShardedDataset(directory)
+    study.optimize(lambda trial: pipeline._hpo_objective(trial, dataset), n_trials=n_trials)
+
+
+class _TrialPruningCallback(pl.Callback):
+    """Report validation loss to an Optuna trial every epoch and prune poor trials."""
+
+    def __init__(self, trial: optuna.Trial, step_offset: int = 0, monitor: str = "val_loss"):
+        super().__init__()
+        self.trial = trial
+        self.step_offset = step_offset
+        self.monitor = monitor
+
+    def on_validation_end(self, trainer: pl.Trainer, pl_module: pl.LightningModule) -> None:
+        if trainer.sanity_checking or self.monitor not in trainer.callback_metrics:
+            return
+
+        step = self.step_offset + trainer.current_epoch
+        self.trial.report(float(trainer.callback_metrics[self.monitor]), step)
+        if self.trial.should_prune():
+            raise optuna.TrialPruned(f"Pruned at step {step}")
+
 
 class MalariaTrainingPipeline:
     """
@@ -61,7 +203,7 @@ class MalariaTrainingPipeline:
         self.scaler = StandardScaler()
 
         # Training state
-        self.training_data = None
+        self.training_data: dict[str, Any] | ShardedDataset | None = None
         self.validation_data = None
         self.best_model: MalariaLSTM | None = None
         self.best_metrics: dict[str, Any] | None = None
@@ -70,6 +212,16 @@ class MalariaTrainingPipeline:
         self.experiment_name = self.config.get("experiment_name", "malaria_prediction")
         self._setup_mlflow()
 
+    @classmethod
+    def _worker_instance(cls, config: dict[str, Any]) -> "MalariaTrainingPipeline":
+        """Pipeline for fold training in a worker, without data sources or MLflow."""
+        pipeline = cls.__new__(cls)
+        pipeline.data_harmonizer = None  # type: ignore[assignment]
+        pipeline.config = config
+        pipeline.evaluator = ModelEvaluationMetrics()
+        pipeline.scaler = StandardScaler()
+        return pipeline
+
     def _get_default_config(self) -> dict[str, Any]:
         """Get default training configuration."""
         return {
@@ -77,6 +229,8 @@ class MalariaTrainingPipeline:
             "lookback_days": 90,
             "prediction_horizon": 30,
             "min_samples_per_fold": 100,
+            "data_concurrency": 8,  # Days harmonized at once
+            "shard_size": 100_000,  # Rows per on-disk training shard
             # Model parameters
             "model_type": "lstm",
             "hidden_size": 128,
@@ -93,11 +247,15 @@ class MalariaTrainingPipeline:
             "num_workers": 4,
             # Cross-validation
             "cv_folds": 5,
+            "cv_workers": 1,  # Processes training folds; 1 trains them in-process
             "test_size": 0.2,
             # Hyperparameter optimization
             "n_trials": 50,
             "optimization_direction": "minimize",
-            "optimization_metric": "val_rmse",
+            "optimization_metric": "rmse",  # Key of the evaluator metrics
+            "hpo_workers": 1,  # Processes running trials; 1 runs them in-process
+            "hpo_storage": None,  # Database URL or journal file shared by workers
+            "hpo_pruner": "median",  # "median", "hyperband" or None
             # MLflow
             "experiment_name": "malaria_prediction",
             "log_artifacts": True,
@@ -137,11 +295,86 @@ class MalariaTrainingPipeline:
         """
         logger.info(f"Preparing training data from {start_date} to {end_date}")
 
-        # Generate date range for predictions
-        date_range = pd.date_range(start_date, end_date, freq="D")
-        training_samples = []
+        training_samples = [
+            sample
+            async for sample in self._harmonized_samples(
+                start_date, end_date, region_bounds, target_resolution
+            )
+        ]
 
-        for target_date in date_range:
+        logger.info(f"Prepared {len(training_samples)} training samples")
+
+        # Organize data for model training
+        training_data = self._organize_training_data(training_samples)
+        return training_data
+
+    async def build_training_dataset(
+        self,
+        start_date: date,
+        end_date: date,
+        region_bounds: tuple[float, float, float, float],
+        output_dir: str | Path,
+        target_resolution: str = "1km",
+    ) -> ShardedDataset:
+        """
+        Build an on-disk sharded training dataset.
+
+        Same samples as ``prepare_training_data``, but each day's rows are
+        appended to shards as soon as they arrive and the feature scaler is
+        fitted incrementally, so memory stays bounded by the shard size
+        whatever the date range.
+
+        Args:
+            start_date: Start date for data collection
+            end_date: End date for data collection
+            region_bounds: Geographic bounds (west, south, east, north)
+            output_dir: Directory for the shards and manifest
+            target_resolution: Spatial resolution
+
+        Returns:
+            ShardedDataset over the written shards
+        """
+        logger.info(f"Building sharded training data from {start_date} to {end_date}")
+
+        self.scaler = StandardScaler()
+        writer: ShardedDatasetWriter | None = None
+
+        async for sample in self._harmonized_samples(
+            start_date, end_date, region_bounds, target_resolution
+        ):
+            arrays = self._sample_arrays(sample)
+            if arrays is None:
+                continue
+            if writer is None:
+                writer = ShardedDatasetWriter(
+                    output_dir,
+                    feature_names=list(sample["features"].keys()),
+                    shard_size=self.config.get("shard_size", 100_000),
+                    scaler=self.scaler,
+                )
+            writer.append(*arrays)
+
+        if writer is None:
+            raise ValueError("No valid features extracted from samples")
+
+        return writer.close()
+
+    async def _harmonized_samples(
+        self,
+        start_date: date,
+        end_date: date,
+        region_bounds: tuple[float, float, float, float],
+        target_resolution: str,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield one harmonized sample per day, in date order.
+
+        Up to ``data_concurrency`` days are fetched at once; a new day is
+        started as soon as the oldest finishes, so at most that many
+        samples are held in memory. Days that fail are logged and skipped.
+        """
+
+        async def fetch(target_date: pd.Timestamp) -> dict[str, Any] | None:
             try:
                 # Get harmonized features for this date
                 harmonized_result = await self.data_harmonizer.get_harmonized_features(
@@ -150,26 +383,69 @@ class MalariaTrainingPipeline:
                     lookback_days=self.config["lookback_days"],
                     target_resolution=target_resolution,
                 )
-
-                # Extract sample with features and target
-                sample = {
-                    "features": harmonized_result.data,
-                    "target_date": target_date.date(),
-                    "spatial_bounds": harmonized_result.spatial_bounds,
-                    "quality_metrics": harmonized_result.quality_metrics,
-                }
-
-                training_samples.append(sample)
-
             except Exception as e:
                 logger.warning(f"Failed to prepare data for {target_date}: {e}")
-                continue
+                return None
 
-        logger.info(f"Prepared {len(training_samples)} training samples")
+            # Extract sample with features and target
+            return {
+                "features": harmonized_result.data,
+                "target_date": target_date.date(),
+                "spatial_bounds": harmonized_result.spatial_bounds,
+                "quality_metrics": harmonized_result.quality_metrics,
+            }
 
-        # Organize data for model training
-        training_data = self._organize_training_data(training_samples)
-        return training_data
+        # Generate date range for predictions
+        dates = iter(pd.date_range(start_date, end_date, freq="D"))
+        concurrency = max(1, self.config.get("data_concurrency", 1))
+        pending = deque(asyncio.ensure_future(fetch(d)) for d in islice(dates, concurrency))
+
+        try:
+            while pending:
+                sample = await pending.popleft()
+                next_date = next(dates, None)
+                if next_date is not None:
+                    pending.append(asyncio.ensure_future(fetch(next_date)))
+                if sample is not None:
+                    yield sample
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _sample_arrays(
+        self, sample: dict[str, Any]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+        """Flatten one day's spatial features into (features, targets, dates, locations)."""
+        # Extract feature vectors (assuming spatial data)
+        feature_arrays = []
+        grid_shape = None
+        for _feature_name, feature_data in sample["features"].items():
+            if isinstance(feature_data, np.ndarray) and feature_data.ndim == 2:
+                # Flatten spatial data to create samples
+                feature_arrays.append(feature_data.flatten())
+                grid_shape = feature_data.shape
+
+        if not feature_arrays or grid_shape is None:
+            return None
+
+        # Stack features
+        sample_features = np.stack(feature_arrays, axis=1)
+
+        # Create targets (using a risk proxy for now)
+        # In practice, this would be real malaria incidence data
+        target_risk = self._generate_synthetic_targets(sample_features)
+
+        # One coordinate per grid cell, in the same row-major order as the features
+        west, south, east, north = sample["spatial_bounds"]
+        lats, lons = np.meshgrid(
+            np.linspace(south, north, grid_shape[0]),
+            np.linspace(west, east, grid_shape[1]),
+            indexing="ij",
+        )
+        locations = np.column_stack([lats.ravel(), lons.ravel()])
+        dates = np.array([sample["target_date"]] * len(target_risk))
+
+        return sample_features, target_risk, dates, locations
 
     def _organize_training_data(self, samples: list[dict[str, Any]]) -> dict[str, Any]:
         """Organize raw samples into model-ready training data."""
@@ -177,37 +453,18 @@ class MalariaTrainingPipeline:
         # Collect all features and targets
         all_features = []
         all_targets = []
-        all_dates = []
-        all_locations = []
+        all_dates: list[Any] = []
+        all_locations: list[tuple[float, ...]] = []
 
         for sample in samples:
-            features = sample["features"]
-            target_date = sample["target_date"]
-
-            # Extract feature vectors (assuming spatial data)
-            feature_arrays = []
-            for _feature_name, feature_data in features.items():
-                if isinstance(feature_data, np.ndarray) and feature_data.ndim == 2:
-                    # Flatten spatial data to create samples
-                    flattened = feature_data.flatten()
-                    feature_arrays.append(flattened)
-
-            if feature_arrays:
-                # Stack features
-                sample_features = np.stack(feature_arrays, axis=1)
-                all_features.append(sample_features)
-
-                # Create targets (using a risk proxy for now)
-                # In practice, this would be real malaria incidence data
-                target_risk = self._generate_synthetic_targets(sample_features)
-                all_targets.append(target_risk)
-
-                # Store metadata
-                all_dates.extend([target_date] * len(target_risk))
-                # Create location coordinates (simplified)
-                spatial_bounds = sample["spatial_bounds"]
-                locations = self._create_location_grid(spatial_bounds, len(target_risk))
-                all_locations.extend(locations)
+            arrays = self._sample_arrays(sample)
+            if arrays is None:
+                continue
+            sample_features, target_risk, dates, locations = arrays
+            all_features.append(sample_features)
+            all_targets.append(target_risk)
+            all_dates.extend(dates)
+            all_locations.extend(map(tuple, locations))
 
         if not all_features:
             raise ValueError("No valid features extracted from samples")
@@ -216,7 +473,7 @@ class MalariaTrainingPipeline:
         X = np.vstack(all_features)
         y = np.concatenate(all_targets)
         dates = np.array(all_dates)
-        locations = np.array(all_locations)  # type: ignore[assignment]
+        locations = np.array(all_locations)
 
         # Apply feature scaling
         X_scaled = self.scaler.fit_transform(X)
@@ -244,86 +501,86 @@ class MalariaTrainingPipeline:
 
         return np.clip(risk_base, 0, 1)
 
-    def _create_location_grid(
-        self, bounds: tuple[float, float, float, float], n_points: int
-    ) -> list[tuple[float, float]]:
-        """Create a grid of location coordinates."""
-        west, south, east, north = bounds
-        grid_size = int(np.sqrt(n_points))
-
-        lats = np.linspace(south, north, grid_size)
-        lons = np.linspace(west, east, grid_size)
-
-        locations = []
-        for lat in lats:
-            for lon in lons:
-                locations.append((lat, lon))
-                if len(locations) >= n_points:
-                    break
-            if len(locations) >= n_points:
-                break
-
-        return locations[:n_points]
-
-    def run_cross_validation(self, training_data: dict[str, Any]) -> dict[str, Any]:
+    def run_cross_validation(
+        self,
+        training_data: dict[str, Any] | ShardedDataset,
+        trial: optuna.Trial | None = None,
+    ) -> dict[str, Any]:
         """
         Run cross-validation with temporal splits.
 
+        Folds are expanding windows over date-ordered rows and train from a
+        sharded dataset; in-memory training data is written to temporary
+        shards first. With ``cv_workers`` above 1 the folds train in a
+        process pool, each worker memory-mapping only its fold's rows.
+
         Args:
-            training_data: Prepared training data
+            training_data: Prepared training data or a sharded dataset
+            trial: Optuna trial to report epoch losses to for pruning; folds
+                then train in-process
 
         Returns:
             Cross-validation results
         """
         logger.info("Starting cross-validation")
 
-        X = training_data["X"]
-        y = training_data["y"]
-        dates = training_data["dates"]
-
-        # Time series split to respect temporal order
-        cv_splitter = TimeSeriesSplit(
-            n_splits=self.config["cv_folds"],
-            test_size=None,  # Will be determined automatically
-            gap=0,
-        )
-
-        cv_results = []
-        fold_metrics = []
-
-        for fold_idx, (train_idx, val_idx) in enumerate(cv_splitter.split(X)):
-            logger.info(f"Training fold {fold_idx + 1}/{self.config['cv_folds']}")
-
-            # Split data
-            X_train, X_val = X[train_idx], X[val_idx]
-            y_train, y_val = y[train_idx], y[val_idx]
-
-            # Check minimum samples
-            if len(X_train) < self.config["min_samples_per_fold"]:
-                logger.warning(
-                    f"Fold {fold_idx} has too few samples ({len(X_train)}), skipping"
+        with tempfile.TemporaryDirectory() as tmp:
+            if isinstance(training_data, ShardedDataset):
+                dataset = training_data
+            else:
+                dataset = ShardedDataset.from_arrays(
+                    tmp,
+                    training_data["X"],
+                    training_data["y"],
+                    training_data["dates"],
+                    training_data["locations"],
+                    training_data.get("feature_names"),
+                    self.config.get("shard_size", 100_000),
                 )
-                continue
-
-            # Train model
-            model = self._train_single_fold(X_train, y_train, X_val, y_val)
 
-            # Evaluate
-            predictions = self._predict_with_model(model, X_val)
-            metrics = self._evaluate_predictions(
-                y_val, predictions, None, dates[val_idx]
-            )
+            folds = []
+            for fold in temporal_folds(len(dataset), self.config["cv_folds"]):
+                fold_idx, (train_start, train_stop), _ = fold
+                # Check minimum samples
+                if train_stop - train_start < self.config["min_samples_per_fold"]:
+                    logger.warning(
+                        f"Fold {fold_idx} has too few samples ({train_stop - train_start}), skipping"
+                    )
+                    continue
+                folds.append(fold)
+
+            workers = min(self.config.get("cv_workers", 1), len(folds))
+            if trial is not None:
+                # Each fold reports its epochs after the previous fold's
+                cv_results = [
+                    self._run_fold(
+                        dataset,
+                        fold,
+                        [_TrialPruningCallback(trial, step_offset=i * self.config["max_epochs"])],
+                    )
+                    for i, fold in enumerate(folds)
+                ]
+            elif workers > 1:
+                logger.info(f"Training {len(folds)} folds in {workers} processes")
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    # Forking a process that has initialized torch is unsafe
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_fold_worker,
+                    initargs=(max(1, (os.cpu_count() or 1) // workers),),
+                ) as executor:
+                    cv_results = list(
+                        executor.map(
+                            _run_fold_in_worker,
+                            repeat(self.config),
+                            repeat(str(dataset.directory)),
+                            folds,
+                        )
+                    )
+            else:
+                cv_results = [self._run_fold(dataset, fold) for fold in folds]
 
-            fold_metrics.append(metrics)
-            cv_results.append(
-                {
-                    "fold": fold_idx,
-                    "model": model,
-                    "metrics": metrics,
-                    "train_size": len(X_train),
-                    "val_size": len(X_val),
-                }
-            )
+        fold_metrics = [result["metrics"] for result in cv_results]
 
         # Aggregate results
         cv_summary = self._aggregate_cv_results(fold_metrics)
@@ -334,21 +591,45 @@ class MalariaTrainingPipeline:
             "best_fold": self._select_best_fold(cv_results),
         }
 
-    def _train_single_fold(
+    def _run_fold(
         self,
-        X_train: np.ndarray,
-        y_train: np.ndarray,
-        X_val: np.ndarray,
-        y_val: np.ndarray,
-    ) -> MalariaLSTM:
-        """Train model for a single CV fold."""
+        dataset: ShardedDataset,
+        fold: Fold,
+        callbacks: list[pl.Callback] | None = None,
+    ) -> dict[str, Any]:
+        """Train and evaluate one temporal fold."""
+        fold_idx, (train_start, train_stop), (val_start, val_stop) = fold
+        logger.info(f"Training fold {fold_idx + 1}/{self.config['cv_folds']}")
+
+        # Train model
+        model = self._train_on_dataset(
+            dataset, (train_start, train_stop), (val_start, val_stop), callbacks
+        )
+
+        # Evaluate
+        predictions = self._predict_dataset(model, dataset, val_start, val_stop)
+        metrics = self._evaluate_predictions(
+            dataset.read("y", val_start, val_stop),
+            predictions,
+            None,
+            dataset.read("dates", val_start, val_stop),
+        )
+
+        return {
+            "fold": fold_idx,
+            "model": model,
+            "metrics": metrics,
+            "train_size": train_stop - train_start,
+            "val_size": val_stop - val_start,
+        }
 
-        # Create model configuration
+    def _build_model(self, n_features: int) -> MalariaLSTM:
+        """Create an LSTM sized for ``n_features`` inputs from the config."""
         model_config = ModelConfig(
-            climate_features=X_train.shape[1] // 4,  # Assume equal distribution
-            vegetation_features=X_train.shape[1] // 4,
-            population_features=X_train.shape[1] // 4,
-            historical_features=X_train.shape[1] // 4,
+            climate_features=n_features // 4,  # Assume equal distribution
+            vegetation_features=n_features // 4,
+            population_features=n_features // 4,
+            historical_features=n_features // 4,
             hidden_size=self.config["hidden_size"],
             num_layers=self.config["num_layers"],
             dropout=self.config["dropout"],
@@ -358,14 +639,16 @@ class MalariaTrainingPipeline:
             use_attention=self.config["use_attention"],
             uncertainty_quantification=self.config["uncertainty_quantification"],
         )
+        return MalariaLSTM(**model_config.to_dict())
 
-        # Initialize model
-        model = MalariaLSTM(**model_config.to_dict())
-
-        # Create data loaders
-        train_loader = self._create_data_loader(X_train, y_train, shuffle=True)
-        val_loader = self._create_data_loader(X_val, y_val, shuffle=False)
-
+    def _fit(
+        self,
+        model: MalariaLSTM,
+        train_loader: torch.utils.data.DataLoader,
+        val_loader: torch.utils.data.DataLoader,
+        callbacks: list[pl.Callback] | None = None,
+    ) -> None:
+        """Fit a model with early stopping on validation loss."""
         # Setup trainer
         trainer = pl.Trainer(
             max_epochs=self.config["max_epochs"],
@@ -377,15 +660,79 @@ class MalariaTrainingPipeline:
                     monitor="val_loss",
                     patience=self.config["early_stopping_patience"],
                     mode="min",
-                )
+                ),
+                *(callbacks or []),
             ],
         )
 
         # Train
         trainer.fit(model, train_loader, val_loader)
 
+    def _train_single_fold(
+        self,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_val: np.ndarray,
+        y_val: np.ndarray,
+    ) -> MalariaLSTM:
+        """Train model for a single CV fold."""
+        model = self._build_model(X_train.shape[1])
+
+        # Create data loaders
+        train_loader = self._create_data_loader(X_train, y_train, shuffle=True)
+        val_loader = self._create_data_loader(X_val, y_val, shuffle=False)
+
+        self._fit(model, train_loader, val_loader)
+
+        return model
+
+    def _train_on_dataset(
+        self,
+        dataset: ShardedDataset,
+        train_rows: tuple[int, int],
+        val_rows: tuple[int, int],
+        callbacks: list[pl.Callback] | None = None,
+    ) -> MalariaLSTM:
+        """Train a model streaming two row ranges of a sharded dataset."""
+        model = self._build_model(dataset.n_features)
+
+        train_loader = self._create_shard_loader(dataset, *train_rows, shuffle=True)
+        val_loader = self._create_shard_loader(dataset, *val_rows, shuffle=False)
+
+        self._fit(model, train_loader, val_loader, callbacks)
+
         return model
 
+    def _create_shard_loader(
+        self, dataset: ShardedDataset, start: int, stop: int, shuffle: bool = False
+    ) -> torch.utils.data.DataLoader:
+        """Create a data loader streaming a row range of a sharded dataset."""
+        return torch.utils.data.DataLoader(
+            ShardIterableDataset(
+                dataset.directory,
+                start,
+                stop,
+                batch_size=self.config["batch_size"],
+                shuffle=shuffle,
+            ),
+            batch_size=None,  # The dataset yields whole batches
+            collate_fn=partial(
+                _lstm_batch, prediction_horizon=self.config["prediction_horizon"]
+            ),
+            num_workers=self.config["num_workers"],
+            pin_memory=torch.cuda.is_available(),
+        )
+
+    def _predict_dataset(
+        self, model: MalariaLSTM, dataset: ShardedDataset, start: int, stop: int
+    ) -> dict[str, np.ndarray]:
+        """Predict a row range batch by batch and concatenate the outputs."""
+        outputs: dict[str, list[np.ndarray]] = {}
+        for (X,) in dataset.batches(start, stop, batch_size=4096, names=("X",)):
+            for key, values in self._predict_with_model(model, X).items():
+                outputs.setdefault(key, []).append(values)
+        return {key: np.concatenate(values) for key, values in outputs.items()}
+
     def _create_data_loader(
         self, X: np.ndarray, y: np.ndarray, shuffle: bool = False
     ) -> torch.utils.data.DataLoader:
@@ -419,18 +766,7 @@ class MalariaTrainingPipeline:
             X_tensor = torch.FloatTensor(X)
 
             # Create dummy batch structure for LSTM
-            batch = {
-                "climate": X_tensor[:, : X_tensor.shape[1] // 4].unsqueeze(1),
-                "vegetation": X_tensor[
-                    :, X_tensor.shape[1] // 4 : X_tensor.shape[1] // 2
-                ].unsqueeze(1),
-                "population": X_tensor[
-                    :, X_tensor.shape[1] // 2 : 3 * X_tensor.shape[1] // 4
-                ].unsqueeze(1),
-                "historical": X_tensor[:, 3 * X_tensor.shape[1] // 4 :].unsqueeze(1),
-            }
-
-            predictions = model(batch)
+            predictions = model(_feature_groups(X_tensor))
 
         result = {"risk_mean": predictions["risk_mean"].cpu().numpy()}
 
@@ -522,13 +858,19 @@ class MalariaTrainingPipeline:
         return best_fold or cv_results[0]
 
     def optimize_hyperparameters(
-        self, training_data: dict[str, Any], n_trials: int | None = None
+        self, training_data: dict[str, Any] | ShardedDataset, n_trials: int | None = None
     ) -> dict[str, Any]:
         """
         Optimize hyperparameters using Optuna.
 
+        Trials report each epoch's validation loss so the configured pruner
+        can stop unpromising ones early. With ``hpo_workers`` above 1 the
+        trials run in a pool of processes, each pinned to its own share of
+        the CPUs, that coordinate through a shared study storage
+        (``hpo_storage``, a temporary journal file by default).
+
         Args:
-            training_data: Prepared training data
+            training_data: Prepared training data or a sharded dataset
             n_trials: Number of optimization trials
 
         Returns:
@@ -537,86 +879,161 @@ class MalariaTrainingPipeline:
         logger.info("Starting hyperparameter optimization")
 
         n_trials = n_trials or self.config["n_trials"]
+        workers = min(self.config.get("hpo_workers", 1), n_trials)
 
-        # Create Optuna study
-        study = optuna.create_study(
-            direction=self.config["optimization_direction"],
-            study_name=f"malaria_hpo_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-        )
-
-        # Define objective function
-        def objective(trial: optuna.Trial) -> float:
-            # Sample hyperparameters
-            params = {
-                "hidden_size": trial.suggest_categorical("hidden_size", [64, 128, 256]),
-                "num_layers": trial.suggest_int("num_layers", 2, 4),
-                "dropout": trial.suggest_float("dropout", 0.1, 0.5),
-                "learning_rate": trial.suggest_float(
-                    "learning_rate", 1e-5, 1e-2, log=True
-                ),
-                "weight_decay": trial.suggest_float(
-                    "weight_decay", 1e-6, 1e-3, log=True
-                ),
-                "use_attention": trial.suggest_categorical(
-                    "use_attention", [True, False]
-                ),
-            }
-
-            # Update config with sampled parameters
-            temp_config = self.config.copy()
-            temp_config.update(params)
-
-            # Store original config
-            original_config = self.config
-            self.config = temp_config
-
-            try:
-                # Run cross-validation with these parameters
-                cv_results = self.run_cross_validation(training_data)
-                cv_summary = cv_results["cv_summary"]
+        with tempfile.TemporaryDirectory() as tmp:
+            # Shards are written once and shared by every trial
+            if isinstance(training_data, ShardedDataset):
+                dataset = training_data
+            else:
+                dataset = ShardedDataset.from_arrays(
+                    Path(tmp) / "shards",
+                    training_data["X"],
+                    training_data["y"],
+                    training_data["dates"],
+                    training_data["locations"],
+                    training_data.get("feature_names"),
+                    self.config.get("shard_size", 100_000),
+                )
 
-                # Get optimization metric
-                metric_key = f"{self.config['optimization_metric']}_mean"
-                if metric_key in cv_summary:
-                    return cv_summary[metric_key]  # type: ignore[no-any-return]
-                else:
-                    return float("inf")
+            storage: str | None = self.config.get("hpo_storage")
+            if storage is None and workers > 1:
+                storage = str(Path(tmp) / "hpo.journal")
 
-            except Exception as e:
-                logger.warning(f"Trial failed: {e}")
-                return float("inf")
+            # Create Optuna study
+            study_storage = _hpo_storage(storage) if storage else None
+            study_name = (
+                f"malaria_hpo_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+            )
+            study = optuna.create_study(
+                direction=self.config["optimization_direction"],
+                study_name=study_name,
+                storage=study_storage,
+                pruner=_hpo_pruner(self.config.get("hpo_pruner"), self._hpo_max_resource()),
+            )
 
-            finally:
-                # Restore original config
-                self.config = original_config
+            # Run optimization
+            if workers > 1:
+                assert storage is not None, "Parallel trials need a shared storage"
+                logger.info(f"Running {n_trials} trials in {workers} processes")
+                trials_per_worker = [len(t) for t in np.array_split(range(n_trials), workers)]
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    # Forking a process that has initialized torch is unsafe
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            _run_hpo_worker,
+                            self.config,
+                            storage,
+                            study_name,
+                            str(dataset.directory),
+                            trials,
+                            cpus,
+                        )
+                        for trials, cpus in zip(
+                            trials_per_worker, _cpu_groups(workers), strict=False
+                        )
+                    ]
+                    for future in futures:
+                        future.result()
+            else:
+                study.optimize(
+                    lambda trial: self._hpo_objective(trial, dataset), n_trials=n_trials
+                )
 
-        # Run optimization
-        study.optimize(objective, n_trials=n_trials)
+            if study_storage is not None and not self.config.get("hpo_storage"):
+                # Keep the study readable after the temporary journal is removed
+                memory = optuna.storages.InMemoryStorage()
+                optuna.copy_study(
+                    from_study_name=study_name,
+                    from_storage=study_storage,
+                    to_storage=memory,
+                )
+                study = optuna.load_study(study_name=study_name, storage=memory)
 
-        # Get best parameters
-        best_params = study.best_params
-        best_value = study.best_value
+            # Get best parameters
+            best_params = study.best_params
+            best_value = study.best_value
+            trials = study.trials
 
+        pruned = sum(trial.state == optuna.trial.TrialState.PRUNED for trial in trials)
         logger.info(f"Best hyperparameters: {best_params}")
         logger.info(f"Best {self.config['optimization_metric']}: {best_value}")
+        logger.info(f"Pruned {pruned} of {len(trials)} trials")
 
         return {
             "best_params": best_params,
             "best_value": best_value,
             "study": study,
             "optimization_history": [
-                trial.value for trial in study.trials if trial.value is not None
+                trial.value for trial in trials if trial.value is not None
             ],
+            "pruned_trials": pruned,
+        }
+
+    def _hpo_max_resource(self) -> int:
+        """Pruning steps in a full trial: every epoch of every fold."""
+        return int(self.config["max_epochs"] * self.config["cv_folds"])
+
+    def _hpo_objective(self, trial: optuna.Trial, dataset: ShardedDataset) -> float:
+        """Cross-validate one sampled configuration."""
+        # Sample hyperparameters
+        params = {
+            "hidden_size": trial.suggest_categorical("hidden_size", [64, 128, 256]),
+            "num_layers": trial.suggest_int("num_layers", 2, 4),
+            "dropout": trial.suggest_float("dropout", 0.1, 0.5),
+            "learning_rate": trial.suggest_float("learning_rate", 1e-5, 1e-2, log=True),
+            "weight_decay": trial.suggest_float("weight_decay", 1e-6, 1e-3, log=True),
+            "use_attention": trial.suggest_categorical("use_attention", [True, False]),
         }
 
+        # Update config with sampled parameters
+        temp_config = self.config.copy()
+        temp_config.update(params)
+
+        # Store original config
+        original_config = self.config
+        self.config = temp_config
+
+        try:
+            # Run cross-validation with these parameters
+            cv_results = self.run_cross_validation(dataset, trial)
+            cv_summary = cv_results["cv_summary"]
+
+            # Get optimization metric
+            metric_key = f"{self.config['optimization_metric']}_mean"
+            if metric_key in cv_summary:
+                return cv_summary[metric_key]  # type: ignore[no-any-return]
+            else:
+                return float("inf")
+
+        except optuna.TrialPruned:
+            raise
+
+        except Exception as e:
+            logger.warning(f"Trial failed: {e}")
+            return float("inf")
+
+        finally:
+            # Restore original config
+            self.config = original_config
+
     def train_final_model(
-        self, training_data: dict[str, Any], best_params: dict[str, Any] | None = None
+        self,
+        training_data: dict[str, Any] | ShardedDataset,
+        best_params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """
         Train final model with best hyperparameters.
 
+        A sharded dataset is split at the same date percentile and streamed;
+        its test features stay on disk, so ``X_test`` is replaced by the
+        ``test_rows`` range.
+
         Args:
-            training_data: Prepared training data
+            training_data: Prepared training data or a sharded dataset
             best_params: Best hyperparameters from optimization
 
         Returns:
@@ -628,28 +1045,47 @@ class MalariaTrainingPipeline:
         if best_params:
             self.config.update(best_params)
 
-        # Split data into train/validation
-        X = training_data["X"]
-        y = training_data["y"]
-        dates = training_data["dates"]
-        locations = training_data["locations"]
+        if isinstance(training_data, ShardedDataset):
+            # Rows are in date order, so the split date is a row boundary
+            dates = training_data.read("dates")
+            days = dates.astype("int64")
+            split_day = np.percentile(days, (1 - self.config["test_size"]) * 100)
+            split_row = int(np.searchsorted(days, split_day, side="right"))
+            test_rows = (split_row, len(training_data))
 
-        # Time-based split for final evaluation
-        split_date = np.percentile(dates, (1 - self.config["test_size"]) * 100)
-        train_mask = dates <= split_date
-        test_mask = dates > split_date
-
-        X_train, X_test = X[train_mask], X[test_mask]
-        y_train, y_test = y[train_mask], y[test_mask]
-        dates_test = dates[test_mask]
-        locations_test = locations[test_mask]
+            self.best_model = self._train_on_dataset(
+                training_data, (0, split_row), test_rows
+            )
+            predictions = self._predict_dataset(self.best_model, training_data, *test_rows)
+            y_test = training_data.read("y", *test_rows)
+            dates_test = dates[split_row:]
+            locations_test = training_data.read("locations", *test_rows)
+            test_data: dict[str, Any] = {"test_rows": test_rows}
+        else:
+            # Split data into train/validation
+            X = training_data["X"]
+            y = training_data["y"]
+            dates = training_data["dates"]
+            locations = training_data["locations"]
+
+            # Time-based split for final evaluation
+            split_date = np.percentile(dates, (1 - self.config["test_size"]) * 100)
+            train_mask = dates <= split_date
+            test_mask = dates > split_date
+
+            X_train, X_test = X[train_mask], X[test_mask]
+            y_train, y_test = y[train_mask], y[test_mask]
+            dates_test = dates[test_mask]
+            locations_test = locations[test_mask]
+
+            # Train final model
+            self.best_model = self._train_single_fold(X_train, y_train, X_test, y_test)
+            predictions = self._predict_with_model(self.best_model, X_test)
+            test_data = {"X_test": X_test}
 
-        # Train final model
-        self.best_model = self._train_single_fold(X_train, y_train, X_test, y_test)
         assert self.best_model is not None, "Model training failed"
 
         # Final evaluation
-        predictions = self._predict_with_model(self.best_model, X_test)
         self.best_metrics = self._evaluate_predictions(
             y_test, predictions, locations_test, dates_test
         )
@@ -667,7 +1103,7 @@ class MalariaTrainingPipeline:
             "metrics": self.best_metrics,
             "predictions": predictions,
             "test_data": {
-                "X_test": X_test,
+                **test_data,
                 "y_test": y_test,
                 "dates_test": dates_test,
                 "locations_test": locations_test,
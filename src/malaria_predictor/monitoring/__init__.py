@@ -32,6 +32,7 @@ from .metrics import (
     MetricsCollector,
     MLModelMetrics,
     PrometheusMetrics,
+    ReportSchedulerMetrics,
     SystemMetrics,
 )
 from .middleware import (
@@ -61,6 +62,7 @@ __all__ = [
     "MLModelMetrics",
     "APIMetrics",
     "SystemMetrics",
+    "ReportSchedulerMetrics",
     # Tracing
     "TracingConfig",
     "get_tracer",
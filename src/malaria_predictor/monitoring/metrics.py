@@ -404,6 +404,18 @@ class MLModelMetrics(MetricsCollector):
             ["model_type", "model_version", "error_type"],
         )
 
+        # Prediction result cache
+        self.prediction_cache_requests = self._create_counter(
+            "malaria_ml_prediction_cache_requests_total",
+            "Prediction cache lookups by tier that answered (memory, redis or miss)",
+            ["model_type", "tier"],
+        )
+
+        self.prediction_cache_hit_rate = self._create_gauge(
+            "malaria_ml_prediction_cache_hit_rate",
+            "Fraction of prediction cache lookups that hit",
+        )
+
         # Feature engineering metrics
         self.feature_extraction_duration = self._create_histogram(
             "malaria_ml_feature_extraction_duration_seconds",
@@ -433,13 +445,19 @@ class MLModelMetrics(MetricsCollector):
         )
 
     def record_model_loading(
-        self, model_type: str, model_version: str, duration: float
+        self,
+        model_type: str,
+        model_version: str,
+        duration: float,
+        memory_bytes: int | None = None,
     ) -> None:
-        """Record model loading metrics."""
+        """Record model loading metrics, and resident memory when given."""
         labels = {"model_type": model_type, "model_version": model_version}
         self.observe_histogram(
             "malaria_ml_model_loading_duration_seconds", duration, labels
         )
+        if memory_bytes is not None:
+            self.set_gauge("malaria_ml_model_memory_usage_bytes", memory_bytes, labels)
 
     def set_model_accuracy(
         self, model_type: str, model_version: str, metric_type: str, accuracy: float
@@ -459,6 +477,16 @@ class MLModelMetrics(MetricsCollector):
         labels = {"model_type": model_type, "model_version": model_version}
         self.set_gauge("malaria_ml_model_memory_usage_bytes", memory_bytes, labels)
 
+    def record_prediction_cache(
+        self, model_type: str, tier: str | None, hit_rate: float
+    ) -> None:
+        """Record a prediction cache lookup; ``tier`` is None for a miss."""
+        self.increment_counter(
+            "malaria_ml_prediction_cache_requests_total",
+            {"model_type": model_type, "tier": tier or "miss"},
+        )
+        self.set_gauge("malaria_ml_prediction_cache_hit_rate", hit_rate)
+
     def record_model_error(self, model_type: str, model_version: str, error_type: str) -> None:
         """Record model error."""
         labels = {
@@ -477,6 +505,78 @@ class MLModelMetrics(MetricsCollector):
         )
 
 
+class ReportSchedulerMetrics(MetricsCollector):
+    """
+    Report scheduler queue metrics.
+
+    Tracks how late due schedules are picked up, how many are waiting or
+    leased, and how long scheduled report executions take.
+    """
+
+    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+        super().__init__(registry)
+        self._setup_metrics()
+
+    def _setup_metrics(self) -> None:
+        """Initialize report scheduler metrics."""
+        self.queue_lag = self._create_histogram(
+            "malaria_report_schedule_lag_seconds",
+            "Delay between a schedule becoming due and a worker claiming it",
+            buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0, 14400.0),
+        )
+
+        self.queue_depth = self._create_gauge(
+            "malaria_report_schedule_queue_depth",
+            "Number of due report schedules by lease state",
+            ["state"],
+        )
+
+        self.oldest_due = self._create_gauge(
+            "malaria_report_schedule_oldest_due_seconds",
+            "Age of the oldest due schedule that is not leased",
+        )
+
+        self.active_executions = self._create_gauge(
+            "malaria_report_schedule_active_executions",
+            "Scheduled reports currently executing on this worker",
+        )
+
+        self.execution_count = self._create_counter(
+            "malaria_report_schedule_executions_total",
+            "Total number of scheduled report executions",
+            ["status"],
+        )
+
+        self.execution_duration = self._create_histogram(
+            "malaria_report_schedule_execution_duration_seconds",
+            "Scheduled report execution duration in seconds",
+            ["status"],
+            buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0),
+        )
+
+    def record_claim(self, lag_seconds: float) -> None:
+        """Record the queue lag of a claimed schedule."""
+        self.observe_histogram("malaria_report_schedule_lag_seconds", lag_seconds)
+
+    def record_execution(self, status: str, duration: float) -> None:
+        """Record a finished scheduled report execution."""
+        labels = {"status": status}
+        self.increment_counter("malaria_report_schedule_executions_total", labels)
+        self.observe_histogram(
+            "malaria_report_schedule_execution_duration_seconds", duration, labels
+        )
+
+    def set_queue_state(self, due: int, leased: int, oldest_due_seconds: float) -> None:
+        """Set queue depth and oldest due age gauges."""
+        self.set_gauge("malaria_report_schedule_queue_depth", due, {"state": "due"})
+        self.set_gauge("malaria_report_schedule_queue_depth", leased, {"state": "leased"})
+        self.set_gauge("malaria_report_schedule_oldest_due_seconds", oldest_due_seconds)
+
+    def set_active_executions(self, count: int) -> None:
+        """Set the number of executions running on this worker."""
+        self.set_gauge("malaria_report_schedule_active_executions", count)
+
+
 class SystemMetrics(MetricsCollector):
     """
     System-level metrics collection.
@@ -706,6 +806,7 @@ class PrometheusMetrics:
         self.api_metrics = APIMetrics(self.registry)
         self.ml_metrics = MLModelMetrics(self.registry)
         self.system_metrics = SystemMetrics(self.registry)
+        self.scheduler_metrics = ReportSchedulerMetrics(self.registry)
 
         # Start system metrics collection
         if settings.monitoring.enable_metrics:
@@ -4,17 +4,22 @@ Monitoring Middleware for FastAPI Integration.
 This module provides comprehensive middleware for integrating all monitoring
 components including metrics collection, distributed tracing, health checks,
 and performance monitoring with FastAPI applications.
+
+The middleware is implemented as pure ASGI callables. Request and response
+sizes are counted as bytes stream through ``receive``/``send`` instead of
+buffering bodies, and no ``BaseHTTPMiddleware`` task wrapping is involved.
 """
 
 import time
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
 from typing import Any
 
-from fastapi import Request, Response
+from fastapi import Response
 from fastapi.responses import JSONResponse
 from opentelemetry import trace
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .health import get_health_checker
 from .logger import RequestContextLogger, get_logger
@@ -22,7 +27,43 @@ from .metrics import get_metrics
 from .tracing import get_api_tracer
 
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
+class _Exchange:
+    """Per-request byte counters and status captured from the ASGI messages."""
+
+    __slots__ = ("status_code", "request_size", "response_size")
+
+    def __init__(self) -> None:
+        self.status_code = 500
+        self.request_size = 0
+        self.response_size = 0
+
+    def wrap(
+        self,
+        receive: Receive,
+        send: Send,
+        on_response_start: Callable[[MutableHeaders], None] | None = None,
+    ) -> tuple[Receive, Send]:
+        """Wrap ``receive``/``send`` so sizes and status are recorded in flight."""
+
+        async def counting_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                self.request_size += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self.status_code = message["status"]
+                if on_response_start is not None:
+                    on_response_start(MutableHeaders(scope=message))
+            elif message["type"] == "http.response.body":
+                self.response_size += len(message.get("body", b""))
+            await send(message)
+
+        return counting_receive, counting_send
+
+
+class PrometheusMiddleware:
     """
     Middleware for Prometheus metrics collection.
 
@@ -32,11 +73,11 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         include_paths: list[str] | None = None,
         exclude_paths: list[str] | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.metrics = get_metrics()
         self.include_paths = include_paths or []
         self.exclude_paths = exclude_paths or [
@@ -48,68 +89,34 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
         ]
         self.logger = get_logger(__name__)
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Collect metrics for HTTP requests."""
-        # Skip excluded paths
-        if self._should_skip_path(request.url.path):
-            return await call_next(request)
+        # Skip non-HTTP traffic and excluded paths
+        if scope["type"] != "http" or self._should_skip_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
         start_time = time.time()
-        method = request.method
-        endpoint = self._extract_endpoint(request)
+        method = scope["method"]
 
-        # Get request size
-        request_size = 0
-        if hasattr(request, "body"):
-            try:
-                body = await request.body()
-                request_size = len(body) if body else 0
-            except Exception:
-                request_size = 0
+        exchange = _Exchange()
+        wrapped_receive, wrapped_send = exchange.wrap(receive, send)
 
         try:
             # Process request
-            response = await call_next(request)
-
-            # Calculate metrics
-            duration = time.time() - start_time
-            status_code = response.status_code
-
-            # Get response size
-            response_size = 0
-            if hasattr(response, "body"):
-                try:
-                    if hasattr(response.body, "__len__"):
-                        response_size = len(response.body)
-                    elif hasattr(response, "content"):
-                        response_size = len(response.content)
-                except Exception:
-                    response_size = 0
-
-            # Record metrics
-            self.metrics.api_metrics.record_request(
-                method=method,
-                endpoint=endpoint,
-                status_code=status_code,
-                duration=duration,
-                request_size=request_size,
-                response_size=response_size,
-            )
-
-            return response
+            await self.app(scope, wrapped_receive, wrapped_send)
 
         except Exception as e:
             # Record error metrics
             duration = time.time() - start_time
+            endpoint = self._extract_endpoint(scope)
 
             self.metrics.api_metrics.record_request(
                 method=method,
                 endpoint=endpoint,
                 status_code=500,
                 duration=duration,
-                request_size=request_size,
+                request_size=exchange.request_size,
                 response_size=0,
             )
 
@@ -122,6 +129,16 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
             self.logger.error(f"Request failed: {method} {endpoint}", exc_info=True)
             raise
 
+        # Record metrics
+        self.metrics.api_metrics.record_request(
+            method=method,
+            endpoint=self._extract_endpoint(scope),
+            status_code=exchange.status_code,
+            duration=time.time() - start_time,
+            request_size=exchange.request_size,
+            response_size=exchange.response_size,
+        )
+
     def _should_skip_path(self, path: str) -> bool:
         """Check if path should be skipped for metrics collection."""
         if self.include_paths:
@@ -129,20 +146,23 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
 
         return any(excluded in path for excluded in self.exclude_paths)
 
-    def _extract_endpoint(self, request: Request) -> str:
-        """Extract normalized endpoint from request."""
-        path = request.url.path
+    def _extract_endpoint(self, scope: Scope) -> str:
+        """
+        Extract normalized endpoint from request.
 
-        # Normalize path parameters
-        if hasattr(request, "path_info"):
-            return request.path_info  # type: ignore[no-any-return]
+        Must be called after the app has run: Starlette's router writes the
+        matched route into the shared scope, so its path template (e.g.
+        ``/tiles/{tile_date}/{z}/{x}/{y}``) keeps label cardinality bounded.
+        Unmatched requests fall back to the raw path.
+        """
+        route = scope.get("route")
+        if route is not None and hasattr(route, "path"):
+            return str(route.path)
 
-        # Simple normalization for common patterns
-        # In production, you might want more sophisticated path normalization
-        return path
+        return str(scope["path"])
 
 
-class TracingMiddleware(BaseHTTPMiddleware):
+class TracingMiddleware:
     """
     Middleware for OpenTelemetry distributed tracing.
 
@@ -150,21 +170,24 @@ class TracingMiddleware(BaseHTTPMiddleware):
     attributes and context propagation.
     """
 
-    def __init__(self, app: Any) -> None:
-        super().__init__(app)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
         self.tracer = get_api_tracer()
         self.logger = get_logger(__name__)
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Create tracing spans for HTTP requests."""
-        method = request.method
-        endpoint = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        endpoint = scope["path"]
 
         # Extract request ID if available
-        request_id_raw = getattr(request.state, "request_id", None)
-        user_id_raw = getattr(request.state, "user_id", None)
+        state = scope.get("state", {})
+        request_id_raw = state.get("request_id")
+        user_id_raw = state.get("user_id")
         request_id = str(request_id_raw) if request_id_raw else ""
         user_id = str(user_id_raw) if user_id_raw else ""
 
@@ -172,31 +195,13 @@ class TracingMiddleware(BaseHTTPMiddleware):
             method, endpoint, user_id, request_id
         ) as span:
             start_time = time.time()
+            exchange = _Exchange()
+            wrapped_receive, wrapped_send = exchange.wrap(receive, send)
 
             try:
-                response = await call_next(request)
-                processing_time = (time.time() - start_time) * 1000
-
-                # Add response metrics to span
-                response_size = 0
-                if hasattr(response, "body") and response.body:
-                    try:
-                        response_size = len(response.body)
-                    except Exception:
-                        pass
-
-                self.tracer.add_request_metrics(
-                    span,  # type: ignore[arg-type]
-                    response.status_code,
-                    response_size,
-                    processing_time,
-                )
-
-                return response
+                await self.app(scope, wrapped_receive, wrapped_send)
 
             except Exception as e:
-                processing_time = (time.time() - start_time) * 1000
-
                 # Record error in span
                 if span:
                     span.record_exception(e)
@@ -208,8 +213,16 @@ class TracingMiddleware(BaseHTTPMiddleware):
                 )
                 raise
 
+            # Add response metrics to span
+            self.tracer.add_request_metrics(
+                span,  # type: ignore[arg-type]
+                exchange.status_code,
+                exchange.response_size,
+                (time.time() - start_time) * 1000,
+            )
+
 
-class HealthCheckMiddleware(BaseHTTPMiddleware):
+class HealthCheckMiddleware:
     """
     Middleware for health check endpoints.
 
@@ -217,30 +230,35 @@ class HealthCheckMiddleware(BaseHTTPMiddleware):
     component status and metrics.
     """
 
-    def __init__(self, app: Any, health_endpoint: str = "/health") -> None:
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, health_endpoint: str = "/health") -> None:
+        self.app = app
         self.health_endpoint = health_endpoint
         self.health_checker = get_health_checker()
         self.logger = get_logger(__name__)
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Handle health check requests."""
-        path = request.url.path
+        if scope["type"] == "http":
+            response = await self.handle_path(scope["path"])
+            if response is not None:
+                await response(scope, receive, send)
+                return
 
-        # Handle health check endpoints
+        await self.app(scope, receive, send)
+
+    async def handle_path(self, path: str) -> Response | None:
+        """Return the health response for ``path``, or None if not a health path."""
         if path == self.health_endpoint:
-            return await self._handle_health_check(request)
+            return await self._handle_health_check()
         elif path == f"{self.health_endpoint}/detailed":
-            return await self._handle_detailed_health_check(request)
+            return await self._handle_detailed_health_check()
         elif path.startswith(f"{self.health_endpoint}/component/"):
             component_name = path.split("/")[-1]
             return await self._handle_component_health_check(component_name)
 
-        return await call_next(request)
+        return None
 
-    async def _handle_health_check(self, request: Request) -> JSONResponse:
+    async def _handle_health_check(self) -> JSONResponse:
         """Handle basic health check."""
         try:
             health_status = await self.health_checker.check_all()
@@ -270,7 +288,7 @@ class HealthCheckMiddleware(BaseHTTPMiddleware):
                 status_code=503,
             )
 
-    async def _handle_detailed_health_check(self, request: Request) -> JSONResponse:
+    async def _handle_detailed_health_check(self) -> JSONResponse:
         """Handle detailed health check with all component information."""
         try:
             health_status = await self.health_checker.check_all()
@@ -330,7 +348,7 @@ class HealthCheckMiddleware(BaseHTTPMiddleware):
             )
 
 
-class PerformanceMonitoringMiddleware(BaseHTTPMiddleware):
+class PerformanceMonitoringMiddleware:
     """
     Middleware for comprehensive performance monitoring.
 
@@ -340,41 +358,49 @@ class PerformanceMonitoringMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         slow_request_threshold: float = 1.0,  # seconds
         log_slow_requests: bool = True,
         track_request_sizes: bool = True,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.slow_request_threshold = slow_request_threshold
         self.log_slow_requests = log_slow_requests
         self.track_request_sizes = track_request_sizes
         self.logger = get_logger(__name__)
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Monitor request performance."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
-        method = request.method
-        endpoint = request.url.path
+        method = scope["method"]
+        endpoint = scope["path"]
 
         # Track request ID for correlation
         request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
 
         # Get client information
-        client_ip = self._get_client_ip(request)
-        user_agent = request.headers.get("user-agent", "unknown")
+        headers = Headers(scope=scope)
+        client_ip = self._get_client_ip(scope, headers)
+        user_agent = headers.get("user-agent", "unknown")
+
+        def add_performance_headers(response_headers: MutableHeaders) -> None:
+            response_headers["X-Request-ID"] = request_id
+            response_headers["X-Response-Time-ms"] = str(
+                round((time.time() - start_time) * 1000, 2)
+            )
 
-        # Track request size if enabled
-        request_size = 0
-        if self.track_request_sizes:
-            try:
-                body = await request.body()
-                request_size = len(body) if body else 0
-            except Exception:
-                request_size = 0
+        # Sizes are only counted when enabled; otherwise pass receive through
+        exchange = _Exchange()
+        wrapped_receive, wrapped_send = exchange.wrap(
+            receive, send, add_performance_headers
+        )
+        if not self.track_request_sizes:
+            wrapped_receive = receive
 
         # Use request context logger
         with RequestContextLogger(
@@ -383,54 +409,7 @@ class PerformanceMonitoringMiddleware(BaseHTTPMiddleware):
         ):
             try:
                 # Process request
-                response = await call_next(request)
-
-                # Calculate performance metrics
-                duration = time.time() - start_time
-                duration_ms = duration * 1000
-
-                # Track response size
-                response_size = 0
-                if self.track_request_sizes and hasattr(response, "body"):
-                    try:
-                        if hasattr(response.body, "__len__"):
-                            response_size = len(response.body)
-                    except Exception:
-                        pass
-
-                # Add performance headers
-                response.headers["X-Request-ID"] = request_id
-                response.headers["X-Response-Time-ms"] = str(round(duration_ms, 2))
-
-                # Log request completion
-                self.logger.info(
-                    f"Request completed: {method} {endpoint}",
-                    extra={
-                        "request_id": request_id,
-                        "method": method,
-                        "endpoint": endpoint,
-                        "status_code": response.status_code,
-                        "duration_ms": round(duration_ms, 2),
-                        "request_size": request_size,
-                        "response_size": response_size,
-                        "client_ip": client_ip,
-                        "user_agent": user_agent,
-                    },
-                )
-
-                # Log slow requests
-                if self.log_slow_requests and duration > self.slow_request_threshold:
-                    self.logger.warning(
-                        f"Slow request detected: {method} {endpoint} took {duration:.2f}s",
-                        extra={
-                            "request_id": request_id,
-                            "duration_seconds": duration,
-                            "threshold_seconds": self.slow_request_threshold,
-                            "slow_request": True,
-                        },
-                    )
-
-                return response
+                await self.app(scope, wrapped_receive, wrapped_send)
 
             except Exception as e:
                 # Calculate duration for failed requests
@@ -455,22 +434,57 @@ class PerformanceMonitoringMiddleware(BaseHTTPMiddleware):
 
                 raise
 
-    def _get_client_ip(self, request: Request) -> str:
+            # Calculate performance metrics
+            duration = time.time() - start_time
+            duration_ms = duration * 1000
+
+            # Log request completion
+            self.logger.info(
+                f"Request completed: {method} {endpoint}",
+                extra={
+                    "request_id": request_id,
+                    "method": method,
+                    "endpoint": endpoint,
+                    "status_code": exchange.status_code,
+                    "duration_ms": round(duration_ms, 2),
+                    "request_size": exchange.request_size,
+                    "response_size": (
+                        exchange.response_size if self.track_request_sizes else 0
+                    ),
+                    "client_ip": client_ip,
+                    "user_agent": user_agent,
+                },
+            )
+
+            # Log slow requests
+            if self.log_slow_requests and duration > self.slow_request_threshold:
+                self.logger.warning(
+                    f"Slow request detected: {method} {endpoint} took {duration:.2f}s",
+                    extra={
+                        "request_id": request_id,
+                        "duration_seconds": duration,
+                        "threshold_seconds": self.slow_request_threshold,
+                        "slow_request": True,
+                    },
+                )
+
+    def _get_client_ip(self, scope: Scope, headers: Headers) -> str:
         """Extract client IP address considering proxy headers."""
         # Check for forwarded headers (when behind proxy)
-        forwarded_for = request.headers.get("x-forwarded-for")
+        forwarded_for = headers.get("x-forwarded-for")
         if forwarded_for:
             return forwarded_for.split(",")[0].strip()
 
-        real_ip = request.headers.get("x-real-ip")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
-            return real_ip
+            return str(real_ip)
 
         # Fallback to direct client
-        return request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        return client[0] if client else "unknown"
 
 
-class MonitoringMiddleware(BaseHTTPMiddleware):
+class MonitoringMiddleware:
     """
     Unified monitoring middleware that combines all monitoring components.
 
@@ -480,7 +494,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         enable_metrics: bool = True,
         enable_tracing: bool = True,
         enable_health_checks: bool = True,
@@ -488,7 +502,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         health_endpoint: str = "/health",
         metrics_endpoint: str = "/metrics",
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.enable_metrics = enable_metrics
         self.enable_tracing = enable_tracing
         self.enable_health_checks = enable_health_checks
@@ -502,31 +516,36 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         if enable_tracing:
             self.tracer = get_api_tracer()
         if enable_health_checks:
-            self.health_checker = get_health_checker()
+            self.health_middleware = HealthCheckMiddleware(app, health_endpoint)
 
         self.logger = get_logger(__name__)
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Unified monitoring dispatch."""
-        path = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
 
         # Handle metrics endpoint
         if path == self.metrics_endpoint and self.enable_metrics:
-            return await self._handle_metrics(request)
+            response = self._handle_metrics(Headers(scope=scope))
+            await response(scope, receive, send)
+            return
 
         # Handle health check endpoints
         if self.enable_health_checks and path.startswith(self.health_endpoint):
-            return await self._handle_health_endpoints(request, call_next)
+            await self.health_middleware(scope, receive, send)
+            return
 
         # Apply monitoring to regular requests
-        return await self._monitor_request(request, call_next)
+        await self._monitor_request(scope, receive, send)
 
-    async def _handle_metrics(self, request: Request) -> Response:
+    def _handle_metrics(self, headers: Headers) -> Response:
         """Handle Prometheus metrics endpoint."""
         try:
-            accept_header = request.headers.get("accept", "")
+            accept_header = headers.get("accept", "")
             content, content_type = self.metrics.get_metrics_output(accept_header)
 
             return Response(
@@ -541,28 +560,32 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
                 media_type="text/plain",
             )
 
-    async def _handle_health_endpoints(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """Handle health check endpoints."""
-        # Delegate to health check middleware logic
-        health_middleware = HealthCheckMiddleware(None, self.health_endpoint)
-        return await health_middleware.dispatch(request, call_next)
-
     async def _monitor_request(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
         """Apply comprehensive monitoring to request."""
         start_time = time.time()
-        method = request.method
-        endpoint = request.url.path
+        method = scope["method"]
+        endpoint = scope["path"]
 
         # Generate request ID
         request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        def add_monitoring_headers(response_headers: MutableHeaders) -> None:
+            response_headers["X-Request-ID"] = request_id
+            response_headers["X-Response-Time-ms"] = str(
+                round((time.time() - start_time) * 1000, 2)
+            )
+
+        exchange = _Exchange()
+        wrapped_receive, wrapped_send = exchange.wrap(
+            receive, send, add_monitoring_headers
+        )
 
         # Start tracing context if enabled
         tracing_context: Any = None
+        span = None
         if self.enable_tracing:
             tracing_context = self.tracer.trace_api_request(
                 method, endpoint, request_id=request_id
@@ -575,7 +598,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         ):
             try:
                 # Process request
-                response = await call_next(request)
+                await self.app(scope, wrapped_receive, wrapped_send)
 
                 # Calculate metrics
                 duration = time.time() - start_time
@@ -585,31 +608,20 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
                     self.metrics.api_metrics.record_request(
                         method=method,
                         endpoint=endpoint,
-                        status_code=response.status_code,
+                        status_code=exchange.status_code,
                         duration=duration,
                     )
 
                 # Add tracing metrics if enabled
                 if self.enable_tracing and span:
-                    processing_time = duration * 1000
-                    response_size = getattr(response, "content_length", 0) or 0
-
                     self.tracer.add_request_metrics(
                         span,
-                        response.status_code,
-                        response_size,
-                        processing_time,
+                        exchange.status_code,
+                        exchange.response_size,
+                        duration * 1000,
                     )
 
-                # Add monitoring headers
-                response.headers["X-Request-ID"] = request_id
-                response.headers["X-Response-Time-ms"] = str(round(duration * 1000, 2))
-
-                return response
-
             except Exception as e:
-                duration = time.time() - start_time
-
                 # Record error metrics if enabled
                 if self.enable_metrics:
                     self.metrics.api_metrics.record_error(
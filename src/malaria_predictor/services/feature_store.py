@@ -0,0 +1,514 @@
+"""
+Lookback-Window Feature Store.
+
+Materializes the per-cell, per-day model input vectors (``climate`` 12,
+``vegetation`` 4, ``population`` 6 and ``historical`` 4 features) into
+memory-mapped NumPy arrays so serving can assemble model inputs without
+harmonizing any data.
+
+Each region holds a fixed list of grid cells and one time-major array per
+year of shape (days in year, cells, 26). A ``[B, seq_len, F]`` window for
+a contiguous run of cells is a transposed slice of the mapped file, and
+each modality is a slice of its last axis, so no feature data is copied.
+Windows spanning a year boundary and scattered cell sets are gathered with
+one copy.
+
+Layout of a store directory:
+    {region}/manifest.json     Cell coordinates and ids, feature layout
+    {region}/{year}.npy        float32 features, (days, cells, features)
+    {region}/{year}.days.npy   bool mask of the days written
+"""
+
+import json
+import logging
+import warnings
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+import torch
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database.repositories import GridCellRepository, grid_cell_key
+from ..database.session import get_session
+from .data_harmonizer import HarmonizedDataResult
+
+if TYPE_CHECKING:
+    from ..api.dependencies import PredictionService
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+# Model input modalities: (harmonized feature prefixes, feature width)
+MODALITY_FEATURES: dict[str, tuple[tuple[str, ...], int]] = {
+    "climate": (("era5_", "chirps_"), 12),
+    "vegetation": (("modis_",), 4),
+    "population": (("worldpop_",), 6),
+    "historical": (("map_",), 4),
+}
+N_FEATURES = sum(width for _, width in MODALITY_FEATURES.values())
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+def as_date(value: date | datetime | str) -> date:
+    """Day of a date, datetime or ISO string."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def modality_slices() -> dict[str, slice]:
+    """Position of each modality along the feature axis."""
+    slices = {}
+    start = 0
+    for name, (_, width) in MODALITY_FEATURES.items():
+        slices[name] = slice(start, start + width)
+        start += width
+    return slices
+
+
+def sample_location_features(
+    harmonized: HarmonizedDataResult,
+    coordinates: list[tuple[float, float]],
+) -> dict[str, np.ndarray]:
+    """
+    Sample each feature grid at the nearest cell to every coordinate.
+
+    Feature grids span ``harmonized.spatial_bounds`` with row 0 at the
+    northern edge; time-series grids contribute their latest slice.
+    Coordinates outside the bounds are clamped to the edge cells.
+
+    Returns:
+        Feature name -> array of shape (len(coordinates),)
+    """
+    lats = np.array([lat for lat, _ in coordinates], dtype=np.float64)
+    lons = np.array([lon for _, lon in coordinates], dtype=np.float64)
+
+    sampled: dict[str, np.ndarray] = {}
+    for name, grid in harmonized.data.items():
+        values = np.asarray(grid, dtype=np.float64)
+        if values.ndim == 3:
+            values = values[-1]
+        if values.ndim != 2 or values.size == 0:
+            continue
+
+        row, col = _grid_position(harmonized.spatial_bounds, values.shape, lats, lons)
+        sampled[name] = np.nan_to_num(values[row, col])
+
+    return sampled
+
+
+def sample_location_series(
+    harmonized: HarmonizedDataResult,
+    latitude: float,
+    longitude: float,
+    days: int,
+) -> dict[str, np.ndarray]:
+    """
+    Daily values of each feature at one location over the last ``days`` days.
+
+    Time-series grids are read as daily steps ending on the harmonized
+    target date, and days before their first step repeat it. Static grids
+    give the same value every day.
+
+    Returns:
+        Feature name -> array of shape (days,), oldest day first
+    """
+    lats = np.array([latitude], dtype=np.float64)
+    lons = np.array([longitude], dtype=np.float64)
+
+    series: dict[str, np.ndarray] = {}
+    for name, grid in harmonized.data.items():
+        values = np.asarray(grid, dtype=np.float64)
+        if values.ndim == 2:
+            values = values[np.newaxis]
+        if values.ndim != 3 or values.size == 0:
+            continue
+
+        steps = values.shape[0]
+        row, col = _grid_position(harmonized.spatial_bounds, values.shape[1:], lats, lons)
+        steps_used = np.clip(np.arange(steps - days, steps), 0, steps - 1)
+        series[name] = np.nan_to_num(values[steps_used, row[0], col[0]])
+
+    return series
+
+
+def _grid_position(
+    bounds: tuple[float, float, float, float],
+    shape: tuple[int, ...],
+    lats: np.ndarray,
+    lons: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row and column of the grid cell nearest to each coordinate, clamped."""
+    west, south, east, north = bounds
+    rows, cols = shape
+    row = ((north - lats) / (north - south) * rows).astype(int)
+    col = ((lons - west) / (east - west) * cols).astype(int)
+    return np.clip(row, 0, rows - 1), np.clip(col, 0, cols - 1)
+
+
+def feature_vectors(location_features: dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Arrange sampled features into one model feature vector per location.
+
+    Features are grouped into modalities by source prefix, in name order,
+    and padded or truncated to each modality's width. Modalities without
+    features are zero-filled.
+
+    Returns:
+        Array of shape (locations, N_FEATURES)
+    """
+    batch_size = len(next(iter(location_features.values()), []))
+    vectors = np.zeros((batch_size, N_FEATURES), dtype=np.float32)
+    for name, columns in modality_slices().items():
+        prefixes, width = MODALITY_FEATURES[name]
+        sources = [
+            values
+            for feature, values in sorted(location_features.items())
+            if feature.startswith(prefixes)
+        ][:width]
+        for index, values in enumerate(sources):
+            vectors[:, columns.start + index] = values
+    return vectors
+
+
+def split_modalities(features: np.ndarray | torch.Tensor) -> dict[str, Any]:
+    """Model input dict of views into a (..., N_FEATURES) array."""
+    return {name: features[..., columns] for name, columns in modality_slices().items()}
+
+
+def _as_slice(indices: np.ndarray) -> slice | np.ndarray:
+    """A slice for ascending consecutive indices, which keeps reads views."""
+    if len(indices) and np.all(np.diff(indices) == 1):
+        return slice(int(indices[0]), int(indices[-1]) + 1)
+    return indices
+
+
+class FeatureStore:
+    """Memory-mapped daily feature vectors of each region's grid cells."""
+
+    def __init__(self, directory: str | Path) -> None:
+        """
+        Args:
+            directory: Store root, created on first write
+        """
+        self.directory = Path(directory)
+        self._manifests: dict[str, dict[str, Any]] = {}
+        self._cell_index: dict[str, dict[tuple[float, float], int]] = {}
+        self._arrays: dict[tuple[str, int], np.ndarray] = {}
+
+    def regions(self) -> list[str]:
+        """Regions with a manifest."""
+        if not self.directory.exists():
+            return []
+        return sorted(path.parent.name for path in self.directory.glob(f"*/{MANIFEST_NAME}"))
+
+    def manifest(self, region: str) -> dict[str, Any]:
+        if region not in self._manifests:
+            path = self.directory / region / MANIFEST_NAME
+            if not path.exists():
+                raise ValueError(f"Feature store has no region {region!r}")
+            self._manifests[region] = json.loads(path.read_text())
+        return self._manifests[region]
+
+    def create_region(
+        self,
+        region: str,
+        coordinates: list[tuple[float, float]],
+        cell_ids: list[int] | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Define a region's cells; their order is the array's cell axis.
+
+        Args:
+            region: Region name
+            coordinates: (latitude, longitude) of each cell
+            cell_ids: Grid cell ids in the same order, if known
+            overwrite: Replace an existing region and drop its features
+
+        Raises:
+            ValueError: If the region exists and ``overwrite`` is not set
+        """
+        region_dir = self.directory / region
+        if (region_dir / MANIFEST_NAME).exists():
+            if not overwrite:
+                raise ValueError(f"Feature store region {region!r} already exists")
+            for path in region_dir.glob("*.npy"):
+                path.unlink()
+        region_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest = {
+            "cells": len(coordinates),
+            "latitudes": [lat for lat, _ in coordinates],
+            "longitudes": [lon for _, lon in coordinates],
+            "cell_ids": list(cell_ids) if cell_ids is not None else None,
+            "features": {
+                name: [columns.start, columns.stop]
+                for name, columns in modality_slices().items()
+            },
+            "created_at": datetime.now().isoformat(),
+        }
+        (region_dir / MANIFEST_NAME).write_text(json.dumps(manifest))
+        for key in [key for key in self._arrays if key[0] == region]:
+            del self._arrays[key]
+        self._manifests.pop(region, None)
+        self._cell_index.pop(region, None)
+
+    def cells(self, region: str) -> list[tuple[float, float]]:
+        """(latitude, longitude) of a region's cells in array order."""
+        manifest = self.manifest(region)
+        return list(zip(manifest["latitudes"], manifest["longitudes"], strict=True))
+
+    def cell_indices(
+        self, region: str, coordinates: list[tuple[float, float]]
+    ) -> np.ndarray:
+        """Cell axis positions of coordinates, -1 where the region lacks the cell."""
+        if region not in self._cell_index:
+            self._cell_index[region] = {
+                grid_cell_key(lat, lon): index
+                for index, (lat, lon) in enumerate(self.cells(region))
+            }
+        index = self._cell_index[region]
+        return np.array(
+            [index.get(grid_cell_key(lat, lon), -1) for lat, lon in coordinates],
+            dtype=np.int64,
+        )
+
+    def locate(
+        self, coordinates: list[tuple[float, float]]
+    ) -> tuple[str, np.ndarray] | None:
+        """The first region holding every coordinate, with their cell positions."""
+        for region in self.regions():
+            indices = self.cell_indices(region, coordinates)
+            if len(indices) and (indices >= 0).all():
+                return region, indices
+        return None
+
+    def _path(self, region: str, year: int, suffix: str = "") -> Path:
+        return self.directory / region / f"{year}{suffix}.npy"
+
+    def _array(self, region: str, year: int, create: bool = False) -> np.ndarray | None:
+        key = (region, year)
+        if key not in self._arrays:
+            path = self._path(region, year)
+            if path.exists():
+                self._arrays[key] = np.load(path, mmap_mode="r+" if create else "r")
+            elif create:
+                days = (date(year + 1, 1, 1) - date(year, 1, 1)).days
+                self._arrays[key] = np.lib.format.open_memmap(
+                    path,
+                    mode="w+",
+                    dtype=np.float32,
+                    shape=(days, self.manifest(region)["cells"], N_FEATURES),
+                )
+            else:
+                return None
+        return self._arrays[key]
+
+    def written_days(self, region: str, year: int) -> np.ndarray:
+        """Mask over the days of a year that have been written."""
+        path = self._path(region, year, ".days")
+        if path.exists():
+            mask: np.ndarray = np.load(path)
+            return mask
+        return np.zeros((date(year + 1, 1, 1) - date(year, 1, 1)).days, dtype=bool)
+
+    def write_day(self, region: str, day: date, vectors: np.ndarray) -> None:
+        """
+        Store one day's feature vectors of all cells in a region.
+
+        Args:
+            region: Region name
+            day: Day the features describe
+            vectors: Array of shape (cells, N_FEATURES) in cell order
+        """
+        expected = (self.manifest(region)["cells"], N_FEATURES)
+        if vectors.shape != expected:
+            raise ValueError(f"Expected features of shape {expected}, got {vectors.shape}")
+
+        # With create=True the year's file is always opened as a memmap
+        array = cast(np.memmap, self._array(region, day.year, create=True))
+        if not array.flags.writeable:
+            # Opened read-only by an earlier read; reopen for writing
+            del self._arrays[(region, day.year)]
+            array = cast(np.memmap, self._array(region, day.year, create=True))
+        doy = day.timetuple().tm_yday - 1
+        array[doy] = vectors
+        array.flush()
+
+        written = self.written_days(region, day.year)
+        written[doy] = True
+        np.save(self._path(region, day.year, ".days"), written)
+
+    def _days(self, end_day: date, seq_len: int) -> list[tuple[int, int, int]]:
+        """(year, first day index, end day index) pieces of a lookback window."""
+        start_day = end_day - timedelta(days=seq_len - 1)
+        pieces = []
+        for year in range(start_day.year, end_day.year + 1):
+            first = start_day if start_day.year == year else date(year, 1, 1)
+            last = end_day if end_day.year == year else date(year, 12, 31)
+            pieces.append((year, first.timetuple().tm_yday - 1, last.timetuple().tm_yday))
+        return pieces
+
+    def available(self, region: str, end_day: date, seq_len: int) -> bool:
+        """Whether every day of the window ending on ``end_day`` was written."""
+        return all(
+            self.written_days(region, year)[first:stop].all()
+            for year, first, stop in self._days(end_day, seq_len)
+        )
+
+    def window(
+        self,
+        region: str,
+        end_day: date,
+        seq_len: int,
+        cells: slice | np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Features of the ``seq_len`` days ending on ``end_day``.
+
+        Args:
+            region: Region name
+            end_day: Last day of the window
+            seq_len: Days in the window
+            cells: Cell positions, all cells when omitted
+
+        Returns:
+            Array of shape (cells, seq_len, N_FEATURES); a view of the
+            mapped file when the window is within one year and the cells
+            are consecutive
+
+        Raises:
+            ValueError: If a year of the window has not been written
+        """
+        selection = slice(None) if cells is None else cells
+        if isinstance(selection, np.ndarray):
+            selection = _as_slice(selection)
+
+        parts = []
+        for year, first, stop in self._days(end_day, seq_len):
+            array = self._array(region, year)
+            if array is None:
+                raise ValueError(f"Feature store region {region!r} has no data for {year}")
+            parts.append(array[first:stop, selection])
+
+        time_major = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        return time_major.transpose(1, 0, 2)
+
+    def model_input(
+        self,
+        region: str,
+        end_day: date,
+        seq_len: int,
+        cells: slice | np.ndarray | None = None,
+    ) -> dict[str, torch.Tensor]:
+        """Window split into model input tensors sharing the window's memory."""
+        window = self.window(region, end_day, seq_len, cells)
+        with warnings.catch_warnings():
+            # The mapping is read-only; models do not write to their inputs
+            warnings.filterwarnings("ignore", message="The given NumPy array is not writable")
+            features = torch.from_numpy(window)
+        return split_modalities(features)
+
+
+class FeatureStoreBuilder:
+    """
+    Materializes daily feature vectors of a region's grid cells.
+
+    The region's cells are read from ``grid_cells`` when it is first built.
+    Each day is harmonized once for the whole region and sampled at every
+    cell, the same way batched predictions sample harmonized grids.
+    """
+
+    def __init__(
+        self,
+        prediction_service: "PredictionService",
+        store: FeatureStore,
+        session_factory: SessionFactory = get_session,
+    ) -> None:
+        self.prediction_service = prediction_service
+        self.store = store
+        self.session_factory = session_factory
+
+    async def build(
+        self,
+        region: str,
+        bounds: tuple[float, float, float, float],
+        start: date,
+        end: date,
+        overwrite: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Write feature vectors for each day from ``start`` to ``end``.
+
+        Args:
+            region: Region name
+            bounds: (west, south, east, north) box of the region
+            start: First day
+            end: Last day (inclusive)
+            overwrite: Rewrite days that were already written
+
+        Returns:
+            Summary with cell, written, skipped and failed day counts
+        """
+        if region not in self.store.regions():
+            west, south, east, north = bounds
+            async with self.session_factory() as session:
+                grid_cells = await GridCellRepository(session).get_cells_in_bbox(
+                    south, west, north, east
+                )
+            self.store.create_region(
+                region,
+                [
+                    (cast(float, cell.latitude), cast(float, cell.longitude))
+                    for cell in grid_cells
+                ],
+                [cast(int, cell.id) for cell in grid_cells],
+            )
+
+        coordinates = self.store.cells(region)
+        summary: dict[str, Any] = {
+            "region": region,
+            "cells": len(coordinates),
+            "written": 0,
+            "skipped": 0,
+            "failed": 0,
+        }
+        if not coordinates:
+            return summary
+
+        day = start
+        while day <= end:
+            if not overwrite and self.store.written_days(region, day.year)[
+                day.timetuple().tm_yday - 1
+            ]:
+                summary["skipped"] += 1
+            else:
+                try:
+                    harmonized = await self.prediction_service.harmonize_region(bounds, day)
+                    if harmonized is None:
+                        raise RuntimeError("no data harmonizer is configured")
+                    self.store.write_day(
+                        region,
+                        day,
+                        feature_vectors(sample_location_features(harmonized, coordinates)),
+                    )
+                    summary["written"] += 1
+                except Exception as e:
+                    logger.warning(f"Failed to materialize features of {region} on {day}: {e}")
+                    summary["failed"] += 1
+            day += timedelta(days=1)
+
+        logger.info(
+            f"Feature store {region}: {summary['written']} days written, "
+            f"{summary['skipped']} skipped, {summary['failed']} failed"
+        )
+        return summary
@@ -0,0 +1,291 @@
+"""
+Precomputed Daily Nowcasts.
+
+Most prediction traffic asks for the risk at a known location for today.
+Once a day, after ingestion completes, ``NowcastGenerator`` predicts a
+regular grid of ``cell_size_degrees`` cells over the configured regions
+with the batched prediction engine, one square block of cells per batch
+and harmonization, and bulk-writes the results to ``risk_nowcasts``.
+``NowcastStore`` snaps requested coordinates to the same grid and looks
+them up in that table, so the prediction endpoints only fall back to live
+inference for locations, days or model versions that were not precomputed.
+
+A nowcast row holds the model's first-day output, which is what the
+endpoints return for every prediction horizon, and the model version that
+produced it. Rows are only served while that version is active, so a model
+swap falls back to live inference until the job runs again.
+"""
+
+import logging
+import math
+from collections.abc import Callable, Iterator
+from contextlib import AbstractAsyncContextManager
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import NowcastSettings, settings
+from ..database.repositories import (
+    GridCellRepository,
+    RiskNowcastRepository,
+    grid_cell_key,
+)
+from ..database.session import get_read_session, get_session
+from .feature_store import as_date
+
+if TYPE_CHECKING:
+    from ..api.dependencies import PredictionService
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+def _cell_centre(row: int, col: int, cell_size: float) -> tuple[float, float]:
+    return grid_cell_key((row + 0.5) * cell_size, (col + 0.5) * cell_size)
+
+
+def nowcast_cell(latitude: float, longitude: float, cell_size: float) -> tuple[float, float]:
+    """Centre of the nowcast cell containing a coordinate, as a grid cell key."""
+    return _cell_centre(
+        math.floor(latitude / cell_size), math.floor(longitude / cell_size), cell_size
+    )
+
+
+def _cell_blocks(
+    bounds: tuple[float, float, float, float], cell_size: float, side: int
+) -> Iterator[list[tuple[int, int]]]:
+    """(row, col) of the cells centred in a region, in square blocks of ``side``."""
+    west, south, east, north = bounds
+    rows = range(
+        math.ceil(south / cell_size - 0.5), math.floor(north / cell_size - 0.5) + 1
+    )
+    cols = range(
+        math.ceil(west / cell_size - 0.5), math.floor(east / cell_size - 0.5) + 1
+    )
+    for row_start in range(0, len(rows), side):
+        for col_start in range(0, len(cols), side):
+            yield [
+                (row, col)
+                for row in rows[row_start : row_start + side]
+                for col in cols[col_start : col_start + side]
+            ]
+
+
+class NowcastStore:
+    """Read side of the nowcast table, used by the prediction service."""
+
+    def __init__(
+        self,
+        session_factory: SessionFactory = get_read_session,
+        cell_size_degrees: float | None = None,
+    ) -> None:
+        """
+        Args:
+            session_factory: Opens a session for lookups, a read replica one
+                by default
+            cell_size_degrees: Nowcast grid spacing, the nowcast settings'
+                when omitted
+        """
+        self.session_factory = session_factory
+        self.cell_size = cell_size_degrees or settings.nowcast.cell_size_degrees
+        self.hits = 0
+        self.misses = 0
+
+    async def lookup(
+        self,
+        coordinates: list[tuple[float, float]],
+        target_date: date | datetime | str,
+        model_type: str,
+        model_version: str,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Nowcasts for many locations in one query.
+
+        Each location is answered by the nowcast of the grid cell containing
+        it, so coordinates need not be cell centres.
+
+        Args:
+            coordinates: (latitude, longitude) pairs
+            target_date: Day predicted
+            model_type: Model type requested
+            model_version: Active version of that model
+
+        Returns:
+            ``risk_score`` and ``uncertainty`` per coordinate, in input order,
+            or None where no nowcast matches. Database errors are logged and
+            treated as misses, so serving falls back to live inference.
+        """
+        if not coordinates:
+            return []
+
+        cells = [nowcast_cell(lat, lon, self.cell_size) for lat, lon in coordinates]
+        try:
+            async with self.session_factory() as session:
+                rows = await RiskNowcastRepository(session).get_for_coordinates(
+                    cells, as_date(target_date), model_type, model_version
+                )
+        except Exception as e:
+            logger.warning(f"Nowcast lookup failed: {e}")
+            rows = {}
+
+        results: list[dict[str, Any] | None] = []
+        for cell in cells:
+            row = rows.get(cell)
+            results.append(
+                None
+                if row is None
+                else {"risk_score": row.risk_score, "uncertainty": row.uncertainty}
+            )
+        found = sum(result is not None for result in results)
+        self.hits += found
+        self.misses += len(results) - found
+        return results
+
+
+class NowcastGenerator:
+    """
+    Daily batch job filling the nowcast table.
+
+    Regions are split into square blocks of at most ``batch_size`` cells.
+    Each block is harmonized over its own extent only and then predicted for
+    every model type in one batch. Cells shared by overlapping regions are
+    predicted once.
+    """
+
+    def __init__(
+        self,
+        prediction_service: "PredictionService",
+        settings: NowcastSettings | None = None,
+        session_factory: SessionFactory = get_session,
+    ) -> None:
+        self.prediction_service = prediction_service
+        self.settings = settings or NowcastSettings()
+        self.session_factory = session_factory
+
+    async def generate(
+        self,
+        target_date: date,
+        model_types: list[Any],
+        regions: dict[str, tuple[float, float, float, float]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Predict and store nowcasts of all grid cells of the regions for a date.
+
+        Args:
+            target_date: Day to nowcast
+            model_types: Models to run (``ModelType`` values)
+            regions: Named (west, south, east, north) regions, defaults to settings
+
+        Returns:
+            Summary with written and failed row counts and rows pruned by
+            the retention window
+        """
+        regions = regions or self.settings.regions
+        cell_size = self.settings.cell_size_degrees
+        side = max(math.isqrt(self.settings.batch_size), 1)
+        summary: dict[str, Any] = {
+            "date": target_date.isoformat(),
+            "cells": 0,
+            "written": 0,
+            "failed": 0,
+            "deleted": 0,
+        }
+
+        seen: set[tuple[int, int]] = set()
+        for region_name, bounds in regions.items():
+            logger.info(
+                f"Nowcasting {region_name} in {cell_size} degree cells on {target_date}"
+            )
+            for block in _cell_blocks(bounds, cell_size, side):
+                cells = [cell for cell in block if cell not in seen]
+                seen.update(cells)
+                if not cells:
+                    continue
+                summary["cells"] += len(cells)
+                coordinates = [_cell_centre(row, col, cell_size) for row, col in cells]
+
+                try:
+                    async with self.session_factory() as session:
+                        cell_ids = await GridCellRepository(session).resolve_cell_ids(
+                            coordinates
+                        )
+                    lats = [lat for lat, _ in coordinates]
+                    lons = [lon for _, lon in coordinates]
+                    harmonized = await self.prediction_service.harmonize_region(
+                        (
+                            min(lons) - cell_size / 2,
+                            min(lats) - cell_size / 2,  # west, south
+                            max(lons) + cell_size / 2,
+                            max(lats) + cell_size / 2,  # east, north
+                        ),
+                        target_date,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to harmonize {len(cells)} cells in {region_name}: {e}"
+                    )
+                    summary["failed"] += len(cells) * len(model_types)
+                    continue
+
+                for model_type in model_types:
+                    try:
+                        summary["written"] += await self._predict_block(
+                            target_date, model_type, coordinates, cell_ids, harmonized
+                        )
+                    except Exception as e:
+                        model_name = getattr(model_type, "value", str(model_type))
+                        logger.warning(
+                            f"Failed to nowcast {len(cells)} cells in {region_name} "
+                            f"with {model_name}: {e}"
+                        )
+                        summary["failed"] += len(cells)
+
+        cutoff = target_date - timedelta(days=self.settings.retention_days)
+        async with self.session_factory() as session:
+            summary["deleted"] = await RiskNowcastRepository(session).delete_before(cutoff)
+
+        logger.info(
+            f"Nowcasts for {target_date}: {summary['written']} written, "
+            f"{summary['failed']} failed, {summary['deleted']} expired rows deleted"
+        )
+        return summary
+
+    async def _predict_block(
+        self,
+        target_date: date,
+        model_type: Any,
+        coordinates: list[tuple[float, float]],
+        cell_ids: dict[tuple[float, float], int],
+        harmonized: Any,
+    ) -> int:
+        """Predict and store one block of cells; returns rows written."""
+        model_name = getattr(model_type, "value", str(model_type))
+        model_manager = self.prediction_service.model_manager
+        version = model_manager.active_version(model_type)
+        predictions = await self.prediction_service.predict_batch(
+            coordinates=coordinates,
+            target_date=target_date,
+            model_type=model_type,
+            batch_size=self.settings.batch_size,
+            harmonized=harmonized,
+        )
+        # Rows are served by version, so a swap mid-run must not
+        # label one version's predictions with another's
+        if model_manager.active_version(model_type) != version:
+            raise RuntimeError(f"{model_name} was swapped during the run")
+
+        rows = [
+            {
+                "target_date": target_date,
+                "model_type": model_name,
+                "grid_cell_id": cell_ids[coordinate],
+                "risk_score": prediction["risk_score"],
+                "uncertainty": prediction["uncertainty"],
+                "model_version": version,
+            }
+            for coordinate, prediction in zip(coordinates, predictions, strict=True)
+        ]
+        async with self.session_factory() as session:
+            return await RiskNowcastRepository(session).bulk_upsert(rows)
@@ -0,0 +1,235 @@
+"""
+Prediction Result Cache.
+
+Dashboards, alert evaluation and mobile clients ask for the same location
+and day over and over. Coordinates are snapped to the centre of a grid
+cell, and each result is cached under (cell, target date, horizon, model
+type, model version). Lookups try an in-process LRU first, then an
+optional Redis tier that replicas share.
+
+Keys also carry a data generation. ``invalidate_data`` bumps the
+generation after new data is ingested, so older entries are no longer
+found and expire through their TTL. With Redis, the generation is a Redis
+counter; without it, the ingestion ``DataVersion`` row in the database.
+Either way every process re-reads it at most every
+``generation_refresh_seconds``, so API replicas stop serving results of
+older data shortly after ingestion in another process. A new model
+version gets new keys without any invalidation step.
+"""
+
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import date, datetime
+from typing import Any
+
+import redis.asyncio as redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import PredictionCacheSettings, settings
+from ..database.repositories import DataVersionRepository
+from ..monitoring.metrics import MLModelMetrics
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "malaria:prediction:"
+GENERATION_KEY = f"{KEY_PREFIX}generation"
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+class PredictionCache:
+    """Two-tier cache of prediction results keyed by grid cell."""
+
+    def __init__(
+        self,
+        config: PredictionCacheSettings | None = None,
+        redis_client: redis.Redis | None = None,
+        metrics: MLModelMetrics | None = None,
+        session_factory: SessionFactory | None = None,
+    ) -> None:
+        """
+        Args:
+            config: Cache settings, the application settings when omitted
+            redis_client: Client for the shared tier; created from the Redis
+                settings when omitted and ``config.use_redis`` is set
+            metrics: Receives hit and miss counts
+            session_factory: Opens a database session for the ingestion
+                data version. Without it and without Redis the generation
+                only changes in this process
+        """
+        self.config = config or settings.prediction_cache
+        self.metrics = metrics
+        self.session_factory = session_factory
+        self._redis = redis_client
+        self._local: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._generation = 0
+        self._generation_checked = -math.inf
+        self.hits = {"memory": 0, "redis": 0}
+        self.misses = 0
+
+    @property
+    def redis_client(self) -> redis.Redis | None:
+        if self._redis is None and self.config.use_redis:
+            self._redis = redis.from_url(
+                settings.get_redis_url(db=self.config.redis_db), decode_responses=True
+            )
+        return self._redis
+
+    def _cell(self, latitude: float, longitude: float) -> tuple[int, int]:
+        size = self.config.cell_size_degrees
+        return math.floor(latitude / size), math.floor(longitude / size)
+
+    def snap(self, latitude: float, longitude: float) -> tuple[float, float]:
+        """Centre of the grid cell containing a coordinate."""
+        row, col = self._cell(latitude, longitude)
+        size = self.config.cell_size_degrees
+        return round((row + 0.5) * size, 6), round((col + 0.5) * size, 6)
+
+    async def key(
+        self,
+        latitude: float,
+        longitude: float,
+        target_date: date | datetime | str,
+        prediction_horizon: int,
+        model_type: str,
+        model_version: str,
+    ) -> str:
+        """Cache key of a prediction; coordinates are snapped to their cell."""
+        row, col = self._cell(latitude, longitude)
+        day = target_date.isoformat()[:10] if hasattr(target_date, "isoformat") else str(target_date)
+        generation = await self.generation()
+        return (
+            f"{KEY_PREFIX}g{generation}:{model_type}:{model_version}:{day}:"
+            f"h{prediction_horizon}:{self.config.cell_size_degrees}:{row}:{col}"
+        )
+
+    async def get(self, key: str, model_type: str) -> dict[str, Any] | None:
+        """Cached result, or None on a miss."""
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(key)
+                self._record(model_type, "memory")
+                return dict(value)
+            del self._local[key]
+
+        client = self.redis_client
+        if client is not None:
+            try:
+                cached = await client.get(key)
+            except Exception as e:
+                logger.warning(f"Prediction cache read failed: {e}")
+                cached = None
+            if cached is not None:
+                value = json.loads(cached)
+                self._store_local(key, value)
+                self._record(model_type, "redis")
+                return dict(value)
+
+        self._record(model_type, None)
+        return None
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """Cache a result in both tiers."""
+        self._store_local(key, value)
+        client = self.redis_client
+        if client is not None:
+            try:
+                await client.set(key, json.dumps(value), ex=self.config.ttl)
+            except Exception as e:
+                logger.warning(f"Prediction cache write failed: {e}")
+
+    async def generation(self) -> int:
+        """Current data generation, re-read from Redis or the database when due."""
+        client = self.redis_client
+        now = time.monotonic()
+        if now - self._generation_checked < self.config.generation_refresh_seconds:
+            return self._generation
+
+        if client is not None:
+            self._generation_checked = now
+            try:
+                self._set_generation(int(await client.get(GENERATION_KEY) or 0))
+            except Exception as e:
+                logger.warning(f"Prediction cache generation read failed: {e}")
+        elif self.session_factory is not None:
+            self._generation_checked = now
+            try:
+                async with self.session_factory() as session:
+                    self._set_generation(await DataVersionRepository(session).get())
+            except Exception as e:
+                logger.warning(f"Prediction cache generation read failed: {e}")
+        return self._generation
+
+    async def invalidate_data(self) -> int:
+        """
+        Invalidate all cached predictions after new data is ingested.
+
+        Bumps the ingestion data version in the database (when a session
+        factory is set) and the Redis generation (when Redis is used).
+
+        Returns:
+            The new data generation
+        """
+        client = self.redis_client
+        generation = self._generation + 1
+        if self.session_factory is not None:
+            try:
+                async with self.session_factory() as session:
+                    generation = await DataVersionRepository(session).bump()
+            except Exception as e:
+                logger.warning(f"Data version update failed: {e}")
+        if client is not None:
+            try:
+                generation = int(await client.incr(GENERATION_KEY))
+            except Exception as e:
+                logger.warning(f"Prediction cache generation update failed: {e}")
+        self._set_generation(generation)
+        logger.info(f"Prediction cache invalidated (data generation {generation})")
+        return generation
+
+    def stats(self) -> dict[str, Any]:
+        """Hit counts per tier and the overall hit rate."""
+        hits = sum(self.hits.values())
+        total = hits + self.misses
+        return {
+            "hits": dict(self.hits),
+            "misses": self.misses,
+            "hit_rate": hits / total if total else 0.0,
+            "entries": len(self._local),
+            "generation": self._generation,
+        }
+
+    def _set_generation(self, generation: int) -> None:
+        if generation != self._generation:
+            # Entries of other generations can no longer be looked up
+            self._local.clear()
+            self._generation = generation
+
+    def _store_local(self, key: str, value: dict[str, Any]) -> None:
+        if not self.config.max_entries:
+            return
+        self._local[key] = (time.monotonic() + self.config.ttl, dict(value))
+        self._local.move_to_end(key)
+        while len(self._local) > self.config.max_entries:
+            self._local.popitem(last=False)
+
+    def _record(self, model_type: str, tier: str | None) -> None:
+        if tier is None:
+            self.misses += 1
+        else:
+            self.hits[tier] += 1
+        if self.metrics is not None:
+            self.metrics.record_prediction_cache(model_type, tier, self.stats()["hit_rate"])
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
@@ -6,25 +6,30 @@ for multiple export formats, template processing, chart rendering, and automated
 scheduling. Integrates with existing analytics infrastructure for data access.
 """
 
+import asyncio
 import base64
+import csv
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import tempfile
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
-from io import BytesIO, StringIO
+from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import matplotlib.pyplot as plt
 import pandas as pd
 import plotly.graph_objects as go
 from jinja2 import Environment, FileSystemLoader, Template
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.drawing.image import Image
 from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils.dataframe import dataframe_to_rows
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
@@ -36,18 +41,24 @@ from reportlab.platypus import (
     SimpleDocTemplate,
     Spacer,
 )
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..database.models import (
+    DataVersion,
     ERA5DataPoint,
     MalariaRiskIndex,
     Report,
     ReportTemplate,
 )
+from ..database.repositories import INGESTION_VERSION, RISK_EDIT_VERSION
 from .data_export import DataExportService
 
 logger = logging.getLogger(__name__)
 
+# Rows buffered per write when streaming CSV exports to disk
+CSV_WRITE_BATCH = 5000
+
 
 class ChartRenderer:
     """High-quality chart rendering for multiple export formats."""
@@ -443,6 +454,55 @@ class ReportExporter:
         self.temp_dir = temp_dir or tempfile.gettempdir()
         self.chart_renderer = ChartRenderer()
 
+    def write_export(
+        self,
+        format_name: str,
+        file_path: str | Path,
+        template_content: str,
+        data: dict[str, Any],
+        charts: dict[str, Any],
+        metadata: dict[str, Any]
+    ) -> int:
+        """
+        Write one export format straight to disk.
+
+        Synchronous and self-contained so it can run in a worker process.
+        The file is written under a temporary name and moved into place, so
+        readers never see a partial export.
+
+        Args:
+            format_name: Export format ("pdf", "excel", "csv", "pptx")
+            file_path: Destination path
+            template_content: Processed HTML template content
+            data: Report data
+            charts: Chart data
+            metadata: Report metadata
+
+        Returns:
+            Size of the written file in bytes
+        """
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        try:
+            if format_name == "pdf":
+                tmp_path.write_bytes(self._build_pdf(template_content, charts, metadata))
+            elif format_name == "excel":
+                self._write_excel(tmp_path, data, charts, metadata)
+            elif format_name == "csv":
+                self._write_csv(tmp_path, data, metadata)
+            elif format_name == "pptx":
+                tmp_path.write_bytes(self._build_powerpoint(template_content, charts, metadata))
+            else:
+                raise ValueError(f"Unsupported export format: {format_name}")
+
+            os.replace(tmp_path, path)
+            return path.stat().st_size
+
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
     async def export_to_pdf(
         self,
         template_content: str,
@@ -461,63 +521,59 @@ class ReportExporter:
             PDF file as bytes
         """
         try:
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4)
-            story = []
-            styles = getSampleStyleSheet()
-
-            # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Title'],
-                fontSize=18,
-                spaceAfter=30,
-                alignment=1  # Center alignment
-            )
-            story.append(Paragraph(metadata.get('title', 'Report'), title_style))
-
-            # Metadata
-            meta_info = f"Generated: {metadata.get('generated_at', datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC'))}"
-            story.append(Paragraph(meta_info, styles['Normal']))
-            story.append(Spacer(1, 20))
-
-            # Process template content (simplified HTML to PDF conversion)
-            content_paragraphs = template_content.split('\n')
-            for para in content_paragraphs:
-                if para.strip():
-                    story.append(Paragraph(para.strip(), styles['Normal']))
-
-            # Add charts
-            for chart_id, chart_data in charts.items():
-                if 'png' in chart_data:
-                    try:
-                        # Decode base64 image
-                        image_data = base64.b64decode(chart_data['png'])
-
-                        # Create temporary file for image
-                        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                            temp_file.write(image_data)
-                            temp_file.flush()
-
-                            # Add image to PDF
-                            img = RLImage(temp_file.name, width=6*inch, height=4*inch)
-                            story.append(img)
-                            story.append(Spacer(1, 20))
-
-                        # Clean up temporary file
-                        os.unlink(temp_file.name)
-
-                    except Exception as e:
-                        logger.error(f"Error adding chart {chart_id} to PDF: {str(e)}")
-
-            doc.build(story)
-            buffer.seek(0)
-            return buffer.getvalue()
+            return self._build_pdf(template_content, charts, metadata)
 
         except Exception as e:
             logger.error(f"Error exporting to PDF: {str(e)}")
             raise
 
+    def _build_pdf(
+        self,
+        template_content: str,
+        charts: dict[str, Any],
+        metadata: dict[str, Any]
+    ) -> bytes:
+        """Lay out the PDF document in memory."""
+        buffer = BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=A4)
+        story = []
+        styles = getSampleStyleSheet()
+
+        # Title
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Title'],
+            fontSize=18,
+            spaceAfter=30,
+            alignment=1  # Center alignment
+        )
+        story.append(Paragraph(metadata.get('title', 'Report'), title_style))
+
+        # Metadata
+        meta_info = f"Generated: {metadata.get('generated_at', datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC'))}"
+        story.append(Paragraph(meta_info, styles['Normal']))
+        story.append(Spacer(1, 20))
+
+        # Process template content (simplified HTML to PDF conversion)
+        content_paragraphs = template_content.split('\n')
+        for para in content_paragraphs:
+            if para.strip():
+                story.append(Paragraph(para.strip(), styles['Normal']))
+
+        # Add charts
+        for chart_id, chart_data in charts.items():
+            if 'png' in chart_data:
+                try:
+                    image_data = BytesIO(base64.b64decode(chart_data['png']))
+                    story.append(RLImage(image_data, width=6*inch, height=4*inch))
+                    story.append(Spacer(1, 20))
+
+                except Exception as e:
+                    logger.error(f"Error adding chart {chart_id} to PDF: {str(e)}")
+
+        doc.build(story)
+        return buffer.getvalue()
+
     async def export_to_excel(
         self,
         data: dict[str, Any],
@@ -536,69 +592,82 @@ class ReportExporter:
             Excel file as bytes
         """
         try:
-            buffer = BytesIO()
-            workbook = Workbook()
-
-            # Remove default sheet
-            workbook.remove(workbook.active)
-
-            # Summary sheet
-            summary_sheet = workbook.create_sheet("Summary")
-            summary_sheet['A1'] = metadata.get('title', 'Report')
-            summary_sheet['A1'].font = Font(size=16, bold=True)
-            summary_sheet['A3'] = f"Generated: {metadata.get('generated_at', datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC'))}"
+            with tempfile.TemporaryDirectory(dir=self.temp_dir) as temp_dir:
+                path = Path(temp_dir) / "report.xlsx"
+                self._write_excel(path, data, charts, metadata)
+                return path.read_bytes()
 
-            # Data sheets
-            for data_name, dataset in data.items():
-                if isinstance(dataset, pd.DataFrame):
-                    sheet = workbook.create_sheet(data_name[:31])  # Excel sheet name limit
-
-                    # Add data
-                    for r in dataframe_to_rows(dataset, index=False, header=True):
-                        sheet.append(r)
-
-                    # Format header
-                    for cell in sheet[1]:
-                        cell.font = Font(bold=True)
-                        cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-                        cell.alignment = Alignment(horizontal="center")
-
-            # Charts sheet
-            if charts:
-                chart_sheet = workbook.create_sheet("Charts")
-                row = 1
-
-                for chart_id, chart_data in charts.items():
-                    chart_sheet[f'A{row}'] = f"Chart: {chart_id}"
-                    chart_sheet[f'A{row}'].font = Font(bold=True)
-
-                    # Add chart as image if PNG data available
-                    if 'png' in chart_data:
-                        try:
-                            image_data = base64.b64decode(chart_data['png'])
-                            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                                temp_file.write(image_data)
-                                temp_file.flush()
+        except Exception as e:
+            logger.error(f"Error exporting to Excel: {str(e)}")
+            raise
 
-                                img = Image(temp_file.name)
-                                img.width = 600
-                                img.height = 400
-                                chart_sheet.add_image(img, f'A{row + 1}')
+    def _write_excel(
+        self,
+        path: Path,
+        data: dict[str, Any],
+        charts: dict[str, Any],
+        metadata: dict[str, Any]
+    ) -> None:
+        """Stream the workbook to disk row by row using a write-only workbook."""
+        workbook = Workbook(write_only=True)
+
+        header_font = Font(bold=True)
+        header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        header_alignment = Alignment(horizontal="center")
+
+        def styled(sheet: Any, value: Any, font: Font, **styles: Any) -> WriteOnlyCell:
+            cell = WriteOnlyCell(sheet, value=value)
+            cell.font = font
+            for name, style in styles.items():
+                setattr(cell, name, style)
+            return cell
+
+        # Summary sheet
+        summary_sheet = workbook.create_sheet("Summary")
+        summary_sheet.append([styled(summary_sheet, metadata.get('title', 'Report'), Font(size=16, bold=True))])
+        summary_sheet.append([])
+        summary_sheet.append([f"Generated: {metadata.get('generated_at', datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC'))}"])
+
+        # Data sheets
+        for data_name, dataset in data.items():
+            columns, rows = _dataset_rows(dataset)
+            if not columns:
+                continue
+
+            sheet = workbook.create_sheet(data_name[:31])  # Excel sheet name limit
+            sheet.append([
+                styled(sheet, column, header_font, fill=header_fill, alignment=header_alignment)
+                for column in columns
+            ])
+            for row in rows:
+                sheet.append(row)
+
+        # Charts sheet
+        if charts:
+            chart_sheet = workbook.create_sheet("Charts")
+            row = 1
 
-                                os.unlink(temp_file.name)
+            for chart_id, chart_data in charts.items():
+                chart_sheet.append([styled(chart_sheet, f"Chart: {chart_id}", header_font)])
+                chart_sheet.append([])
 
-                        except Exception as e:
-                            logger.error(f"Error adding chart {chart_id} to Excel: {str(e)}")
+                # Add chart as image if PNG data available
+                if 'png' in chart_data:
+                    try:
+                        img = Image(BytesIO(base64.b64decode(chart_data['png'])))
+                        img.width = 600
+                        img.height = 400
+                        chart_sheet.add_image(img, f'A{row + 1}')
 
-                    row += 25  # Space for next chart
+                    except Exception as e:
+                        logger.error(f"Error adding chart {chart_id} to Excel: {str(e)}")
 
-            workbook.save(buffer)
-            buffer.seek(0)
-            return buffer.getvalue()
+                # Space for next chart
+                for _ in range(23):
+                    chart_sheet.append([])
+                row += 25
 
-        except Exception as e:
-            logger.error(f"Error exporting to Excel: {str(e)}")
-            raise
+        workbook.save(path)
 
     async def export_to_csv(
         self,
@@ -616,32 +685,41 @@ class ReportExporter:
             CSV file as bytes
         """
         try:
-            buffer = StringIO()
+            with tempfile.TemporaryDirectory(dir=self.temp_dir) as temp_dir:
+                path = Path(temp_dir) / "report.csv"
+                self._write_csv(path, data, metadata)
+                return path.read_bytes()
+
+        except Exception as e:
+            logger.error(f"Error exporting to CSV: {str(e)}")
+            raise
 
+    def _write_csv(self, path: Path, data: dict[str, Any], metadata: dict[str, Any]) -> None:
+        """Stream report data sections to a CSV file in row batches."""
+        with open(path, "w", newline="", encoding="utf-8") as handle:
             # Write metadata header
-            buffer.write(f"# {metadata.get('title', 'Report')}\n")
-            buffer.write(f"# Generated: {metadata.get('generated_at', datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC'))}\n")
-            buffer.write("\n")
+            handle.write(f"# {metadata.get('title', 'Report')}\n")
+            handle.write(f"# Generated: {metadata.get('generated_at', datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC'))}\n")
+            handle.write("\n")
+
+            writer = csv.writer(handle, lineterminator="\n")
 
             # Write data sections
             for data_name, dataset in data.items():
-                buffer.write(f"# {data_name}\n")
+                handle.write(f"# {data_name}\n")
 
-                if isinstance(dataset, pd.DataFrame):
-                    dataset.to_csv(buffer, index=False)
-                elif isinstance(dataset, list):
-                    if dataset and isinstance(dataset[0], dict):
-                        df = pd.DataFrame(dataset)
-                        df.to_csv(buffer, index=False)
+                columns, rows = _dataset_rows(dataset)
+                if columns:
+                    writer.writerow(columns)
+                    batch: list[list[Any]] = []
+                    for row in rows:
+                        batch.append(row)
+                        if len(batch) >= CSV_WRITE_BATCH:
+                            writer.writerows(batch)
+                            batch.clear()
+                    writer.writerows(batch)
 
-                buffer.write("\n")
-
-            content = buffer.getvalue()
-            return content.encode('utf-8')
-
-        except Exception as e:
-            logger.error(f"Error exporting to CSV: {str(e)}")
-            raise
+                handle.write("\n")
 
     async def export_to_powerpoint(
         self,
@@ -661,31 +739,197 @@ class ReportExporter:
             PowerPoint file as bytes
         """
         try:
-            # Note: This would require python-pptx library
-            # For now, return a placeholder
-            logger.warning("PowerPoint export not fully implemented - requires python-pptx")
-            return b"PowerPoint export placeholder"
+            return self._build_powerpoint(template_content, charts, metadata)
 
         except Exception as e:
             logger.error(f"Error exporting to PowerPoint: {str(e)}")
             raise
 
+    def _build_powerpoint(
+        self,
+        template_content: str,
+        charts: dict[str, Any],
+        metadata: dict[str, Any]
+    ) -> bytes:
+        """Build the PowerPoint document."""
+        # Note: This would require python-pptx library
+        # For now, return a placeholder
+        logger.warning("PowerPoint export not fully implemented - requires python-pptx")
+        return b"PowerPoint export placeholder"
+
+
+def _dataset_rows(dataset: Any) -> tuple[list[str], Any]:
+    """
+    Return (columns, row iterator) for a report data section.
+
+    Supports DataFrames and lists of dicts; rows are produced lazily so
+    exports can stream them without building an intermediate frame.
+    """
+    if isinstance(dataset, pd.DataFrame):
+        return [str(column) for column in dataset.columns], (
+            list(row) for row in dataset.itertuples(index=False, name=None)
+        )
+    if isinstance(dataset, list) and dataset and isinstance(dataset[0], dict):
+        columns = list(dataset[0].keys())
+        return columns, ([record.get(column) for column in columns] for record in dataset)
+    return [], iter(())
+
+
+class ReportSectionCache:
+    """
+    Disk cache for computed report data sections and rendered charts.
+
+    Entries are JSON files keyed by a hash of (template version, section
+    parameters, data version), so a scheduled report re-run against
+    unchanged data reuses its sections and chart images instead of querying
+    and rendering them again. Keys change whenever any input changes, so
+    entries never need invalidating; the oldest are pruned past
+    ``max_entries``.
+    """
+
+    def __init__(self, directory: str | Path = "exports/reports/cache", max_entries: int = 512) -> None:
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash JSON-serializable key parts into a stable cache key."""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None on a miss."""
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, encoding="utf-8") as handle:
+                value = json.load(handle)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under ``key``."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{key}.json"
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(value, handle, default=str)
+            os.replace(tmp_path, path)
+            self._prune()
+        except OSError as e:
+            logger.warning(f"Failed to cache report section {key}: {e}")
+
+    def _prune(self) -> None:
+        entries = sorted(self.directory.glob("*.json"), key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[: max(0, len(entries) - self.max_entries)]:
+            entry.unlink(missing_ok=True)
+
+
+def _render_section_charts(section: str, records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Render the charts derived from one data section (runs in a worker process)."""
+    chart_renderer = ChartRenderer()
+    charts: dict[str, Any] = {}
+
+    df = pd.DataFrame(records)
+    if df.empty:
+        return charts
+    df['date'] = pd.to_datetime(df['date'])
+
+    # Prediction trends chart
+    if section == 'predictions':
+        # Risk level distribution
+        charts['risk_distribution'] = chart_renderer.create_distribution_chart(
+            df, 'risk_level', 'Risk Level Distribution'
+        )
+
+        # Confidence over time
+        if len(df) > 1:
+            charts['confidence_trend'] = chart_renderer.create_time_series_chart(
+                df, 'date', ['confidence'], 'Prediction Confidence Over Time'
+            )
+
+    # Climate trends
+    elif section == 'climate':
+        charts['temperature_trend'] = chart_renderer.create_time_series_chart(
+            df, 'date', ['temperature'], 'Temperature Trends'
+        )
+
+        charts['precipitation_trend'] = chart_renderer.create_time_series_chart(
+            df, 'date', ['precipitation'], 'Precipitation Trends'
+        )
+
+    return charts
+
+
+def _write_export_file(
+    format_name: str,
+    file_path: str,
+    template_content: str,
+    data: dict[str, Any],
+    charts: dict[str, Any],
+    metadata: dict[str, Any]
+) -> int:
+    """Write one export format to disk (runs in a worker process)."""
+    return ReportExporter().write_export(
+        format_name, file_path, template_content, data, charts, metadata
+    )
+
+
+_export_pool: ProcessPoolExecutor | None = None
+
+
+def get_export_pool(max_workers: int | None = None) -> Executor:
+    """
+    Return the process pool shared by report generators.
+
+    Export formats and chart rendering are CPU-bound (matplotlib, plotly,
+    openpyxl, reportlab), so they run in worker processes rather than on the
+    event loop. Workers are spawned rather than forked so they don't inherit
+    the event loop, database connections or model threads of the parent.
+    """
+    global _export_pool
+    if _export_pool is None:
+        _export_pool = ProcessPoolExecutor(
+            max_workers=max_workers or min(4, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _export_pool
+
 
 class ReportGenerator:
     """Main report generation engine with comprehensive functionality."""
 
-    def __init__(self, db_session: Session) -> None:
+    def __init__(
+        self,
+        db_session: Session,
+        executor: Executor | None = None,
+        section_cache: ReportSectionCache | None = None,
+        exports_dir: str | Path = "exports/reports"
+    ) -> None:
         """
         Initialize report generator.
 
         Args:
             db_session: Database session for data access
+            executor: Executor for CPU-bound chart rendering and exports,
+                defaults to the shared process pool
+            section_cache: Cache for data sections and charts
+            exports_dir: Directory export files are written to
         """
         self.db = db_session
         self.data_export = DataExportService(db_session)  # type: ignore[arg-type]
         self.chart_renderer = ChartRenderer()
         self.template_processor = TemplateProcessor()
         self.exporter = ReportExporter()
+        self.executor = executor
+        self.section_cache = section_cache or ReportSectionCache(Path(exports_dir) / "cache")
+        self.exports_dir = Path(exports_dir)
 
     async def generate_report(
         self,
@@ -697,6 +941,12 @@ class ReportGenerator:
         """
         Generate comprehensive report with multiple export formats.
 
+        Data sections and their charts are reused from the section cache when
+        the template, parameters and underlying data are unchanged. Export
+        formats are written to disk concurrently on the executor, and the
+        blocking session calls run in a worker thread to keep the event loop
+        free.
+
         Args:
             template_id: ID of report template to use
             report_config: Custom report configuration
@@ -708,6 +958,7 @@ class ReportGenerator:
         """
         start_time = time.time()
         export_formats = export_formats or ["pdf", "excel", "csv"]
+        report_config = report_config or {}
 
         try:
             logger.info(f"Starting report generation for user {user_id}")
@@ -715,15 +966,18 @@ class ReportGenerator:
             # Load template if specified
             template = None
             if template_id:
-                template = self.db.query(ReportTemplate).filter(ReportTemplate.id == template_id).first()
+                template = await asyncio.to_thread(self.db.get, ReportTemplate, template_id)
                 if not template:
                     raise ValueError(f"Template {template_id} not found")
 
-            # Generate report data
-            report_data = await self._generate_report_data(report_config or {})
+            # Generate report data, reusing unchanged sections
+            section_keys = await asyncio.to_thread(
+                self._section_cache_keys, report_config, template
+            )
+            report_data = await self._generate_report_data(report_config, section_keys)
 
             # Generate charts
-            charts = await self._generate_charts(report_data, template)
+            charts = await self._generate_charts(report_data, template, section_keys)
 
             # Process template
             template_config = template.layout_configuration if template else self._get_default_template()
@@ -735,9 +989,9 @@ class ReportGenerator:
 
             # Create report record
             report = Report(
-                title=report_config.get('title', 'Generated Report'),  # type: ignore[union-attr]
-                description=report_config.get('description'),  # type: ignore[union-attr]
-                report_type=report_config.get('type', 'custom'),  # type: ignore[union-attr]
+                title=report_config.get('title', 'Generated Report'),
+                description=report_config.get('description'),
+                report_type=report_config.get('type', 'custom'),
                 template_id=template_id,
                 generated_by=user_id,
                 report_data=report_data,
@@ -746,65 +1000,74 @@ class ReportGenerator:
                 export_formats=export_formats,
                 status="generating"
             )
-            self.db.add(report)
-            self.db.commit()
+            await asyncio.to_thread(self._save, report)
 
             # Generate exports
-            export_results = {}
+            export_results: dict[str, dict[str, Any]] = {}
             file_paths = {}
             file_sizes = {}
 
             metadata = {
                 'title': report.title,
-                'generated_at': report.generated_at.isoformat(),
+                'generated_at': report.generated_at.isoformat() if report.generated_at else datetime.utcnow().isoformat(),
                 'user_id': user_id,
                 'report_id': report.id
             }
 
+            supported_formats = []
             for format_name in export_formats:
-                try:
-                    logger.info(f"Generating {format_name} export")
-
-                    if format_name == "pdf":
-                        content = await self.exporter.export_to_pdf(
-                            template_content['html'], charts, metadata
-                        )
-                    elif format_name == "excel":
-                        content = await self.exporter.export_to_excel(
-                            report_data, charts, metadata
-                        )
-                    elif format_name == "csv":
-                        content = await self.exporter.export_to_csv(
-                            report_data, metadata
-                        )
-                    elif format_name == "pptx":
-                        content = await self.exporter.export_to_powerpoint(
-                            template_content['html'], charts, metadata
-                        )
-                    else:
-                        logger.warning(f"Unsupported export format: {format_name}")
-                        continue
-
-                    # Save file
-                    file_path = await self._save_export_file(int(report.id), format_name, content)
-                    file_paths[format_name] = file_path
-                    file_sizes[format_name] = len(content)
-                    export_results[format_name] = {
-                        'status': 'completed',
-                        'path': file_path,
-                        'generated_at': datetime.utcnow().isoformat(),
-                        'size_bytes': len(content)
-                    }
-
-                    logger.info(f"Generated {format_name} export: {len(content)} bytes")
+                if format_name in ("pdf", "excel", "csv", "pptx"):
+                    supported_formats.append(format_name)
+                else:
+                    logger.warning(f"Unsupported export format: {format_name}")
+
+            logger.info(f"Generating exports in parallel: {', '.join(supported_formats)}")
+            loop = asyncio.get_running_loop()
+            executor = self.executor or get_export_pool()
+            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+
+            target_paths = {
+                format_name: str(self.exports_dir / f"report_{report.id}_{timestamp}.{format_name}")
+                for format_name in supported_formats
+            }
+            outcomes = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor,
+                        _write_export_file,
+                        format_name,
+                        target_paths[format_name],
+                        template_content.get('html', ''),
+                        report_data,
+                        charts,
+                        metadata,
+                    )
+                    for format_name in supported_formats
+                ),
+                return_exceptions=True,
+            )
 
-                except Exception as e:
-                    logger.error(f"Error generating {format_name} export: {str(e)}")
+            for format_name, outcome in zip(supported_formats, outcomes, strict=True):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Error generating {format_name} export: {str(outcome)}")
                     export_results[format_name] = {
                         'status': 'failed',
-                        'error': str(e),
+                        'error': str(outcome),
                         'generated_at': datetime.utcnow().isoformat()
                     }
+                    continue
+
+                file_path = target_paths[format_name]
+                file_paths[format_name] = file_path
+                file_sizes[format_name] = outcome
+                export_results[format_name] = {
+                    'status': 'completed',
+                    'path': file_path,
+                    'generated_at': datetime.utcnow().isoformat(),
+                    'size_bytes': outcome
+                }
+
+                logger.info(f"Generated {format_name} export: {outcome} bytes")
 
             # Update report with results
             generation_time = time.time() - start_time
@@ -815,9 +1078,12 @@ class ReportGenerator:
             report.generation_time_seconds = generation_time  # type: ignore[assignment]
             report.data_points_count = self._count_data_points(report_data)  # type: ignore[assignment]
 
-            self.db.commit()
+            await asyncio.to_thread(self._save, report)
 
-            logger.info(f"Report generation completed in {generation_time:.2f} seconds")
+            logger.info(
+                f"Report generation completed in {generation_time:.2f} seconds "
+                f"(section cache: {self.section_cache.hits} hits, {self.section_cache.misses} misses)"
+            )
 
             return {
                 'report_id': report.id,
@@ -835,94 +1101,175 @@ class ReportGenerator:
             if 'report' in locals():
                 report.status = "failed"  # type: ignore[assignment]
                 report.error_message = str(e)  # type: ignore[assignment]
-                self.db.commit()
+                await asyncio.to_thread(self._save, report)
 
             raise
 
-    async def _generate_report_data(self, config: dict[str, Any]) -> dict[str, Any]:
-        """Generate report data based on configuration."""
-        data = {}
+    def _save(self, report: Report) -> None:
+        """Commit a report and reload it, so reading it later needs no query."""
+        self.db.add(report)
+        self.db.commit()
+        self.db.refresh(report)
+
+    def _data_version(self, name: str) -> int:
+        """Current value of a ``DataVersion`` counter, 0 before its first bump."""
+        row = self.db.get(DataVersion, name)
+        return cast(int, row.version) if row is not None else 0
+
+    def _section_cache_keys(
+        self,
+        config: dict[str, Any],
+        template: ReportTemplate | None
+    ) -> dict[str, str]:
+        """
+        Build cache keys for the data sections a report needs.
+
+        Each key combines the template version, the parameters that shape
+        the section and data versions that change whenever its rows do: the
+        ``DataVersion`` counters bumped by ingestion and by risk assessment
+        edits, and the newest risk assessment id. These are primary key
+        lookups, so building keys costs far less than the sections.
+        """
+        template_version = (
+            [template.id, template.last_modified_at or template.created_at]
+            if template is not None
+            else "default"
+        )
+        ingestion_version = self._data_version(INGESTION_VERSION)
+        keys = {}
 
-        # Prediction accuracy data
         if config.get('include_prediction_accuracy', True):
             start_date = config.get('start_date')
             end_date = config.get('end_date')
+            latest_assessment = self.db.query(func.max(MalariaRiskIndex.id)).scalar()
 
-            query = self.db.query(MalariaRiskIndex)
-            if start_date:
-                query = query.filter(MalariaRiskIndex.assessment_date >= start_date)
-            if end_date:
-                query = query.filter(MalariaRiskIndex.assessment_date <= end_date)
-            predictions = query.limit(1000).all()
-
-            data['predictions'] = [
-                {
-                    'date': p.assessment_date.isoformat(),
-                    'location': p.location_name,
-                    'risk_level': p.risk_level,
-                    'confidence': p.confidence_score,
-                    'model_type': p.model_type
-                }
-                for p in predictions
-            ]
+            keys['predictions'] = self.section_cache.make_key(
+                'predictions',
+                template_version,
+                [start_date, end_date],
+                [ingestion_version, self._data_version(RISK_EDIT_VERSION), latest_assessment],
+            )
+
+        if config.get('include_climate_data', True):
+            keys['climate'] = self.section_cache.make_key(
+                'climate', template_version, ingestion_version
+            )
+
+        return keys
+
+    async def _generate_report_data(
+        self,
+        config: dict[str, Any],
+        section_keys: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Generate report data based on configuration."""
+        section_keys = section_keys or {}
+        data = {}
+
+        # Prediction accuracy data
+        if config.get('include_prediction_accuracy', True):
+            cached = self._cached_section(section_keys.get('predictions'))
+            if cached is not None:
+                data['predictions'] = cached
+            else:
+                start_date = config.get('start_date')
+                end_date = config.get('end_date')
+
+                query = self.db.query(MalariaRiskIndex)
+                if start_date:
+                    query = query.filter(MalariaRiskIndex.assessment_date >= start_date)
+                if end_date:
+                    query = query.filter(MalariaRiskIndex.assessment_date <= end_date)
+                predictions = await asyncio.to_thread(query.limit(1000).all)
+
+                data['predictions'] = [
+                    {
+                        'date': p.assessment_date.isoformat(),
+                        'location': p.location_name,
+                        'risk_level': p.risk_level,
+                        'confidence': p.confidence_score,
+                        'model_type': p.model_type
+                    }
+                    for p in predictions
+                ]
+                self._store_section(section_keys.get('predictions'), data['predictions'])
 
         # Climate data
         if config.get('include_climate_data', True):
-            climate_data = self.db.query(ERA5DataPoint).limit(500).all()
-            data['climate'] = [
-                {
-                    'date': c.timestamp.isoformat(),
-                    'latitude': c.latitude,
-                    'longitude': c.longitude,
-                    'temperature': c.temperature_2m,
-                    'precipitation': c.total_precipitation
-                }
-                for c in climate_data
-            ]
+            cached = self._cached_section(section_keys.get('climate'))
+            if cached is not None:
+                data['climate'] = cached
+            else:
+                climate_data = await asyncio.to_thread(
+                    self.db.query(ERA5DataPoint).limit(500).all
+                )
+                data['climate'] = [
+                    {
+                        'date': c.timestamp.isoformat(),
+                        'latitude': c.latitude,
+                        'longitude': c.longitude,
+                        'temperature': c.temperature_2m,
+                        'precipitation': c.total_precipitation
+                    }
+                    for c in climate_data
+                ]
+                self._store_section(section_keys.get('climate'), data['climate'])
 
         return data
 
     async def _generate_charts(
         self,
         data: dict[str, Any],
-        template: ReportTemplate | None
+        template: ReportTemplate | None,
+        section_keys: dict[str, str] | None = None
     ) -> dict[str, Any]:
-        """Generate charts based on data and template configuration."""
-        charts = {}
-
-        # Prediction trends chart
-        if 'predictions' in data:
-            df = pd.DataFrame(data['predictions'])
-            if not df.empty:
-                df['date'] = pd.to_datetime(df['date'])
-
-                # Risk level distribution
-                charts['risk_distribution'] = self.chart_renderer.create_distribution_chart(
-                    df, 'risk_level', 'Risk Level Distribution'
-                )
-
-                # Confidence over time
-                if len(df) > 1:
-                    charts['confidence_trend'] = self.chart_renderer.create_time_series_chart(
-                        df, 'date', ['confidence'], 'Prediction Confidence Over Time'
-                    )
-
-        # Climate trends
-        if 'climate' in data:
-            df = pd.DataFrame(data['climate'])
-            if not df.empty:
-                df['date'] = pd.to_datetime(df['date'])
-
-                charts['temperature_trend'] = self.chart_renderer.create_time_series_chart(
-                    df, 'date', ['temperature'], 'Temperature Trends'
-                )
+        """
+        Generate charts based on data and template configuration.
 
-                charts['precipitation_trend'] = self.chart_renderer.create_time_series_chart(
-                    df, 'date', ['precipitation'], 'Precipitation Trends'
+        Charts are rendered per data section, concurrently on the executor,
+        and cached alongside the section they are derived from.
+        """
+        section_keys = section_keys or {}
+        charts: dict[str, Any] = {}
+
+        pending = []
+        for section in ('predictions', 'climate'):
+            if not data.get(section):
+                continue
+
+            chart_key = section_keys.get(section)
+            if chart_key:
+                chart_key = f"{chart_key}-charts"
+            cached = self._cached_section(chart_key)
+            if cached is not None:
+                charts.update(cached)
+            else:
+                pending.append((section, chart_key))
+
+        if pending:
+            loop = asyncio.get_running_loop()
+            executor = self.executor or get_export_pool()
+            rendered = await asyncio.gather(
+                *(
+                    loop.run_in_executor(executor, _render_section_charts, section, data[section])
+                    for section, _ in pending
                 )
+            )
+            for (_, chart_key), section_charts in zip(pending, rendered, strict=True):
+                charts.update(section_charts)
+                # Chart rendering logs and returns {} on failure; don't cache that
+                if section_charts and all(section_charts.values()):
+                    self._store_section(chart_key, section_charts)
 
         return charts
 
+    def _cached_section(self, key: str | None) -> Any | None:
+        return self.section_cache.get(key) if key else None
+
+    def _store_section(self, key: str | None, value: Any) -> None:
+        if key:
+            self.section_cache.set(key, value)
+
     def _get_default_template(self) -> dict[str, Any]:
         """Get default template configuration."""
         return {
@@ -938,23 +1285,6 @@ class ReportGenerator:
             ]
         }
 
-    async def _save_export_file(self, report_id: int, format_name: str, content: bytes) -> str:
-        """Save exported file and return relative path."""
-        # Create reports directory
-        reports_dir = Path("exports/reports")
-        reports_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate filename
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        filename = f"report_{report_id}_{timestamp}.{format_name}"
-        file_path = reports_dir / filename
-
-        # Save file
-        with open(file_path, 'wb') as f:
-            f.write(content)
-
-        return str(file_path)
-
     def _count_data_points(self, data: dict[str, Any]) -> int:
         """Count total data points in report."""
         total = 0
@@ -3,41 +3,110 @@ Report Scheduler Service for Automated Report Generation.
 
 This module provides comprehensive automated report scheduling capabilities
 with support for cron expressions, interval-based scheduling, email delivery,
-and webhook notifications.
+and webhook notifications. Due schedules are claimed with row leases
+(``FOR UPDATE SKIP LOCKED``) so several scheduler instances can share the
+queue, and each instance runs a bounded number of reports concurrently.
 """
 
 import asyncio
 import logging
 import smtplib
-from datetime import datetime, timedelta
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any
+from typing import Any, cast
 
 import aiofiles
 import aiohttp
 from croniter import croniter
-from sqlalchemy import and_
+from sqlalchemy import ColumnElement, and_, func, or_
 from sqlalchemy.orm import Session
 
 from ..database.models import Report, ReportSchedule, ReportTemplate
+from ..monitoring.metrics import ReportSchedulerMetrics, get_metrics
 from .report_generator import ReportGenerator
 
 logger = logging.getLogger(__name__)
 
 
+def _as_naive_utc(value: datetime | None) -> datetime | None:
+    """Normalize a timestamp to the naive UTC values used by the scheduler."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+def _due_unleased(current_time: datetime) -> ColumnElement[bool]:
+    """Filter for due schedules without a live lease (never claimed or expired)."""
+    schedule = ReportSchedule.__table__.c
+    return and_(
+        schedule.is_active,
+        schedule.next_execution <= current_time,
+        schedule.status == "active",
+        or_(schedule.lease_expires_at.is_(None), schedule.lease_expires_at < current_time),
+    )
+
+
 class EmailDeliveryService:
     """Email delivery service for scheduled reports."""
 
-    def __init__(self, smtp_config: dict[str, Any]) -> None:
+    def __init__(self, smtp_config: dict[str, Any], max_connections: int = 4) -> None:
         """
         Initialize email delivery service.
 
         Args:
             smtp_config: SMTP configuration dictionary
+            max_connections: Maximum number of open SMTP connections
         """
         self.smtp_config = smtp_config
+        self.max_connections = max_connections
+        self._idle_connections: list[smtplib.SMTP] = []
+        self._connection_slots = asyncio.Semaphore(max_connections)
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        server = smtplib.SMTP(self.smtp_config['host'], self.smtp_config['port'])
+        if self.smtp_config.get('use_tls'):
+            server.starttls()
+        if self.smtp_config.get('username'):
+            server.login(self.smtp_config['username'], self.smtp_config['password'])
+        return server
+
+    def _send(self, server: smtplib.SMTP | None, msg: MIMEMultipart) -> smtplib.SMTP:
+        """Send a message, reconnecting if the pooled connection went stale."""
+        if server is not None:
+            try:
+                if server.noop()[0] != 250:
+                    raise smtplib.SMTPServerDisconnected("NOOP failed")
+            except (smtplib.SMTPException, OSError):
+                self._quit(server)
+                server = None
+
+        if server is None:
+            server = self._connect()
+
+        try:
+            server.send_message(msg)
+        except Exception:
+            self._quit(server)
+            raise
+        return server
+
+    @staticmethod
+    def _quit(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    async def close(self) -> None:
+        """Close idle pooled SMTP connections."""
+        idle, self._idle_connections = self._idle_connections, []
+        for server in idle:
+            await asyncio.to_thread(self._quit, server)
 
     async def send_report_email(
         self,
@@ -81,14 +150,11 @@ class EmailDeliveryService:
                 attachment.add_header('Content-Disposition', 'attachment', filename=filename)
                 msg.attach(attachment)
 
-            # Send email
-            with smtplib.SMTP(self.smtp_config['host'], self.smtp_config['port']) as server:
-                if self.smtp_config.get('use_tls'):
-                    server.starttls()
-                if self.smtp_config.get('username'):
-                    server.login(self.smtp_config['username'], self.smtp_config['password'])
-
-                server.send_message(msg)
+            # Send on a pooled connection; smtplib blocks, so keep it off the event loop
+            async with self._connection_slots:
+                server = self._idle_connections.pop() if self._idle_connections else None
+                server = await asyncio.to_thread(self._send, server, msg)
+                self._idle_connections.append(server)
 
             logger.info(f"Report email sent successfully to {len(recipients)} recipients")
             return True
@@ -101,6 +167,51 @@ class EmailDeliveryService:
 class WebhookDeliveryService:
     """Webhook delivery service for scheduled reports."""
 
+    def __init__(self, max_connections: int = 20) -> None:
+        """
+        Initialize webhook delivery service.
+
+        Args:
+            max_connections: Connection pool size shared by all deliveries
+        """
+        self.max_connections = max_connections
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared client session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared client session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _post(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        report_data: dict[str, Any],
+        timeout: int
+    ) -> bool:
+        try:
+            async with session.post(
+                url, json=report_data, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"Webhook sent successfully to {url}")
+                    return True
+                logger.error(f"Webhook failed for {url}: HTTP {response.status}")
+                return False
+
+        except Exception as e:
+            logger.error(f"Webhook error for {url}: {str(e)}")
+            return False
+
     async def send_report_webhook(
         self,
         webhook_urls: list[str],
@@ -108,7 +219,7 @@ class WebhookDeliveryService:
         timeout: int = 30
     ) -> dict[str, bool]:
         """
-        Send report data to webhook endpoints.
+        Send report data to webhook endpoints concurrently.
 
         Args:
             webhook_urls: List of webhook URLs
@@ -118,24 +229,11 @@ class WebhookDeliveryService:
         Returns:
             Dictionary of URL -> success status
         """
-        results = {}
-
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
-            for url in webhook_urls:
-                try:
-                    async with session.post(url, json=report_data) as response:
-                        if response.status == 200:
-                            results[url] = True
-                            logger.info(f"Webhook sent successfully to {url}")
-                        else:
-                            results[url] = False
-                            logger.error(f"Webhook failed for {url}: HTTP {response.status}")
-
-                except Exception as e:
-                    results[url] = False
-                    logger.error(f"Webhook error for {url}: {str(e)}")
-
-        return results
+        session = self._get_session()
+        statuses = await asyncio.gather(
+            *(self._post(session, url, report_data, timeout) for url in webhook_urls)
+        )
+        return dict(zip(webhook_urls, statuses, strict=True))
 
 
 class ReportScheduler:
@@ -144,7 +242,13 @@ class ReportScheduler:
     def __init__(
         self,
         db_session: Session,
-        email_config: dict[str, Any] | None = None
+        email_config: dict[str, Any] | None = None,
+        max_concurrent_reports: int = 4,
+        lease_seconds: int = 900,
+        poll_interval: float = 60.0,
+        session_factory: Callable[[], Session] | None = None,
+        metrics: ReportSchedulerMetrics | None = None,
+        worker_id: str | None = None
     ):
         """
         Initialize report scheduler.
@@ -152,6 +256,14 @@ class ReportScheduler:
         Args:
             db_session: Database session for schedule management
             email_config: Email configuration for delivery
+            max_concurrent_reports: Reports this instance executes at once
+            lease_seconds: How long a claimed schedule stays leased; renewed
+                while the report is running
+            poll_interval: Seconds between checks for due schedules
+            session_factory: Creates one session per execution; defaults to
+                sessions bound to ``db_session``'s engine
+            metrics: Queue metrics collector; defaults to the global one
+            worker_id: Lease owner name, unique per scheduler instance
         """
         self.db = db_session
         self.report_generator = ReportGenerator(db_session)
@@ -159,79 +271,290 @@ class ReportScheduler:
         self.webhook_service = WebhookDeliveryService()
         self.running = False
 
+        self.max_concurrent_reports = max_concurrent_reports
+        self.lease_duration = timedelta(seconds=lease_seconds)
+        self.poll_interval = poll_interval
+        self.session_factory = session_factory or self._new_session
+        self.metrics = metrics
+        self.worker_id = worker_id or f"scheduler-{uuid.uuid4().hex[:12]}"
+        self._active: set[asyncio.Task[None]] = set()
+        self._executing = 0
+
+    def _new_session(self) -> Session:
+        """Open a session on the same engine as the scheduler's session."""
+        return Session(bind=self.db.get_bind(), expire_on_commit=False)
+
     async def start_scheduler(self) -> None:
-        """Start the report scheduler background task."""
+        """
+        Start the report scheduler background task.
+
+        Free worker slots are refilled with newly claimed schedules whenever
+        an execution finishes, instead of waiting for a whole batch.
+        """
         if self.running:
             logger.warning("Scheduler is already running")
             return
 
         self.running = True
-        logger.info("Starting report scheduler")
+        if self.metrics is None:
+            self.metrics = get_metrics().scheduler_metrics
+        logger.info(
+            f"Starting report scheduler {self.worker_id} "
+            f"({self.max_concurrent_reports} concurrent reports)"
+        )
 
         try:
             while self.running:
-                await self._process_scheduled_reports()
-                await asyncio.sleep(60)  # Check every minute
+                free_slots = self.max_concurrent_reports - len(self._active)
+                if free_slots > 0:
+                    claimed = await asyncio.to_thread(self._claim_due_schedules, free_slots)
+                    for schedule_id, due_at in claimed:
+                        task = asyncio.create_task(self._run_claimed_schedule(schedule_id, due_at))
+                        self._active.add(task)
+                        task.add_done_callback(self._active.discard)
+                    await asyncio.to_thread(self.get_queue_metrics)
+
+                if self._active:
+                    await asyncio.wait(
+                        self._active,
+                        timeout=self.poll_interval,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                else:
+                    await asyncio.sleep(self.poll_interval)
 
         except Exception as e:
             logger.error(f"Scheduler error: {str(e)}")
         finally:
+            if self._active:
+                await asyncio.gather(*self._active, return_exceptions=True)
+            await self._close_delivery_services()
             self.running = False
             logger.info("Report scheduler stopped")
 
     async def stop_scheduler(self) -> None:
-        """Stop the report scheduler."""
+        """Stop the report scheduler; running reports are allowed to finish."""
         self.running = False
         logger.info("Stopping report scheduler")
 
-    async def _process_scheduled_reports(self) -> None:
-        """Process all scheduled reports that are due for execution."""
+    async def _close_delivery_services(self) -> None:
+        await self.webhook_service.close()
+        if self.email_service:
+            await self.email_service.close()
+
+    async def _process_scheduled_reports(self) -> int:
+        """
+        Claim due schedules and execute them concurrently.
+
+        Returns:
+            Number of schedules executed
+        """
         try:
-            # Get schedules due for execution
-            current_time = datetime.utcnow()
-            due_schedules = self.db.query(ReportSchedule).filter(
-                and_(
-                    ReportSchedule.is_active,
-                    ReportSchedule.next_execution <= current_time,
-                    ReportSchedule.status == "active"
+            claimed = await asyncio.to_thread(
+                self._claim_due_schedules, self.max_concurrent_reports
+            )
+            if not claimed:
+                return 0
+
+            logger.info(f"Processing {len(claimed)} scheduled reports")
+            await asyncio.gather(
+                *(self._run_claimed_schedule(schedule_id, due_at) for schedule_id, due_at in claimed)
+            )
+            return len(claimed)
+
+        except Exception as e:
+            logger.error(f"Error processing scheduled reports: {str(e)}")
+            return 0
+
+    def _claim_due_schedules(self, limit: int) -> list[tuple[int, datetime | None]]:
+        """
+        Lease up to ``limit`` due schedules for this worker.
+
+        Rows locked by another worker's claim are skipped rather than waited
+        on, and schedules whose lease expired (crashed worker) are reclaimed.
+        Blocks on the database; async callers run it in a worker thread.
+
+        Returns:
+            List of (schedule_id, next_execution) for the claimed schedules
+        """
+        current_time = datetime.utcnow()
+        with self.session_factory() as session:
+            try:
+                schedules = (
+                    session.query(ReportSchedule)
+                    .filter(_due_unleased(current_time))
+                    .order_by(ReportSchedule.__table__.c.next_execution)
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                    .all()
                 )
-            ).all()
 
-            if not due_schedules:
-                return
+                claimed: list[tuple[int, datetime | None]] = []
+                for schedule in schedules:
+                    schedule.lease_owner = self.worker_id  # type: ignore[assignment]
+                    schedule.lease_expires_at = current_time + self.lease_duration  # type: ignore[assignment]
+                    due_at = cast(datetime | None, schedule.next_execution)
+                    claimed.append((int(schedule.id), _as_naive_utc(due_at)))
+                session.commit()
+
+            except Exception as e:
+                logger.error(f"Error claiming due schedules: {str(e)}")
+                session.rollback()
+                return []
+
+        for _schedule_id, due_at in claimed:
+            if self.metrics and due_at is not None:
+                self.metrics.record_claim(max((current_time - due_at).total_seconds(), 0.0))
+        return claimed
+
+    def _renew_lease(self, schedule_id: int) -> bool:
+        """Extend this worker's lease on a schedule; False if it was lost."""
+        with self.session_factory() as session:
+            renewed = (
+                session.query(ReportSchedule)
+                .filter(
+                    ReportSchedule.id == schedule_id,
+                    ReportSchedule.lease_owner == self.worker_id
+                )
+                .update(
+                    {ReportSchedule.lease_expires_at: datetime.utcnow() + self.lease_duration},
+                    synchronize_session=False
+                )
+            )
+            session.commit()
+        return bool(renewed)
+
+    async def _keep_lease(self, schedule_id: int) -> None:
+        """Renew a lease periodically while its report is executing."""
+        interval = self.lease_duration.total_seconds() / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await asyncio.to_thread(self._renew_lease, schedule_id):
+                    logger.warning(f"Lease on schedule {schedule_id} was lost by {self.worker_id}")
+                    return
+            except Exception as e:
+                logger.error(f"Error renewing lease on schedule {schedule_id}: {str(e)}")
+
+    async def _run_claimed_schedule(self, schedule_id: int, due_at: datetime | None) -> None:
+        """
+        Execute a leased schedule in its own session and release the lease.
 
-            logger.info(f"Processing {len(due_schedules)} scheduled reports")
+        Args:
+            schedule_id: ID of a schedule leased by this worker
+            due_at: The schedule's next_execution at claim time
+        """
+        execution_start = datetime.utcnow()
+        status = "failed"
+        lease_keeper = asyncio.create_task(self._keep_lease(schedule_id))
+        self._executing += 1
+        if self.metrics:
+            self.metrics.set_active_executions(self._executing)
 
-            for schedule in due_schedules:
-                try:
-                    await self._execute_scheduled_report(schedule)
-                except Exception as e:
-                    logger.error(f"Error executing schedule {schedule.id}: {str(e)}")
-                    # Update schedule with error
-                    schedule.error_count += 1  # type: ignore[assignment]
-                    schedule.last_error_message = str(e)  # type: ignore[assignment]
-                    if schedule.error_count >= 5:  # Max retries
-                        schedule.status = "failed"  # type: ignore[assignment]
-                        logger.error(f"Schedule {schedule.id} disabled after 5 failures")
+        db = self.session_factory()
+        try:
+            schedule = await asyncio.to_thread(db.get, ReportSchedule, schedule_id)
+            if schedule is None or schedule.lease_owner != self.worker_id:
+                logger.warning(f"Schedule {schedule_id} is no longer leased by {self.worker_id}")
+                status = "skipped"
+                return
 
-            self.db.commit()
+            try:
+                await self._execute_scheduled_report(schedule, db)
+                status = "success"
+            except Exception as e:
+                logger.error(f"Error executing schedule {schedule.id}: {str(e)}")
+                # Update schedule with error
+                schedule.error_count += 1  # type: ignore[assignment]
+                schedule.last_error_message = str(e)  # type: ignore[assignment]
+                if schedule.error_count >= 5:  # Max retries
+                    schedule.status = "failed"  # type: ignore[assignment]
+                    logger.error(f"Schedule {schedule.id} disabled after 5 failures")
+            finally:
+                schedule.lease_owner = None  # type: ignore[assignment]
+                schedule.lease_expires_at = None  # type: ignore[assignment]
+                await asyncio.to_thread(db.commit)
 
         except Exception as e:
-            logger.error(f"Error processing scheduled reports: {str(e)}")
+            logger.error(f"Error finishing schedule {schedule_id}: {str(e)}")
+            await asyncio.to_thread(db.rollback)
+        finally:
+            lease_keeper.cancel()
+            await asyncio.to_thread(db.close)
+            self._executing -= 1
+            if self.metrics:
+                self.metrics.record_execution(
+                    status, (datetime.utcnow() - execution_start).total_seconds()
+                )
+                self.metrics.set_active_executions(self._executing)
 
-    async def _execute_scheduled_report(self, schedule: ReportSchedule) -> None:
+    def get_queue_metrics(self) -> dict[str, Any]:
+        """
+        Summarize the schedule queue and update the queue gauges.
+
+        Blocks on the database; async callers run it in a worker thread.
+
+        Returns:
+            Counts of due and leased schedules and the age in seconds of the
+            oldest due schedule nobody has leased yet
+        """
+        current_time = datetime.utcnow()
+        schedule = ReportSchedule.__table__.c
+
+        with self.session_factory() as session:
+            due, oldest = session.query(
+                func.count(schedule.id), func.min(schedule.next_execution)
+            ).filter(_due_unleased(current_time)).one()
+            leased = session.query(func.count(schedule.id)).filter(
+                schedule.lease_expires_at >= current_time
+            ).scalar()
+
+        oldest = _as_naive_utc(oldest)
+        oldest_due_seconds = (
+            max((current_time - oldest).total_seconds(), 0.0) if oldest is not None else 0.0
+        )
+        if self.metrics:
+            self.metrics.set_queue_state(due, leased, oldest_due_seconds)
+
+        return {
+            "worker_id": self.worker_id,
+            "due": due,
+            "leased": leased,
+            "oldest_due_seconds": oldest_due_seconds,
+            "active_executions": self._executing,
+        }
+
+    async def _execute_scheduled_report(
+        self,
+        schedule: ReportSchedule,
+        db: Session | None = None
+    ) -> None:
         """
         Execute a single scheduled report.
 
         Args:
             schedule: ReportSchedule object to execute
+            db: Session the schedule was loaded in; defaults to the
+                scheduler's own session
         """
         execution_start = datetime.utcnow()
         logger.info(f"Executing scheduled report {schedule.id}: {schedule.name}")
 
+        if db is None or db is self.db:
+            db = self.db
+            report_generator = self.report_generator
+        else:
+            # Share the export pool and section cache across concurrent executions
+            report_generator = ReportGenerator(
+                db,
+                executor=self.report_generator.executor,
+                section_cache=self.report_generator.section_cache,
+                exports_dir=self.report_generator.exports_dir
+            )
+
         try:
             # Generate report
-            report_result = await self.report_generator.generate_report(
+            report_result = await report_generator.generate_report(
                 template_id=int(schedule.template_id) if schedule.template_id else None,
                 report_config=dict(schedule.report_configuration) if schedule.report_configuration else None,
                 user_id=f"schedule_{schedule.id}",
@@ -240,7 +563,7 @@ class ReportScheduler:
 
             if report_result['status'] == 'completed':
                 # Deliver report based on delivery methods
-                await self._deliver_report(schedule, report_result)
+                await self._deliver_report(schedule, report_result, db)
 
                 # Update schedule success metrics
                 schedule.success_count += 1  # type: ignore[assignment]
@@ -282,34 +605,46 @@ class ReportScheduler:
     async def _deliver_report(
         self,
         schedule: ReportSchedule,
-        report_result: dict[str, Any]
+        report_result: dict[str, Any],
+        db: Session | None = None
     ) -> None:
         """
         Deliver report based on configured delivery methods.
 
+        Delivery methods run concurrently; the first failure is raised after
+        all of them have finished.
+
         Args:
             schedule: ReportSchedule configuration
             report_result: Report generation results
+            db: Session to load the report from
         """
         delivery_methods = schedule.delivery_methods
         report_id = report_result['report_id']
 
         # Load actual report from database
-        report = self.db.query(Report).filter(Report.id == report_id).first()
+        report = await asyncio.to_thread((db or self.db).get, Report, report_id)
         if not report:
             raise Exception(f"Report {report_id} not found for delivery")
 
+        deliveries = []
+
         # Email delivery
         if "email" in delivery_methods and schedule.email_recipients and self.email_service:
-            await self._deliver_via_email(schedule, report, report_result)
+            deliveries.append(self._deliver_via_email(schedule, report, report_result))
 
         # Webhook delivery
         if "webhook" in delivery_methods and schedule.webhook_urls:
-            await self._deliver_via_webhook(schedule, report, report_result)
+            deliveries.append(self._deliver_via_webhook(schedule, report, report_result))
 
         # Storage delivery (copy to specific locations)
         if "storage" in delivery_methods and schedule.storage_locations:
-            await self._deliver_via_storage(schedule, report, report_result)
+            deliveries.append(self._deliver_via_storage(schedule, report, report_result))
+
+        results = await asyncio.gather(*deliveries, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def _deliver_via_email(
         self,
@@ -9,10 +9,20 @@ Key thresholds based on research:
 - Rainfall: 80mm+ monthly needed for sustained transmission
 - Humidity: 60%+ needed for mosquito survival
 - Elevation: Higher risk decreases with altitude (varies by region)
+
+``RiskCalculator.calculate_overall_risk_array`` scores whole grids at once and
+returns exactly the values the scalar ``calculate_overall_risk`` would.
 """
 
 import math
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import date
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import xarray as xr
 
 from ..models import (
     EnvironmentalFactors,
@@ -22,6 +32,81 @@ from ..models import (
     RiskLevel,
 )
 
+# Input variables for the array API, named like EnvironmentalFactors fields
+REQUIRED_ARRAY_INPUTS = ("mean_temperature", "monthly_rainfall", "relative_humidity", "elevation")
+OPTIONAL_ARRAY_INPUTS = ("ndvi", "evi")
+
+# Categorical levels in threshold order, as assigned by calculate_overall_risk
+_RISK_LEVEL_THRESHOLDS = (
+    (0.8, RiskLevel.CRITICAL),
+    (0.6, RiskLevel.HIGH),
+    (0.3, RiskLevel.MEDIUM),
+)
+
+
+@dataclass
+class RiskAssessmentArrays:
+    """Array counterpart of ``RiskAssessment`` for a grid of cells.
+
+    Values are rounded like the ``RiskAssessment`` fields; ``risk_level``
+    holds ``RiskLevel`` values as strings.
+    """
+
+    risk_score: np.ndarray
+    risk_level: np.ndarray
+    confidence: np.ndarray
+    temperature_factor: np.ndarray
+    rainfall_factor: np.ndarray
+    humidity_factor: np.ndarray
+    vegetation_factor: np.ndarray
+    elevation_factor: np.ndarray
+    dims: tuple[str, ...] | None = None
+    coords: Mapping[str, Any] | None = None
+
+    def to_dataset(self) -> xr.Dataset:
+        """Return the arrays as an xarray Dataset on the input grid."""
+        dims = self.dims or tuple(f"dim_{i}" for i in range(self.risk_score.ndim))
+        names = (
+            "risk_score",
+            "risk_level",
+            "confidence",
+            "temperature_factor",
+            "rainfall_factor",
+            "humidity_factor",
+            "vegetation_factor",
+            "elevation_factor",
+        )
+        return xr.Dataset(
+            {name: (dims, getattr(self, name)) for name in names},
+            coords=self.coords,
+        )
+
+
+def _round3(values: np.ndarray) -> np.ndarray:
+    """Round to 3 decimals exactly like the builtin ``round(value, 3)``.
+
+    ``rint(x * 1000) / 1000`` matches ``round`` except where the scaled value
+    lands on a half after the multiplication rounds; those few cells are
+    rounded with the builtin.
+    """
+    scaled = values * 1000.0
+    rounded = np.rint(scaled) / 1000.0
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(value, 3) for value in values[near_half].tolist()]
+    return rounded
+
+
+def _exp(values: np.ndarray, exact: bool) -> np.ndarray:
+    """Exponential of an array; ``exact`` uses ``math.exp`` per element.
+
+    NumPy's SIMD ``exp`` can differ from the C library by one ulp, which
+    would break bit-identity with the scalar path.
+    """
+    if not exact:
+        return np.exp(values)
+    return np.fromiter(map(math.exp, values.tolist()), dtype=np.float64, count=values.size)
+
 
 class RiskCalculator:
     """Service for calculating malaria outbreak risk from environmental data."""
@@ -239,6 +324,163 @@ class RiskCalculator:
             elevation_factor=round(elevation_factor, 3),
         )
 
+    def calculate_overall_risk_array(
+        self,
+        data: xr.Dataset | Mapping[str, npt.ArrayLike],
+        exact: bool = True,
+    ) -> RiskAssessmentArrays:
+        """Calculate malaria risk for every cell of a grid.
+
+        Vectorized form of ``calculate_overall_risk``: each cell gets the same
+        score, level, confidence and factors the scalar method returns for an
+        ``EnvironmentalFactors`` with those values.
+
+        Args:
+            data: Dataset or mapping with ``mean_temperature``,
+                ``monthly_rainfall``, ``relative_humidity`` and ``elevation``,
+                and optionally ``ndvi``/``evi`` (NaN where unavailable).
+                Arrays are broadcast together; values are assumed to lie in
+                the ``EnvironmentalFactors`` ranges.
+            exact: Use ``math.exp`` for the temperature curve so results are
+                bit-identical to the scalar path; ``False`` uses ``np.exp``,
+                which is faster but may differ by one ulp before rounding.
+
+        Returns:
+            Arrays shaped like the broadcast inputs
+        """
+        missing = [name for name in REQUIRED_ARRAY_INPUTS if name not in data]
+        if missing:
+            raise ValueError(f"Missing environmental inputs: {', '.join(missing)}")
+
+        names = [name for name in REQUIRED_ARRAY_INPUTS + OPTIONAL_ARRAY_INPUTS if name in data]
+        dims: tuple[str, ...] | None = None
+        coords: Mapping[str, Any] | None = None
+        if isinstance(data, xr.Dataset):
+            broadcast = xr.broadcast(*(data[name] for name in names))
+            dims = broadcast[0].dims  # type: ignore[assignment]
+            coords = broadcast[0].coords
+            arrays = [np.asarray(array.values, dtype=np.float64) for array in broadcast]
+        else:
+            arrays = np.broadcast_arrays(*(np.asarray(data[name], dtype=np.float64) for name in names))
+        inputs = dict(zip(names, arrays, strict=True))
+        shape = arrays[0].shape
+
+        temp_factor = self._temperature_factor_array(inputs["mean_temperature"], exact)
+        rainfall_factor = self._rainfall_factor_array(inputs["monthly_rainfall"])
+        humidity_factor = self._humidity_factor_array(inputs["relative_humidity"])
+        vegetation_factor = self._vegetation_factor_array(
+            inputs.get("ndvi", np.full(shape, np.nan)),
+            inputs.get("evi", np.full(shape, np.nan)),
+        )
+        elevation_factor = self._elevation_factor_array(inputs["elevation"])
+
+        # Same operation order as calculate_overall_risk, so float results match
+        weighted_score = (
+            temp_factor * 0.4
+            + rainfall_factor * 0.25
+            + humidity_factor * 0.15
+            + vegetation_factor * 0.1
+            + elevation_factor * 0.1
+        )
+        transmits = temp_factor != 0.0
+        overall_score = np.where(transmits, weighted_score * temp_factor, 0.0)
+
+        supporting = 1.0 + (rainfall_factor > 0).astype(np.float64) + (humidity_factor > 0)
+        confidence = np.where(transmits, np.minimum(0.95, 0.6 + 0.1 * supporting), 0.9)
+
+        risk_level = np.select(
+            [overall_score >= threshold for threshold, _ in _RISK_LEVEL_THRESHOLDS],
+            [level.value for _, level in _RISK_LEVEL_THRESHOLDS],
+            default=RiskLevel.LOW.value,
+        )
+
+        return RiskAssessmentArrays(
+            risk_score=_round3(overall_score),
+            risk_level=risk_level,
+            confidence=_round3(confidence),
+            temperature_factor=_round3(temp_factor),
+            rainfall_factor=_round3(rainfall_factor),
+            humidity_factor=_round3(humidity_factor),
+            vegetation_factor=_round3(vegetation_factor),
+            elevation_factor=_round3(elevation_factor),
+            dims=dims,
+            coords=coords,
+        )
+
+    def _temperature_factor_array(self, temp: np.ndarray, exact: bool) -> np.ndarray:
+        """Array form of ``calculate_temperature_factor``."""
+        factor = np.zeros(temp.shape)
+        viable = (temp >= self.MIN_TRANSMISSION_TEMP) & (temp <= self.MAX_TRANSMISSION_TEMP)
+        temp_deviation = np.abs(temp - self.OPTIMAL_TEMP)
+
+        factor[viable & (temp_deviation == 0)] = 1.0
+        curve = viable & (temp_deviation != 0)
+        range_size = np.where(
+            temp < self.OPTIMAL_TEMP,
+            self.OPTIMAL_TEMP - self.MIN_TRANSMISSION_TEMP,
+            self.MAX_TRANSMISSION_TEMP - self.OPTIMAL_TEMP,
+        )
+        normalized_dev = temp_deviation[curve] / range_size[curve]
+        factor[curve] = _exp(-2 * normalized_dev, exact)
+        return np.clip(factor, 0.0, 1.0)
+
+    def _rainfall_factor_array(self, rainfall: np.ndarray) -> np.ndarray:
+        """Array form of ``calculate_rainfall_factor``."""
+        excess = rainfall - self.OPTIMAL_RAINFALL
+        factor = np.select(
+            [rainfall < self.MIN_RAINFALL, rainfall <= self.OPTIMAL_RAINFALL],
+            [
+                0.0,
+                (rainfall - self.MIN_RAINFALL) / (self.OPTIMAL_RAINFALL - self.MIN_RAINFALL),
+            ],
+            default=1.0 - 0.3 * (excess / (excess + 300)),
+        )
+        return np.clip(factor, 0.0, 1.0)
+
+    def _humidity_factor_array(self, humidity: np.ndarray) -> np.ndarray:
+        """Array form of ``calculate_humidity_factor``."""
+        factor = np.select(
+            [humidity < self.MIN_HUMIDITY, humidity <= self.OPTIMAL_HUMIDITY],
+            [
+                0.0,
+                (humidity - self.MIN_HUMIDITY) / (self.OPTIMAL_HUMIDITY - self.MIN_HUMIDITY),
+            ],
+            default=1.0,
+        )
+        return np.clip(factor, 0.0, 1.0)
+
+    def _vegetation_factor_array(self, ndvi: np.ndarray, evi: np.ndarray) -> np.ndarray:
+        """Array form of ``calculate_vegetation_factor``; NaN means unavailable."""
+        vegetation_index = np.where(np.isnan(ndvi), evi, ndvi)
+        available = ~np.isnan(vegetation_index)
+
+        normalized_vi = (np.clip(vegetation_index, -1.0, 1.0) + 1.0) / 2.0
+        factor = np.select(
+            [~available, normalized_vi < 0.3, normalized_vi <= 0.7],
+            [0.5, normalized_vi / 0.3, 1.0],
+            default=1.0 - 0.3 * ((normalized_vi - 0.7) / 0.3),
+        )
+        return np.clip(factor, 0.0, 1.0)
+
+    def _elevation_factor_array(self, elevation: np.ndarray) -> np.ndarray:
+        """Array form of ``calculate_elevation_factor``."""
+        mid_position = (elevation - self.LOW_RISK_ELEVATION) / (
+            self.MEDIUM_RISK_ELEVATION - self.LOW_RISK_ELEVATION
+        )
+        high_position = (elevation - self.MEDIUM_RISK_ELEVATION) / (
+            self.HIGH_RISK_ELEVATION - self.MEDIUM_RISK_ELEVATION
+        )
+        factor = np.select(
+            [
+                elevation <= self.LOW_RISK_ELEVATION,
+                elevation <= self.MEDIUM_RISK_ELEVATION,
+                elevation <= self.HIGH_RISK_ELEVATION,
+            ],
+            [1.0, 1.0 - 0.3 * mid_position, 0.7 - 0.6 * high_position],
+            default=0.1,
+        )
+        return np.clip(factor, 0.0, 1.0)
+
     def create_prediction(
         self,
         location: GeographicLocation,
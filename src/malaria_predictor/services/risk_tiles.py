@@ -0,0 +1,408 @@
+"""
+Precomputed Risk Tile Service.
+
+This module renders malaria risk predictions onto the standard XYZ
+web-mercator tile grid so map clients can pan over static tiles instead of
+calling the prediction endpoints for every viewport.
+
+Tiles are stored as 8-bit palette PNGs keyed by
+``{date}/{model}/{z}/{x}/{y}.png``. Each pixel index is the risk score
+quantized to 0-254 (255 marks missing data), and the palette maps indices to
+a green-to-red risk ramp, so a tile is both displayable and decodable back to
+risk values.
+"""
+
+import logging
+import math
+import os
+import struct
+import zlib
+from collections.abc import Sequence
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ..config import TileSettings
+
+if TYPE_CHECKING:
+    from ..api.dependencies import PredictionService
+
+logger = logging.getLogger(__name__)
+
+# Web-mercator latitude limit
+MAX_LATITUDE = 85.05112878
+
+# Pixel index reserved for cells without a prediction
+NODATA_INDEX = 255
+
+# Risk ramp stops as (risk score, RGB)
+RISK_COLOR_STOPS: list[tuple[float, tuple[int, int, int]]] = [
+    (0.0, (26, 152, 80)),
+    (0.25, (166, 217, 106)),
+    (0.5, (254, 224, 139)),
+    (0.75, (244, 109, 67)),
+    (1.0, (165, 0, 38)),
+]
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """Return (west, south, east, north) in degrees for an XYZ tile."""
+    n = 2**z
+    west = x / n * 360.0 - 180.0
+    east = (x + 1) / n * 360.0 - 180.0
+    north = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / n))))
+    south = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (y + 1) / n))))
+    return west, south, east, north
+
+
+def lonlat_to_tile(longitude: float, latitude: float, z: int) -> tuple[int, int]:
+    """Return the XYZ tile containing a coordinate."""
+    n = 2**z
+    latitude = max(-MAX_LATITUDE, min(MAX_LATITUDE, latitude))
+    lat_rad = math.radians(latitude)
+    x = int((longitude + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tiles_for_bounds(
+    bounds: tuple[float, float, float, float], z: int
+) -> list[tuple[int, int]]:
+    """List the (x, y) tiles at zoom ``z`` covering a (west, south, east, north) box."""
+    west, south, east, north = bounds
+    if west > east or south > north:
+        raise ValueError(
+            f"Invalid bounds {bounds}: boxes crossing the antimeridian must be split"
+        )
+    min_x, min_y = lonlat_to_tile(west, north, z)
+    max_x, max_y = lonlat_to_tile(east, south, z)
+    return [
+        (x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)
+    ]
+
+
+def tile_sample_grid(
+    z: int, x: int, y: int, samples: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return latitude and longitude arrays of sample-cell centres for a tile.
+
+    Samples are evenly spaced in mercator space so they line up with tile
+    pixels. Both arrays have shape (samples, samples), row 0 being north.
+    """
+    n = 2**z
+    offsets = (np.arange(samples) + 0.5) / samples
+    lons = (x + offsets) / n * 360.0 - 180.0
+    lats = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * (y + offsets) / n))))
+    lon_grid, lat_grid = np.meshgrid(lons, lats)
+    return lat_grid, lon_grid
+
+
+def quantize_risk(risk_scores: np.ndarray) -> np.ndarray:
+    """Quantize risk scores in [0, 1] to uint8 palette indices, NaN -> nodata."""
+    scores = np.asarray(risk_scores, dtype=np.float64)
+    indices = np.rint(np.clip(scores, 0.0, 1.0) * (NODATA_INDEX - 1))
+    indices = np.where(np.isnan(scores), NODATA_INDEX, indices)
+    return indices.astype(np.uint8)
+
+
+def dequantize_risk(indices: np.ndarray) -> np.ndarray:
+    """Convert palette indices back to risk scores, nodata -> NaN."""
+    values = np.asarray(indices, dtype=np.float64) / (NODATA_INDEX - 1)
+    return np.where(np.asarray(indices) == NODATA_INDEX, np.nan, values)
+
+
+def _build_palette() -> tuple[bytes, bytes]:
+    """Build PLTE and tRNS chunk payloads for the risk ramp."""
+    palette = bytearray()
+    for index in range(NODATA_INDEX):
+        value = index / (NODATA_INDEX - 1)
+        for (low, low_rgb), (high, high_rgb) in zip(
+            RISK_COLOR_STOPS, RISK_COLOR_STOPS[1:], strict=False
+        ):
+            if value <= high:
+                t = 0.0 if high == low else (value - low) / (high - low)
+                palette.extend(
+                    round(a + (b - a) * t) for a, b in zip(low_rgb, high_rgb, strict=True)
+                )
+                break
+    palette.extend((0, 0, 0))  # nodata
+
+    alpha = bytes([200] * NODATA_INDEX + [0])
+    return bytes(palette), alpha
+
+
+_PALETTE, _ALPHA = _build_palette()
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data))
+        + chunk_type
+        + data
+        + struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF)
+    )
+
+
+def encode_tile_png(indices: np.ndarray) -> bytes:
+    """Encode a 2-D uint8 index array as a palette PNG."""
+    height, width = indices.shape
+    header = struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)
+
+    # Filter type 0 (None) prefix on every scanline
+    raw = np.zeros((height, width + 1), dtype=np.uint8)
+    raw[:, 1:] = indices
+
+    return b"".join(
+        [
+            b"\x89PNG\r\n\x1a\n",
+            _png_chunk(b"IHDR", header),
+            _png_chunk(b"PLTE", _PALETTE),
+            _png_chunk(b"tRNS", _ALPHA),
+            _png_chunk(b"IDAT", zlib.compress(raw.tobytes(), 6)),
+            _png_chunk(b"IEND", b""),
+        ]
+    )
+
+
+def decode_tile_png(data: bytes) -> np.ndarray:
+    """Decode a tile written by ``encode_tile_png`` back to palette indices."""
+    offset = 8
+    width = height = 0
+    idat = bytearray()
+    while offset < len(data):
+        (length,) = struct.unpack(">I", data[offset : offset + 4])
+        chunk_type = data[offset + 4 : offset + 8]
+        chunk = data[offset + 8 : offset + 8 + length]
+        if chunk_type == b"IHDR":
+            width, height = struct.unpack(">II", chunk[:8])
+        elif chunk_type == b"IDAT":
+            idat.extend(chunk)
+        offset += 12 + length
+
+    raw = np.frombuffer(zlib.decompress(bytes(idat)), dtype=np.uint8)
+    return raw.reshape(height, width + 1)[:, 1:].copy()
+
+
+class RiskTileStore:
+    """Filesystem layout for rendered risk tiles."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+
+    def tile_path(
+        self, tile_date: date, model_type: str, z: int, x: int, y: int
+    ) -> Path:
+        """Return the on-disk path for a tile."""
+        return (
+            self.directory
+            / tile_date.isoformat()
+            / model_type
+            / str(z)
+            / str(x)
+            / f"{y}.png"
+        )
+
+    def write_tile(
+        self, tile_date: date, model_type: str, z: int, x: int, y: int, data: bytes
+    ) -> Path:
+        """Atomically write a tile so readers never see a partial file."""
+        path = self.tile_path(tile_date, model_type, z, x, y)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".png.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        return path
+
+    def etag(self, path: Path) -> str:
+        """Cheap validator derived from file metadata; changes on every re-render."""
+        stat = path.stat()
+        return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+    def available_dates(self) -> list[str]:
+        """List dates that have rendered tiles, newest first."""
+        if not self.directory.exists():
+            return []
+        return sorted(
+            (entry.name for entry in self.directory.iterdir() if entry.is_dir()),
+            reverse=True,
+        )
+
+
+class RiskTileGenerator:
+    """
+    Render risk tiles for configured regions and zoom levels.
+
+    Intended to run once per day after ingestion completes. Tiles are
+    predicted on a ``samples_per_tile`` square grid, ``tiles_per_batch``
+    tiles per batched prediction call that harmonizes only the batch's
+    extent, and upsampled to ``tile_size`` pixels. Samples inside any region
+    are predicted, so tiles on region borders are complete; samples outside
+    all regions are left as nodata.
+    """
+
+    def __init__(
+        self,
+        prediction_service: "PredictionService",
+        settings: TileSettings | None = None,
+    ) -> None:
+        self.prediction_service = prediction_service
+        self.settings = settings or TileSettings()
+        self.store = RiskTileStore(self.settings.directory)
+
+    async def render_tiles(
+        self,
+        tile_date: date,
+        model_type: Any,
+        tiles: list[tuple[int, int, int]],
+        regions: Sequence[tuple[float, float, float, float]],
+        prediction_horizon: int = 30,
+    ) -> dict[tuple[int, int, int], bytes]:
+        """
+        Predict and encode a batch of tiles.
+
+        The prediction service harmonizes the bounding box of the batch's
+        samples, so a batch never harmonizes more than the area it renders.
+
+        Args:
+            tile_date: Date the tiles represent
+            model_type: Model to predict with
+            tiles: (z, x, y) tiles to render
+            regions: (west, south, east, north) boxes whose samples are predicted
+            prediction_horizon: Prediction horizon in days
+
+        Returns:
+            Encoded PNG bytes keyed by (z, x, y)
+        """
+        samples = self.settings.samples_per_tile
+
+        grids = []
+        coordinates: list[tuple[float, float]] = []
+        for z, x, y in tiles:
+            lat_grid, lon_grid = tile_sample_grid(z, x, y, samples)
+            inside = np.zeros((samples, samples), dtype=bool)
+            for west, south, east, north in regions:
+                inside |= (
+                    (lon_grid >= west)
+                    & (lon_grid <= east)
+                    & (lat_grid >= south)
+                    & (lat_grid <= north)
+                )
+            grids.append(inside)
+            coordinates.extend(
+                zip(lat_grid[inside].tolist(), lon_grid[inside].tolist(), strict=True)
+            )
+
+        risk_scores = np.empty(0, dtype=np.float64)
+        if coordinates:
+            predictions = await self.prediction_service.predict_batch(
+                coordinates=coordinates,
+                target_date=tile_date,
+                model_type=model_type,
+                prediction_horizon=prediction_horizon,
+            )
+            risk_scores = np.array(
+                [prediction["risk_score"] for prediction in predictions],
+                dtype=np.float64,
+            )
+
+        scale = self.settings.tile_size // samples
+        rendered: dict[tuple[int, int, int], bytes] = {}
+        offset = 0
+        for tile, inside in zip(tiles, grids, strict=True):
+            scores = np.full((samples, samples), np.nan)
+            count = int(inside.sum())
+            scores[inside] = risk_scores[offset : offset + count]
+            offset += count
+
+            indices = quantize_risk(scores)
+            if scale > 1:
+                indices = np.repeat(np.repeat(indices, scale, axis=0), scale, axis=1)
+            rendered[tile] = encode_tile_png(indices)
+
+        return rendered
+
+    async def generate(
+        self,
+        tile_date: date,
+        model_types: list[Any],
+        regions: dict[str, tuple[float, float, float, float]] | None = None,
+        zoom_levels: list[int] | None = None,
+        overwrite: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Render all tiles for the given date.
+
+        Args:
+            tile_date: Date the tiles represent
+            model_types: Models to render (``ModelType`` values)
+            regions: Named (west, south, east, north) regions, defaults to settings
+            zoom_levels: Zoom levels to render, defaults to settings
+            overwrite: Re-render tiles that already exist on disk
+
+        Returns:
+            Summary with rendered, skipped and failed tile counts
+        """
+        regions = regions or self.settings.regions
+        zoom_levels = zoom_levels or self.settings.zoom_levels
+        tiles_per_batch = self.settings.tiles_per_batch
+
+        summary: dict[str, Any] = {
+            "date": tile_date.isoformat(),
+            "rendered": 0,
+            "skipped": 0,
+            "failed": 0,
+        }
+
+        # Tiles on a border between regions are rendered once, with the
+        # samples of every region; sorting keeps each batch's extent compact
+        region_bounds = list(regions.values())
+        tiles = sorted(
+            {
+                (z, x, y)
+                for bounds in region_bounds
+                for z in zoom_levels
+                for x, y in tiles_for_bounds(bounds, z)
+            }
+        )
+
+        for model_type in model_types:
+            model_name = getattr(model_type, "value", str(model_type))
+
+            pending = []
+            for z, x, y in tiles:
+                path = self.store.tile_path(tile_date, model_name, z, x, y)
+                if path.exists() and not overwrite:
+                    summary["skipped"] += 1
+                else:
+                    pending.append((z, x, y))
+
+            if not pending:
+                continue
+
+            logger.info(
+                f"Rendering {len(pending)} risk tiles for {model_name} on {tile_date}"
+            )
+
+            for start in range(0, len(pending), tiles_per_batch):
+                batch = pending[start : start + tiles_per_batch]
+                try:
+                    rendered = await self.render_tiles(
+                        tile_date, model_type, batch, region_bounds
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to render {len(batch)} tiles: {e}")
+                    summary["failed"] += len(batch)
+                    continue
+
+                for (z, x, y), data in rendered.items():
+                    self.store.write_tile(tile_date, model_name, z, x, y, data)
+                summary["rendered"] += len(rendered)
+
+        logger.info(
+            f"Risk tiles for {tile_date}: {summary['rendered']} rendered, "
+            f"{summary['skipped']} skipped, {summary['failed']} failed"
+        )
+        return summary
@@ -7,13 +7,21 @@ including base test setup and common utilities.
 
 import os
 import tempfile
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Generator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import sort_tables
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -157,6 +165,58 @@ def mock_worldpop_client():
     return client
 
 
+@pytest.fixture
+def no_grid_cells():
+    """Skip grid cell resolution in repository tests with mocked sessions."""
+    with (
+        patch("malaria_predictor.database.repositories._assign_grid_cells"),
+        patch("malaria_predictor.database.repositories._assign_grid_cell"),
+    ):
+        yield
+
+
+# In-memory database fixtures for repository and service unit tests
+@pytest.fixture
+def db_tables() -> list[Table]:
+    """Tables created by ``memory_engine``; test modules override this."""
+    return []
+
+
+@pytest.fixture
+async def memory_engine(db_tables: list[Table]) -> AsyncGenerator[AsyncEngine, None]:
+    """In-memory SQLite engine with only the module's ``db_tables`` created."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for table in sort_tables(db_tables):
+            await conn.run_sync(table.create)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(memory_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """Session on the in-memory database."""
+    maker = async_sessionmaker(memory_engine, class_=AsyncSession, expire_on_commit=False)
+    async with maker() as db:
+        yield db
+
+
+@pytest.fixture
+def session_factory(
+    memory_engine: AsyncEngine,
+) -> Callable[[], AbstractAsyncContextManager[AsyncSession]]:
+    """Opens sessions on the in-memory database that commit on exit."""
+    maker = async_sessionmaker(memory_engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def open_session() -> AsyncIterator[AsyncSession]:
+        async with maker() as db:
+            yield db
+            await db.commit()
+
+    return open_session
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest with custom markers."""
@@ -22,7 +22,12 @@ from sqlalchemy.orm import sessionmaker
 from malaria_predictor.api.main import app
 from malaria_predictor.config import Settings
 from malaria_predictor.database.models import Base
-from malaria_predictor.database.session import get_session
+from malaria_predictor.database.session import (
+    get_db,
+    get_read_db,
+    get_read_session,
+    get_session,
+)
 from malaria_predictor.ml.models import (
     MalariaEnsembleModel,
     MalariaLSTM,
@@ -199,6 +204,9 @@ def test_app(test_settings, test_db_session):
         yield test_db_session
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_read_session] = override_get_session
+    app.dependency_overrides[get_db] = override_get_session
+    app.dependency_overrides[get_read_db] = override_get_session
 
     yield app
 
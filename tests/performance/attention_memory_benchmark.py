@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Spatial Attention Memory Benchmark.
+
+Compares peak resident memory and latency of one SpatialTemporalAttention
+forward pass over long location sequences for the explicit softmax
+formulation, the fused dense kernel, and k-nearest-neighbour attention.
+Each measurement runs in its own process so peak RSS is not shared.
+
+Run directly:
+    python tests/performance/attention_memory_benchmark.py --seq-lens 1024 4096 --knn 32
+"""
+
+import argparse
+import math
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import torch
+import torch.nn.functional as F
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from malaria_predictor.ml.models.transformer_model import (  # noqa: E402
+    SpatialTemporalAttention,
+)
+
+MODES = ("explicit", "fused", "knn")
+
+
+def _explicit_attention(
+    attention: SpatialTemporalAttention, x: torch.Tensor, coords: torch.Tensor
+) -> torch.Tensor:
+    """Attention as computed before the fused kernel, for comparison."""
+    batch_size, seq_len, _ = x.shape
+
+    def heads(projection: torch.nn.Module) -> torch.Tensor:
+        return projection(x).view(batch_size, seq_len, attention.num_heads, -1).transpose(1, 2)
+
+    Q, K, V = heads(attention.query), heads(attention.key), heads(attention.value)
+    scores = Q @ K.transpose(-2, -1) / math.sqrt(attention.head_dim)
+    distances = torch.norm(coords[:, :, None] - coords[:, None, :], dim=-1)
+    scores = scores + attention.spatial_bias * torch.exp(-distances).unsqueeze(1)
+    attended = F.softmax(scores, dim=-1) @ V
+    return attention.output_proj(attended.transpose(1, 2).reshape(batch_size, seq_len, -1))
+
+
+def measure(mode: str, seq_len: int, knn: int, d_model: int, heads: int) -> tuple[float, float]:
+    """Return (latency ms, peak RSS MB) of one forward pass in this process."""
+    torch.manual_seed(0)
+    attention = SpatialTemporalAttention(
+        d_model, heads, knn_neighbors=knn if mode == "knn" else None
+    ).eval()
+    x = torch.randn(1, seq_len, d_model)
+    coords = torch.rand(1, seq_len, 2) * 10
+
+    with torch.no_grad():
+        start = time.perf_counter()
+        if mode == "explicit":
+            _explicit_attention(attention, x, coords)
+        else:
+            attention(x, coords)
+        elapsed = (time.perf_counter() - start) * 1000
+
+    return elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Spatial attention memory benchmark")
+    parser.add_argument("--seq-lens", type=int, nargs="+", default=[1024, 2048, 4096])
+    parser.add_argument("--knn", type=int, default=32, help="neighbours per location")
+    parser.add_argument("--d-model", type=int, default=128)
+    parser.add_argument("--heads", type=int, default=8)
+    parser.add_argument("--single", nargs=2, metavar=("MODE", "SEQ_LEN"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        mode, seq_len = args.single[0], int(args.single[1])
+        elapsed, peak = measure(mode, seq_len, args.knn, args.d_model, args.heads)
+        print(f"{elapsed} {peak}")
+        return
+
+    print(f"{'seq_len':>8} {'mode':<9} {'ms':>9} {'peak MB':>9}")
+    for seq_len in args.seq_lens:
+        for mode in MODES:
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--single",
+                    mode,
+                    str(seq_len),
+                    "--knn",
+                    str(args.knn),
+                    "--d-model",
+                    str(args.d_model),
+                    "--heads",
+                    str(args.heads),
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.split()
+            print(f"{seq_len:>8} {mode:<9} {float(output[0]):>9.1f} {float(output[1]):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Ensemble Inference Benchmark.
+
+Compares p50 latency of the default ensemble model with its base models
+run sequentially, run concurrently, and served from the base-output cache
+for a repeated request.
+
+Run directly:
+    python tests/performance/ensemble_inference_benchmark.py --batch-sizes 1 64 --threads 4
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import torch
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from malaria_predictor.ml import MalariaEnsembleModel  # noqa: E402
+from malaria_predictor.ml.export import example_inputs  # noqa: E402
+
+MODES = {
+    "sequential": {"parallel": False, "cache_size": 0},
+    "parallel": {"parallel": True, "cache_size": 0},
+    "parallel + cache hit": {"parallel": True, "cache_size": 16},
+}
+
+
+def run_benchmark(batch_sizes: list[int], repeats: int) -> dict[int, dict[str, float]]:
+    """Return p50 latency in ms per batch size and mode."""
+    model = MalariaEnsembleModel({}, {}).eval()
+    results: dict[int, dict[str, float]] = {}
+    for batch_size in batch_sizes:
+        inputs = example_inputs(model, batch_size=batch_size)
+        results[batch_size] = {}
+        for mode, options in MODES.items():
+            model.configure_inference(**options)
+            with torch.no_grad():
+                model(inputs)  # Warm-up, and fills the cache
+                timings = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    model(inputs)
+                    timings.append((time.perf_counter() - start) * 1000)
+            results[batch_size][mode] = statistics.median(timings)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ensemble inference benchmark")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 64, 256])
+    parser.add_argument("--threads", type=int, default=4, help="intra-op threads")
+    parser.add_argument("--repeats", type=int, default=30)
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads)
+    results = run_benchmark(args.batch_sizes, args.repeats)
+
+    print(f"{'batch':>6} {'mode':<22} {'p50 ms':>9}")
+    for batch_size, modes in results.items():
+        for mode, p50 in modes.items():
+            print(f"{batch_size:>6} {mode:<22} {p50:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
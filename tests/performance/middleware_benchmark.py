@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Middleware Overhead Micro-Benchmark.
+
+Measures the per-request overhead that each API middleware layer adds on
+top of a trivial ASGI endpoint, reporting p50/p99 latency in microseconds.
+Every layer is measured twice: "before" is the ``BaseHTTPMiddleware``
+implementation loaded from ``--before-ref`` (the last revision before the
+pure ASGI conversion), "after" is the current implementation. The full
+stack is assembled in the same order as ``api/main.py``.
+
+Run directly:
+    python tests/performance/middleware_benchmark.py --iterations 5000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import subprocess
+import sys
+import time
+import types
+from collections.abc import Callable
+from pathlib import Path
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from malaria_predictor.api import middleware as current_middleware  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Last revision whose API middleware was built on BaseHTTPMiddleware
+DEFAULT_BEFORE_REF = "d3e140f"
+MIDDLEWARE_PATH = "src/malaria_predictor/api/middleware.py"
+
+RESPONSE_BODY = b'{"status":"ok"}'
+REQUEST_BODY = b'{"latitude": -1.2864, "longitude": 36.8172}'
+
+
+async def endpoint_app(scope: Scope, receive: Receive, send: Send) -> None:
+    """Minimal ASGI endpoint that drains the body and returns a small JSON."""
+    more_body = True
+    while more_body:
+        message = await receive()
+        more_body = message.get("more_body", False)
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(RESPONSE_BODY)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": RESPONSE_BODY})
+
+
+def load_middleware_module(ref: str) -> types.ModuleType:
+    """Load ``api/middleware.py`` as it was at a git revision."""
+    source = subprocess.run(
+        ["git", "show", f"{ref}:{MIDDLEWARE_PATH}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    module = types.ModuleType(f"middleware_at_{ref}")
+    # Resolve the module's lazy relative imports against the current package
+    module.__package__ = current_middleware.__package__
+    exec(compile(source, f"{ref}:{MIDDLEWARE_PATH}", "exec"), module.__dict__)
+    return module
+
+
+def _make_scope() -> Scope:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/predict/single",
+        "raw_path": b"/predict/single",
+        "query_string": b"model_type=ensemble",
+        "root_path": "",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(REQUEST_BODY)).encode()),
+            (b"user-agent", b"middleware-benchmark"),
+        ],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": REQUEST_BODY, "more_body": False}
+
+
+async def _send(message: Message) -> None:
+    return None
+
+
+def layer_factories(module: types.ModuleType) -> dict[str, Callable[[ASGIApp], ASGIApp]]:
+    """
+    Return the ``api/main.py`` middleware stack as (name -> factory).
+
+    Order matches the ``add_middleware`` calls in ``api/main.py``: the first
+    entry is innermost, the last is outermost. CORS and GZip are Starlette
+    layers shared by both revisions and are left out.
+    """
+    return {
+        "RequestIdMiddleware": module.RequestIdMiddleware,
+        "SecurityHeadersMiddleware": lambda app: module.SecurityHeadersMiddleware(
+            app, environment="development"
+        ),
+        "InputValidationMiddleware": lambda app: module.InputValidationMiddleware(
+            app, max_content_length=10 * 1024 * 1024
+        ),
+        "AuditLoggingMiddleware": lambda app: module.AuditLoggingMiddleware(
+            app, log_sensitive_data=False
+        ),
+        "LoggingMiddleware": module.LoggingMiddleware,
+        # Limit raised so the benchmark never trips it
+        "RateLimitMiddleware": lambda app: module.RateLimitMiddleware(
+            app, calls=10**9, period=60
+        ),
+    }
+
+
+async def _time_app(app: ASGIApp, iterations: int, warmup: int) -> list[float]:
+    """Return per-request latencies in microseconds."""
+    for _ in range(warmup):
+        await app(_make_scope(), _receive, _send)
+
+    samples = []
+    for _ in range(iterations):
+        scope = _make_scope()
+        start = time.perf_counter_ns()
+        await app(scope, _receive, _send)
+        samples.append((time.perf_counter_ns() - start) / 1000)
+    return samples
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _summarize(samples: list[float], base_p50: float, base_p99: float) -> dict[str, float]:
+    p50 = _percentile(samples, 50)
+    p99 = _percentile(samples, 99)
+    return {
+        "p50_us": p50,
+        "p99_us": p99,
+        "overhead_p50_us": p50 - base_p50,
+        "overhead_p99_us": p99 - base_p99,
+        "mean_us": statistics.fmean(samples),
+    }
+
+
+def _build_stack(factories: dict[str, Callable[[ASGIApp], ASGIApp]]) -> ASGIApp:
+    stack: ASGIApp = endpoint_app
+    for factory in factories.values():
+        stack = factory(stack)
+    return stack
+
+
+async def run_benchmark(
+    iterations: int = 5000, warmup: int = 500, before_ref: str = DEFAULT_BEFORE_REF
+) -> dict[str, dict[str, dict[str, float]]]:
+    """
+    Benchmark every layer before and after the ASGI conversion.
+
+    Returns:
+        Mapping of layer name to {"before": stats, "after": stats}, where
+        stats holds p50/p99 latency and overhead over the bare endpoint
+    """
+    baseline = await _time_app(endpoint_app, iterations, warmup)
+    base_p50 = _percentile(baseline, 50)
+    base_p99 = _percentile(baseline, 99)
+
+    revisions = {
+        "before": layer_factories(load_middleware_module(before_ref)),
+        "after": layer_factories(current_middleware),
+    }
+
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for name in revisions["after"]:
+        results[name] = {}
+        for label, factories in revisions.items():
+            samples = await _time_app(factories[name](endpoint_app), iterations, warmup)
+            results[name][label] = _summarize(samples, base_p50, base_p99)
+
+    results["full stack (api/main.py order)"] = {}
+    for label, factories in revisions.items():
+        samples = await _time_app(_build_stack(factories), iterations, warmup)
+        results["full stack (api/main.py order)"][label] = _summarize(
+            samples, base_p50, base_p99
+        )
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Middleware overhead benchmark")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=500)
+    parser.add_argument(
+        "--before-ref",
+        default=DEFAULT_BEFORE_REF,
+        help="git revision holding the BaseHTTPMiddleware implementation",
+    )
+    args = parser.parse_args()
+
+    # Keep per-request log lines out of the measurement
+    logging.disable(logging.CRITICAL)
+    results = asyncio.run(run_benchmark(args.iterations, args.warmup, args.before_ref))
+    logging.disable(logging.NOTSET)
+
+    print(
+        f"{'layer':<35} {'before +p50':>12} {'after +p50':>12} "
+        f"{'before +p99':>12} {'after +p99':>12}"
+    )
+    for name, stats in results.items():
+        before, after = stats["before"], stats["after"]
+        print(
+            f"{name:<35} {before['overhead_p50_us']:>12.1f} {after['overhead_p50_us']:>12.1f} "
+            f"{before['overhead_p99_us']:>12.1f} {after['overhead_p99_us']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
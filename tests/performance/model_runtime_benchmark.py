@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Model Serving Runtime Benchmark.
+
+Exports the LSTM, Transformer and Ensemble models and compares CPU
+inference latency of eager PyTorch, TorchScript and ONNX Runtime (when
+installed) at several batch sizes.
+
+Run directly:
+    python tests/performance/model_runtime_benchmark.py --batch-sizes 1 32 256 --threads 4
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import torch
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from malaria_predictor.ml import (  # noqa: E402
+    MalariaEnsembleModel,
+    MalariaLSTM,
+    MalariaTransformer,
+)
+from malaria_predictor.ml.export import (  # noqa: E402
+    ONNXRUNTIME_AVAILABLE,
+    ExportedModel,
+    example_inputs,
+    export_model,
+)
+
+MODELS = {
+    "lstm": lambda: MalariaLSTM(),
+    "transformer": lambda: MalariaTransformer(),
+    "ensemble": lambda: MalariaEnsembleModel({}, {}),
+}
+
+
+def _p50_ms(run, inputs, repeats: int) -> float:
+    run(inputs)  # Warm-up
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run(inputs)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run_benchmark(
+    batch_sizes: list[int], threads: int, repeats: int
+) -> dict[str, dict[int, dict[str, float]]]:
+    """Return p50 latency in ms per model, batch size and runtime."""
+    torch.set_num_threads(threads)
+    formats = ("torchscript", "onnx") if ONNXRUNTIME_AVAILABLE else ("torchscript",)
+    results: dict[str, dict[int, dict[str, float]]] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, build in MODELS.items():
+            model = build().eval()
+            export_model(model, Path(tmp) / name, formats)
+            runtimes = {"eager": lambda batch, m=model: m(batch)}
+            for runtime in formats:
+                runtimes[runtime] = ExportedModel(
+                    Path(tmp) / name, runtime, intra_op_threads=threads, inter_op_threads=1
+                )
+
+            results[name] = {}
+            for batch_size in batch_sizes:
+                inputs = example_inputs(model, batch_size=batch_size)
+                with torch.no_grad():
+                    results[name][batch_size] = {
+                        runtime: _p50_ms(run, inputs, repeats) for runtime, run in runtimes.items()
+                    }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Model serving runtime benchmark")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 32, 256])
+    parser.add_argument("--threads", type=int, default=4, help="intra-op threads")
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.batch_sizes, args.threads, args.repeats)
+
+    print(f"{'model':<12} {'batch':>6} {'runtime':<12} {'p50 ms':>9}")
+    for name, batches in results.items():
+        for batch_size, runtimes in batches.items():
+            for runtime, p50 in runtimes.items():
+                print(f"{name:<12} {batch_size:>6} {runtime:<12} {p50:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Quantized Model Benchmark.
+
+Compares fp32 and int8 dynamically quantized variants of the LSTM,
+Transformer and Ensemble models:
+
+- p50 CPU inference latency per batch size
+- serialized weight size, which bounds the memory each replica needs
+- accuracy on a synthetic held-out set via ModelEvaluationMetrics
+
+Run directly:
+    python tests/performance/quantization_benchmark.py --batch-sizes 1 64 --threads 4
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from malaria_predictor.ml import (  # noqa: E402
+    MalariaEnsembleModel,
+    MalariaLSTM,
+    MalariaTransformer,
+)
+from malaria_predictor.ml.export import example_inputs  # noqa: E402
+from malaria_predictor.ml.quantization import (  # noqa: E402
+    check_quantized_accuracy,
+    model_size_bytes,
+    quantize_model,
+)
+
+MODELS = {
+    "lstm": lambda: MalariaLSTM(),
+    "transformer": lambda: MalariaTransformer(),
+    "ensemble": lambda: MalariaEnsembleModel({}, {}),
+}
+
+
+def _p50_ms(model, inputs, repeats: int) -> float:
+    with torch.no_grad():
+        model(inputs)  # Warm-up
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            model(inputs)
+            timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run_benchmark(batch_sizes: list[int], repeats: int, holdout: int) -> dict[str, dict]:
+    """Return latency, size and accuracy per model and variant."""
+    results = {}
+    for name, build in MODELS.items():
+        fp32 = build().eval()
+        int8 = quantize_model(fp32)
+
+        # Held-out targets: fp32 predictions plus observation noise
+        inputs = example_inputs(fp32, batch_size=holdout, seed=7)
+        with torch.no_grad():
+            targets = fp32(inputs)["risk_mean"].numpy()[:, 0]
+        targets = np.clip(targets + np.random.default_rng(7).normal(0, 0.05, holdout), 0, 1)
+        accuracy = check_quantized_accuracy(fp32, int8, inputs, targets)
+
+        results[name] = {
+            "size_mb": {"fp32": model_size_bytes(fp32) / 1e6, "int8": model_size_bytes(int8) / 1e6},
+            "latency_ms": {
+                batch_size: {
+                    variant: _p50_ms(model, example_inputs(fp32, batch_size=batch_size), repeats)
+                    for variant, model in (("fp32", fp32), ("int8", int8))
+                }
+                for batch_size in batch_sizes
+            },
+            "rmse": {"fp32": accuracy["fp32"]["rmse"], "int8": accuracy["int8"]["rmse"]},
+            "accuracy_passed": accuracy["passed"],
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="fp32 vs int8 model benchmark")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 64, 256])
+    parser.add_argument("--threads", type=int, default=4, help="intra-op threads")
+    parser.add_argument("--repeats", type=int, default=30)
+    parser.add_argument("--holdout", type=int, default=512, help="held-out samples")
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads)
+    results = run_benchmark(args.batch_sizes, args.repeats, args.holdout)
+
+    for name, result in results.items():
+        print(f"\n{name}")
+        print(f"  {'':<14} {'fp32':>10} {'int8':>10}")
+        for label, key in (("weights MB", "size_mb"), ("held-out RMSE", "rmse")):
+            print(f"  {label:<14} {result[key]['fp32']:>10.3f} {result[key]['int8']:>10.3f}")
+        for batch_size, latency in result["latency_ms"].items():
+            label = f"p50 ms @{batch_size}"
+            print(f"  {label:<14} {latency['fp32']:>10.3f} {latency['int8']:>10.3f}")
+        print(f"  accuracy check: {'passed' if result['accuracy_passed'] else 'FAILED'}")
+
+
+if __name__ == "__main__":
+    main()
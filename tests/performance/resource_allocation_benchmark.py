@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Resource Allocation Benchmark.
+
+Solves national multi-facility allocation problems with the LP/MILP solver
+and compares them with the previous priority-sorted greedy heuristic, which
+stops at the first facility it cannot fully fund. Reports wall-clock time
+and priority-weighted stock-out days (lower is better) for a cold solve, a
+warm-started next-day solve and a multi-resource solve.
+
+Run directly:
+    python tests/performance/resource_allocation_benchmark.py --facilities 5000
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from malaria_predictor.healthcare.resource_allocation.allocation_solver import (  # noqa: E402
+    AllocationProblem,
+    AllocationSolver,
+)
+
+RESOURCE_TYPES = ["medication", "diagnostic_supplies", "vaccines"]
+
+
+def _problem(facilities: int, resources: int, periods: int, seed: int) -> AllocationProblem:
+    rng = np.random.default_rng(seed)
+    monthly = rng.gamma(2.0, 60.0, (facilities, resources))
+    risk = rng.uniform(0, 1, facilities)
+    demand = monthly * (1.0 + 0.5 * risk)[:, None]
+    period_lengths = np.full(periods, 30.0 / periods)
+    return AllocationProblem(
+        facility_ids=[f"F{i:05d}" for i in range(facilities)],
+        resource_types=RESOURCE_TYPES[:resources],
+        period_demand=demand[:, :, None] * (period_lengths / 30.0)[None, None, :],
+        initial_inventory=rng.uniform(0, 0.6, (facilities, resources)) * demand,
+        storage_capacity=rng.uniform(1.0, 2.0, (facilities, resources)) * demand,
+        unit_costs=rng.uniform(2.0, 12.0, (facilities, resources)),
+        priorities=0.4 * risk + 0.6 * rng.uniform(0, 1, facilities),
+        budget=float(0.5 * (demand * 10.0).sum()),
+        period_lengths=period_lengths,
+    )
+
+
+def _next_day(problem: AllocationProblem, seed: int) -> AllocationProblem:
+    rng = np.random.default_rng(seed)
+    return AllocationProblem(
+        facility_ids=problem.facility_ids,
+        resource_types=problem.resource_types,
+        period_demand=problem.period_demand * rng.uniform(0.95, 1.05, problem.period_demand.shape),
+        initial_inventory=problem.initial_inventory * rng.uniform(0.9, 1.0, problem.initial_inventory.shape),
+        storage_capacity=problem.storage_capacity,
+        unit_costs=problem.unit_costs,
+        priorities=problem.priorities,
+        budget=problem.budget,
+        period_lengths=problem.period_lengths,
+    )
+
+
+def greedy_baseline(problem: AllocationProblem) -> np.ndarray:
+    """Previous heuristic: fund whole-horizon demand by priority, per resource type."""
+    shipments = np.zeros(problem.shape)
+    order = np.argsort(-problem.priorities, kind="stable")
+    horizon_demand = problem.period_demand.sum(axis=2)
+    remaining = problem.budget
+    # The heuristic was rerun per resource type against the remaining budget
+    for r in range(problem.shape[1]):
+        for i in order:
+            cost = horizon_demand[i, r] * problem.unit_costs[i, r]
+            if cost <= remaining:
+                shipments[i, r, 0] = horizon_demand[i, r]
+                remaining -= cost
+            else:
+                shipments[i, r, 0] = remaining / problem.unit_costs[i, r]
+                remaining = 0.0
+                break
+    return shipments
+
+
+def _score(solver: AllocationSolver, problem: AllocationProblem, shipments: np.ndarray) -> float:
+    return solver._objective(problem, shipments, solver._shortages(problem, shipments))
+
+
+def run_benchmark(facilities: int = 5000, periods: int = 4, time_limit: float = 60.0) -> list[tuple[str, float, float]]:
+    """Return (scenario, seconds, weighted stock-out days) rows."""
+    rows = []
+    solver = AllocationSolver(time_limit=time_limit)
+
+    for resources in (1, 3):
+        problem = _problem(facilities, resources, periods, seed=resources)
+        label = f"{facilities} facilities x {resources} resource(s)"
+
+        start = time.perf_counter()
+        shipments = greedy_baseline(problem)
+        rows.append((f"{label}: greedy", time.perf_counter() - start, _score(solver, problem, shipments)))
+
+        solution = solver.solve(problem)
+        rows.append((f"{label}: LP cold", solution.computation_time, solution.objective_value))
+
+        solution = solver.solve(_next_day(problem, seed=10 + resources))
+        rows.append((f"{label}: LP next day (warm)", solution.computation_time, solution.objective_value))
+
+        solution = solver.solve(problem, integer=True, warm_start=False)
+        rows.append((f"{label}: MILP", solution.computation_time, solution.objective_value))
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resource allocation solver benchmark")
+    parser.add_argument("--facilities", type=int, default=5000)
+    parser.add_argument("--periods", type=int, default=4)
+    parser.add_argument("--time-limit", type=float, default=60.0)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rows = run_benchmark(args.facilities, args.periods, args.time_limit)
+
+    print(f"{'scenario':<55} {'seconds':>10} {'stock-out days':>16}")
+    for name, seconds, objective in rows:
+        print(f"{name:<55} {seconds:>10.3f} {objective:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Rule-Based Risk Calculator Benchmark.
+
+Measures per-cell cost of scoring a grid with the scalar
+``calculate_overall_risk`` (one EnvironmentalFactors object per cell)
+against ``calculate_overall_risk_array`` with exact (math.exp) and fast
+(np.exp) temperature curves.
+
+Run directly:
+    python tests/performance/risk_calculator_benchmark.py --cells 1000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from malaria_predictor.models import EnvironmentalFactors  # noqa: E402
+from malaria_predictor.services.risk_calculator import RiskCalculator  # noqa: E402
+
+
+def _grid(cells: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    ndvi = rng.uniform(-1, 1, cells)
+    ndvi[::4] = np.nan
+    return {
+        "mean_temperature": rng.uniform(10, 40, cells),
+        "monthly_rainfall": rng.uniform(0, 600, cells),
+        "relative_humidity": rng.uniform(40, 100, cells),
+        "elevation": rng.uniform(0, 2600, cells),
+        "ndvi": ndvi,
+        "evi": rng.uniform(-1, 1, cells),
+    }
+
+
+def _scalar(calculator: RiskCalculator, grid: dict[str, np.ndarray], cells: int) -> None:
+    for i in range(cells):
+        ndvi = grid["ndvi"][i]
+        env = EnvironmentalFactors(
+            mean_temperature=float(grid["mean_temperature"][i]),
+            min_temperature=-20.0,
+            max_temperature=55.0,
+            monthly_rainfall=float(grid["monthly_rainfall"][i]),
+            relative_humidity=float(grid["relative_humidity"][i]),
+            ndvi=None if np.isnan(ndvi) else float(ndvi),
+            evi=float(grid["evi"][i]),
+            elevation=float(grid["elevation"][i]),
+        )
+        calculator.calculate_overall_risk(env)
+
+
+def run_benchmark(cells: int = 1_000_000, scalar_cells: int = 20_000) -> dict[str, float]:
+    """Return nanoseconds per cell for each path."""
+    calculator = RiskCalculator()
+    grid = _grid(cells)
+    results = {}
+
+    scalar_cells = min(scalar_cells, cells)
+    start = time.perf_counter()
+    _scalar(calculator, grid, scalar_cells)
+    results["scalar (pydantic per cell)"] = (time.perf_counter() - start) / scalar_cells * 1e9
+
+    for label, exact in (("array exact (math.exp)", True), ("array fast (np.exp)", False)):
+        start = time.perf_counter()
+        calculator.calculate_overall_risk_array(grid, exact=exact)
+        results[label] = (time.perf_counter() - start) / cells * 1e9
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rule-based risk calculator benchmark")
+    parser.add_argument("--cells", type=int, default=1_000_000)
+    parser.add_argument(
+        "--scalar-cells", type=int, default=20_000, help="cells timed on the slow scalar path"
+    )
+    args = parser.parse_args()
+
+    results = run_benchmark(args.cells, args.scalar_cells)
+
+    print(f"{'path':<30} {'ns/cell':>10}")
+    for name, ns in results.items():
+        print(f"{name:<30} {ns:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Streaming Repository Read Benchmark.
+
+Seeds ERA5 rows into a database (a temporary SQLite file by default) and
+compares reading them all with:
+
+- ``get_data_range``: one query, every row hydrated as an ORM object
+- ``stream_data_range``: keyset pages of plain column rows
+- ``stream_record_batches``: keyset pages converted to NumPy arrays
+
+Peak Python memory is measured with tracemalloc.
+
+Run directly:
+    python tests/performance/streaming_read_benchmark.py --rows 200000
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from malaria_predictor.database.models import Base, ERA5DataPoint  # noqa: E402
+from malaria_predictor.database.repositories import ERA5Repository  # noqa: E402
+
+START = datetime(2020, 1, 1)
+COLUMNS = ["timestamp", "latitude", "longitude", "temperature_2m", "total_precipitation"]
+
+
+async def _seed(session: AsyncSession, rows: int) -> None:
+    chunk = 5_000
+    for offset in range(0, rows, chunk):
+        await session.execute(
+            insert(ERA5DataPoint),
+            [
+                {
+                    "timestamp": START + timedelta(hours=i // 100),
+                    "latitude": (i % 100) * 0.25,
+                    "longitude": 30.0,
+                    "temperature_2m": 20.0 + (i % 15),
+                    "total_precipitation": (i % 7) * 0.5,
+                }
+                for i in range(offset, min(offset + chunk, rows))
+            ],
+        )
+    await session.commit()
+
+
+async def _measure(label: str, read, results: dict[str, tuple[float, float, int]]) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = await read()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results[label] = (elapsed, peak / 1e6, count)
+
+
+async def run_benchmark(
+    database_url: str | None = None, rows: int = 200_000, batch_size: int = 10_000
+) -> dict[str, tuple[float, float, int]]:
+    """Return (seconds, peak MB, rows read) per read path."""
+    with tempfile.TemporaryDirectory() as tmp:
+        url = database_url or f"sqlite+aiosqlite:///{tmp}/bench.db"
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[ERA5DataPoint.__table__])
+
+        end = START + timedelta(days=3650)
+        results: dict[str, tuple[float, float, int]] = {}
+        session_maker = async_sessionmaker(engine, class_=AsyncSession)
+        try:
+            async with session_maker() as session:
+                await _seed(session, rows)
+
+            async with session_maker() as session:
+                repository = ERA5Repository(session)
+
+                async def orm() -> int:
+                    return len(await repository.get_data_range(START, end))
+
+                async def pages() -> int:
+                    count = 0
+                    async for page in repository.stream_data_range(
+                        START, end, columns=COLUMNS, batch_size=batch_size
+                    ):
+                        count += len(page)
+                    return count
+
+                async def batches() -> int:
+                    count = 0
+                    async for batch in repository.stream_record_batches(
+                        START, end, columns=COLUMNS, batch_size=batch_size
+                    ):
+                        count += len(batch["timestamp"])
+                    return count
+
+                await _measure("get_data_range (ORM list)", orm, results)
+                session.expunge_all()
+                await _measure("stream_data_range (rows)", pages, results)
+                await _measure("stream_record_batches (numpy)", batches, results)
+        finally:
+            if database_url is not None:
+                async with engine.begin() as conn:
+                    await conn.run_sync(
+                        Base.metadata.drop_all, tables=[ERA5DataPoint.__table__]
+                    )
+            await engine.dispose()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming repository read benchmark")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="scratch database URL (default: temporary SQLite file); the ERA5 table is dropped afterwards",
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args.database_url, args.rows, args.batch_size))
+
+    print(f"{'path':<32} {'seconds':>9} {'peak MB':>9} {'rows':>9}")
+    for label, (seconds, peak_mb, count) in results.items():
+        print(f"{label:<32} {seconds:>9.2f} {peak_mb:>9.1f} {count:>9,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Unit tests for the pure ASGI security middleware in api/middleware.py.
+"""
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.malaria_predictor.api.middleware import (
+    InputValidationMiddleware,
+    LoggingMiddleware,
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    RequestIdMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+
+class _Item(BaseModel):
+    note: str
+
+
+def _build_app(*middleware) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/items")
+    async def create_item(item: _Item) -> dict:
+        return {"size": len(item.note)}
+
+    @app.get("/ping")
+    async def ping(request: Request) -> dict:
+        return {"request_id": getattr(request.state, "request_id", None)}
+
+    @app.post("/echo")
+    async def echo(request: Request) -> dict:
+        body = await request.body()
+        return {"size": len(body)}
+
+    @app.get("/boom")
+    async def boom() -> dict:
+        raise RuntimeError("boom")
+
+    for cls, kwargs in middleware:
+        app.add_middleware(cls, **kwargs)
+    return app
+
+
+class TestHeaderMiddleware:
+    """Test middleware that decorates response headers."""
+
+    def test_request_id_shared_with_handler_and_headers(self):
+        app = _build_app(
+            (RequestIdMiddleware, {}),
+            (SecurityHeadersMiddleware, {"environment": "production"}),
+        )
+        response = TestClient(app).get("/ping")
+
+        assert response.status_code == 200
+        request_id = response.json()["request_id"]
+        assert request_id
+        assert response.headers["X-Request-ID"] == request_id
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert "Strict-Transport-Security" in response.headers
+
+    def test_logging_adds_process_time_and_handles_errors(self):
+        app = _build_app((LoggingMiddleware, {}))
+        client = TestClient(app, raise_server_exceptions=False)
+
+        assert "X-Process-Time" in client.get("/ping").headers
+        error_response = client.get("/boom")
+        assert error_response.status_code == 500
+
+    def test_rate_limit_headers_and_rejection(self):
+        app = _build_app((RateLimitMiddleware, {"calls": 2, "period": 60}))
+        client = TestClient(app)
+
+        first = client.get("/ping")
+        assert first.headers["X-RateLimit-Limit"] == "2"
+        assert first.headers["X-RateLimit-Remaining"] == "1"
+        client.get("/ping")
+
+        rejected = client.get("/ping")
+        assert rejected.status_code == 429
+        assert rejected.headers["Retry-After"] == "60"
+
+    def test_metrics_records_status_codes(self):
+        app = _build_app()
+        metrics = MetricsMiddleware(app)
+        client = TestClient(metrics)
+
+        client.get("/ping")
+        client.get("/missing")
+
+        collected = metrics.get_metrics()
+        assert collected["total_requests"] == 2
+        assert collected["endpoints"]["GET /missing"]["error_count"] == 1
+
+
+class TestInputValidationMiddleware:
+    """Test streaming request validation."""
+
+    def test_declared_content_length_limit(self):
+        app = _build_app((InputValidationMiddleware, {"max_content_length": 10}))
+        response = TestClient(app).post("/echo", json={"data": "x" * 50})
+
+        assert response.status_code == 413
+
+    def test_streamed_body_limit_without_content_length(self):
+        app = _build_app((InputValidationMiddleware, {"max_content_length": 1024}))
+
+        def chunks():
+            for _ in range(8):
+                yield b"x" * 512
+
+        response = TestClient(app).post(
+            "/echo", content=chunks(), headers={"content-type": "application/json"}
+        )
+
+        assert response.status_code == 413
+
+    def test_streamed_rejection_with_pydantic_body(self):
+        app = _build_app(
+            (InputValidationMiddleware, {"max_content_length": 1024, "body_scan_limit": 4096})
+        )
+        client = TestClient(app)
+        headers = {"content-type": "application/json"}
+
+        def chunks():
+            yield b'{"note": "'
+            for _ in range(8):
+                yield b"x" * 512
+            yield b'"}'
+
+        too_large = client.post("/items", content=chunks(), headers=headers)
+        assert too_large.status_code == 413
+        assert too_large.json()["detail"] == "Request entity too large"
+
+        dangerous = client.post(
+            "/items", content=b'{"note": "javascript:alert(1)"}', headers=headers
+        )
+        assert dangerous.status_code == 400
+        assert dangerous.json()["detail"] == "Invalid request body"
+
+        assert client.post("/items", json={"note": "ok"}).json() == {"size": 2}
+
+    def test_body_scan_respects_limit(self):
+        payload = b'{"note": "' + b"a" * 100 + b'javascript:alert(1)"}'
+        headers = {"content-type": "application/json"}
+
+        scanning = _build_app((InputValidationMiddleware, {"body_scan_limit": 4096}))
+        assert TestClient(scanning).post("/echo", content=payload, headers=headers).status_code == 400
+
+        capped = _build_app((InputValidationMiddleware, {"body_scan_limit": 50}))
+        response = TestClient(capped).post("/echo", content=payload, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["size"] == len(payload)
+
+    def test_dangerous_query_parameter_rejected(self):
+        app = _build_app((InputValidationMiddleware, {}))
+        response = TestClient(app).get("/ping", params={"q": "<script>x</script>"})
+
+        assert response.status_code == 400
+
+    def test_unsupported_media_type(self):
+        app = _build_app((InputValidationMiddleware, {}))
+        response = TestClient(app).post(
+            "/echo", content=b"abc", headers={"content-type": "text/plain"}
+        )
+
+        assert response.status_code == 415
@@ -0,0 +1,130 @@
+"""
+Unit tests for concurrent, cached ensemble inference.
+"""
+import copy
+import threading
+
+import pytest
+import torch
+
+from src.malaria_predictor.api.dependencies import ModelManager
+from src.malaria_predictor.api.models import ModelType
+from src.malaria_predictor.ml import MalariaEnsembleModel
+from src.malaria_predictor.ml.export import example_inputs
+
+
+def _ensemble() -> MalariaEnsembleModel:
+    torch.manual_seed(0)
+    return MalariaEnsembleModel(
+        {"hidden_size": 16, "num_layers": 1, "prediction_horizon": 5},
+        {"d_model": 32, "num_layers": 1, "num_heads": 2, "d_ff": 64, "prediction_horizon": 5},
+    )
+
+
+class _CallRecorder:
+    """Forward hook recording the thread each call ran on."""
+
+    def __init__(self, module: torch.nn.Module) -> None:
+        self.threads: list[str] = []
+        module.register_forward_hook(self)
+
+    def __call__(self, module, inputs, outputs) -> None:
+        self.threads.append(threading.current_thread().name)
+
+
+class TestEnsembleInference:
+    """Test the ensemble's inference mode against its training-mode forward."""
+
+    def test_parallel_matches_sequential(self):
+        model = _ensemble().eval()
+        inputs = example_inputs(model, batch_size=4)
+        transformer_calls = _CallRecorder(model.transformer_model)
+
+        with torch.no_grad():
+            sequential = model(inputs)
+            model.configure_inference(parallel=True, cache_size=0, return_base_predictions=True)
+            parallel = model(inputs)
+
+        assert transformer_calls.threads[0] == threading.current_thread().name
+        assert transformer_calls.threads[1].startswith("ensemble-base")
+        for name, values in sequential.items():
+            torch.testing.assert_close(parallel[name], values)
+        assert not parallel["risk_mean"].requires_grad
+
+    def test_fused_only_outputs(self):
+        model = _ensemble().eval().configure_inference()
+
+        with torch.no_grad():
+            outputs = model(example_inputs(model))
+            confidence = model.predict_with_confidence(example_inputs(model))
+
+        assert set(outputs) == {"risk_mean", "risk_variance"}
+        assert "model_disagreement" in confidence
+
+    def test_repeated_inputs_reuse_base_outputs(self):
+        model = _ensemble().eval().configure_inference(cache_size=2)
+        lstm_calls = _CallRecorder(model.lstm_model)
+        batches = [example_inputs(model, seed=seed) for seed in range(3)]
+
+        with torch.no_grad():
+            first = model(batches[0])
+            again = model({name: value.clone() for name, value in batches[0].items()})
+            model(batches[1])
+            model(batches[2])  # Evicts batch 0
+            model(batches[0])
+
+        assert len(lstm_calls.threads) == 4
+        torch.testing.assert_close(first["risk_mean"], again["risk_mean"])
+        assert len(model._base_output_cache) == 2
+
+    def test_cache_is_shared_safely_between_threads(self):
+        model = _ensemble().eval().configure_inference(parallel=True, cache_size=2)
+        batches = [example_inputs(model, seed=seed) for seed in range(4)]
+        with torch.no_grad():
+            expected = [model(batch)["risk_mean"] for batch in batches]
+        results: dict[tuple[int, int], torch.Tensor] = {}
+
+        def predict(worker: int) -> None:
+            with torch.no_grad():
+                for round_ in range(20):
+                    index = (worker + round_) % len(batches)
+                    results[worker, round_] = model(batches[index])["risk_mean"]
+
+        threads = [threading.Thread(target=predict, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 80
+        for (worker, round_), risk in results.items():
+            torch.testing.assert_close(risk, expected[(worker + round_) % len(batches)])
+        assert len(model._base_output_cache) == 2
+        assert len(copy.deepcopy(model)._base_output_cache) == 2
+
+    def test_cache_is_bypassed_with_gradients_and_cleared_by_training(self):
+        model = _ensemble().eval().configure_inference(cache_size=4)
+        lstm_calls = _CallRecorder(model.lstm_model)
+        inputs = example_inputs(model)
+
+        model(inputs)
+        model(inputs)
+        with torch.no_grad():
+            model(inputs)
+        assert len(lstm_calls.threads) == 3
+        assert len(model._base_output_cache) == 1
+
+        model.train()
+        assert len(model._base_output_cache) == 0
+        outputs = model(inputs)
+        assert "lstm_predictions" in outputs
+
+    @pytest.mark.asyncio
+    async def test_model_manager_configures_ensemble(self):
+        manager = ModelManager(ensemble_parallel=True, ensemble_cache_size=8)
+
+        model = await manager.get_model(ModelType.ENSEMBLE)
+
+        assert model.parallel_inference
+        assert model.inference_cache_size == 8
+        assert not model.return_base_predictions
@@ -0,0 +1,176 @@
+"""
+Unit tests for the memory-mapped model feature store.
+"""
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import torch
+
+from src.malaria_predictor.api.dependencies import ModelManager, PredictionService
+from src.malaria_predictor.api.models import ModelType
+from src.malaria_predictor.database.models import GridCell
+from src.malaria_predictor.database.repositories import GridCellRepository
+from src.malaria_predictor.services.feature_store import (
+    N_FEATURES,
+    FeatureStore,
+    FeatureStoreBuilder,
+    feature_vectors,
+)
+
+CELLS = [(0.0, 30.0), (0.0, 30.5), (0.5, 30.0), (0.5, 30.5)]
+BOUNDS = (29.75, -0.25, 30.75, 0.75)
+
+
+def _vectors(day: date, cells: int = len(CELLS)) -> np.ndarray:
+    """Features encoding the day and cell, so windows are easy to check."""
+    values = np.arange(cells * N_FEATURES, dtype=np.float32).reshape(cells, N_FEATURES)
+    return values + day.toordinal() * 1000
+
+
+def _store(directory, start: date, days: int) -> FeatureStore:
+    store = FeatureStore(directory)
+    store.create_region("lake", CELLS)
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        store.write_day("lake", day, _vectors(day))
+    return store
+
+
+class FakeHarmonizer:
+    """Harmonizer returning a 2x2 grid whose values encode the day."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_harmonized_features(self, region_bounds, target_date, **kwargs):
+        self.calls += 1
+        grid = np.array([[1.0, 2.0], [3.0, 4.0]]) + target_date.day
+        return SimpleNamespace(
+            data={"era5_temperature": grid, "modis_ndvi": grid / 10},
+            spatial_bounds=region_bounds,
+            quality_metrics={},
+        )
+
+
+class RecordingModel:
+    """Model returning each location's mean climate input as its risk."""
+
+    def __init__(self) -> None:
+        self.inputs = []
+
+    def __call__(self, model_input):
+        self.inputs.append(model_input)
+        risk = model_input["climate"][:, :, 0].mean(dim=1, keepdim=True)
+        return {"risk_mean": risk.expand(-1, 30)}
+
+
+class TestFeatureStore:
+    """Test the time-major layout and lookback windows."""
+
+    def test_consecutive_cells_are_read_without_copies(self, tmp_path):
+        day = date(2024, 3, 10)
+        store = _store(tmp_path, day - timedelta(days=9), 10)
+
+        window = store.window("lake", day, 10, np.array([1, 2]))
+        model_input = store.model_input("lake", day, 10, np.array([1, 2]))
+
+        year = np.load(tmp_path / "lake" / "2024.npy", mmap_mode="r")
+        assert window.shape == (2, 10, N_FEATURES)
+        assert np.shares_memory(window, store._arrays[("lake", 2024)])
+        np.testing.assert_array_equal(window[:, -1], _vectors(day)[1:3])
+        np.testing.assert_array_equal(window[0, 0], year[day.timetuple().tm_yday - 10, 1])
+        assert model_input["climate"].shape == (2, 10, 12)
+        assert model_input["historical"].shape == (2, 10, 4)
+        assert model_input["vegetation"].data_ptr() == model_input["climate"].data_ptr() + 12 * 4
+
+    def test_windows_span_year_boundaries(self, tmp_path):
+        store = _store(tmp_path, date(2023, 12, 28), 6)
+
+        window = store.window("lake", date(2024, 1, 2), 6, np.array([3, 0]))
+
+        assert window.shape == (2, 6, N_FEATURES)
+        np.testing.assert_array_equal(window[1, 0], _vectors(date(2023, 12, 28))[0])
+        np.testing.assert_array_equal(window[0, -1], _vectors(date(2024, 1, 2))[3])
+
+    def test_missing_days_are_not_available(self, tmp_path):
+        store = _store(tmp_path, date(2024, 3, 1), 10)
+
+        assert store.available("lake", date(2024, 3, 10), 10)
+        assert not store.available("lake", date(2024, 3, 11), 10)
+        assert not store.available("lake", date(2024, 3, 10), 11)
+        assert store.locate([(0.5, 30.5), (0.0, 30.0)])[1].tolist() == [3, 0]
+        assert store.locate([(0.5, 30.5), (9.0, 9.0)]) is None
+        with pytest.raises(ValueError):
+            store.write_day("lake", date(2024, 3, 11), np.zeros((2, N_FEATURES)))
+
+
+@pytest.fixture
+def db_tables():
+    return [GridCell.__table__]
+
+
+@pytest.fixture
+async def session_factory(session_factory):
+    async with session_factory() as session:
+        await GridCellRepository(session).resolve_cell_ids(CELLS)
+    return session_factory
+
+
+class TestFeatureStoreServing:
+    """Test materializing features and predicting from them."""
+
+    @pytest.mark.asyncio
+    async def test_predictions_read_stored_windows(self, tmp_path, session_factory):
+        manager = ModelManager()
+        model = RecordingModel()
+        manager.registry.add(ModelType.LSTM.value, "v1", model)
+        store = FeatureStore(tmp_path)
+        service = PredictionService(manager, feature_store=store, seq_len=3)
+        service.data_harmonizer = FakeHarmonizer()
+
+        summary = await FeatureStoreBuilder(service, store, session_factory).build(
+            "lake", BOUNDS, date(2024, 3, 1), date(2024, 3, 3)
+        )
+        rerun = await FeatureStoreBuilder(service, store, session_factory).build(
+            "lake", BOUNDS, date(2024, 3, 1), date(2024, 3, 3)
+        )
+        service.data_harmonizer.calls = 0
+
+        results = await service.predict_batch(
+            [(0.5, 30.5), (0.0, 30.0)], date(2024, 3, 3), ModelType.LSTM
+        )
+        single = await service.predict_single(0.5, 30.0, date(2024, 3, 3), ModelType.LSTM)
+
+        assert (summary["cells"], summary["written"], rerun["skipped"]) == (4, 3, 3)
+        assert service.data_harmonizer.calls == 0
+        # North-east cell is 2 + day, south-west 3 + day, averaged over days 1-3
+        assert [r["risk_score"] for r in results] == pytest.approx([4.0, 5.0])
+        assert single["risk_score"] == pytest.approx(3.0)
+        assert model.inputs[0]["climate"].shape == (2, 3, 12)
+
+    @pytest.mark.asyncio
+    async def test_uncovered_requests_harmonize(self, tmp_path):
+        manager = ModelManager()
+        manager.registry.add(ModelType.LSTM.value, "v1", RecordingModel())
+        service = PredictionService(manager, feature_store=_store(tmp_path, date(2024, 3, 1), 3))
+        service.data_harmonizer = FakeHarmonizer()
+
+        await service.predict_batch([(0.0, 30.0), (5.0, 5.0)], date(2024, 3, 3), ModelType.LSTM)
+
+        assert service.data_harmonizer.calls == 1
+
+    def test_vectors_group_features_by_modality(self):
+        vectors = feature_vectors(
+            {
+                "modis_ndvi": np.array([0.5]),
+                "era5_temperature": np.array([25.0]),
+                "chirps_precipitation": np.array([3.0]),
+            }
+        )
+
+        assert vectors.shape == (1, N_FEATURES)
+        assert vectors[0, :2].tolist() == [3.0, 25.0]
+        assert vectors[0, 12] == 0.5
+        assert torch.from_numpy(vectors).sum() == pytest.approx(28.5)
@@ -0,0 +1,131 @@
+"""
+Unit tests for the grid cell location dimension.
+"""
+import importlib.util
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+
+from src.malaria_predictor.database.models import (
+    ERA5DataPoint,
+    GridCell,
+    LatestRisk,
+    MalariaRiskIndex,
+)
+from src.malaria_predictor.database.repositories import (
+    ERA5Repository,
+    GridCellRepository,
+    MalariaRiskRepository,
+    grid_cell_key,
+)
+
+
+@pytest.fixture
+def db_tables():
+    return [
+        GridCell.__table__,
+        ERA5DataPoint.__table__,
+        MalariaRiskIndex.__table__,
+        LatestRisk.__table__,
+    ]
+
+
+class TestGridCellRepository:
+    """Test resolving coordinates to grid cells."""
+
+    @pytest.mark.asyncio
+    async def test_resolve_creates_each_cell_once(self, session):
+        repository = GridCellRepository(session)
+
+        first = await repository.resolve_cell_ids([(0.0, 30.0), (-1.25, 36.5), (0.0, 30.0)])
+        # Float noise below the precision resolves to the same cell
+        second = await repository.resolve_cell_ids([(1e-9, 30.0), (5.0, 5.0)])
+
+        assert set(first) == {(0.0, 30.0), (-1.25, 36.5)}
+        assert second[grid_cell_key(1e-9, 30.0)] == first[(0.0, 30.0)]
+        assert await session.scalar(select(func.count()).select_from(GridCell)) == 3
+        assert [c.latitude for c in await repository.get_cells_in_bbox(-2, 29, 1, 37)] == [
+            -1.25,
+            0.0,
+        ]
+
+    def test_key_matches_migration_backfill(self):
+        path = Path(__file__).parents[1] / "migrations/versions/20261018_1200-005_grid_cells.py"
+        spec = importlib.util.spec_from_file_location("grid_cells_migration", path)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+
+        # Half-way decimals where round() and a numeric round half up disagree
+        values = [0.00015, -0.00015, 2.67505, -2.67505, 36.82195, -1.28335]
+        values += np.random.default_rng(0).uniform(-180, 180, 1000).round(5).tolist()
+        with sqlite3.connect(":memory:") as db:
+            backfilled = [
+                db.execute(f"SELECT {migration._rounded('?')}", (value,)).fetchone()[0]
+                for value in values
+            ]
+
+        assert [grid_cell_key(value, 0.0)[0] for value in values] == backfilled
+
+    @pytest.mark.asyncio
+    async def test_postgresql_binds_two_arrays(self):
+        db = AsyncMock()
+        db.bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+        db.execute.side_effect = [Mock(), [SimpleNamespace(id=7, latitude=0.0, longitude=30.0)]]
+        coordinates = [(float(i % 90), float(i % 180)) for i in range(20000)]
+
+        await GridCellRepository(db).resolve_cell_ids(coordinates)
+
+        insert_sql, select_sql = (
+            call.args[0].compile(dialect=postgresql.dialect()) for call in db.execute.call_args_list
+        )
+        assert "ON CONFLICT (latitude, longitude) DO NOTHING" in str(insert_sql)
+        assert "FROM unnest(" in str(insert_sql)
+        assert set(insert_sql.params) == {"latitudes", "longitudes"}
+        assert set(select_sql.params) == {"latitudes", "longitudes"}
+
+
+class TestFactCellKeys:
+    """Test that writes key facts to cells and reads accept cell ids."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_and_cell_reads(self, session):
+        now = datetime(2025, 1, 1)
+        points = [
+            {"timestamp": now + timedelta(hours=h), "latitude": lat, "longitude": 30.0}
+            for h in range(3)
+            for lat in (0.0, 0.25)
+        ]
+        repository = ERA5Repository(session)
+
+        await repository.bulk_insert_data_points(points, upsert=False)
+        cells = await GridCellRepository(session).resolve_cell_ids([(0.25, 30.0)])
+        rows = await repository.get_cell_data(
+            list(cells.values()), now, now + timedelta(hours=1)
+        )
+
+        assert "grid_cell_id" not in points[0]
+        assert [(r.latitude, r.timestamp.hour) for r in rows] == [(0.25, 0), (0.25, 1)]
+
+    @pytest.mark.asyncio
+    async def test_risk_assessment_gets_cell(self, session):
+        repository = MalariaRiskRepository(session)
+        saved = await repository.save_risk_assessment(
+            assessment_date=datetime(2025, 1, 1),
+            latitude=-1.25,
+            longitude=36.5,
+            risk_data={"composite_score": 0.4},
+        )
+
+        history = await repository.get_cell_history(
+            [saved.grid_cell_id], datetime(2024, 12, 1), datetime(2025, 2, 1)
+        )
+
+        assert saved.grid_cell_id is not None
+        assert [r.id for r in history] == [saved.id]
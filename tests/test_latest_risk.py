@@ -0,0 +1,103 @@
+"""
+Unit tests for batched latest-risk lookups and the latest_risk table.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.malaria_predictor.database.models import (
+    DataVersion,
+    GridCell,
+    LatestRisk,
+    MalariaRiskIndex,
+)
+from src.malaria_predictor.database.repositories import MalariaRiskRepository
+
+
+@pytest.fixture
+def db_tables():
+    return [
+        DataVersion.__table__,
+        GridCell.__table__,
+        MalariaRiskIndex.__table__,
+        LatestRisk.__table__,
+    ]
+
+
+async def _save(repository: MalariaRiskRepository, day: int, lat: float, lon: float, score: float):
+    return await repository.save_risk_assessment(
+        assessment_date=datetime(2025, 1, day),
+        latitude=lat,
+        longitude=lon,
+        risk_data={"composite_score": score},
+    )
+
+
+class TestLatestRisk:
+    """Test latest-per-location reads and maintenance of latest_risk."""
+
+    @pytest.mark.asyncio
+    async def test_current_risk_levels_one_row_per_location(self, session):
+        repository = MalariaRiskRepository(session)
+        await _save(repository, 1, 0.0, 30.0, 0.1)
+        await _save(repository, 3, 0.0, 30.0, 0.7)
+        await _save(repository, 2, 0.0, 30.0, 0.4)
+        await _save(repository, 2, -1.0, 36.0, 0.9)
+
+        current = await repository.get_current_risk_levels(
+            [(0.0, 30.0), (-1.0, 36.0), (5.0, 5.0), (0.0, 30.0)]
+        )
+
+        assert [(r.latitude, r.assessment_date.day, r.composite_risk_score) for r in current] == [
+            (-1.0, 2, 0.9),
+            (0.0, 3, 0.7),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_latest_risk_keeps_newest_assessment(self, session):
+        repository = MalariaRiskRepository(session)
+        await _save(repository, 1, 0.0, 30.0, 0.1)
+        newest = await _save(repository, 3, 0.0, 30.0, 0.7)
+        # A late-arriving older assessment does not replace the newer one
+        await _save(repository, 2, 0.0, 30.0, 0.4)
+
+        latest = (await session.execute(select(LatestRisk))).scalars().all()
+
+        assert len(latest) == 1
+        assert latest[0].risk_index_id == newest.id
+        assert latest[0].composite_risk_score == 0.7
+        assert latest[0].risk_level == "high"
+
+    @pytest.mark.asyncio
+    async def test_risk_map_and_update_sync(self, session):
+        repository = MalariaRiskRepository(session)
+        inside = await _save(repository, 1, 0.0, 30.0, 0.2)
+        await _save(repository, 1, 10.0, 30.0, 0.9)
+
+        await repository.update_risk_assessment(inside.id, {"risk_level": "high"})
+        rows = await repository.get_latest_risk_map(south=-5, west=25, north=5, east=35)
+
+        assert [(r.latitude, r.risk_level) for r in rows] == [(0.0, "high")]
+        assert await repository.get_latest_risk_map(-5, 25, 5, 35, risk_levels=["low"]) == []
+
+    @pytest.mark.asyncio
+    async def test_postgresql_uses_distinct_on_with_arrays(self):
+        db = AsyncMock()
+        db.bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+        db.execute.return_value = Mock()
+        locations = [(float(i), float(i)) for i in range(2000)]
+
+        await MalariaRiskRepository(db).get_current_risk_levels(locations)
+
+        statement = db.execute.call_args.args[0]
+        compiled = statement.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "SELECT DISTINCT ON (malaria_risk_indices.latitude, malaria_risk_indices.longitude)" in sql
+        assert "unnest(%(latitudes)s::FLOAT[], %(longitudes)s::FLOAT[]) AS requested(latitude, longitude)" in sql
+        # Two array parameters regardless of the number of locations
+        assert set(compiled.params) == {"latitudes", "longitudes"}
+        assert len(compiled.params["latitudes"]) == 2000
@@ -0,0 +1,131 @@
+"""
+Unit tests for TorchScript/ONNX model export and exported-model serving.
+"""
+import json
+
+import pytest
+import torch
+from typer.testing import CliRunner
+
+from src.malaria_predictor.api.dependencies import ModelManager
+from src.malaria_predictor.api.models import ModelType
+from src.malaria_predictor.cli import app
+from src.malaria_predictor.ml import (
+    MalariaEnsembleModel,
+    MalariaLSTM,
+    MalariaTransformer,
+)
+from src.malaria_predictor.ml.export import (
+    ExportedModel,
+    check_parity,
+    example_inputs,
+    export_model,
+)
+
+SMALL_TRANSFORMER = {"d_model": 32, "num_layers": 1, "num_heads": 2, "d_ff": 64, "max_spatial_size": 4}
+
+MODELS = {
+    "lstm": lambda: MalariaLSTM(hidden_size=16, num_layers=1, prediction_horizon=5),
+    "lstm_point": lambda: MalariaLSTM(
+        hidden_size=16, num_layers=1, prediction_horizon=5, uncertainty_quantification=False
+    ),
+    "transformer": lambda: MalariaTransformer(prediction_horizon=5, **SMALL_TRANSFORMER),
+    "ensemble": lambda: MalariaEnsembleModel(
+        {"hidden_size": 16, "num_layers": 1, "prediction_horizon": 5},
+        {"prediction_horizon": 5, **SMALL_TRANSFORMER},
+    ),
+}
+
+
+class TestTorchScriptExport:
+    """Test tracing each model family and serving the traced graph."""
+
+    @pytest.mark.parametrize("name", MODELS)
+    def test_traced_model_matches_eager(self, name, tmp_path):
+        torch.manual_seed(0)
+        model = MODELS[name]()
+
+        manifest = export_model(model, tmp_path, formats=("torchscript",))
+
+        assert manifest["parity"]["torchscript"] < 1e-4
+        assert manifest["inputs"]["climate"] == [None, 10, 12]
+        expected_outputs = ["risk_mean"] if name == "lstm_point" else ["risk_mean", "risk_variance"]
+        assert manifest["outputs"] == expected_outputs
+
+        # Any batch size, including the expanded inputs built for serving
+        exported = ExportedModel(tmp_path, "torchscript")
+        inputs = {k: v[:1].expand(7, -1, -1) for k, v in example_inputs(model).items()}
+        outputs = exported(inputs)
+        assert outputs["risk_mean"].shape == (7, 5)
+        assert model.training  # Export restores the training flag
+
+    def test_parity_failure_is_reported(self, tmp_path):
+        model = MODELS["lstm"]()
+        export_model(model, tmp_path, formats=("torchscript",))
+        with torch.no_grad():
+            model.risk_predictor[0].bias.add_(1.0)
+
+        with pytest.raises(ValueError, match="differs from eager"):
+            check_parity(model, ExportedModel(tmp_path, "torchscript"))
+
+    def test_unknown_format_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown export formats"):
+            export_model(MODELS["lstm"](), tmp_path, formats=("tflite",))
+
+
+class TestOnnxExport:
+    """Test ONNX export served through ONNX Runtime."""
+
+    @pytest.mark.parametrize("name", ["lstm", "ensemble"])
+    def test_onnx_runtime_matches_eager(self, name, tmp_path):
+        pytest.importorskip("onnx")
+        pytest.importorskip("onnxruntime")
+        model = MODELS[name]()
+
+        manifest = export_model(model, tmp_path, formats=("onnx",))
+
+        assert manifest["parity"]["onnx"] < 1e-4
+        exported = ExportedModel(tmp_path, "onnx", intra_op_threads=1, inter_op_threads=1)
+        assert exported(example_inputs(model, batch_size=4))["risk_mean"].shape == (4, 5)
+
+
+class TestExportedServing:
+    """Test the model manager serving exported models."""
+
+    @pytest.mark.asyncio
+    async def test_manager_loads_from_export_directory(self, tmp_path):
+        export_model(MODELS["lstm"](), tmp_path / "lstm", formats=("torchscript",))
+        manager = ModelManager(runtime="torchscript", export_dir=tmp_path)
+
+        model = await manager.get_model(ModelType.LSTM)
+
+        assert isinstance(model, ExportedModel)
+        health = await manager.health_check()
+        assert health["lstm"]["status"] == "healthy"
+
+    @pytest.mark.asyncio
+    async def test_missing_export_is_an_error(self, tmp_path):
+        manager = ModelManager(runtime="torchscript", export_dir=tmp_path)
+
+        with pytest.raises(FileNotFoundError):
+            await manager.load_model(ModelType.TRANSFORMER)
+        assert manager.model_health[ModelType.TRANSFORMER]["status"] == "error"
+
+    def test_cli_exports_default_models(self, tmp_path):
+        result = CliRunner().invoke(
+            app,
+            [
+                "export-model",
+                "--model-type",
+                "lstm",
+                "--output-dir",
+                str(tmp_path),
+                "--format",
+                "torchscript",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "max abs diff" in result.output
+        manifest = json.loads((tmp_path / "lstm" / "export.json").read_text())
+        assert manifest["model_class"] == "MalariaLSTM"
@@ -0,0 +1,175 @@
+"""
+Unit tests for the versioned model registry and hot swapping.
+"""
+import asyncio
+
+import pytest
+import torch
+import torch.nn as nn
+from prometheus_client import CollectorRegistry
+
+from src.malaria_predictor.api.dependencies import ModelManager
+from src.malaria_predictor.api.model_registry import ModelRegistry, resident_size_bytes
+from src.malaria_predictor.api.models import ModelType
+from src.malaria_predictor.monitoring.metrics import MLModelMetrics
+
+
+class RecordingLoader:
+    """Builds small Linear models and records what was loaded."""
+
+    def __init__(self) -> None:
+        self.loaded: list[tuple[str, str, str | None]] = []
+
+    def __call__(self, model_type, version, path):
+        self.loaded.append((model_type, version, path))
+        return nn.Linear(64, 64)
+
+
+MODEL_BYTES = resident_size_bytes(nn.Linear(64, 64))
+
+
+class TestLazyLoading:
+    """Test loading on first use and warm-up."""
+
+    @pytest.mark.asyncio
+    async def test_models_load_once_on_first_use(self):
+        loader = RecordingLoader()
+        warmed = []
+        registry = ModelRegistry(loader, warmup=warmed.append)
+        registry.register("lstm", "v1", "/models/lstm-v1.pt")
+
+        assert loader.loaded == []
+        first, second = await asyncio.gather(registry.get("lstm"), registry.get("lstm"))
+
+        assert first is second
+        assert loader.loaded == [("lstm", "v1", "/models/lstm-v1.pt")]
+        assert warmed == [first.model]
+        assert first.size_bytes == MODEL_BYTES
+
+    @pytest.mark.asyncio
+    async def test_unregistered_version_is_rejected(self):
+        registry = ModelRegistry(RecordingLoader())
+
+        with pytest.raises(ValueError):
+            await registry.get("lstm")
+
+    @pytest.mark.asyncio
+    async def test_load_time_and_memory_are_recorded(self):
+        collectors = CollectorRegistry()
+        registry = ModelRegistry(RecordingLoader(), metrics=MLModelMetrics(collectors))
+        registry.register("lstm", "v1")
+
+        await registry.get("lstm")
+
+        labels = {"model_type": "lstm", "model_version": "v1"}
+        assert collectors.get_sample_value(
+            "malaria_ml_model_loading_duration_seconds_count", labels
+        ) == 1
+        assert collectors.get_sample_value(
+            "malaria_ml_model_memory_usage_bytes", labels
+        ) == MODEL_BYTES
+
+
+class TestEviction:
+    """Test least-recently-used eviction under the memory budget."""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_idle_model_is_evicted(self):
+        loader = RecordingLoader()
+        registry = ModelRegistry(loader, memory_budget_bytes=2 * MODEL_BYTES)
+        for model_type in ("lstm", "transformer", "ensemble"):
+            registry.register(model_type, "v1")
+
+        await registry.get("lstm")
+        await registry.get("transformer")
+        await registry.get("lstm")
+        await registry.get("ensemble")
+
+        assert [entry.model_type for entry in registry.resident()] == ["lstm", "ensemble"]
+        # Evicted models reload on their next use
+        await registry.get("transformer")
+        assert loader.loaded.count(("transformer", "v1", None)) == 2
+
+    @pytest.mark.asyncio
+    async def test_models_in_use_are_not_evicted(self):
+        registry = ModelRegistry(RecordingLoader(), memory_budget_bytes=MODEL_BYTES)
+        registry.register("lstm", "v1")
+        registry.register("transformer", "v1")
+
+        async with registry.acquire("lstm"):
+            await registry.get("transformer")
+            assert len(registry.resident()) == 2
+
+        await registry.get("transformer")
+        assert len(registry.resident()) == 2
+
+
+class TestHotSwap:
+    """Test switching versions while requests are in flight."""
+
+    @pytest.mark.asyncio
+    async def test_swap_drains_requests_on_old_version(self):
+        registry = ModelRegistry(RecordingLoader())
+        registry.register("lstm", "v1")
+        old = (await registry.get("lstm")).model
+        release = asyncio.Event()
+        acquired = asyncio.Event()
+
+        async def long_request():
+            async with registry.acquire("lstm") as model:
+                acquired.set()
+                await release.wait()
+                return model
+
+        request = asyncio.create_task(long_request())
+        await acquired.wait()
+        swap = asyncio.create_task(registry.swap("lstm", "v2"))
+        while registry.active_version("lstm") != "v2":
+            await asyncio.sleep(0.01)
+
+        async with registry.acquire("lstm") as model:
+            new = model
+        assert not swap.done()
+        assert {entry.version for entry in registry.resident()} == {"v1", "v2"}
+
+        release.set()
+        assert await request is old
+        await swap
+        assert new is not old
+        assert [entry.version for entry in registry.resident()] == ["v2"]
+
+    @pytest.mark.asyncio
+    async def test_failed_swap_keeps_serving_old_version(self):
+        def loader(model_type, version, path):
+            if version == "broken":
+                raise FileNotFoundError(path)
+            return nn.Linear(2, 2)
+
+        registry = ModelRegistry(loader)
+        registry.register("lstm", "v1")
+        await registry.get("lstm")
+
+        with pytest.raises(FileNotFoundError):
+            await registry.swap("lstm", "broken", "/missing.pt")
+        assert registry.active_version("lstm") == "v1"
+
+
+class TestModelManagerRegistry:
+    """Test the model manager serving through the registry."""
+
+    @pytest.mark.asyncio
+    async def test_swap_model_serves_new_checkpoint(self, tmp_path):
+        manager = ModelManager(warmup_runs=1)
+        first = await manager.get_model(ModelType.LSTM)
+        model = type(first)(hidden_size=32)
+        path = tmp_path / "lstm-v2.pt"
+        torch.save({"config": {"hidden_size": 32}, "model_state_dict": model.state_dict()}, path)
+
+        await manager.swap_model(ModelType.LSTM, "v2", str(path))
+
+        async with manager.use_model(ModelType.LSTM) as served:
+            assert served.hidden_size == 32
+        assert manager.model_health[ModelType.LSTM]["version"] == "v2"
+        assert list(manager.models) == [ModelType.LSTM]
+        health = await manager.health_check()
+        assert health["lstm"]["status"] == "healthy"
@@ -0,0 +1,197 @@
+"""
+Unit tests for the precomputed daily nowcasts.
+"""
+from contextlib import asynccontextmanager
+from datetime import date
+
+import pytest
+import torch
+from sqlalchemy import func, select
+
+from src.malaria_predictor.api.dependencies import ModelManager, PredictionService
+from src.malaria_predictor.api.models import ModelType
+from src.malaria_predictor.config import NowcastSettings, PredictionCacheSettings
+from src.malaria_predictor.database.models import GridCell, RiskNowcast
+from src.malaria_predictor.database.repositories import (
+    GridCellRepository,
+    RiskNowcastRepository,
+)
+from src.malaria_predictor.services.nowcast import (
+    NowcastGenerator,
+    NowcastStore,
+    nowcast_cell,
+)
+from src.malaria_predictor.services.prediction_cache import PredictionCache
+
+DAY = date(2024, 3, 1)
+CELL = 0.5
+REGIONS = {"east": (29.0, -2.0, 37.0, 1.0), "lake": (29.5, -0.5, 31.0, 0.5)}
+# Cell centres of "east" at 0.5 degrees: 6 rows by 16 columns; "lake" is inside it
+EAST_CELLS = 96
+
+
+class CountingModel:
+    """Model returning a constant risk and counting predicted locations."""
+
+    def __init__(self, risk: float = 0.4) -> None:
+        self.risk = risk
+        self.locations = 0
+
+    def __call__(self, model_input):
+        batch_size = model_input["climate"].shape[0]
+        self.locations += batch_size
+        return {"risk_mean": torch.full((batch_size, 30), self.risk)}
+
+
+@pytest.fixture
+def db_tables():
+    return [GridCell.__table__, RiskNowcast.__table__]
+
+
+def _service(session_factory, model) -> PredictionService:
+    manager = ModelManager()
+    manager.registry.add(ModelType.ENSEMBLE.value, "v1", model)
+    service = PredictionService(
+        manager, nowcasts=NowcastStore(session_factory, cell_size_degrees=CELL)
+    )
+    service.data_harmonizer = None
+    return service
+
+
+async def _generate(service, session_factory, **settings):
+    generator = NowcastGenerator(
+        service, NowcastSettings(cell_size_degrees=CELL, **settings), session_factory
+    )
+    return await generator.generate(DAY, [ModelType.ENSEMBLE], regions=REGIONS)
+
+
+class TestNowcastGenerator:
+    """Test the batch job writing nowcasts."""
+
+    @pytest.mark.asyncio
+    async def test_grid_cells_are_predicted_once_per_block(self, session_factory):
+        model = CountingModel()
+        service = _service(session_factory, model)
+        harmonized = []
+
+        async def harmonize_region(region_bounds, target_date):
+            harmonized.append(region_bounds)
+
+        service.harmonize_region = harmonize_region
+        summary = await _generate(service, session_factory, batch_size=16)
+
+        # The lake cells overlap "east" and are not predicted again
+        assert summary["cells"] == EAST_CELLS
+        assert summary["written"] == EAST_CELLS
+        assert model.locations == EAST_CELLS
+        async with session_factory() as session:
+            rows = (await session.execute(select(RiskNowcast))).scalars().all()
+            cells = await session.scalar(select(func.count()).select_from(GridCell))
+        assert cells == EAST_CELLS
+        assert {(row.model_type, row.model_version) for row in rows} == {("ensemble", "v1")}
+        assert all(row.risk_score == pytest.approx(0.4) for row in rows)
+        # 4x4 cell blocks, each harmonized over its own 2x2 degree extent
+        assert (29.0, -2.0, 31.0, 0.0) in harmonized
+        assert all(
+            east - west <= 2.2 and north - south <= 2.2
+            for west, south, east, north in harmonized
+        )
+
+    @pytest.mark.asyncio
+    async def test_rerun_replaces_rows_and_prunes_old_days(self, session_factory):
+        service = _service(session_factory, CountingModel())
+        async with session_factory() as session:
+            cell_ids = await GridCellRepository(session).resolve_cell_ids([(0.0, 30.0)])
+            await RiskNowcastRepository(session).bulk_upsert(
+                [
+                    {
+                        "target_date": date(2024, 1, 1),
+                        "model_type": "ensemble",
+                        "grid_cell_id": cell_ids[(0.0, 30.0)],
+                        "risk_score": 0.1,
+                        "model_version": "v0",
+                    }
+                ]
+            )
+
+        first = await _generate(service, session_factory)
+        service.model_manager.registry.add(ModelType.ENSEMBLE.value, "v2", CountingModel(0.8))
+        await _generate(service, session_factory)
+
+        assert first["deleted"] == 1
+        async with session_factory() as session:
+            count = await session.scalar(select(func.count()).select_from(RiskNowcast))
+            assert count == EAST_CELLS
+            versions = (await session.execute(select(RiskNowcast.model_version))).scalars()
+            assert set(versions) == {"v2"}
+
+
+class TestNowcastServing:
+    """Test the prediction service answering from nowcasts."""
+
+    @pytest.mark.asyncio
+    async def test_matching_requests_skip_inference(self, session_factory):
+        model = CountingModel()
+        service = _service(session_factory, model)
+        await _generate(service, session_factory)
+        model.locations = 0
+
+        # Any point inside a nowcast cell is answered by that cell
+        single = await service.predict_single(0.2345, 30.4111, DAY, ModelType.ENSEMBLE, 14)
+        batch = await service.lookup_nowcasts(
+            [(-1.25, 36.99), (5.0, 5.0)], DAY, ModelType.ENSEMBLE
+        )
+
+        assert single == {
+            "risk_score": pytest.approx(0.4),
+            "uncertainty": None,
+            "model_type": "ensemble",
+            "prediction_horizon": 14,
+        }
+        assert batch[0]["risk_score"] == pytest.approx(0.4)
+        assert batch[1] is None
+        assert model.locations == 0
+        assert (service.nowcasts.hits, service.nowcasts.misses) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_other_dates_and_versions_fall_back_to_inference(self, session_factory):
+        model = CountingModel()
+        service = _service(session_factory, model)
+        await _generate(service, session_factory)
+        model.locations = 0
+
+        await service.predict_single(0.0, 30.0, date(2024, 3, 2), ModelType.ENSEMBLE)
+        service.model_manager.registry.add(ModelType.ENSEMBLE.value, "v2", CountingModel(0.9))
+        swapped = await service.predict_single(0.0, 30.0, DAY, ModelType.ENSEMBLE)
+
+        assert model.locations == 1
+        assert swapped["risk_score"] == pytest.approx(0.9)
+
+    @pytest.mark.asyncio
+    async def test_cache_snapped_coordinates_find_their_cell(self, session_factory):
+        service = _service(session_factory, CountingModel())
+        await _generate(service, session_factory)
+        service.prediction_cache = PredictionCache(PredictionCacheSettings(use_redis=False))
+        model = CountingModel(0.9)
+        service.model_manager.registry.add(ModelType.ENSEMBLE.value, "v1", model)
+
+        result = await service.predict_single(-0.0001, 29.2501, DAY, ModelType.ENSEMBLE)
+
+        assert result["risk_score"] == pytest.approx(0.4)
+        assert model.locations == 0
+
+    def test_coordinates_snap_to_the_containing_cell(self):
+        assert nowcast_cell(0.2345, 30.4111, 0.5) == (0.25, 30.25)
+        assert nowcast_cell(-0.0001, -0.0001, 0.1) == (-0.05, -0.05)
+        assert nowcast_cell(0.105, 36.82, 0.01) == (0.105, 36.825)
+
+    @pytest.mark.asyncio
+    async def test_lookup_errors_are_misses(self):
+        @asynccontextmanager
+        async def unavailable():
+            raise ConnectionError("database down")
+            yield
+
+        store = NowcastStore(unavailable)
+
+        assert await store.lookup([(0.0, 30.0)], DAY, "ensemble", "v1") == [None]
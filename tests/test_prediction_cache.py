@@ -0,0 +1,180 @@
+"""
+Unit tests for the grid-cell prediction result cache.
+"""
+from datetime import date
+
+import pytest
+import torch
+from prometheus_client import CollectorRegistry
+
+from src.malaria_predictor.api.dependencies import ModelManager, PredictionService
+from src.malaria_predictor.api.models import ModelType
+from src.malaria_predictor.config import PredictionCacheSettings
+from src.malaria_predictor.database.models import DataVersion
+from src.malaria_predictor.monitoring.metrics import MLModelMetrics
+from src.malaria_predictor.services import prediction_cache as cache_module
+from src.malaria_predictor.services.prediction_cache import (
+    GENERATION_KEY,
+    PredictionCache,
+)
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the few Redis commands the cache uses."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return int(self.values[key])
+
+    async def aclose(self):
+        pass
+
+
+class CountingModel:
+    """Model returning a constant risk and counting forward passes."""
+
+    def __init__(self, risk: float = 0.4) -> None:
+        self.risk = risk
+        self.calls = 0
+
+    def __call__(self, model_input):
+        self.calls += 1
+        batch_size = model_input["climate"].shape[0]
+        return {"risk_mean": torch.full((batch_size, 30), self.risk)}
+
+
+async def _key(cache, lat, lon, day=date(2024, 3, 1), version="v1"):
+    return await cache.key(lat, lon, day, 30, "ensemble", version)
+
+
+@pytest.fixture
+def db_tables():
+    return [DataVersion.__table__]
+
+
+class TestPredictionCache:
+    """Test keys, tiers and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_points_in_one_cell_share_a_key(self):
+        cache = PredictionCache(PredictionCacheSettings(cell_size_degrees=0.01))
+
+        assert cache.snap(-1.2834, 36.8171) == (-1.285, 36.815)
+        assert await _key(cache, -1.2834, 36.8171) == await _key(cache, -1.2801, 36.8199)
+        assert await _key(cache, -1.2834, 36.8171) != await _key(cache, -1.2834, 36.8201)
+        assert await _key(cache, -1.2834, 36.8171) != await _key(
+            cache, -1.2834, 36.8171, day=date(2024, 3, 2)
+        )
+        assert await _key(cache, -1.2834, 36.8171) != await _key(
+            cache, -1.2834, 36.8171, version="v2"
+        )
+
+    @pytest.mark.asyncio
+    async def test_local_entries_expire_and_are_bounded(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = PredictionCache(PredictionCacheSettings(max_entries=2, ttl=60))
+
+        for key in "abc":
+            await cache.set(key, {"risk_score": 0.1})
+        assert await cache.get("a", "lstm") is None
+        assert await cache.get("c", "lstm") == {"risk_score": 0.1}
+
+        now[0] = 61.0
+        assert await cache.get("c", "lstm") is None
+        assert cache.stats()["hits"] == {"memory": 1, "redis": 0}
+        assert cache.stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_replicas_share_results_and_invalidation(self):
+        shared = FakeRedis()
+        config = PredictionCacheSettings(use_redis=True, generation_refresh_seconds=0)
+        first = PredictionCache(config, redis_client=shared)
+        second = PredictionCache(config, redis_client=shared)
+
+        key = await _key(first, 0.5, 30.5)
+        await first.set(key, {"risk_score": 0.7})
+        assert await second.get(await _key(second, 0.5, 30.5), "ensemble") == {"risk_score": 0.7}
+        assert second.hits["redis"] == 1
+
+        await first.invalidate_data()
+
+        assert shared.values[GENERATION_KEY] == "1"
+        assert await second.get(await _key(second, 0.5, 30.5), "ensemble") is None
+
+    @pytest.mark.asyncio
+    async def test_processes_without_redis_share_the_data_version(self, session_factory):
+        config = PredictionCacheSettings(generation_refresh_seconds=0)
+        api = PredictionCache(config, session_factory=session_factory)
+        ingestion = PredictionCache(config, session_factory=session_factory)
+
+        key = await _key(api, 0.5, 30.5)
+        await api.set(key, {"risk_score": 0.7})
+        assert await api.get(await _key(api, 0.5, 30.5), "ensemble") == {"risk_score": 0.7}
+
+        assert await ingestion.invalidate_data() == 1
+        assert await ingestion.invalidate_data() == 2
+
+        assert await api.generation() == 2
+        assert await api.get(await _key(api, 0.5, 30.5), "ensemble") is None
+
+    @pytest.mark.asyncio
+    async def test_hits_and_misses_are_recorded(self):
+        collectors = CollectorRegistry()
+        cache = PredictionCache(PredictionCacheSettings(), metrics=MLModelMetrics(collectors))
+
+        await cache.get("missing", "lstm")
+        await cache.set("present", {})
+        await cache.get("present", "lstm")
+
+        def requests(tier):
+            return collectors.get_sample_value(
+                "malaria_ml_prediction_cache_requests_total",
+                {"model_type": "lstm", "tier": tier},
+            )
+
+        assert requests("miss") == 1
+        assert requests("memory") == 1
+        assert collectors.get_sample_value("malaria_ml_prediction_cache_hit_rate") == 0.5
+
+
+class TestCachedPredictions:
+    """Test the prediction service answering repeated requests from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_cell_requests_skip_inference(self):
+        manager = ModelManager()
+        model = CountingModel()
+        manager.registry.add(ModelType.ENSEMBLE.value, "v1", model)
+        service = PredictionService(manager, PredictionCache(PredictionCacheSettings()))
+        service.data_harmonizer = None
+
+        first = await service.predict_single(-1.2834, 36.8171, date(2024, 3, 1), ModelType.ENSEMBLE)
+        second = await service.predict_single(-1.2801, 36.8199, date(2024, 3, 1), ModelType.ENSEMBLE)
+        await service.predict_single(-1.2801, 36.8199, date(2024, 3, 2), ModelType.ENSEMBLE)
+
+        assert first == second
+        assert first["risk_score"] == pytest.approx(0.4)
+        assert model.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_new_model_version_is_not_served_stale_results(self):
+        manager = ModelManager()
+        manager.registry.add(ModelType.ENSEMBLE.value, "v1", CountingModel(0.4))
+        service = PredictionService(manager, PredictionCache(PredictionCacheSettings()))
+        service.data_harmonizer = None
+        await service.predict_single(0.5, 30.5, date(2024, 3, 1), ModelType.ENSEMBLE)
+
+        manager.registry.add(ModelType.ENSEMBLE.value, "v2", CountingModel(0.9))
+        result = await service.predict_single(0.5, 30.5, date(2024, 3, 1), ModelType.ENSEMBLE)
+
+        assert result["risk_score"] == pytest.approx(0.9)
@@ -0,0 +1,205 @@
+"""
+Unit tests for streamed NDJSON and Arrow prediction responses.
+"""
+import gzip
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from src.malaria_predictor.api.models import (
+    BatchPredictionRequest,
+    LocationPoint,
+    SpatialPredictionRequest,
+)
+from src.malaria_predictor.api.routers.prediction import (
+    _prediction_chunks,
+    predict_batch_locations,
+    predict_spatial_grid,
+)
+from src.malaria_predictor.api.streaming import (
+    ARROW_AVAILABLE,
+    ZSTD_AVAILABLE,
+    encode_ndjson,
+    negotiate_encoding,
+    negotiate_format,
+    prediction_columns,
+)
+
+
+class FakePredictionService:
+    """Service with a nowcast for the first location and failing inference at 9.0."""
+
+    def __init__(self) -> None:
+        self.lookups = []
+        self.predicted = []
+
+    async def lookup_nowcasts(self, coordinates, target_date, model_type, prediction_horizon):
+        self.lookups.append(len(coordinates))
+        return [
+            {"risk_score": 0.9, "uncertainty": None} if (lat, lon) == (0.0, 30.0) else None
+            for lat, lon in coordinates
+        ]
+
+    async def predict_single(self, latitude, longitude, use_nowcast=True, **kwargs):
+        assert not use_nowcast
+        self.predicted.append((latitude, longitude))
+        if latitude == 9.0:
+            raise RuntimeError("no data")
+        return {"risk_score": latitude / 10, "uncertainty": 0.05}
+
+
+async def _body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+class TestNegotiation:
+    """Test Accept and Accept-Encoding handling."""
+
+    def test_format_follows_accept_weights(self):
+        assert negotiate_format(None) == "json"
+        assert negotiate_format("*/*") == "json"
+        assert negotiate_format("application/x-ndjson") == "ndjson"
+        assert negotiate_format("application/json;q=0.5, application/ndjson") == "ndjson"
+        assert negotiate_format("application/json, application/x-ndjson") == "json"
+        with pytest.raises(HTTPException) as error:
+            negotiate_format("text/csv")
+        assert error.value.status_code == 406
+
+    @pytest.mark.skipif(ARROW_AVAILABLE, reason="pyarrow is installed")
+    def test_arrow_is_not_offered_without_pyarrow(self):
+        accept = "application/vnd.apache.arrow.stream, application/x-ndjson;q=0.1"
+        assert negotiate_format(accept) == "ndjson"
+        with pytest.raises(HTTPException):
+            negotiate_format("application/vnd.apache.arrow.stream")
+
+    def test_encoding_prefers_zstd_when_available(self):
+        assert negotiate_encoding(None) is None
+        assert negotiate_encoding("gzip;q=0, br") is None
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+        assert negotiate_encoding("zstd, gzip") == ("zstd" if ZSTD_AVAILABLE else "gzip")
+
+
+class TestColumnarEncoding:
+    """Test column-wise encoding of prediction chunks."""
+
+    def test_failed_predictions_are_dropped(self):
+        columns = prediction_columns(
+            [(0.0, 30.0), (1.0, 31.0), (2.0, 32.0)],
+            [
+                {"risk_score": 0.25, "uncertainty": None},
+                None,
+                {"risk_score": 0.9, "uncertainty": 0.1},
+            ],
+        )
+
+        assert columns["latitude"].tolist() == [0.0, 2.0]
+        assert columns["risk_level"].tolist() == ["medium", "very_high"]
+        assert np.isnan(columns["confidence_lower"][0])
+        assert columns["confidence_upper"][1] == 1.0
+
+        rows = [json.loads(line) for line in encode_ndjson(columns).splitlines()]
+        assert rows[0]["uncertainty"] is None
+        assert rows[1] == {
+            "latitude": 2.0,
+            "longitude": 32.0,
+            "risk_score": 0.9,
+            "risk_level": "very_high",
+            "uncertainty": 0.1,
+            "confidence_lower": pytest.approx(0.704),
+            "confidence_upper": 1.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_predicted_and_yielded_in_order(self):
+        service = FakePredictionService()
+        points = [(0.0, 30.0), (1.0, 30.0), (9.0, 30.0), (3.0, 30.0), (4.0, 30.0)]
+
+        chunks = [
+            columns
+            async for columns in _prediction_chunks(
+                service, points, date(2024, 3, 1), None, 7, chunk_size=2
+            )
+        ]
+
+        assert service.lookups == [2, 2, 1]
+        assert (0.0, 30.0) not in service.predicted
+        assert [chunk["latitude"].tolist() for chunk in chunks] == [
+            [0.0, 1.0],
+            [3.0],
+            [4.0],
+        ]
+
+
+class TestStreamedRoutes:
+    """Test the batch and spatial endpoints in streaming mode."""
+
+    @pytest.mark.asyncio
+    async def test_batch_streams_gzipped_ndjson(self):
+        request = BatchPredictionRequest(
+            locations=[
+                LocationPoint(latitude=lat, longitude=30.0) for lat in (0.0, 9.0, 5.0)
+            ],
+            target_date=date(2024, 3, 1),
+        )
+
+        response = await predict_batch_locations(
+            request,
+            background_tasks=None,
+            prediction_service=FakePredictionService(),
+            accept="application/x-ndjson",
+            accept_encoding="gzip",
+        )
+        rows = [json.loads(line) for line in gzip.decompress(await _body(response)).splitlines()]
+
+        assert response.media_type == "application/x-ndjson"
+        assert response.headers["content-encoding"] == "gzip"
+        assert [(row["latitude"], row["risk_score"]) for row in rows] == [
+            (0.0, 0.9),
+            (5.0, 0.5),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_spatial_streams_uncompressed_without_accept_encoding(self):
+        request = SpatialPredictionRequest(
+            bounds={"south": 1.0, "north": 2.0, "west": 30.0, "east": 30.5},
+            resolution=0.5,
+            target_date=date(2024, 3, 1),
+        )
+
+        response = await predict_spatial_grid(
+            request,
+            prediction_service=FakePredictionService(),
+            accept="application/x-ndjson",
+            accept_encoding=None,
+        )
+        rows = [json.loads(line) for line in (await _body(response)).splitlines()]
+
+        assert "content-encoding" not in response.headers
+        assert len(rows) == 6
+        assert rows[-1]["latitude"] == 2.0 and rows[-1]["longitude"] == 30.5
+
+    @pytest.mark.skipif(not ARROW_AVAILABLE, reason="pyarrow is not installed")
+    @pytest.mark.asyncio
+    async def test_spatial_streams_arrow_record_batches(self):
+        import pyarrow as pa
+
+        request = SpatialPredictionRequest(
+            bounds={"south": 1.0, "north": 2.0, "west": 30.0, "east": 30.5},
+            resolution=0.5,
+            target_date=date(2024, 3, 1),
+        )
+
+        response = await predict_spatial_grid(
+            request,
+            prediction_service=FakePredictionService(),
+            accept="application/vnd.apache.arrow.stream",
+            accept_encoding=None,
+        )
+        table = pa.ipc.open_stream(await _body(response)).read_all()
+
+        assert table.num_rows == 6
+        assert table.schema.metadata[b"target_date"] == b"2024-03-01"
+        assert table.column("risk_level").to_pylist()[0] == "low"
@@ -0,0 +1,104 @@
+"""
+Unit tests for int8 quantized model variants.
+"""
+import numpy as np
+import pytest
+import torch
+from pydantic import ValidationError
+
+from src.malaria_predictor.api.dependencies import ModelManager
+from src.malaria_predictor.api.models import ModelType
+from src.malaria_predictor.config import MLModelSettings
+from src.malaria_predictor.ml import MalariaLSTM, MalariaTransformer
+from src.malaria_predictor.ml.export import example_inputs
+from src.malaria_predictor.ml.quantization import (
+    check_quantized_accuracy,
+    model_size_bytes,
+    quantize_model,
+)
+
+
+def _lstm() -> MalariaLSTM:
+    torch.manual_seed(0)
+    return MalariaLSTM(hidden_size=32, num_layers=2, prediction_horizon=5)
+
+
+class TestQuantizeModel:
+    """Test dynamic int8 quantization of the model families."""
+
+    @pytest.mark.parametrize(
+        "build",
+        [
+            _lstm,
+            lambda: MalariaTransformer(
+                d_model=32, num_layers=1, num_heads=2, d_ff=64, max_spatial_size=4, prediction_horizon=5
+            ),
+        ],
+    )
+    def test_quantized_copy_is_smaller_and_close(self, build):
+        model = build().eval()
+        inputs = example_inputs(model, batch_size=8)
+
+        quantized = quantize_model(model)
+
+        quantized_types = {type(m).__module__ for m in quantized.modules()}
+        assert any("quantized" in name for name in quantized_types)
+        assert all(not hasattr(m, "_packed_params") for m in model.modules())
+        assert model_size_bytes(quantized) < model_size_bytes(model)
+        with torch.no_grad():
+            diff = torch.abs(model(inputs)["risk_mean"] - quantized(inputs)["risk_mean"])
+        assert float(diff.max()) < 0.05
+
+    def test_pruning_zeroes_smallest_weights(self):
+        quantized = quantize_model(_lstm(), prune_amount=0.5)
+
+        weight = quantized.risk_predictor[0].weight().dequantize()
+        assert float((weight == 0).float().mean()) >= 0.5
+
+    def test_invalid_prune_amount(self):
+        with pytest.raises(ValueError):
+            quantize_model(_lstm(), prune_amount=1.0)
+
+
+class TestAccuracyCheck:
+    """Test the held-out accuracy comparison against fp32."""
+
+    def test_reports_metrics_for_both_variants(self):
+        model = _lstm().eval()
+        inputs = example_inputs(model, batch_size=64)
+        with torch.no_grad():
+            fp32 = model(inputs)["risk_mean"].numpy()
+        targets = np.clip(fp32[:, 0] + np.random.default_rng(0).normal(0, 0.05, 64), 0, 1)
+
+        report = check_quantized_accuracy(model, quantize_model(model), inputs, targets)
+
+        assert report["passed"]
+        assert {"rmse", "mae", "r2"} <= set(report["fp32"]) & set(report["int8"])
+        assert abs(report["rmse_increase"]) < 0.01
+
+        strict = check_quantized_accuracy(
+            model, quantize_model(model, prune_amount=0.9), inputs, targets, max_rmse_increase=-1.0
+        )
+        assert not strict["passed"]
+
+
+class TestQuantizedServing:
+    """Test per-model-type variant selection in the model manager."""
+
+    @pytest.mark.asyncio
+    async def test_selected_model_types_are_quantized(self):
+        manager = ModelManager(quantized_models=["lstm"])
+
+        lstm = await manager.get_model(ModelType.LSTM)
+        transformer = await manager.get_model(ModelType.TRANSFORMER)
+
+        assert manager.model_health[ModelType.LSTM]["variant"] == "int8"
+        assert manager.model_health[ModelType.TRANSFORMER]["variant"] == "fp32"
+        assert any(hasattr(m, "_packed_params") for m in lstm.modules())
+        assert not any(hasattr(m, "_packed_params") for m in transformer.modules())
+        health = await manager.health_check()
+        assert health["lstm"]["status"] == "healthy"
+
+    def test_unknown_quantized_model_type_is_rejected(self):
+        with pytest.raises(ValidationError):
+            MLModelSettings(quantized_models=["gru"])
@@ -0,0 +1,168 @@
+"""
+Unit tests for statement caching settings, reusable hot queries and pool metrics.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.malaria_predictor.alerts.alert_engine import AlertEngine
+from src.malaria_predictor.database import session as db_session
+from src.malaria_predictor.database.models import AlertConfiguration, AlertRule, Base
+from src.malaria_predictor.database.session import (
+    InstrumentedAsyncQueuePool,
+    PoolMetrics,
+)
+
+
+@pytest_asyncio.fixture
+async def pooled_engine(tmp_path, monkeypatch):
+    metrics = PoolMetrics()
+    monkeypatch.setattr(db_session, "_pool_metrics", metrics)
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path}/pool.db",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    db_session._instrument_pool(engine)
+    yield engine, metrics
+    await engine.dispose()
+
+
+class TestPoolMetrics:
+    """Test wait and checkout timing of the instrumented pool."""
+
+    @pytest.mark.asyncio
+    async def test_checkouts_are_timed(self, pooled_engine):
+        engine, metrics = pooled_engine
+
+        for _ in range(3):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        snapshot = metrics.snapshot()
+        assert snapshot["checkouts"] == 3
+        assert len(metrics.checkout_ms) == 3
+        assert snapshot["wait_ms"]["p99"] >= snapshot["wait_ms"]["p50"] >= 0
+        assert snapshot["checkout_ms"]["max"] is not None
+
+    @pytest.mark.asyncio
+    async def test_pool_timeouts_are_counted(self, pooled_engine):
+        engine, metrics = pooled_engine
+
+        async with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        assert metrics.timeouts == 1
+        assert metrics.wait_ms[-1] >= 100
+
+    @pytest.mark.asyncio
+    async def test_pool_status_of_a_real_pool(self, pooled_engine, monkeypatch):
+        engine, _ = pooled_engine
+        monkeypatch.setattr(db_session, "_engine", engine)
+        monkeypatch.setattr(db_session, "_replica_router", None)
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            status = await db_session.get_connection_pool_status()
+
+        assert status["pool_size"] == 1
+        assert status["checked_out"] == 1
+        assert status["invalid"] is None
+        assert status["checkouts"] == 1
+        assert status["wait_ms"]["max"] is not None
+
+    def test_percentiles_of_empty_window(self):
+        assert PoolMetrics().snapshot()["wait_ms"] == {
+            "p50": None,
+            "p95": None,
+            "p99": None,
+            "max": None,
+        }
+
+
+class TestEngineCacheSettings:
+    """Test the statement cache and pool policy passed to the engine."""
+
+    @pytest.mark.parametrize(
+        ("environment", "pool_size", "pre_ping"),
+        [("development", 5, False), ("staging", 10, True), ("production", 20, True)],
+    )
+    def test_environment_pool_policy(self, environment, pool_size, pre_ping):
+        db_session._engine = None
+        with (
+            patch.object(db_session, "settings") as mock_settings,
+            patch.object(db_session, "create_async_engine") as mock_create,
+        ):
+            mock_settings.testing = False
+            mock_settings.environment = environment
+            mock_settings.get_database_url.return_value = "postgresql+asyncpg://u:p@db/malaria"
+            mock_settings.database.statement_cache_size = 250
+            mock_settings.database.query_cache_size = 2000
+            mock_create.return_value = AsyncMock()
+
+            db_session.get_engine()
+
+        db_session._engine = None
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["poolclass"] is InstrumentedAsyncQueuePool
+        assert kwargs["pool_size"] == pool_size
+        assert kwargs["pool_pre_ping"] is pre_ping
+        assert kwargs["connect_args"] == {"prepared_statement_cache_size": 250}
+        assert kwargs["query_cache_size"] == 2000
+
+    def test_statement_cache_only_for_asyncpg(self):
+        assert db_session._connect_args("sqlite+aiosqlite:///local.db") == {}
+
+
+class TestReusableStatements:
+    """Test that hot lookups bind their values instead of rebuilding SQL."""
+
+    @pytest.mark.asyncio
+    async def test_alert_rule_lookup_binds_each_request(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=[AlertConfiguration.__table__, AlertRule.__table__],
+            )
+        async with AsyncSession(engine) as db:
+            for name, (south, north) in {"north": (5, 10), "south": (-10, -5)}.items():
+                config = AlertConfiguration(
+                    user_id="user",
+                    configuration_name=name,
+                    latitude_min=south,
+                    latitude_max=north,
+                )
+                db.add(config)
+                await db.flush()
+                db.add(
+                    AlertRule(
+                        configuration_id=config.id,
+                        rule_name=name,
+                        conditions={},
+                        rule_type="threshold",
+                    )
+                )
+            await db.commit()
+
+            engine_under_test = AlertEngine.__new__(AlertEngine)
+            found = [
+                [
+                    rule.rule_name
+                    for rule in await engine_under_test._get_active_alert_rules(
+                        db, SimpleNamespace(latitude=latitude, longitude=30.0, country_code=None)
+                    )
+                ]
+                for latitude in (7.0, -7.0)
+            ]
+        await engine.dispose()
+
+        assert found == [["north"], ["south"]]
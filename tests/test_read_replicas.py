@@ -0,0 +1,143 @@
+"""
+Unit tests for read-replica session routing.
+"""
+import asyncio
+import shutil
+
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.malaria_predictor.database import session as db_session
+from src.malaria_predictor.database.session import (
+    ReplicaRouter,
+    get_db,
+    get_read_db,
+    get_read_session,
+    get_replica_router,
+    get_session,
+    monitor_replica_health,
+)
+
+
+async def _count(session) -> int:
+    return (await session.execute(text("SELECT count(*) FROM readings"))).scalar()
+
+
+@pytest_asyncio.fixture
+async def databases(tmp_path, monkeypatch):
+    """A primary SQLite file and a copy standing in for its replica."""
+    primary_path = tmp_path / "primary.db"
+    primary = create_async_engine(f"sqlite+aiosqlite:///{primary_path}")
+    async with primary.begin() as conn:
+        await conn.execute(text("CREATE TABLE readings (id INTEGER PRIMARY KEY)"))
+        await conn.execute(text("INSERT INTO readings DEFAULT VALUES"))
+
+    replica_path = tmp_path / "replica.db"
+    shutil.copy(primary_path, replica_path)
+    async with primary.begin() as conn:
+        # Written after the copy, so only the primary has it
+        await conn.execute(text("INSERT INTO readings DEFAULT VALUES"))
+
+    monkeypatch.setattr(db_session, "_engine", primary)
+    monkeypatch.setattr(db_session, "_async_session_maker", None)
+    monkeypatch.setattr(db_session, "_replica_router", None)
+    monkeypatch.setattr(db_session.settings.database, "replica_urls", [])
+
+    def use_replicas(*paths):
+        monkeypatch.setattr(
+            db_session.settings.database,
+            "replica_urls",
+            [f"sqlite+aiosqlite:///{path}" for path in paths],
+        )
+        return get_replica_router()
+
+    yield replica_path, use_replicas
+
+    if db_session._replica_router is not None:
+        for engine in db_session._replica_router.engines.values():
+            await engine.dispose()
+    await primary.dispose()
+
+
+class TestReadSessions:
+    """Test that read sessions go to replicas and fall back to the primary."""
+
+    @pytest.mark.asyncio
+    async def test_reads_use_replica_and_writes_use_primary(self, databases):
+        replica_path, use_replicas = databases
+        use_replicas(replica_path)
+
+        async with get_read_session() as session:
+            assert await _count(session) == 1
+        async with get_session() as session:
+            assert await _count(session) == 2
+
+    @pytest.mark.asyncio
+    async def test_without_replicas_reads_use_primary(self, databases):
+        async with get_read_session() as session:
+            assert await _count(session) == 2
+
+    @pytest.mark.asyncio
+    async def test_unreachable_replica_falls_back_and_leaves_rotation(self, databases, tmp_path):
+        _, use_replicas = databases
+        router = use_replicas(tmp_path / "missing" / "replica.db")
+
+        async with get_read_session() as session:
+            assert await _count(session) == 2
+
+        assert [replica["healthy"] for replica in router.status()] == [False]
+        assert router.candidates() == []
+
+
+    @pytest.mark.asyncio
+    async def test_session_dependencies_in_routes(self, databases):
+        replica_path, use_replicas = databases
+        use_replicas(replica_path)
+        app = FastAPI()
+
+        @app.get("/read")
+        async def read(db: AsyncSession = Depends(get_read_db)) -> int:
+            return await _count(db)
+
+        @app.get("/write")
+        async def write(db: AsyncSession = Depends(get_db)) -> int:
+            return await _count(db)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            assert (await client.get("/read")).json() == 1
+            assert (await client.get("/write")).json() == 2
+
+    @pytest.mark.asyncio
+    async def test_monitor_takes_failing_replicas_out_of_rotation(self, databases):
+        replica_path, use_replicas = databases
+        # SQLite has no pg_last_xact_replay_timestamp, so the lag probe fails
+        router = use_replicas(replica_path)
+
+        monitor = asyncio.create_task(monitor_replica_health(0.01))
+        await asyncio.sleep(0.2)
+        monitor.cancel()
+
+        assert [replica["healthy"] for replica in router.status()] == [False]
+
+
+class TestReplicaRouter:
+    """Test rotation over healthy replicas."""
+
+    def test_round_robin_skips_unhealthy(self):
+        engines = {name: create_async_engine("sqlite+aiosqlite://") for name in "abc"}
+        router = ReplicaRouter(engines, retry_seconds=60)
+
+        first = [name for name, _ in router.candidates()]
+        second = [name for name, _ in router.candidates()]
+        router.mark_unhealthy("b")
+        third = [name for name, _ in router.candidates()]
+        router.mark_healthy("b")
+
+        assert first == ["a", "b", "c"]
+        assert second == ["b", "c", "a"]
+        assert "b" not in third
+        assert all(replica["healthy"] for replica in router.status())
@@ -0,0 +1,195 @@
+"""
+Unit tests for report generation: section caching, streamed exports and
+parallel export execution.
+"""
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from openpyxl import load_workbook
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.malaria_predictor.database.models import (
+    Base,
+    DataVersion,
+    ERA5DataPoint,
+    MalariaRiskIndex,
+    Report,
+    ReportTemplate,
+)
+from src.malaria_predictor.database.repositories import (
+    INGESTION_VERSION,
+    RISK_EDIT_VERSION,
+)
+from src.malaria_predictor.services import report_generator
+from src.malaria_predictor.services.report_generator import (
+    ReportExporter,
+    ReportGenerator,
+    ReportSectionCache,
+)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            DataVersion.__table__,
+            MalariaRiskIndex.__table__,
+            ERA5DataPoint.__table__,
+            ReportTemplate.__table__,
+            Report.__table__,
+        ],
+    )
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _add_risk(session, day: int) -> None:
+    session.add(
+        MalariaRiskIndex(
+            assessment_date=datetime(2024, 1, day),
+            latitude=-1.0,
+            longitude=36.0,
+            location_name="Nairobi",
+            composite_risk_score=0.5,
+            temperature_risk_component=0.5,
+            precipitation_risk_component=0.5,
+            humidity_risk_component=0.5,
+            risk_level="medium",
+            confidence_score=0.8,
+            prediction_date=datetime(2024, 1, day),
+            time_horizon_days=30,
+            model_version="1.0",
+            model_type="ensemble",
+        )
+    )
+    session.commit()
+
+
+def _render_stub(section, records):
+    return {f"{section}_chart": {"svg": "<svg/>"}}
+
+
+class TestReportSectionCache:
+    """Test the disk-backed section cache."""
+
+    def test_round_trip_and_prune(self, tmp_path):
+        cache = ReportSectionCache(tmp_path, max_entries=2)
+        keys = [cache.make_key("section", i) for i in range(3)]
+
+        assert cache.get(keys[0]) is None
+        for i, key in enumerate(keys):
+            cache.set(key, [{"value": i}])
+
+        assert cache.get(keys[2]) == [{"value": 2}]
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_key_is_order_independent_for_dicts(self):
+        assert ReportSectionCache.make_key({"a": 1, "b": 2}) == ReportSectionCache.make_key(
+            {"b": 2, "a": 1}
+        )
+
+
+class TestStreamingExports:
+    """Test exports written straight to disk."""
+
+    def test_csv_and_excel_written_to_disk(self, tmp_path):
+        exporter = ReportExporter()
+        data = {"predictions": [{"date": "2024-01-01", "risk": i / 10} for i in range(10)]}
+        metadata = {"title": "Weekly", "generated_at": "2024-01-08"}
+
+        csv_size = exporter.write_export("csv", tmp_path / "r.csv", "", data, {}, metadata)
+        assert csv_size == (tmp_path / "r.csv").stat().st_size
+        rows = [row for row in csv.reader((tmp_path / "r.csv").read_text().splitlines()) if row]
+        assert rows[3] == ["date", "risk"]
+        assert len(rows) == 4 + 10
+
+        exporter.write_export("excel", tmp_path / "r.xlsx", "", data, {}, metadata)
+        workbook = load_workbook(tmp_path / "r.xlsx")
+        sheet = workbook["predictions"]
+        assert [cell.value for cell in sheet[1]] == ["date", "risk"]
+        assert sheet.max_row == 11
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_unsupported_format_leaves_no_file(self, tmp_path):
+        with pytest.raises(ValueError):
+            ReportExporter().write_export("docx", tmp_path / "r.docx", "", {}, {}, {})
+        assert not list(tmp_path.iterdir())
+
+
+class TestReportGenerator:
+    """Test report generation with cached sections and parallel exports."""
+
+    @pytest.mark.asyncio
+    async def test_sections_reused_until_data_changes(self, db_session, tmp_path):
+        _add_risk(db_session, 1)
+        executor = ThreadPoolExecutor(max_workers=3)
+        generator = ReportGenerator(db_session, executor=executor, exports_dir=tmp_path)
+
+        with patch.object(
+            report_generator, "_render_section_charts", side_effect=_render_stub
+        ) as render:
+            first = await generator.generate_report(export_formats=["csv", "excel"])
+            assert render.call_count == 1  # climate section is empty
+            assert all(
+                result["status"] == "completed" for result in first["export_results"].values()
+            )
+            for path in first["file_paths"].values():
+                assert (tmp_path / path.rsplit("/", 1)[-1]).exists()
+
+            hits = generator.section_cache.hits
+            await generator.generate_report(export_formats=["csv"])
+            assert render.call_count == 1
+            assert generator.section_cache.hits > hits
+
+            _add_risk(db_session, 2)
+            second = await generator.generate_report(export_formats=["csv"])
+            assert render.call_count == 2
+            assert second["data_points_count"] == 2
+
+        executor.shutdown()
+
+    def test_section_keys_follow_data_versions(self, db_session, tmp_path):
+        _add_risk(db_session, 1)
+        generator = ReportGenerator(db_session, exports_dir=tmp_path)
+        before = generator._section_cache_keys({}, None)
+
+        db_session.add(DataVersion(name=RISK_EDIT_VERSION, version=1))
+        db_session.commit()
+        edited = generator._section_cache_keys({}, None)
+        assert edited["predictions"] != before["predictions"]
+        assert edited["climate"] == before["climate"]
+
+        db_session.add(DataVersion(name=INGESTION_VERSION, version=1))
+        db_session.commit()
+        ingested = generator._section_cache_keys({}, None)
+        assert ingested["climate"] != edited["climate"]
+
+    @pytest.mark.asyncio
+    async def test_failed_format_does_not_block_others(self, db_session, tmp_path):
+        executor = ThreadPoolExecutor(max_workers=2)
+        generator = ReportGenerator(db_session, executor=executor, exports_dir=tmp_path)
+
+        def failing_write(format_name, *args):
+            if format_name == "pdf":
+                raise RuntimeError("layout failed")
+            return ReportExporter().write_export(format_name, *args)
+
+        with patch.object(report_generator, "_write_export_file", side_effect=failing_write):
+            result = await generator.generate_report(export_formats=["pdf", "csv", "docx"])
+
+        assert result["export_results"]["pdf"]["status"] == "failed"
+        assert result["export_results"]["csv"]["status"] == "completed"
+        assert "docx" not in result["export_results"]
+        executor.shutdown()
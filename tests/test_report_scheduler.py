@@ -0,0 +1,258 @@
+"""
+Unit tests for leased, concurrent execution of scheduled reports.
+"""
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from prometheus_client import CollectorRegistry
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.malaria_predictor.database.models import (
+    Base,
+    Report,
+    ReportSchedule,
+    ReportTemplate,
+)
+from src.malaria_predictor.monitoring.metrics import ReportSchedulerMetrics
+from src.malaria_predictor.services.report_scheduler import (
+    ReportScheduler,
+    WebhookDeliveryService,
+)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(
+        engine,
+        tables=[ReportTemplate.__table__, ReportSchedule.__table__, Report.__table__],
+    )
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    with factory() as session:
+        session.add(
+            ReportTemplate(
+                id=1,
+                name="Weekly",
+                created_by="admin",
+                template_type="standard",
+                category="analytics",
+                layout_configuration={},
+                widgets=[],
+                data_sources={},
+            )
+        )
+        session.commit()
+    return factory
+
+
+def _add_schedules(factory, count: int, minutes_overdue: int = 5) -> None:
+    due = datetime.utcnow() - timedelta(minutes=minutes_overdue)
+    with factory() as session:
+        for i in range(count):
+            session.add(
+                ReportSchedule(
+                    name=f"schedule-{i}",
+                    created_by="admin",
+                    template_id=1,
+                    report_configuration={},
+                    schedule_type="interval",
+                    interval_minutes=60,
+                    next_execution=due,
+                    delivery_methods=["storage"],
+                    export_formats=["csv"],
+                )
+            )
+        session.commit()
+
+
+def _scheduler(factory, **kwargs) -> ReportScheduler:
+    return ReportScheduler(factory(), session_factory=factory, **kwargs)
+
+
+class TestScheduleLeases:
+    """Test claiming schedules across scheduler instances."""
+
+    def test_claimed_schedules_are_not_claimed_twice(self, session_factory):
+        _add_schedules(session_factory, 3)
+        first = _scheduler(session_factory, worker_id="a")
+        second = _scheduler(session_factory, worker_id="b")
+
+        claimed_a = first._claim_due_schedules(2)
+        claimed_b = second._claim_due_schedules(5)
+
+        assert len(claimed_a) == 2
+        assert len(claimed_b) == 1
+        assert not {sid for sid, _ in claimed_a} & {sid for sid, _ in claimed_b}
+        assert second._claim_due_schedules(5) == []
+
+    def test_expired_lease_is_reclaimed(self, session_factory):
+        _add_schedules(session_factory, 1)
+        crashed = _scheduler(session_factory, worker_id="crashed", lease_seconds=-1)
+        (schedule_id, _), = crashed._claim_due_schedules(1)
+
+        survivor = _scheduler(session_factory, worker_id="survivor")
+        assert [sid for sid, _ in survivor._claim_due_schedules(1)] == [schedule_id]
+        assert not crashed._renew_lease(schedule_id)
+        assert survivor._renew_lease(schedule_id)
+
+
+class TestConcurrentExecution:
+    """Test bounded concurrent execution of claimed schedules."""
+
+    @pytest.mark.asyncio
+    async def test_runs_up_to_limit_concurrently_and_releases_leases(self, session_factory):
+        _add_schedules(session_factory, 5)
+        metrics = ReportSchedulerMetrics(CollectorRegistry())
+        scheduler = _scheduler(session_factory, max_concurrent_reports=3, metrics=metrics)
+        running = 0
+        peak = 0
+
+        async def fake_execute(schedule, db=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            schedule.next_execution = datetime.utcnow() + timedelta(hours=1)
+            schedule.success_count = (schedule.success_count or 0) + 1
+
+        with patch.object(scheduler, "_execute_scheduled_report", side_effect=fake_execute):
+            assert await scheduler._process_scheduled_reports() == 3
+            assert await scheduler._process_scheduled_reports() == 2
+            assert await scheduler._process_scheduled_reports() == 0
+
+        assert peak == 3
+        with session_factory() as session:
+            schedules = session.query(ReportSchedule).all()
+            assert all(s.lease_owner is None and s.lease_expires_at is None for s in schedules)
+            assert all(s.success_count == 1 for s in schedules)
+
+        lag = metrics.registry.get_sample_value("malaria_report_schedule_lag_seconds_count")
+        assert lag == 5
+        assert metrics.registry.get_sample_value(
+            "malaria_report_schedule_executions_total", {"status": "success"}
+        ) == 5
+
+    @pytest.mark.asyncio
+    async def test_worker_loop_refills_free_slots(self, session_factory):
+        _add_schedules(session_factory, 4)
+        metrics = ReportSchedulerMetrics(CollectorRegistry())
+        scheduler = _scheduler(
+            session_factory, max_concurrent_reports=2, poll_interval=0.01, metrics=metrics
+        )
+        executed = []
+
+        async def fake_execute(schedule, db=None):
+            await asyncio.sleep(0.02)
+            schedule.next_execution = datetime.utcnow() + timedelta(hours=1)
+            executed.append(schedule.id)
+            if len(executed) == 4:
+                await scheduler.stop_scheduler()
+
+        with patch.object(scheduler, "_execute_scheduled_report", side_effect=fake_execute):
+            await asyncio.wait_for(scheduler.start_scheduler(), timeout=5)
+
+        assert sorted(executed) == [1, 2, 3, 4]
+        assert not scheduler.running
+        assert scheduler.get_queue_metrics()["active_executions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_is_recorded_and_lease_released(self, session_factory):
+        _add_schedules(session_factory, 1)
+        scheduler = _scheduler(session_factory)
+
+        with patch.object(
+            scheduler, "_execute_scheduled_report", side_effect=RuntimeError("boom")
+        ):
+            await scheduler._process_scheduled_reports()
+
+        with session_factory() as session:
+            schedule = session.query(ReportSchedule).one()
+            assert schedule.error_count == 1
+            assert schedule.last_error_message == "boom"
+            assert schedule.lease_owner is None
+
+    def test_queue_metrics(self, session_factory):
+        _add_schedules(session_factory, 4, minutes_overdue=10)
+        metrics = ReportSchedulerMetrics(CollectorRegistry())
+        scheduler = _scheduler(session_factory, metrics=metrics)
+        scheduler._claim_due_schedules(1)
+
+        queue = scheduler.get_queue_metrics()
+
+        assert queue["due"] == 3
+        assert queue["leased"] == 1
+        assert queue["oldest_due_seconds"] >= 600
+        assert metrics.registry.get_sample_value(
+            "malaria_report_schedule_queue_depth", {"state": "due"}
+        ) == 3
+
+    @pytest.mark.asyncio
+    async def test_database_calls_run_off_the_event_loop(self, session_factory):
+        _add_schedules(session_factory, 1)
+        scheduler = _scheduler(session_factory)
+        loop_thread = threading.get_ident()
+        threads = []
+        claim = scheduler._claim_due_schedules
+
+        def recording_claim(limit):
+            threads.append(threading.get_ident())
+            return claim(limit)
+
+        async def fake_execute(schedule, db=None):
+            schedule.next_execution = datetime.utcnow() + timedelta(hours=1)
+
+        with (
+            patch.object(scheduler, "_claim_due_schedules", side_effect=recording_claim),
+            patch.object(scheduler, "_execute_scheduled_report", side_effect=fake_execute),
+        ):
+            assert await scheduler._process_scheduled_reports() == 1
+
+        assert threads and loop_thread not in threads
+
+
+class TestWebhookDelivery:
+    """Test concurrent webhook delivery over a shared connection pool."""
+
+    @pytest.mark.asyncio
+    async def test_posts_concurrently_on_shared_session(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return web.Response(status=200 if request.path != "/fail" else 500)
+
+        app = web.Application()
+        app.router.add_post("/{name}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        service = WebhookDeliveryService()
+        try:
+            urls = [str(server.make_url(f"/hook{i}")) for i in range(3)]
+            urls.append(str(server.make_url("/fail")))
+            results = await service.send_report_webhook(urls, {"report_id": 1})
+            session = service._session
+            await service.send_report_webhook(urls[:1], {"report_id": 2})
+            assert service._session is session
+        finally:
+            await service.close()
+            await server.close()
+
+        assert peak == 4
+        assert [results[url] for url in urls] == [True, True, True, False]
@@ -282,6 +282,7 @@ class TestERA5Repository:
         assert result == 0
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_bulk_insert_data_points_with_upsert(self, repository, mock_session):
         """Test bulk_insert_data_points with upsert enabled."""
         data_points = [
@@ -311,6 +312,7 @@ class TestERA5Repository:
             mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_bulk_insert_data_points_without_upsert(
         self, repository, mock_session
     ):
@@ -378,6 +380,7 @@ class TestERA5Repository:
                 latitude=40.7128,
                 longitude=-74.0060,
                 buffer_degrees=0.25,
+                radius_km=None,
             )
 
     @pytest.mark.asyncio
@@ -480,6 +483,7 @@ class TestERA5Repository:
             mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_bulk_insert_sqlite_dialect(self, repository, mock_session):
         """Test bulk_insert_data_points with SQLite dialect."""
         data_points = [
@@ -605,6 +609,7 @@ class TestProcessedClimateRepository:
             assert result.empty
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_save_processing_result_with_data(self, repository, mock_session):
         """Test save_processing_result with actual DataFrame data processing."""
         # Mock processing result
@@ -641,6 +646,7 @@ class TestProcessedClimateRepository:
             mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_save_processing_result_postgresql_dialect(
         self, repository, mock_session
     ):
@@ -843,6 +849,7 @@ class TestMalariaRiskRepository:
             mock_method.assert_called_once_with(assessment_id, updated_data)
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_save_risk_assessment_actual_implementation(
         self, repository, mock_session
     ):
@@ -954,20 +961,17 @@ class TestMalariaRiskRepository:
 
         locations = [(40.7128, -74.0060), (34.0522, -118.2437)]
 
-        with patch("malaria_predictor.database.repositories.select") as mock_select:
-            with patch("sqlalchemy.or_") as mock_or:
-                mock_query = Mock()
-                mock_select.return_value = mock_query
-                mock_query.where.return_value = mock_query
-                mock_query.order_by.return_value = mock_query
+        result = await repository.get_current_risk_levels(locations)
 
-                result = await repository.get_current_risk_levels(locations)
-
-                assert result == mock_data
-                mock_session.execute.assert_called_once()
-                mock_or.assert_called_once()
+        assert result == mock_data
+        mock_session.execute.assert_called_once()
+        # One set-based query ranking assessments per location
+        sql = str(mock_session.execute.call_args.args[0])
+        assert "row_number() OVER" in sql
+        assert " OR " not in sql
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_store_risk_assessment_actual_implementation(
         self, repository, mock_session
     ):
@@ -1027,7 +1031,8 @@ class TestMalariaRiskRepository:
             )
 
             assert result == 1
-            mock_session.execute.assert_called_once()
+            # Assessment update plus the matching latest_risk row
+            assert mock_session.execute.call_count == 2
             mock_session.commit.assert_called_once()
 
 
@@ -1045,6 +1050,7 @@ class TestEnvironmentalDataRepository:
         return EnvironmentalDataRepository(mock_session)
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_store_data_modis(self, repository, mock_session):
         """Test storing MODIS environmental data."""
         data = {
@@ -1245,6 +1251,7 @@ class TestPredictionRepository:
         return PredictionRepository(mock_session)
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_store_prediction(self, repository, mock_session):
         """Test storing prediction data."""
         data = {
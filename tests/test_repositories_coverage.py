@@ -52,6 +52,7 @@ class TestERA5Repository:
         assert result == 0
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_bulk_insert_data_points_postgresql_upsert(
         self, repository, mock_session
     ):
@@ -80,6 +81,7 @@ class TestERA5Repository:
         mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_bulk_insert_data_points_sqlite(self, repository, mock_session):
         """Test bulk insert with SQLite (testing mode)."""
         mock_session.bind.dialect.name = "sqlite"
@@ -104,6 +106,7 @@ class TestERA5Repository:
         mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_bulk_insert_data_points_no_upsert(self, repository, mock_session):
         """Test bulk insert without upsert."""
         data_points = [
@@ -202,14 +205,15 @@ class TestERA5Repository:
     @pytest.mark.asyncio
     async def test_delete_old_data(self, repository, mock_session):
         """Test deleting old data."""
+        # PostgreSQL: count the old rows, drop their chunks, delete the rest
         mock_result = Mock()
-        mock_result.rowcount = 50
+        mock_result.scalar.return_value = 50
         mock_session.execute.return_value = mock_result
 
         result = await repository.delete_old_data(days_to_keep=30)
 
         assert result == 50
-        mock_session.execute.assert_called_once()
+        assert mock_session.execute.call_count == 3
         mock_session.commit.assert_called_once()
 
 
@@ -261,6 +265,7 @@ class TestProcessedClimateRepository:
         assert result == 0
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_save_processing_result_postgresql(
         self, repository, mock_session, mock_processing_result
     ):
@@ -292,6 +297,7 @@ class TestProcessedClimateRepository:
         mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_save_processing_result_sqlite(
         self, repository, mock_session, mock_processing_result
     ):
@@ -403,6 +409,7 @@ class TestMalariaRiskRepository:
         assert repo.session == mock_session
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_save_risk_assessment(self, repository, mock_session):
         """Test saving a risk assessment."""
         assessment_date = datetime(2023, 1, 1)
@@ -436,6 +443,7 @@ class TestMalariaRiskRepository:
         mock_session.refresh.assert_called_once()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_save_risk_assessment_minimal_data(self, repository, mock_session):
         """Test saving risk assessment with minimal data."""
         assessment_date = datetime(2023, 1, 1)
@@ -2,12 +2,19 @@
 
 from datetime import date
 
+import numpy as np
+import pytest
+import xarray as xr
+
 from malaria_predictor.models import (
     EnvironmentalFactors,
     GeographicLocation,
     RiskLevel,
 )
-from malaria_predictor.services.risk_calculator import RiskCalculator
+from malaria_predictor.services.risk_calculator import (
+    RiskCalculator,
+    _round3,
+)
 
 
 class TestRiskCalculator:
@@ -427,3 +434,134 @@ class TestRiskCalculator:
         assert len(str(assessment.risk_score).split(".")[-1]) <= 3
         assert len(str(assessment.confidence).split(".")[-1]) <= 3
         assert len(str(assessment.temperature_factor).split(".")[-1]) <= 3
+
+
+FACTOR_FIELDS = (
+    "risk_score",
+    "confidence",
+    "temperature_factor",
+    "rainfall_factor",
+    "humidity_factor",
+    "vegetation_factor",
+    "elevation_factor",
+)
+
+
+def _grid_inputs(size: int, seed: int = 0) -> dict[str, np.ndarray]:
+    """Random cells plus every threshold value of the scalar rules."""
+    rng = np.random.default_rng(seed)
+    temperature = np.concatenate([rng.uniform(10, 40, size), [18.0, 25.0, 34.0, 17.999, 34.001]])
+    n = temperature.size
+    rainfall = np.concatenate([rng.uniform(0, 600, size), [80.0, 200.0, 0.0, 79.9, 2000.0]])
+    humidity = np.concatenate([rng.uniform(40, 100, size), [60.0, 80.0, 100.0, 59.9, 0.0]])
+    elevation = np.concatenate([rng.uniform(0, 2600, size), [1200.0, 1600.0, 2000.0, 0.0, 3000.0]])
+    ndvi = rng.uniform(-1, 1, n)
+    evi = rng.uniform(-1, 1, n)
+    ndvi[::3] = np.nan
+    evi[::5] = np.nan
+    ndvi[-5:] = [-0.4, 0.4, -1.0, 1.0, np.nan]
+    return {
+        "mean_temperature": temperature,
+        "monthly_rainfall": rainfall,
+        "relative_humidity": humidity,
+        "elevation": elevation,
+        "ndvi": ndvi,
+        "evi": evi,
+    }
+
+
+class TestRiskCalculatorArray:
+    """Tests for the vectorized whole-grid scoring path."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = RiskCalculator()
+
+    def _scalar(self, inputs: dict[str, np.ndarray], i: int):
+        def optional(name):
+            value = inputs[name][i]
+            return None if np.isnan(value) else float(value)
+
+        env = EnvironmentalFactors(
+            mean_temperature=float(inputs["mean_temperature"][i]),
+            min_temperature=-20.0,
+            max_temperature=55.0,
+            monthly_rainfall=float(inputs["monthly_rainfall"][i]),
+            relative_humidity=float(inputs["relative_humidity"][i]),
+            ndvi=optional("ndvi"),
+            evi=optional("evi"),
+            elevation=float(inputs["elevation"][i]),
+        )
+        return self.calculator.calculate_overall_risk(env)
+
+    def test_bit_identical_to_scalar_path(self):
+        """Every cell matches calculate_overall_risk exactly."""
+        inputs = _grid_inputs(3000)
+        result = self.calculator.calculate_overall_risk_array(inputs)
+
+        for i in range(inputs["mean_temperature"].size):
+            expected = self._scalar(inputs, i)
+            for field in FACTOR_FIELDS:
+                actual = getattr(result, field)[i]
+                assert actual == getattr(expected, field), (field, i)
+            assert result.risk_level[i] == expected.risk_level.value
+
+    def test_fast_exp_close_to_exact(self):
+        """np.exp path stays within rounding of the exact path."""
+        inputs = _grid_inputs(2000, seed=1)
+        exact = self.calculator.calculate_overall_risk_array(inputs)
+        fast = self.calculator.calculate_overall_risk_array(inputs, exact=False)
+
+        np.testing.assert_allclose(fast.risk_score, exact.risk_score, atol=1e-3)
+
+    def test_broadcasting_and_missing_vegetation(self):
+        """Inputs broadcast together; absent NDVI/EVI give the neutral factor."""
+        result = self.calculator.calculate_overall_risk_array(
+            {
+                "mean_temperature": np.array([[20.0], [25.0]]),
+                "monthly_rainfall": np.array([100.0, 250.0, 400.0]),
+                "relative_humidity": 70.0,
+                "elevation": 900.0,
+            }
+        )
+
+        assert result.risk_score.shape == (2, 3)
+        assert np.all(result.vegetation_factor == 0.5)
+        assert result.risk_level.dtype.kind == "U"
+
+    def test_xarray_dataset(self):
+        """Dataset inputs keep their dims and coordinates."""
+        dataset = xr.Dataset(
+            {
+                "mean_temperature": (("lat", "lon"), np.full((2, 3), 26.0)),
+                "monthly_rainfall": ("lon", [50.0, 150.0, 300.0]),
+                "relative_humidity": (("lat", "lon"), np.full((2, 3), 85.0)),
+                "elevation": ("lat", [500.0, 1800.0]),
+            },
+            coords={"lat": [-1.0, 0.0], "lon": [36.0, 36.5, 37.0]},
+        )
+
+        output = self.calculator.calculate_overall_risk_array(dataset).to_dataset()
+
+        assert output["risk_score"].dims == ("lat", "lon")
+        assert list(output["lon"].values) == [36.0, 36.5, 37.0]
+        assert output["rainfall_factor"].sel(lat=0.0, lon=36.0) == 0.0
+
+    def test_missing_required_input(self):
+        """Required inputs must be present."""
+        with pytest.raises(ValueError, match="elevation"):
+            self.calculator.calculate_overall_risk_array(
+                {"mean_temperature": [25.0], "monthly_rainfall": [100.0], "relative_humidity": [70.0]}
+            )
+
+    def test_round3_matches_builtin_round(self):
+        """Array rounding reproduces round(value, 3), including halfway cases."""
+        values = np.concatenate(
+            [
+                np.random.default_rng(2).uniform(0, 1, 100000),
+                np.arange(0, 1001) / 1000 + 0.0005,
+                [0.0625, 0.1235, 0.2675, 0.9995],
+            ]
+        )
+        expected = np.array([round(value, 3) for value in values.tolist()])
+        np.testing.assert_array_equal(_round3(values), expected)
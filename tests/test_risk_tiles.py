@@ -0,0 +1,292 @@
+"""
+Unit tests for precomputed risk tile rendering and storage.
+"""
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+import torch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.malaria_predictor.api.dependencies import ModelManager, PredictionService
+from src.malaria_predictor.api.models import ModelType
+from src.malaria_predictor.api.routers import tiles
+from src.malaria_predictor.config import TileSettings
+from src.malaria_predictor.services.data_harmonizer import HarmonizedDataResult
+from src.malaria_predictor.services.risk_tiles import (
+    NODATA_INDEX,
+    RiskTileGenerator,
+    RiskTileStore,
+    decode_tile_png,
+    dequantize_risk,
+    encode_tile_png,
+    lonlat_to_tile,
+    quantize_risk,
+    tile_bounds,
+    tile_sample_grid,
+    tiles_for_bounds,
+)
+
+
+class TestTileMath:
+    """Test web-mercator tile arithmetic."""
+
+    def test_world_tile_bounds(self):
+        west, south, east, north = tile_bounds(0, 0, 0)
+        assert west == -180.0 and east == 180.0
+        assert north == pytest.approx(85.0511, abs=1e-3)
+        assert south == pytest.approx(-85.0511, abs=1e-3)
+
+    def test_lonlat_round_trip(self):
+        x, y = lonlat_to_tile(36.817, -1.286, 8)
+        west, south, east, north = tile_bounds(8, x, y)
+        assert west <= 36.817 <= east
+        assert south <= -1.286 <= north
+
+    def test_tiles_for_bounds_covers_region(self):
+        tiles = tiles_for_bounds((30.0, -5.0, 40.0, 5.0), 5)
+        assert lonlat_to_tile(35.0, 0.0, 5) in tiles
+        assert len(tiles) == len(set(tiles))
+
+    def test_tiles_for_bounds_rejects_antimeridian_box(self):
+        with pytest.raises(ValueError):
+            tiles_for_bounds((170.0, -20.0, -170.0, -10.0), 4)
+
+    def test_sample_grid_inside_tile(self):
+        lats, lons = tile_sample_grid(6, 38, 31, 8)
+        west, south, east, north = tile_bounds(6, 38, 31)
+        assert lats.shape == (8, 8)
+        assert np.all((lons > west) & (lons < east))
+        assert np.all((lats > south) & (lats < north))
+        assert lats[0, 0] > lats[-1, 0]  # row 0 is north
+
+
+class TestTileEncoding:
+    """Test quantization and PNG encoding."""
+
+    def test_quantize_round_trip(self):
+        scores = np.array([0.0, 0.25, 0.5, 1.0, np.nan])
+        indices = quantize_risk(scores)
+        assert indices[-1] == NODATA_INDEX
+        restored = dequantize_risk(indices)
+        assert np.isnan(restored[-1])
+        np.testing.assert_allclose(restored[:-1], scores[:-1], atol=1 / 254)
+
+    def test_png_round_trip(self):
+        indices = np.arange(64 * 64, dtype=np.uint32).reshape(64, 64) % 256
+        data = encode_tile_png(indices.astype(np.uint8))
+        assert data.startswith(b"\x89PNG")
+        np.testing.assert_array_equal(decode_tile_png(data), indices)
+
+
+class _FakePredictionService:
+    def __init__(self):
+        self.harmonized_regions = []
+        self.predict_calls = 0
+
+    async def harmonize_region(self, region_bounds, target_date):
+        self.harmonized_regions.append(region_bounds)
+        return {"bounds": region_bounds}
+
+    async def predict_batch(
+        self, coordinates, target_date, model_type, prediction_horizon=30, harmonized=None
+    ):
+        if harmonized is None:
+            lats = [lat for lat, _ in coordinates]
+            lons = [lon for _, lon in coordinates]
+            harmonized = await self.harmonize_region(
+                (min(lons), min(lats), max(lons), max(lats)), target_date
+            )
+        west, south, east, north = harmonized["bounds"]
+        assert all(west <= lon <= east and south <= lat <= north for lat, lon in coordinates)
+        self.predict_calls += 1
+        return [{"risk_score": 0.5, "uncertainty": None} for _ in coordinates]
+
+
+class TestRiskTileGenerator:
+    """Test tile generation and storage layout."""
+
+    @pytest.mark.asyncio
+    async def test_generate_writes_and_skips_existing(self, tmp_path):
+        settings = TileSettings(
+            directory=tmp_path,
+            tile_size=64,
+            samples_per_tile=8,
+            zoom_levels=[3],
+            regions={"kenya": (34.0, -4.7, 41.9, 5.0)},
+        )
+        service = _FakePredictionService()
+        generator = RiskTileGenerator(service, settings)
+
+        summary = await generator.generate(date(2024, 1, 15), ["ensemble"])
+        assert summary["rendered"] > 0
+        assert summary["failed"] == 0
+        ((west, south, east, north),) = service.harmonized_regions
+        assert 34.0 <= west and east <= 41.9 and -4.7 <= south and north <= 5.0
+
+        x, y = lonlat_to_tile(37.0, 0.0, 3)
+        path = RiskTileStore(tmp_path).tile_path(date(2024, 1, 15), "ensemble", 3, x, y)
+        indices = decode_tile_png(path.read_bytes())
+        assert indices.shape == (64, 64)
+        # Samples inside Kenya are predicted, the rest of the tile is nodata
+        assert set(np.unique(indices)) == {127, NODATA_INDEX}
+
+        again = await generator.generate(date(2024, 1, 15), ["ensemble"])
+        assert again["rendered"] == 0
+        assert again["skipped"] == summary["rendered"]
+
+    @pytest.mark.asyncio
+    async def test_generate_batches_tiles_per_prediction_call(self, tmp_path):
+        settings = TileSettings(
+            directory=tmp_path,
+            tile_size=64,
+            samples_per_tile=4,
+            zoom_levels=[6],
+            regions={"africa": (-20.0, -35.0, 55.0, 40.0)},
+            tiles_per_batch=50,
+        )
+        service = _FakePredictionService()
+
+        summary = await RiskTileGenerator(service, settings).generate(
+            date(2024, 1, 15), ["ensemble"]
+        )
+
+        assert summary["rendered"] > 50
+        assert service.predict_calls == -(-summary["rendered"] // 50)
+        # Each batch harmonizes its own extent, not the whole region
+        assert len(service.harmonized_regions) == service.predict_calls
+        assert all(
+            east - west < 75.0 or north - south < 75.0
+            for west, south, east, north in service.harmonized_regions
+        )
+
+    @pytest.mark.asyncio
+    async def test_tiles_on_region_borders_have_no_holes(self, tmp_path):
+        # Tile (3, 4, 3) spans 0-45E, 0-41N and is split between two regions
+        regions = {"west": (0.0, 0.0, 22.5, 41.0), "east": (22.5, 0.0, 45.0, 41.0)}
+        settings = TileSettings(
+            directory=tmp_path,
+            tile_size=64,
+            samples_per_tile=8,
+            zoom_levels=[3],
+            regions=regions,
+        )
+        service = _FakePredictionService()
+
+        summary = await RiskTileGenerator(service, settings).generate(
+            date(2024, 1, 15), ["ensemble"]
+        )
+
+        assert summary["rendered"] == len(tiles_for_bounds((0.0, 0.0, 45.0, 41.0), 3))
+        path = RiskTileStore(tmp_path).tile_path(date(2024, 1, 15), "ensemble", 3, 4, 3)
+        assert set(np.unique(decode_tile_png(path.read_bytes()))) == {127}
+
+    def test_settings_require_divisible_sampling(self):
+        with pytest.raises(ValueError):
+            TileSettings(tile_size=256, samples_per_tile=30)
+
+    def test_settings_reject_antimeridian_regions(self):
+        with pytest.raises(ValueError):
+            TileSettings(regions={"pacific": (170.0, -20.0, -170.0, -10.0)})
+
+
+class _LocationModel:
+    """Stand-in model whose risk equals the first climate feature."""
+
+    def __call__(self, model_input):
+        climate = model_input["climate"]
+        risk = climate[:, -1, :1].repeat(1, 30)
+        return {"risk_mean": risk, "risk_variance": torch.zeros_like(risk)}
+
+
+class TestPredictBatch:
+    """Test batched prediction over harmonized grids."""
+
+    def _service(self) -> PredictionService:
+        manager = ModelManager()
+        manager.registry.add(ModelType.ENSEMBLE.value, "test", _LocationModel())
+        manager.model_health[ModelType.ENSEMBLE] = {"prediction_count": 0, "error_count": 0}
+        return PredictionService(manager)
+
+    @pytest.mark.asyncio
+    async def test_inputs_are_sampled_per_coordinate(self):
+        # 2x2 grid over (0, 0, 2, 2); row 0 is north
+        harmonized = HarmonizedDataResult(
+            data={"era5_temp_mean": np.array([[0.1, 0.2], [0.3, 0.4]])},
+            metadata={},
+            quality_metrics={},
+            feature_names=["era5_temp_mean"],
+            spatial_bounds=(0.0, 0.0, 2.0, 2.0),
+            temporal_range=(datetime(2024, 1, 15), datetime(2024, 1, 15)),
+            target_resolution="1km",
+            processing_timestamp=datetime(2024, 1, 15),
+        )
+        coordinates = [(1.5, 0.5), (1.5, 1.5), (0.5, 0.5), (0.5, 1.5), (5.0, 5.0)]
+
+        results = await self._service().predict_batch(
+            coordinates,
+            date(2024, 1, 15),
+            ModelType.ENSEMBLE,
+            batch_size=2,
+            harmonized=harmonized,
+        )
+
+        np.testing.assert_allclose(
+            [result["risk_score"] for result in results],
+            [0.1, 0.2, 0.3, 0.4, 0.2],  # out-of-bounds clamps to the edge cell
+            rtol=1e-6,
+        )
+        assert all(result["uncertainty"] == 0.0 for result in results)
+        assert results[0]["model_type"] == "ensemble"
+
+    @pytest.mark.asyncio
+    async def test_empty_coordinates(self):
+        assert await self._service().predict_batch([], date(2024, 1, 15), ModelType.ENSEMBLE) == []
+
+
+def _tiles_client(store: RiskTileStore) -> TestClient:
+    app = FastAPI()
+    app.include_router(tiles.router, prefix="/tiles")
+    app.dependency_overrides[tiles.get_tile_store] = lambda: store
+    # Bypass authentication; scope checks are covered by the auth tests
+    for route in tiles.router.routes:
+        for dependency in route.dependant.dependencies:
+            if dependency.call.__name__ == "scope_dependency":
+                app.dependency_overrides[dependency.call] = lambda: None
+    return TestClient(app)
+
+
+class TestTilesRouter:
+    """Test the tile serving endpoints."""
+
+    def test_invalid_coordinates(self, tmp_path):
+        client = _tiles_client(RiskTileStore(tmp_path))
+
+        assert client.get("/tiles/2024-01-15/3/8/0").status_code == 400
+        assert client.get("/tiles/2024-01-15/3/0/-1").status_code == 400
+        assert client.get("/tiles/2024-01-15/-1/0/0").status_code == 400
+
+    def test_missing_tile(self, tmp_path):
+        client = _tiles_client(RiskTileStore(tmp_path))
+
+        assert client.get("/tiles/2024-01-15/3/4/3").status_code == 404
+
+    def test_etag_and_not_modified(self, tmp_path):
+        store = RiskTileStore(tmp_path)
+        data = encode_tile_png(np.zeros((4, 4), dtype=np.uint8))
+        store.write_tile(date(2024, 1, 15), "ensemble", 3, 4, 3, data)
+        client = _tiles_client(store)
+
+        response = client.get("/tiles/2024-01-15/3/4/3")
+        assert response.status_code == 200
+        assert response.content == data
+        assert response.headers["content-type"] == "image/png"
+        assert "immutable" not in response.headers["cache-control"]
+        etag = response.headers["etag"]
+
+        cached = client.get("/tiles/2024-01-15/3/4/3", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
+        assert client.get("/tiles/dates").json() == {"dates": ["2024-01-15"]}
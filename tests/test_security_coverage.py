@@ -631,6 +631,7 @@ class TestRepositoriesCoverage:
         mock_session.execute.assert_not_called()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_era5_repository_bulk_insert_sqlite(
         self, mock_session, sample_era5_data
     ):
@@ -652,6 +653,7 @@ class TestRepositoriesCoverage:
         mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_era5_repository_bulk_insert_no_upsert(
         self, mock_session, sample_era5_data
     ):
@@ -684,6 +686,7 @@ class TestRepositoriesCoverage:
         mock_session.execute.assert_not_called()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_processed_climate_repository_sqlite(self, mock_session):
         """Test save_processing_result with SQLite - covers lines 226-228."""
         from malaria_predictor.database.repositories import ProcessedClimateRepository
@@ -749,6 +752,7 @@ class TestRepositoriesCoverage:
         assert repo._calculate_risk_level(0.8) == "critical"
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_era5_repository_postgresql_upsert(
         self, mock_session, sample_era5_data
     ):
@@ -810,18 +814,20 @@ class TestRepositoriesCoverage:
         """Test delete_old_data method - covers lines 162-172."""
         from malaria_predictor.database.repositories import ERA5Repository
 
+        # PostgreSQL: count the old rows, drop their chunks, delete the rest
         mock_result = Mock()
-        mock_result.rowcount = 50
+        mock_result.scalar.return_value = 50
         mock_session.execute.return_value = mock_result
 
         repo = ERA5Repository(mock_session)
         result = await repo.delete_old_data(days_to_keep=30)
 
         assert result == 50
-        mock_session.execute.assert_called_once()
+        assert mock_session.execute.call_count == 3
         mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_processed_climate_repository_postgresql_upsert(self, mock_session):
         """Test save_processing_result with PostgreSQL upsert - covers lines 230-231."""
         from malaria_predictor.database.repositories import ProcessedClimateRepository
@@ -886,6 +892,7 @@ class TestRepositoriesCoverage:
         assert result.iloc[0]["mean_temperature"] == 25.0
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_grid_cells")
     async def test_malaria_risk_repository_save_risk_assessment(self, mock_session):
         """Test save_risk_assessment method - covers lines 330-352."""
         from malaria_predictor.database.repositories import MalariaRiskRepository
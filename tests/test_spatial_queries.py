@@ -0,0 +1,129 @@
+"""
+Unit tests for PostGIS-backed location filters in the repositories.
+"""
+import math
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.malaria_predictor.database.models import ERA5DataPoint, MalariaRiskIndex
+from src.malaria_predictor.database.repositories import (
+    ERA5Repository,
+    MalariaRiskRepository,
+    _location_filter,
+    _radius_box,
+    haversine_km,
+)
+
+
+def _postgres_session():
+    return SimpleNamespace(bind=SimpleNamespace(dialect=SimpleNamespace(name="postgresql")))
+
+
+def _sql(clause) -> str:
+    return str(
+        clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+def _destination(lat: float, lon: float, bearing: float, distance_km: float) -> tuple[float, float]:
+    delta = distance_km / 6371.0088
+    phi1, lambda1, theta = map(math.radians, (lat, lon, bearing))
+    phi2 = math.asin(
+        math.sin(phi1) * math.cos(delta) + math.cos(phi1) * math.sin(delta) * math.cos(theta)
+    )
+    lambda2 = lambda1 + math.atan2(
+        math.sin(theta) * math.sin(delta) * math.cos(phi1),
+        math.cos(delta) - math.sin(phi1) * math.sin(phi2),
+    )
+    return math.degrees(phi2), math.degrees(lambda2)
+
+
+class TestLocationFilter:
+    """Test SQL generated for PostgreSQL and the degree box it relies on."""
+
+    def test_buffer_uses_geom_bbox_operator(self):
+        sql = _sql(_location_filter(_postgres_session(), ERA5DataPoint, -1.0, 36.0, 0.5))
+
+        assert "era5_data_points.geom && ST_MakeEnvelope(35.5, -1.5, 36.5, -0.5, 4326)" in sql
+        assert "latitude" not in sql
+        assert "ST_DWithin" not in sql
+
+    def test_radius_uses_dwithin_on_geography(self):
+        sql = _sql(
+            _location_filter(_postgres_session(), MalariaRiskIndex, -1.0, 36.0, radius_km=25.0)
+        )
+
+        assert "malaria_risk_indices.geom && ST_MakeEnvelope(" in sql
+        assert "ST_DWithin(geography(malaria_risk_indices.geom), geography(" in sql
+        assert "25000.0" in sql
+
+    @pytest.mark.parametrize("latitude", [0.0, -33.9, 60.0, 89.0])
+    def test_radius_box_encloses_circle(self, latitude):
+        lat_delta, lon_delta = _radius_box(latitude, 100.0)
+
+        for bearing in range(0, 360, 5):
+            lat, lon = _destination(latitude, 20.0, bearing, 100.0)
+            assert abs(lat - latitude) <= lat_delta
+            assert abs((lon - 20.0 + 180.0) % 360.0 - 180.0) <= lon_delta
+
+
+@pytest.fixture
+def db_tables():
+    return [ERA5DataPoint.__table__, MalariaRiskIndex.__table__]
+
+
+class TestRadiusQueries:
+    """Test radius queries on dialects without PostGIS."""
+
+    @pytest.mark.asyncio
+    async def test_era5_radius_excludes_box_corners(self, session):
+        now = datetime(2025, 1, 1)
+        # Center, 20 km north, and a box corner about 28 km away
+        points = [(0.0, 30.0), (0.18, 30.0), (0.2, 30.2)]
+        session.add_all(
+            ERA5DataPoint(timestamp=now, latitude=lat, longitude=lon) for lat, lon in points
+        )
+        await session.commit()
+
+        rows = await ERA5Repository(session).get_data_range(
+            now - timedelta(days=1), now + timedelta(days=1), 0.0, 30.0, radius_km=25.0
+        )
+        in_box = await ERA5Repository(session).get_data_range(
+            now - timedelta(days=1), now + timedelta(days=1), 0.0, 30.0, buffer_degrees=0.25
+        )
+
+        assert sorted((r.latitude, r.longitude) for r in rows) == points[:2]
+        assert len(in_box) == 3
+        assert haversine_km(0.0, 30.0, 0.2, 30.2) > 25.0
+
+    @pytest.mark.asyncio
+    async def test_latest_assessment_within_radius(self, session):
+        repository = MalariaRiskRepository(session)
+        for days, lat in ((1, 0.0), (0, 0.2)):
+            session.add(
+                MalariaRiskIndex(
+                    assessment_date=datetime(2025, 1, 10) - timedelta(days=days),
+                    latitude=lat,
+                    longitude=30.2 if lat else 30.0,
+                    composite_risk_score=0.5,
+                    temperature_risk_component=0.5,
+                    precipitation_risk_component=0.5,
+                    humidity_risk_component=0.5,
+                    risk_level="medium",
+                    confidence_score=0.8,
+                    prediction_date=datetime(2025, 1, 10),
+                    time_horizon_days=30,
+                    model_version="1.0",
+                    model_type="rule-based",
+                )
+            )
+        await session.commit()
+
+        nearest = await repository.get_latest_assessment(0.0, 30.0, radius_km=10.0)
+        newest = await repository.get_latest_assessment(0.0, 30.0, buffer_degrees=0.25)
+
+        assert nearest.latitude == 0.0
+        assert newest.latitude == 0.2
@@ -0,0 +1,192 @@
+"""
+Unit tests for keyset-paginated streaming reads in the repositories.
+"""
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.malaria_predictor.database.models import (
+    ERA5DataPoint,
+    MODISDataPoint,
+    ProcessedClimateData,
+)
+from src.malaria_predictor.database.repositories import (
+    ARROW_AVAILABLE,
+    EnvironmentalDataRepository,
+    ERA5Repository,
+    ProcessedClimateRepository,
+    to_record_batch,
+)
+
+START = datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def db_tables():
+    return [
+        ERA5DataPoint.__table__,
+        ProcessedClimateData.__table__,
+        MODISDataPoint.__table__,
+    ]
+
+
+class _Row(tuple):
+    """Minimal stand-in for a SQLAlchemy Row."""
+
+    def __new__(cls, fields, values):
+        row = super().__new__(cls, values)
+        row._fields = fields
+        row._mapping = dict(zip(fields, values, strict=True))
+        return row
+
+
+async def _pages(iterator) -> list:
+    return [page async for page in iterator]
+
+
+class TestStreamingReads:
+    """Test paging, column selection and record batches on SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_cover_every_row_once(self, session):
+        # Five locations share each timestamp, so pages split ties on id
+        session.add_all(
+            ERA5DataPoint(
+                timestamp=START + timedelta(hours=h),
+                latitude=0.05 * i,
+                longitude=30.0,
+                temperature_2m=20.0 + h,
+            )
+            for h in range(5)
+            for i in range(5)
+        )
+        await session.commit()
+
+        pages = await _pages(
+            ERA5Repository(session).stream_data_range(
+                START, START + timedelta(days=1), columns=["temperature_2m"], batch_size=10
+            )
+        )
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        rows = [row for page in pages for row in page]
+        assert len({row.id for row in rows}) == 25
+        assert [(row.timestamp, row.id) for row in rows] == sorted(
+            (row.timestamp, row.id) for row in rows
+        )
+        assert rows[0]._fields == ("temperature_2m", "timestamp", "id")
+
+    @pytest.mark.asyncio
+    async def test_radius_filter_applies_per_page(self, session):
+        session.add_all(
+            ERA5DataPoint(timestamp=START, latitude=lat, longitude=lon)
+            for lat, lon in [(0.0, 30.0), (0.18, 30.0), (0.2, 30.2)]
+        )
+        await session.commit()
+
+        pages = await _pages(
+            ERA5Repository(session).stream_data_range(
+                START, START, 0.0, 30.0, radius_km=25.0, columns=["latitude"], batch_size=2
+            )
+        )
+
+        assert [row.latitude for page in pages for row in page] == [0.0, 0.18]
+
+    @pytest.mark.asyncio
+    async def test_processed_batches_match_location_frame(self, session):
+        session.add_all(
+            ProcessedClimateData(
+                date=START + timedelta(days=d),
+                latitude=0.0,
+                longitude=30.0,
+                mean_temperature=24.0 + d,
+                max_temperature=30.0,
+                min_temperature=18.0,
+                daily_precipitation_mm=None if d == 1 else 2.0,
+                processing_version="1.0.0",
+            )
+            for d in range(3)
+        )
+        await session.commit()
+        repository = ProcessedClimateRepository(session)
+
+        batches = await _pages(
+            repository.stream_location_batches(
+                0.0, 30.0, START, START + timedelta(days=5), batch_size=2
+            )
+        )
+        frame = await repository.get_location_data(0.0, 30.0, START, START + timedelta(days=5))
+
+        temperatures = np.concatenate([b["mean_temperature"] for b in batches])
+        assert temperatures.dtype == np.float64
+        np.testing.assert_array_equal(temperatures, frame["mean_temperature"].to_numpy())
+        assert np.isnan(batches[0]["daily_precipitation_mm"][1])
+        assert batches[0]["date"].dtype == np.dtype("datetime64[us]")
+        assert batches[0]["id"].dtype == np.int64
+
+    @pytest.mark.asyncio
+    async def test_environmental_stream_is_not_capped(self, session):
+        session.add_all(
+            MODISDataPoint(date=START + timedelta(days=d), latitude=0.0, longitude=30.0, ndvi=0.5)
+            for d in range(150)
+        )
+        await session.commit()
+        repository = EnvironmentalDataRepository(session)
+
+        pages = await _pages(repository.stream_by_location(0.0, 30.0, columns=["ndvi"], batch_size=64))
+
+        assert sum(len(page) for page in pages) == 150
+        with pytest.raises(ValueError, match="Unsupported environmental data type"):
+            repository.stream_by_location(0.0, 30.0, data_type="chirps")
+
+
+class TestRecordBatches:
+    """Test columnar conversion of row pages."""
+
+    def test_column_types(self):
+        fields = ("when", "count", "missing", "name")
+        rows = [
+            _Row(fields, (datetime(2025, 1, 1, 3, tzinfo=UTC), 1, None, "a")),
+            _Row(fields, (None, None, 2, "b")),
+        ]
+
+        batch = to_record_batch(rows)
+
+        assert batch["when"][0] == np.datetime64("2025-01-01T03:00:00")
+        assert np.isnat(batch["when"][1])
+        assert batch["count"].dtype == np.float64
+        assert batch["missing"].dtype == np.float64
+        assert batch["name"].dtype == object
+
+    @pytest.mark.skipif(ARROW_AVAILABLE, reason="pyarrow is installed")
+    def test_arrow_requires_pyarrow(self):
+        with pytest.raises(ImportError, match="pyarrow"):
+            to_record_batch([_Row(("a",), (1.0,))], arrow=True)
+
+
+class TestPostgresKeyset:
+    """Test the SQL of follow-up pages."""
+
+    @pytest.mark.asyncio
+    async def test_next_page_resumes_after_last_key(self):
+        key = (ERA5DataPoint.__table__.c.timestamp, ERA5DataPoint.__table__.c.id)
+        first = [_Row(key, (START, i)) for i in range(2)]
+        db = AsyncMock()
+        db.bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+        db.stream.side_effect = [
+            SimpleNamespace(all=AsyncMock(return_value=first)),
+            SimpleNamespace(all=AsyncMock(return_value=[])),
+        ]
+
+        await _pages(
+            ERA5Repository(db).stream_data_range(START, START, columns=[], batch_size=2)
+        )
+
+        sql = str(db.stream.call_args_list[1].args[0].compile(dialect=postgresql.dialect()))
+        assert "(era5_data_points.timestamp, era5_data_points.id) > (" in sql
+        assert "ORDER BY era5_data_points.timestamp, era5_data_points.id" in sql
+        assert "LIMIT" in sql and "OFFSET" not in sql
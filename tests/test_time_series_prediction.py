@@ -0,0 +1,115 @@
+"""
+Unit tests for batched time-series prediction.
+"""
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import torch
+
+from src.malaria_predictor.api.dependencies import ModelManager, PredictionService
+from src.malaria_predictor.api.models import ModelType
+from src.malaria_predictor.services.feature_store import (
+    N_FEATURES,
+    FeatureStore,
+    modality_slices,
+)
+
+
+class SeriesHarmonizer:
+    """Harmonizer whose temperature grid counts days up to the target date."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    async def get_harmonized_features(self, region_bounds, target_date, lookback_days=90, **kwargs):
+        self.calls.append((target_date, lookback_days))
+        steps = lookback_days + 1
+        days = np.arange(steps, dtype=np.float64) + target_date.toordinal() - lookback_days
+        return SimpleNamespace(
+            data={
+                "era5_temperature": np.broadcast_to(days[:, None, None], (steps, 2, 2)),
+                "worldpop_density": np.full((2, 2), 7.0),
+            },
+            spatial_bounds=region_bounds,
+            quality_metrics={},
+        )
+
+
+class WindowModel:
+    """Model returning the last and first day of each climate window."""
+
+    def __init__(self) -> None:
+        self.batch_sizes = []
+
+    def __call__(self, model_input):
+        climate = model_input["climate"]
+        self.batch_sizes.append(climate.shape[0])
+        assert model_input["population"][:, :, 0].eq(7.0).all()
+        risk = torch.stack([climate[:, -1, 0], climate[:, 0, 0]], dim=1)
+        return {"risk_mean": risk, "risk_variance": torch.full_like(risk, 0.04)}
+
+
+def _service(model, **kwargs) -> PredictionService:
+    manager = ModelManager()
+    manager.registry.add(ModelType.LSTM.value, "v1", model)
+    service = PredictionService(manager, **kwargs)
+    service.data_harmonizer = SeriesHarmonizer()
+    return service
+
+
+class TestTimeSeriesPrediction:
+    """Test one harmonization and batched sliding windows per series."""
+
+    @pytest.mark.asyncio
+    async def test_year_costs_one_harmonization_and_few_passes(self):
+        model = WindowModel()
+        service = _service(model, seq_len=10)
+        start, end = date(2023, 1, 1), date(2023, 12, 31)
+
+        series = await service.predict_time_series(
+            -1.28, 36.82, start, end, ModelType.LSTM, batch_size=128
+        )
+
+        assert service.data_harmonizer.calls == [(end, 364 + 90)]
+        assert model.batch_sizes == [128, 128, 109]
+        assert [point["date"] for point in series] == [
+            start + timedelta(days=offset) for offset in range(365)
+        ]
+        # Each window ends on its own date and starts seq_len - 1 days earlier
+        assert series[0]["risk_score"] == start.toordinal()
+        assert series[-1]["risk_score"] == end.toordinal()
+        assert all(point["uncertainty"] == pytest.approx(0.2) for point in series)
+        assert series[0]["prediction_horizon"] == 1
+
+    @pytest.mark.asyncio
+    async def test_windows_are_views_of_the_daily_features(self):
+        service = _service(WindowModel(), seq_len=4)
+
+        daily = await service._daily_features(0.0, 30.0, date(2024, 3, 10), 7)
+        windows = daily["climate"].unfold(0, 4, 1).transpose(1, 2)
+
+        assert windows.shape == (4, 4, 12)
+        assert windows.data_ptr() == daily["climate"].data_ptr()
+        assert windows[3, :, 0].tolist() == [
+            float(date(2024, 3, day).toordinal()) for day in (7, 8, 9, 10)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stored_features_skip_harmonization(self, tmp_path):
+        store = FeatureStore(tmp_path)
+        store.create_region("lake", [(0.0, 30.0)])
+        first = date(2024, 2, 25)
+        for offset in range(10):
+            vectors = np.full((1, N_FEATURES), offset, np.float32)
+            vectors[:, modality_slices()["population"]] = 7.0
+            store.write_day("lake", first + timedelta(days=offset), vectors)
+        service = _service(WindowModel(), seq_len=3, feature_store=store)
+
+        series = await service.predict_time_series(
+            0.0, 30.0, date(2024, 2, 27), date(2024, 3, 5), ModelType.LSTM
+        )
+
+        assert service.data_harmonizer.calls == []
+        assert [point["risk_score"] for point in series] == list(range(2, 10))
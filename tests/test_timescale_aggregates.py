@@ -0,0 +1,148 @@
+"""
+Unit tests for reads routed to TimescaleDB continuous aggregates.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.malaria_predictor.alerts.alert_history_manager import AlertHistoryManager
+from src.malaria_predictor.database.models import ERA5DataPoint
+from src.malaria_predictor.database.repositories import ERA5Repository, bucket_start
+
+
+def _postgres_session():
+    db = AsyncMock()
+    db.bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+    db.execute.return_value = Mock()
+    return db
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def db_tables():
+    return [ERA5DataPoint.__table__]
+
+
+class TestClimateSummary:
+    """Test climate rollups from raw rows and from the aggregates."""
+
+    def test_bucket_start(self):
+        timestamp = datetime(2025, 1, 9, 13, 45)  # Thursday
+
+        assert bucket_start(timestamp, "hourly") == datetime(2025, 1, 9, 13)
+        assert bucket_start(timestamp, "daily") == datetime(2025, 1, 9)
+        assert bucket_start(timestamp, "weekly") == datetime(2025, 1, 6)
+
+    @pytest.mark.asyncio
+    async def test_raw_fallback_matches_aggregate_columns(self, session):
+        rows = [
+            (datetime(2025, 1, 6, 0), 0.0, 20.0, 1.0),
+            (datetime(2025, 1, 6, 12), 0.1, None, 2.0),
+            (datetime(2025, 1, 7, 0), 0.0, 26.0, None),
+            (datetime(2025, 1, 13, 0), 0.0, 30.0, 4.0),
+        ]
+        session.add_all(
+            ERA5DataPoint(
+                timestamp=timestamp,
+                latitude=lat,
+                longitude=30.0,
+                temperature_2m=temp,
+                temperature_2m_max=temp,
+                temperature_2m_min=temp,
+                total_precipitation=precip,
+            )
+            for timestamp, lat, temp, precip in rows
+        )
+        await session.commit()
+        repository = ERA5Repository(session)
+
+        daily = await repository.get_climate_summary(
+            datetime(2025, 1, 1), datetime(2025, 1, 31), 0.0, 30.0
+        )
+        weekly = await repository.get_climate_summary(
+            datetime(2025, 1, 1), datetime(2025, 1, 31), 0.0, 30.0, granularity="weekly"
+        )
+
+        assert [(d["period"].day, d["avg_temp"], d["total_precip"], d["data_points"]) for d in daily] == [
+            (6, 20.0, 3.0, 2),
+            (7, 26.0, None, 1),
+            (13, 30.0, 4.0, 1),
+        ]
+        assert weekly[0] == {
+            "period": datetime(2025, 1, 6),
+            "avg_temp": 23.0,
+            "max_temp": 26.0,
+            "min_temp": 20.0,
+            "total_precip": 3.0,
+            "data_points": 3,
+        }
+        assert len(weekly) == 2
+
+    @pytest.mark.asyncio
+    async def test_postgresql_reads_weighted_aggregate(self):
+        db = _postgres_session()
+        db.execute.return_value = []
+
+        await ERA5Repository(db).get_climate_summary(
+            datetime(2025, 1, 9), datetime(2025, 2, 1), 0.0, 30.0, granularity="weekly"
+        )
+
+        sql = _sql(db.execute.call_args.args[0])
+        assert "FROM weekly_climate_summary" in sql
+        assert "era5_data_points" not in sql
+        assert "sum(weekly_climate_summary.avg_temp * weekly_climate_summary.temp_count)" in sql
+        assert "GROUP BY weekly_climate_summary.week" in sql
+
+    @pytest.mark.asyncio
+    async def test_hourly_and_unknown_granularity(self):
+        db = _postgres_session()
+        db.execute.return_value.scalars.return_value.all.return_value = []
+
+        assert await ERA5Repository(db).get_climate_summary(
+            datetime(2025, 1, 1), datetime(2025, 1, 2), 0.0, 30.0, granularity="hourly"
+        ) == []
+        assert "FROM era5_data_points" in _sql(db.execute.call_args.args[0])
+
+        with pytest.raises(ValueError, match="Unsupported granularity"):
+            await ERA5Repository(db).get_climate_summary(
+                datetime(2025, 1, 1), datetime(2025, 1, 2), 0.0, 30.0, granularity="monthly"
+            )
+
+
+class TestRetention:
+    """Test ERA5 retention on PostgreSQL."""
+
+    @pytest.mark.asyncio
+    async def test_delete_old_data_drops_chunks_and_counts_rows(self):
+        db = _postgres_session()
+        db.execute.return_value.scalar.return_value = 3
+
+        deleted = await ERA5Repository(db).delete_old_data(days_to_keep=30)
+
+        count, drop, delete = (str(call.args[0]) for call in db.execute.call_args_list)
+        assert "count(*)" in count
+        assert "drop_chunks('era5_data_points', older_than => :cutoff)" in drop
+        assert delete.startswith("DELETE FROM era5_data_points")
+        assert deleted == 3
+        db.commit.assert_called_once()
+
+
+class TestAlertTrends:
+    """Test alert trend queries over the alert aggregates."""
+
+    def test_aggregate_statement(self):
+        statement = AlertHistoryManager()._aggregate_trends_statement(
+            "user-1", "daily", datetime(2025, 1, 9, 13)
+        )
+
+        sql = _sql(statement)
+        assert "FROM daily_alert_summary JOIN alert_configurations" in sql
+        assert "nullif(sum(daily_alert_summary.risk_score_count)" in sql
+        assert "FROM alerts" not in sql
+        assert statement.compile().params["day_1"] == datetime(2025, 1, 9)
@@ -0,0 +1,228 @@
+"""
+Unit tests for the sharded training dataset and parallel cross-validation.
+"""
+import asyncio
+import os
+from datetime import date
+from types import SimpleNamespace
+
+import numpy as np
+import optuna
+import pytest
+import torch
+from sklearn.model_selection import TimeSeriesSplit
+from sklearn.preprocessing import StandardScaler
+
+from src.malaria_predictor.ml.training.dataset import (
+    ShardedDataset,
+    ShardedDatasetWriter,
+    ShardIterableDataset,
+)
+from src.malaria_predictor.ml.training.pipeline import (
+    MalariaTrainingPipeline,
+    _cpu_groups,
+    _TrialPruningCallback,
+    temporal_folds,
+)
+
+
+class FakeHarmonizer:
+    """Harmonizer returning a 3x4 grid per day, with uneven delays."""
+
+    def __init__(self, fail_on: date | None = None) -> None:
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_harmonized_features(self, region_bounds, target_date, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01 * (target_date.day % 3))
+            if target_date == self.fail_on:
+                raise RuntimeError("source unavailable")
+            grid = np.full((3, 4), float(target_date.day))
+            return SimpleNamespace(
+                data={name: grid + i for i, name in enumerate("abcd")},
+                spatial_bounds=region_bounds,
+                quality_metrics={},
+            )
+        finally:
+            self.in_flight -= 1
+
+
+def _pipeline(harmonizer=None, **config) -> MalariaTrainingPipeline:
+    pipeline = MalariaTrainingPipeline._worker_instance(
+        {**MalariaTrainingPipeline._get_default_config(None), **config}  # type: ignore[arg-type]
+    )
+    pipeline.data_harmonizer = harmonizer
+    return pipeline
+
+
+def _write(directory, rows: int, shard_size: int) -> ShardedDataset:
+    X = np.arange(rows * 4, dtype=np.float32).reshape(rows, 4)
+    dates = np.datetime64("2024-01-01") + np.arange(rows) // 10
+    return ShardedDataset.from_arrays(
+        directory, X, X[:, 0], dates, np.zeros((rows, 2)), list("abcd"), shard_size
+    )
+
+
+class TestShardedDataset:
+    """Test writing, reading and streaming shards."""
+
+    def test_reads_span_shards(self, tmp_path):
+        dataset = _write(tmp_path, rows=25, shard_size=10)
+
+        assert len(dataset) == 25
+        assert [s["rows"] for s in dataset.shards] == [10, 10, 5]
+        assert dataset.pieces(8, 22) == [(0, 8, 10), (1, 0, 10), (2, 0, 2)]
+        np.testing.assert_array_equal(dataset.read("y", 8, 22), np.arange(8, 22) * 4)
+        assert dataset.read("dates", 24, 25)[0] == np.datetime64("2024-01-03")
+
+    def test_scaler_is_fitted_incrementally(self, tmp_path):
+        rng = np.random.default_rng(0)
+        X = rng.normal(5.0, 2.0, size=(300, 3))
+        writer = ShardedDatasetWriter(tmp_path, list("abc"), shard_size=64, scaler=StandardScaler())
+        for chunk in np.array_split(X, 7):
+            writer.append(chunk, chunk[:, 0], np.full(len(chunk), "2024-01-01"), np.zeros((len(chunk), 2)))
+        dataset = writer.close()
+
+        expected = StandardScaler().fit_transform(X)
+        np.testing.assert_allclose(dataset.read("X"), expected, atol=1e-5)
+
+    def test_iterable_dataset_splits_rows_between_workers(self, tmp_path):
+        _write(tmp_path, rows=95, shard_size=20)
+        loader = torch.utils.data.DataLoader(
+            ShardIterableDataset(tmp_path, start=5, stop=90, batch_size=8, shuffle=True, seed=1),
+            batch_size=None,
+            num_workers=2,
+        )
+
+        seen = torch.cat([y for _, y in loader]).numpy() / 4
+
+        assert sorted(seen.astype(int)) == list(range(5, 90))
+
+
+class TestParallelDataBuilder:
+    """Test bounded-concurrency harmonization into shards."""
+
+    @pytest.mark.asyncio
+    async def test_days_are_fetched_concurrently_in_order(self, tmp_path):
+        harmonizer = FakeHarmonizer(fail_on=date(2024, 1, 5))
+        pipeline = _pipeline(harmonizer, data_concurrency=3, shard_size=50)
+
+        dataset = await pipeline.build_training_dataset(
+            date(2024, 1, 1), date(2024, 1, 10), (30.0, -1.0, 31.0, 0.0), tmp_path
+        )
+
+        assert harmonizer.max_in_flight == 3
+        # Nine days of a 3x4 grid, day 5 skipped
+        assert len(dataset) == 108
+        days = dataset.read("dates").astype(object)
+        assert list(dict.fromkeys(d.day for d in days)) == [1, 2, 3, 4, 6, 7, 8, 9, 10]
+        assert dataset.read("locations", 0, 4).tolist() == [
+            [-1.0, 30.0],
+            [-1.0, 30.0 + 1 / 3],
+            [-1.0, 30.0 + 2 / 3],
+            [-1.0, 31.0],
+        ]
+
+
+class TestParallelCrossValidation:
+    """Test temporal folds and fold training in a process pool."""
+
+    def test_folds_match_time_series_split(self):
+        expected = [
+            ((0, train[-1] + 1), (val[0], val[-1] + 1))
+            for train, val in TimeSeriesSplit(n_splits=4).split(np.zeros(103))
+        ]
+
+        assert [fold[1:] for fold in temporal_folds(103, 4)] == expected
+        with pytest.raises(ValueError):
+            list(temporal_folds(3, 5))
+
+    def test_folds_train_in_worker_processes(self, tmp_path, monkeypatch):
+        # Lightning writes checkpoints under the working directory
+        monkeypatch.chdir(tmp_path)
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(240, 4)).astype(np.float32)
+        dates = np.datetime64("2024-01-01") + np.arange(240) // 8
+        dataset = ShardedDataset.from_arrays(
+            tmp_path / "shards", X, rng.random(240), dates, np.zeros((240, 2)), shard_size=64
+        )
+        pipeline = _pipeline(
+            cv_folds=3,
+            cv_workers=2,
+            min_samples_per_fold=10,
+            max_epochs=1,
+            hidden_size=8,
+            num_layers=1,
+            prediction_horizon=2,
+            batch_size=32,
+            num_workers=0,
+            use_attention=False,
+        )
+
+        results = pipeline.run_cross_validation(dataset)
+
+        assert [r["fold"] for r in results["cv_results"]] == [0, 1, 2]
+        assert [r["val_size"] for r in results["cv_results"]] == [60, 60, 60]
+        assert "rmse_mean" in results["cv_summary"]
+
+
+class TestParallelHyperparameterSearch:
+    """Test pruned Optuna search shared between worker processes."""
+
+    @staticmethod
+    def _dataset(directory) -> ShardedDataset:
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(160, 4)).astype(np.float32)
+        dates = np.datetime64("2024-01-01") + np.arange(160) // 8
+        return ShardedDataset.from_arrays(directory, X, rng.random(160), dates, np.zeros((160, 2)))
+
+    @staticmethod
+    def _search_config(**config) -> dict:
+        return {
+            "cv_folds": 2,
+            "min_samples_per_fold": 10,
+            "max_epochs": 2,
+            "prediction_horizon": 2,
+            "num_workers": 0,
+            **config,
+        }
+
+    def test_pruning_callback_stops_losing_trials(self):
+        study = optuna.create_study(pruner=optuna.pruners.MedianPruner(n_startup_trials=1))
+        study.add_trial(
+            optuna.trial.create_trial(
+                value=0.1, intermediate_values={0: 0.1, 1: 0.1}, distributions={}, params={}
+            )
+        )
+        trial = study.ask()
+        trainer = SimpleNamespace(
+            sanity_checking=False, current_epoch=1, callback_metrics={"val_loss": torch.tensor(0.9)}
+        )
+
+        with pytest.raises(optuna.TrialPruned):
+            _TrialPruningCallback(trial, step_offset=0).on_validation_end(trainer, None)
+        assert study.trials[-1].intermediate_values == {1: pytest.approx(0.9)}
+
+    def test_cpus_are_split_between_workers(self):
+        cpus = os.sched_getaffinity(0)
+        groups = _cpu_groups(len(cpus) + 1)
+
+        assert len(groups) == len(cpus) + 1
+        assert all(len(group) == 1 for group in groups)
+        assert set(sum(groups, [])) == cpus
+
+    def test_workers_share_a_journal_study(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        storage = tmp_path / "hpo.journal"
+        pipeline = _pipeline(**self._search_config(hpo_workers=2, hpo_storage=str(storage)))
+
+        results = pipeline.optimize_hyperparameters(self._dataset(tmp_path / "shards"), n_trials=4)
+
+        assert len(results["study"].trials) == 4
+        assert storage.exists()
+        assert results["best_value"] < float("inf")
+        assert set(results["best_params"]) >= {"hidden_size", "num_layers", "dropout"}
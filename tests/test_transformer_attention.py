@@ -0,0 +1,167 @@
+"""
+Unit tests for the Transformer's spatial-temporal attention kernels.
+"""
+import math
+
+import pytest
+import torch
+import torch.nn.functional as F
+
+from src.malaria_predictor.ml.models.transformer_model import (
+    MalariaTransformer,
+    SpatialDistanceCache,
+    SpatialTemporalAttention,
+    _distance_cache,
+)
+
+
+def _reference_attention(attention, x, spatial_coords, mask=None):
+    """Explicit softmax(QK^T / sqrt(d) + bias) V over all pairs."""
+    batch_size, seq_len, _ = x.shape
+
+    def heads(projection):
+        return projection(x).view(batch_size, seq_len, attention.num_heads, -1).transpose(1, 2)
+
+    Q, K, V = heads(attention.query), heads(attention.key), heads(attention.value)
+    scores = Q @ K.transpose(-2, -1) / math.sqrt(attention.head_dim)
+    if spatial_coords is not None:
+        distances = torch.norm(spatial_coords[:, :, None] - spatial_coords[:, None, :], dim=-1)
+        scores = scores + attention.spatial_bias * torch.exp(-distances).unsqueeze(1)
+    if mask is not None:
+        scores = scores.masked_fill(mask.unsqueeze(1) == 0, float("-inf"))
+    attended = (F.softmax(scores, dim=-1) @ V).transpose(1, 2).reshape(batch_size, seq_len, -1)
+    return attention.output_proj(attended)
+
+
+@pytest.fixture
+def inputs():
+    torch.manual_seed(0)
+    x = torch.randn(2, 12, 16)
+    coords = torch.rand(2, 12, 2) * 3
+    mask = torch.ones(2, 12, 12).tril()
+    return x, coords, mask
+
+
+class TestDenseAttention:
+    """Test that the fused kernel matches explicit attention."""
+
+    @pytest.mark.parametrize("use_coords", [True, False])
+    @pytest.mark.parametrize("use_mask", [True, False])
+    def test_matches_reference(self, inputs, use_coords, use_mask):
+        x, coords, mask = inputs
+        attention = SpatialTemporalAttention(16, num_heads=4).eval()
+        coords = coords if use_coords else None
+        mask = mask if use_mask else None
+
+        with torch.no_grad():
+            expected = _reference_attention(attention, x, coords, mask)
+            actual = attention(x, coords, mask)
+
+        torch.testing.assert_close(actual, expected, atol=1e-5, rtol=1e-5)
+
+    def test_gradients_reach_spatial_bias(self, inputs):
+        x, coords, _ = inputs
+        attention = SpatialTemporalAttention(16, num_heads=4)
+
+        attention(x, coords).sum().backward()
+
+        assert attention.spatial_bias.grad is not None
+        assert attention.spatial_bias.grad.abs().sum() > 0
+
+
+class TestNearestNeighbourAttention:
+    """Test attention restricted to each location's nearest neighbours."""
+
+    def test_all_neighbours_matches_dense(self, inputs):
+        x, coords, mask = inputs
+        dense = SpatialTemporalAttention(16, num_heads=4).eval()
+        knn = SpatialTemporalAttention(16, num_heads=4, knn_neighbors=11, knn_chunk_size=5).eval()
+        knn.load_state_dict(dense.state_dict())
+        # Eleven of twelve neighbours: mask out the farthest to compare densely
+        distances = torch.cdist(coords, coords)
+        farthest = distances.argmax(dim=-1, keepdim=True)
+        knn_mask = mask.scatter(2, farthest, 0.0)
+
+        with torch.no_grad():
+            expected = dense(x, coords, knn_mask)
+            actual = knn(x, coords, mask)
+
+        torch.testing.assert_close(actual, expected, atol=1e-5, rtol=1e-5)
+
+    def test_short_sequences_use_dense_attention(self, inputs):
+        x, coords, _ = inputs
+        dense = SpatialTemporalAttention(16, num_heads=4).eval()
+        knn = SpatialTemporalAttention(16, num_heads=4, knn_neighbors=32).eval()
+        knn.load_state_dict(dense.state_dict())
+
+        with torch.no_grad():
+            torch.testing.assert_close(knn(x, coords), dense(x, coords))
+
+    def test_model_forward(self):
+        model = MalariaTransformer(
+            climate_features=3,
+            vegetation_features=2,
+            population_features=2,
+            historical_features=1,
+            d_model=16,
+            num_heads=4,
+            num_layers=2,
+            d_ff=32,
+            knn_neighbors=4,
+        ).eval()
+        batch = {
+            "climate": torch.randn(2, 10, 3),
+            "vegetation": torch.randn(2, 10, 2),
+            "population": torch.randn(2, 10, 2),
+            "historical": torch.randn(2, 10, 1),
+            "spatial_coords": torch.rand(2, 10, 2),
+        }
+
+        with torch.no_grad():
+            outputs = model(batch)
+
+        assert outputs["risk_mean"].shape == (2, model.prediction_horizon)
+        assert torch.isfinite(outputs["risk_mean"]).all()
+
+
+class TestSpatialDistanceCache:
+    """Test reuse of distance decay between layers and batches."""
+
+    def test_repeated_coordinates_hit_the_cache(self):
+        cache = SpatialDistanceCache(max_entries=2)
+        coords = torch.rand(1, 6, 2)
+
+        first, _ = cache.lookup(coords)
+        second, _ = cache.lookup(coords.clone())
+
+        assert first is second
+        torch.testing.assert_close(first.diagonal(dim1=1, dim2=2), torch.ones(1, 6))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = SpatialDistanceCache(max_entries=2)
+        a, b, c = (torch.rand(1, 4, 2) for _ in range(3))
+
+        kept, _ = cache.lookup(a)
+        cache.lookup(b)
+        cache.lookup(a)
+        cache.lookup(c)
+
+        assert cache.lookup(a)[0] is kept
+        assert len(cache._entries) == 2
+
+    def test_nearest_neighbours_include_self(self):
+        coords = torch.rand(2, 8, 2)
+
+        decay, neighbors = SpatialDistanceCache().lookup(coords, knn=3)
+
+        assert neighbors.shape == (2, 8, 3)
+        torch.testing.assert_close(neighbors[..., 0], torch.arange(8).expand(2, 8))
+        torch.testing.assert_close(decay[..., 0], torch.ones(2, 8))
+
+    def test_coordinates_requiring_grad_are_not_cached(self):
+        _distance_cache.clear()
+        coords = torch.rand(1, 4, 2, requires_grad=True)
+
+        _distance_cache.lookup(coords)
+
+        assert len(_distance_cache._entries) == 0